@@ -0,0 +1,30 @@
+"""Read-only data file handles of backend accessors, opened on first use.
+"""
+from functools import partial
+from threading import Lock
+
+
+class LazyOpenHandles(dict):
+    """Read-only file handles of a backend accessor, keyed by file uid.
+
+    When an accessor is opened in read mode, each data file is registered
+    with a ``functools.partial`` which opens it, and the file is only opened
+    the first time it is read. Reader threads share an accessor, so the
+    partial is called under a lock held by this mapping, and each file is
+    opened once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = Lock()
+
+    def opened(self, uid: str):
+        """Return the handle of the file ``uid``, opening it if not yet open.
+        """
+        handle = self[uid]
+        if isinstance(handle, partial):
+            with self._lock:
+                handle = self[uid]
+                if isinstance(handle, partial):
+                    handle = self[uid] = handle()
+        return handle
@@ -182,6 +182,7 @@ finally:
     _logger.setLevel(_initialLevel)
 from xxhash import xxh64_hexdigest
 
+from .handles import LazyOpenHandles
 from .specs import HDF5_00_DataHashSpec
 from .. import __version__
 from ..optimized_utils import SizedDict
@@ -351,7 +352,7 @@ class HDF5_00_FileHandles(object):
         self.schema_dtype: np.dtype = schema_dtype
         self._dflt_backend_opts: Optional[dict] = None
 
-        self.rFp: HDF5_00_MapTypes = {}
+        self.rFp: HDF5_00_MapTypes = LazyOpenHandles()
         self.wFp: HDF5_00_MapTypes = {}
         self.Fp: HDF5_00_MapTypes = ChainMap(self.rFp, self.wFp)
         self.rDatasets = SizedDict(maxsize=100)
@@ -363,6 +364,10 @@ class HDF5_00_FileHandles(object):
         self.hMaxSize: Optional[int] = None
         self.hNextPath: Optional[int] = None
         self.hColsRemain: Optional[int] = None
+        # locations written by this process whose checksum need not be verified
+        # on read when ``trust_fresh_writes`` is enabled.
+        self.trust_fresh_writes: bool = False
+        self._fresh: set = set()
 
         self.STAGEDIR: Path = Path(self.path, DIR_DATA_STAGE, _FmtCode)
         self.REMOTEDIR: Path = Path(self.path, DIR_DATA_REMOTE, _FmtCode)
@@ -396,7 +401,7 @@ class HDF5_00_FileHandles(object):
         """ensure multiprocess operations can pickle relevant data.
         """
         self.__dict__.update(state)
-        self.rFp = {}
+        self.rFp = LazyOpenHandles()
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
         self.rDatasets = {}
@@ -488,6 +493,7 @@ class HDF5_00_FileHandles(object):
             self.hIdx = None
             self.hColsRemain = None
             self.w_uid = None
+            self._fresh.clear()
 
         for uid in list(self.rFp.keys()):
             with suppress(AttributeError):
@@ -758,7 +764,7 @@ class HDF5_00_FileHandles(object):
                     self.Fp[hashVal.uid][dsetCol].read_direct(destArr, srcSlc, None)
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                 except TypeError:
-                    self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
+                    self.rFp.opened(hashVal.uid)
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                     self.rDatasets[rdictkey].read_direct(destArr, srcSlc, None)
                 except KeyError:
@@ -778,7 +784,7 @@ class HDF5_00_FileHandles(object):
                     destArr = self.Fp[hashVal.uid][dsetCol][srcSlc]
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                 except TypeError:
-                    self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
+                    self.rFp.opened(hashVal.uid)
                     destArr = self.Fp[hashVal.uid][dsetCol][srcSlc]
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                 except KeyError:
@@ -792,6 +798,9 @@ class HDF5_00_FileHandles(object):
                         raise
 
         out = destArr.reshape(hashVal.shape)
+        location = (hashVal.uid, hashVal.dataset, hashVal.dataset_idx)
+        if self.trust_fresh_writes and location in self._fresh:
+            return out
         if xxh64_hexdigest(out) != hashVal.checksum:
             # try casting to check if dtype does not match for all zeros case
             out = out.astype(np.typeDict[self.Fp[hashVal.uid]['/'].attrs['schema_dtype_num']])
@@ -800,7 +809,8 @@ class HDF5_00_FileHandles(object):
                     f'DATA CORRUPTION Checksum {xxh64_hexdigest(out)} != recorded {hashVal}')
         return out
 
-    def write_data(self, array: np.ndarray, *, remote_operation: bool = False) -> bytes:
+    def write_data(self, array: np.ndarray, *, remote_operation: bool = False,
+                   checksum: Optional[str] = None) -> bytes:
         """verifies correctness of array data and performs write operation.
 
         Parameters
@@ -812,6 +822,10 @@ class HDF5_00_FileHandles(object):
             hdf5 dataset files will be created in the remote data dir instead
             of the stage directory. (default is False, which is for a regular
             access process)
+        checksum : Optional[str], optional, kwarg only
+            xxh64 hexdigest of ``array`` if already computed by the caller (ie.
+            alongside the content digest in a single pass over the data). If
+            None (default), the checksum is computed here.
 
         Returns
         -------
@@ -819,7 +833,8 @@ class HDF5_00_FileHandles(object):
             string identifying the collection dataset and collection dim-0 index
             which the array can be accessed at.
         """
-        checksum = xxh64_hexdigest(array)
+        if checksum is None:
+            checksum = xxh64_hexdigest(array)
         if self.w_uid in self.wFp:
             self.hIdx += 1
             if self.hIdx >= self.hMaxSize:
@@ -840,4 +855,6 @@ class HDF5_00_FileHandles(object):
         flat_arr = np.ravel(array)
         self.wdset.write_direct(flat_arr, None, destSlc)
         self.wdset.flush()
+        if self.trust_fresh_writes:
+            self._fresh.add((self.w_uid, str(self.hNextPath), self.hIdx))
         return hdf5_00_encode(self.w_uid, checksum, self.hNextPath, self.hIdx, array.shape)
@@ -203,8 +203,9 @@ import os
 from collections import ChainMap
 from contextlib import suppress
 from functools import partial
+from itertools import product
 from pathlib import Path
-from typing import MutableMapping, Tuple, Optional, Union, Callable
+from typing import MutableMapping, NamedTuple, Tuple, Optional, Union, Callable
 
 import h5py
 import numpy as np
@@ -223,6 +224,7 @@ from xxhash import xxh64_hexdigest
 
 
 from .chunk import calc_chunkshape
+from .handles import LazyOpenHandles
 from .specs import HDF5_01_DataHashSpec
 from .. import __version__
 from ..optimized_utils import SizedDict
@@ -275,6 +277,122 @@ def hdf5_01_encode(uid: str, cksum: str, dset: int, dset_idx: int,
     return f'01:{uid}:{cksum}:{dset}:{dset_idx}:{shape_str}'.encode()
 
 
+# ----------------------------- Raw Chunks ------------------------------------
+
+
+try:
+    # lock h5py holds around every call into the (not thread safe) hdf5 library.
+    from h5py._objects import phil as _HDF5_LIBRARY_LOCK
+except ImportError:  # pragma: no cover
+    _HDF5_LIBRARY_LOCK = None
+
+# h5py's direct chunk methods corrupt the heap when they overlap any other call
+# into the hdf5 library, so they are only used while holding h5py's library
+# lock. Compressed chunks are not passed through if that lock is not found.
+RAW_CHUNKS_SUPPORTED = _HDF5_LIBRARY_LOCK is not None
+
+
+def _require_raw_chunks_supported():
+    if not RAW_CHUNKS_SUPPORTED:
+        raise RuntimeError(
+            f'Direct chunk reads / writes are disabled; the hdf5 library lock '
+            f'was not found in h5py {h5py.__version__}.')
+
+
+class HDF5_01_RawChunks(NamedTuple):
+    """Compressed chunks of a sample exactly as written by the hdf5 filter pipeline.
+
+    Samples are transferred in this form between repositories whose collection
+    datasets share a layout (dtype, shape, chunk shape, and filter pipeline),
+    so the chunks can be copied between files without being decompressed,
+    verified, and recompressed.
+
+    Attributes
+    ----------
+    checksum : str
+        xxhash_64.hex_digest checksum of the sample data.
+    shape : Tuple[int]
+        shape of the sample.
+    dtype : str
+        ``numpy.dtype.str`` of the collection dataset.
+    row_shape : Tuple[int]
+        shape of a collection dataset row (excluding the collection index).
+    chunk_shape : Tuple[int]
+        shape of a chunk within the row.
+    filters : Tuple[Tuple[int, int, Tuple[int, ...]], ...]
+        (filter id, flags, client data values) of each filter in the pipeline.
+    chunks : Tuple[Tuple[Tuple[int, ...], int, bytes], ...]
+        (offset within the row, filter mask, compressed bytes) of every chunk
+        intersecting the sample.
+    """
+    checksum: str
+    shape: Tuple[int, ...]
+    dtype: str
+    row_shape: Tuple[int, ...]
+    chunk_shape: Tuple[int, ...]
+    filters: Tuple[Tuple[int, int, Tuple[int, ...]], ...]
+    chunks: Tuple[Tuple[Tuple[int, ...], int, bytes], ...]
+
+    @property
+    def layout(self) -> tuple:
+        return (self.dtype, self.row_shape, self.chunk_shape, self.filters)
+
+
+def _dataset_layout(dset: h5py.Dataset) -> tuple:
+    """(dtype, row shape, chunk shape, filters) of a collection dataset.
+    """
+    plist = dset.id.get_create_plist()
+    filters = []
+    for i in range(plist.get_nfilters()):
+        filter_id, flags, cd_values, _ = plist.get_filter(i)
+        filters.append((int(filter_id), int(flags), tuple(int(v) for v in cd_values)))
+    return (dset.dtype.str, tuple(dset.shape[1:]), tuple(dset.chunks[1:]), tuple(filters))
+
+
+def decode_raw_chunks(raw: HDF5_01_RawChunks) -> np.ndarray:
+    """Decompress raw chunks into the sample array they were written from.
+
+    The chunks are run through their filter pipeline by writing them to an
+    in-memory hdf5 file holding a dataset of the same layout, and reading the
+    sample back from an image of the file (hdf5 does not respect the filters
+    skipped for directly written chunks until a file is reopened).
+
+    Parameters
+    ----------
+    raw : HDF5_01_RawChunks
+        compressed chunks of a sample.
+
+    Returns
+    -------
+    np.ndarray
+        decompressed sample.
+    """
+    _require_raw_chunks_supported()
+    dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+    dcpl.set_chunk((1, *raw.chunk_shape))
+    for filter_id, flags, cd_values in raw.filters:
+        dcpl.set_filter(filter_id, flags, cd_values)
+    dtype = np.dtype(raw.dtype)
+    name = random_string()
+    with h5py.File(name, 'w', driver='core', backing_store=False) as fh:
+        space = h5py.h5s.create_simple((1, *raw.row_shape))
+        dsid = h5py.h5d.create(fh.id, b'raw', h5py.h5t.py_create(dtype), space, dcpl=dcpl)
+        with _HDF5_LIBRARY_LOCK:
+            for offset, filter_mask, data in raw.chunks:
+                dsid.write_direct_chunk((0, *offset), data, filter_mask)
+        fh.flush()
+        image = fh.id.get_file_image()
+
+    fapl = h5py.h5p.create(h5py.h5p.FILE_ACCESS)
+    fapl.set_fapl_core(backing_store=False)
+    fapl.set_file_image(image)
+    with h5py.File(h5py.h5f.open(name.encode(), h5py.h5f.ACC_RDONLY, fapl=fapl)) as fh:
+        destArr = np.empty(raw.shape, dtype)
+        srcSlc = (0, *[slice(0, dim) for dim in raw.shape])
+        fh['raw'].read_direct(destArr, srcSlc, None)
+    return destArr
+
+
 # ------------------------- Accessor Object -----------------------------------
 
 
@@ -387,8 +505,9 @@ class HDF5_01_FileHandles(object):
         self.schema_shape: tuple = schema_shape
         self.schema_dtype: np.dtype = schema_dtype
         self._dflt_backend_opts: Optional[dict] = None
+        self._raw_write_layout: Optional[tuple] = None
 
-        self.rFp: HDF5_01_MapTypes = {}
+        self.rFp: HDF5_01_MapTypes = LazyOpenHandles()
         self.wFp: HDF5_01_MapTypes = {}
         self.Fp: HDF5_01_MapTypes = ChainMap(self.rFp, self.wFp)
         self.rDatasets = SizedDict(maxsize=100)
@@ -400,6 +519,10 @@ class HDF5_01_FileHandles(object):
         self.hMaxSize: Optional[int] = None
         self.hNextPath: Optional[int] = None
         self.hColsRemain: Optional[int] = None
+        # locations written by this process whose checksum need not be verified
+        # on read when ``trust_fresh_writes`` is enabled.
+        self.trust_fresh_writes: bool = False
+        self._fresh: set = set()
 
         self.STAGEDIR: Path = Path(self.path, DIR_DATA_STAGE, _FmtCode)
         self.REMOTEDIR: Path = Path(self.path, DIR_DATA_REMOTE, _FmtCode)
@@ -433,7 +556,7 @@ class HDF5_01_FileHandles(object):
         """ensure multiprocess operations can pickle relevant data.
         """
         self.__dict__.update(state)
-        self.rFp = {}
+        self.rFp = LazyOpenHandles()
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
         self.rDatasets = {}
@@ -449,6 +572,7 @@ class HDF5_01_FileHandles(object):
         """Nonstandard descriptor method. See notes in ``backend_opts.setter``.
         """
         self._dflt_backend_opts = val
+        self._raw_write_layout = None
         return
 
     @backend_opts.setter
@@ -525,6 +649,7 @@ class HDF5_01_FileHandles(object):
             self.hIdx = None
             self.hColsRemain = None
             self.w_uid = None
+            self._fresh.clear()
 
         for uid in list(self.rFp.keys()):
             with suppress(AttributeError):
@@ -629,6 +754,21 @@ class HDF5_01_FileHandles(object):
             raise ValueError(f'unknown value for opt arg `complib`: {complib}')
         return args
 
+    def _collection_shapes(self) -> Tuple[tuple, list]:
+        """chunk shape and (chunk aligned) row shape of collection datasets.
+        """
+        schema_shape = self.schema_shape
+        itemsize = np.dtype(self.schema_dtype).itemsize
+        expectedrows = COLLECTION_SIZE * COLLECTION_COUNT
+        maindim = 0
+
+        chunk_shape = calc_chunkshape(schema_shape, expectedrows, itemsize, maindim)
+        if chunk_shape == (1,) and schema_shape == ():
+            schema_shape = (1,)
+        req_chunks_per_dim = [math.ceil(i / j) for i, j in zip(schema_shape, chunk_shape)]
+        req_shape = [i * j for i, j in zip(req_chunks_per_dim, chunk_shape)]
+        return chunk_shape, req_shape
+
     def _create_schema(self, *, remote_operation: bool = False):
         """stores the shape and dtype as the schema of a column.
 
@@ -665,16 +805,10 @@ class HDF5_01_FileHandles(object):
         """
 
         # -------------------- Chunk & RDCC Vals ------------------------------
-        schema_shape = self.schema_shape
         itemsize = np.dtype(self.schema_dtype).itemsize
         expectedrows = COLLECTION_SIZE * COLLECTION_COUNT
-        maindim = 0
-
-        chunk_shape = calc_chunkshape(schema_shape, expectedrows, itemsize, maindim)
-        if chunk_shape == (1,) and schema_shape == ():
-            schema_shape = (1,)
-        req_chunks_per_dim = [math.ceil(i / j) for i, j in zip(schema_shape, chunk_shape)]
-        req_shape = [i * j for i, j in zip(req_chunks_per_dim, chunk_shape)]
+        chunk_shape, req_shape = self._collection_shapes()
+        req_chunks_per_dim = [i // j for i, j in zip(req_shape, chunk_shape)]
         chunk_nbytes = np.prod(chunk_shape) * itemsize
         nchunks = np.prod(req_chunks_per_dim)
 
@@ -766,7 +900,7 @@ class HDF5_01_FileHandles(object):
                     self.Fp[hashVal.uid][dsetCol].read_direct(destArr, srcSlc, None)
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                 except TypeError:
-                    self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
+                    self.rFp.opened(hashVal.uid)
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                     self.rDatasets[rdictkey].read_direct(destArr, srcSlc, None)
                 except KeyError:
@@ -786,7 +920,7 @@ class HDF5_01_FileHandles(object):
                     destArr = self.Fp[hashVal.uid][dsetCol][srcSlc]
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                 except TypeError:
-                    self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
+                    self.rFp.opened(hashVal.uid)
                     destArr = self.Fp[hashVal.uid][dsetCol][srcSlc]
                     self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                 except KeyError:
@@ -799,6 +933,9 @@ class HDF5_01_FileHandles(object):
                     else:
                         raise
 
+        location = (hashVal.uid, hashVal.dataset, hashVal.dataset_idx)
+        if self.trust_fresh_writes and location in self._fresh:
+            return destArr
         if xxh64_hexdigest(destArr) != hashVal.checksum:
             # try casting to check if dtype does not match for all zeros case
             destArr = destArr.astype(np.typeDict[self.Fp[hashVal.uid]['/'].attrs['schema_dtype_num']])
@@ -807,7 +944,8 @@ class HDF5_01_FileHandles(object):
                     f'DATA CORRUPTION Checksum {xxh64_hexdigest(destArr)} != recorded {hashVal}')
         return destArr
 
-    def write_data(self, array: np.ndarray, *, remote_operation: bool = False) -> bytes:
+    def write_data(self, array: np.ndarray, *, remote_operation: bool = False,
+                   checksum: Optional[str] = None) -> bytes:
         """verifies correctness of array data and performs write operation.
 
         Parameters
@@ -819,6 +957,10 @@ class HDF5_01_FileHandles(object):
             hdf5 dataset files will be created in the remote data dir instead
             of the stage directory. (default is False, which is for a regular
             access process)
+        checksum : Optional[str], optional, kwarg only
+            xxh64 hexdigest of ``array`` if already computed by the caller (ie.
+            alongside the content digest in a single pass over the data). If
+            None (default), the checksum is computed here.
 
         Returns
         -------
@@ -826,7 +968,20 @@ class HDF5_01_FileHandles(object):
             string identifying the collection dataset and collection dim-0 index
             which the array can be accessed at.
         """
-        checksum = xxh64_hexdigest(array)
+        if checksum is None:
+            checksum = xxh64_hexdigest(array)
+        self._next_write_location(remote_operation=remote_operation)
+        destSlc = (self.hIdx, *[slice(0, dim) for dim in array.shape])
+        self.wdset.write_direct(array, None, destSlc)
+        self.wdset.flush()
+        if self.trust_fresh_writes:
+            self._fresh.add((self.w_uid, str(self.hNextPath), self.hIdx))
+        res = hdf5_01_encode(self.w_uid, checksum, self.hNextPath, self.hIdx, array.shape)
+        return res
+
+    def _next_write_location(self, *, remote_operation: bool = False):
+        """advance to the next free collection index, creating files as needed.
+        """
         if self.w_uid in self.wFp:
             self.hIdx += 1
             if self.hIdx >= self.hMaxSize:
@@ -843,8 +998,113 @@ class HDF5_01_FileHandles(object):
         else:
             self._create_schema(remote_operation=remote_operation)
 
-        destSlc = (self.hIdx, *[slice(0, dim) for dim in array.shape])
-        self.wdset.write_direct(array, None, destSlc)
+    def _read_dataset(self, hashVal: HDF5_01_DataHashSpec) -> h5py.Dataset:
+        """collection dataset a record is stored in, opening its file if needed.
+        """
+        dsetCol = f'/{hashVal.dataset}'
+        rdictkey = f'{hashVal.uid}{dsetCol}'
+        if rdictkey in self.rDatasets:
+            return self.rDatasets[rdictkey]
+        try:
+            dset = self.Fp[hashVal.uid][dsetCol]
+        except TypeError:
+            self.rFp.opened(hashVal.uid)
+            dset = self.Fp[hashVal.uid][dsetCol]
+        except KeyError:
+            process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
+            if Path(process_dir, f'{hashVal.uid}.hdf5').is_file():
+                file_pth = self.DATADIR.joinpath(f'{hashVal.uid}.hdf5')
+                self.rFp[hashVal.uid] = h5py.File(file_pth, 'r', swmr=True, libver='latest')
+                dset = self.Fp[hashVal.uid][dsetCol]
+            else:
+                raise
+        self.rDatasets[rdictkey] = dset
+        return dset
+
+    def read_raw_chunks(self, hashVal: HDF5_01_DataHashSpec) -> HDF5_01_RawChunks:
+        """Read the compressed chunks of a sample without running the filter pipeline.
+
+        Parameters
+        ----------
+        hashVal : HDF5_01_DataHashSpec
+            record specification parsed from its serialized store val in lmdb.
+
+        Returns
+        -------
+        HDF5_01_RawChunks
+            compressed chunks (and the dataset layout they are valid for) of
+            every chunk intersecting the sample. The data is not verified
+            against the recorded checksum; that happens when it is decoded.
+        """
+        _require_raw_chunks_supported()
+        dset = self._read_dataset(hashVal)
+        dtype, row_shape, chunk_shape, filters = _dataset_layout(dset)
+        # scalar samples are stored in a row of shape (1,)
+        extent = (*hashVal.shape, *[1] * (len(row_shape) - len(hashVal.shape)))
+        offsets = product(*[range(0, dim, cdim) for dim, cdim in zip(extent, chunk_shape)])
+        raw_chunks = []
+        with _HDF5_LIBRARY_LOCK:
+            for offset in offsets:
+                filter_mask, data = dset.id.read_direct_chunk((hashVal.dataset_idx, *offset))
+                raw_chunks.append((offset, filter_mask, data))
+        return HDF5_01_RawChunks(checksum=hashVal.checksum,
+                                 shape=tuple(hashVal.shape),
+                                 dtype=dtype,
+                                 row_shape=row_shape,
+                                 chunk_shape=chunk_shape,
+                                 filters=filters,
+                                 chunks=tuple(raw_chunks))
+
+    def _write_layout(self) -> tuple:
+        """layout of the collection datasets written to by this accessor.
+        """
+        if self.wdset is not None:
+            return _dataset_layout(self.wdset)
+        if self._raw_write_layout is None:
+            chunk_shape, req_shape = self._collection_shapes()
+            optKwargs = self._dataset_opts(**self._dflt_backend_opts)
+            with h5py.File(random_string(), 'w', driver='core', backing_store=False) as fh:
+                dset = fh.create_dataset('layout',
+                                         shape=(COLLECTION_SIZE, *req_shape),
+                                         dtype=self.schema_dtype,
+                                         chunks=(1, *chunk_shape),
+                                         **optKwargs)
+                self._raw_write_layout = _dataset_layout(dset)
+        return self._raw_write_layout
+
+    def write_raw_chunks(self, raw: HDF5_01_RawChunks, *,
+                         remote_operation: bool = False) -> Optional[bytes]:
+        """Write the compressed chunks of a sample without running the filter pipeline.
+
+        Parameters
+        ----------
+        raw : HDF5_01_RawChunks
+            compressed chunks of a sample read by :meth:`read_raw_chunks`.
+        remote_operation : optional, kwarg only, bool
+            If this is a remote process which is adding data, any necessary
+            hdf5 dataset files will be created in the remote data dir instead
+            of the stage directory. (default is False, which is for a regular
+            access process)
+
+        Returns
+        -------
+        Optional[bytes]
+            hash record of the written sample, or None (and nothing is written)
+            if the chunks were compressed for a dataset layout other than the
+            one written by this accessor, or skipped a filter of the pipeline
+            (hdf5 does not respect the skipped filters of directly written
+            chunks until a file is reopened); such samples must be decoded with
+            :func:`decode_raw_chunks` and written with :meth:`write_data`.
+        """
+        _require_raw_chunks_supported()
+        if raw.layout != self._write_layout():
+            return None
+        if any(filter_mask for _, filter_mask, _ in raw.chunks):
+            return None
+        self._next_write_location(remote_operation=remote_operation)
+        with _HDF5_LIBRARY_LOCK:
+            for offset, filter_mask, data in raw.chunks:
+                self.wdset.id.write_direct_chunk((self.hIdx, *offset), data, filter_mask)
         self.wdset.flush()
-        res = hdf5_01_encode(self.w_uid, checksum, self.hNextPath, self.hIdx, array.shape)
+        res = hdf5_01_encode(self.w_uid, raw.checksum, self.hNextPath, self.hIdx, raw.shape)
         return res
@@ -94,6 +94,7 @@ from typing import Optional
 import lmdb
 from xxhash import xxh64_hexdigest
 
+from .handles import LazyOpenHandles
 from .specs import LMDB_31_DataHashSpec
 from ..constants import DIR_DATA_REMOTE, DIR_DATA_STAGE, DIR_DATA_STORE, DIR_DATA
 from ..op_state import reader_checkout_only, writer_checkout_only
@@ -167,7 +168,7 @@ class LMDB_31_FileHandles:
 
         self.path: Path = repo_path
 
-        self.rFp = {}
+        self.rFp = LazyOpenHandles()
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
 
@@ -204,7 +205,7 @@ class LMDB_31_FileHandles:
         """ensure multiprocess operations can pickle relevant data.
         """
         self.__dict__.update(state)
-        self.rFp = {}
+        self.rFp = LazyOpenHandles()
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
 
@@ -350,7 +351,7 @@ class LMDB_31_FileHandles:
                 if res is False:
                     raise RuntimeError(hashVal)
         except AttributeError:
-            self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
+            self.rFp.opened(hashVal.uid)
             return self.read_data(hashVal)
         except KeyError:
             process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
@@ -86,6 +86,7 @@ import numpy as np
 from numpy.lib.format import open_memmap
 from xxhash import xxh64_hexdigest
 
+from .handles import LazyOpenHandles
 from .specs import NUMPY_10_DataHashSpec
 from ..constants import DIR_DATA_REMOTE, DIR_DATA_STAGE, DIR_DATA_STORE, DIR_DATA
 from ..op_state import reader_checkout_only, writer_checkout_only
@@ -172,13 +173,17 @@ class NUMPY_10_FileHandles(object):
         self.schema_dtype = schema_dtype
         self._dflt_backend_opts: Optional[dict] = None
 
-        self.rFp: MutableMapping[str, np.memmap] = {}
+        self.rFp: MutableMapping[str, np.memmap] = LazyOpenHandles()
         self.wFp: MutableMapping[str, np.memmap] = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
 
         self.mode: str = None
         self.w_uid: str = None
         self.hIdx: int = None
+        # locations written by this process whose checksum need not be verified
+        # on read when ``trust_fresh_writes`` is enabled.
+        self.trust_fresh_writes: bool = False
+        self._fresh: set = set()
 
         self.STAGEDIR: Path = Path(self.repo_path, DIR_DATA_STAGE, _FmtCode)
         self.REMOTEDIR: Path = Path(self.repo_path, DIR_DATA_REMOTE, _FmtCode)
@@ -201,7 +206,7 @@ class NUMPY_10_FileHandles(object):
         """ensure multiprocess operations can pickle relevant data.
         """
         self.__dict__.update(state)
-        self.rFp = {}
+        self.rFp = LazyOpenHandles()
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
         self.open(mode=self.mode)
@@ -278,6 +283,7 @@ class NUMPY_10_FileHandles(object):
                 self.hIdx = None
             for k in list(self.wFp.keys()):
                 del self.wFp[k]
+            self._fresh.clear()
 
         for k in list(self.rFp.keys()):
             del self.rFp[k]
@@ -374,7 +380,7 @@ class NUMPY_10_FileHandles(object):
         try:
             res = self.Fp[hashVal.uid][srcSlc]
         except TypeError:
-            self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
+            self.rFp.opened(hashVal.uid)
             res = self.Fp[hashVal.uid][srcSlc]
         except KeyError:
             process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
@@ -386,12 +392,15 @@ class NUMPY_10_FileHandles(object):
                 raise
 
         out = np.array(res, dtype=res.dtype, order='C')
+        if self.trust_fresh_writes and (hashVal.uid, hashVal.collection_idx) in self._fresh:
+            return out
         if xxh64_hexdigest(out) != hashVal.checksum:
             raise RuntimeError(
                 f'DATA CORRUPTION Checksum {xxh64_hexdigest(out)} != recorded {hashVal}')
         return out
 
-    def write_data(self, array: np.ndarray, *, remote_operation: bool = False) -> bytes:
+    def write_data(self, array: np.ndarray, *, remote_operation: bool = False,
+                   checksum: Optional[str] = None) -> bytes:
         """writes array data to disk in the numpy_00 fmtBackend
 
         Parameters
@@ -401,13 +410,18 @@ class NUMPY_10_FileHandles(object):
         remote_operation : bool, optional, kwarg only
             True if writing in a remote operation, otherwise False. Default is
             False
+        checksum : Optional[str], optional, kwarg only
+            xxh64 hexdigest of ``array`` if already computed by the caller (ie.
+            alongside the content digest in a single pass over the data). If
+            None (default), the checksum is computed here.
 
         Returns
         -------
         bytes
             db hash record value specifying location information
         """
-        checksum = xxh64_hexdigest(array)
+        if checksum is None:
+            checksum = xxh64_hexdigest(array)
         if self.w_uid in self.wFp:
             self.hIdx += 1
             if self.hIdx >= COLLECTION_SIZE:
@@ -419,4 +433,6 @@ class NUMPY_10_FileHandles(object):
         destSlc = (self.hIdx, *[slice(0, x) for x in array.shape])
         self.wFp[self.w_uid][destSlc] = array
         self.wFp[self.w_uid].flush()
+        if self.trust_fresh_writes:
+            self._fresh.add((self.w_uid, self.hIdx))
         return numpy_10_encode(self.w_uid, checksum, self.hIdx, array.shape)
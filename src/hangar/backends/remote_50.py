@@ -78,6 +78,22 @@ def remote_50_encode(schema_hash: str = '') -> bytes:
     return f'50:{schema_hash}'.encode()
 
 
+class REMOTE_50_ReferenceSpec(REMOTE_50_DataHashSpec):
+    """Remote data hash spec which also records the digest of the referenced data.
+
+    Columns hold these in place of plain ``REMOTE_50_DataHashSpec`` so that a
+    remote referenced sample can be retrieved from the server when it is read.
+    """
+    __slots__ = ('digest',)
+
+    def __init__(self, backend: str, schema_hash: str, digest: str):
+        super().__init__(backend, schema_hash)
+        self.digest = digest
+
+    def __reduce__(self):
+        return (self.__class__, (self.backend, self.schema_hash, self.digest))
+
+
 # ------------------------- Accessor Object -----------------------------------
 
 
@@ -108,6 +124,8 @@ class REMOTE_50_Handler(object):
         self.repo_path = repo_path
         self._dflt_backend_opts: Optional[dict] = None
         self._mode: Optional[str] = None
+        # set when samples should be retrieved from a remote as they are read.
+        self.read_through = None
 
     def __enter__(self):
         return self
@@ -121,6 +139,7 @@ class REMOTE_50_Handler(object):
         """
         self.close()
         state = self.__dict__.copy()
+        state['read_through'] = None
         return state
 
     def __setstate__(self, state: dict) -> None:  # pragma: no cover
@@ -170,6 +189,8 @@ class REMOTE_50_Handler(object):
         return
 
     def read_data(self, hashVal: REMOTE_50_DataHashSpec) -> None:
+        if self.read_through is not None:
+            return self.read_through.read(hashVal)
         raise FileNotFoundError(
             f'data hash spec: {REMOTE_50_DataHashSpec} does not exist on this machine. '
             f'Perform a `data-fetch` operation to retrieve it from the remote server.')
@@ -0,0 +1,57 @@
+"""Backend accessors shared by the work of a pool of worker processes.
+
+Bulk export, integrity verification, and the server read pool each read
+samples in worker processes. Backend accessors cannot be sent between
+processes, so every worker opens its own read-only set of accessors when it is
+started (:func:`open_worker_accessors` is passed as the ``initializer`` of the
+pool), and looks them up in :data:`WORKER_ACCESSORS` to read the specs it is
+sent.
+"""
+import atexit
+from pathlib import Path
+from typing import Dict
+
+from . import BACKEND_ACCESSOR_MAP, BACKEND_IS_LOCAL_MAP
+
+# backend accessors opened in (and private to) each worker process.
+WORKER_ACCESSORS: Dict[str, object] = {}
+
+
+def open_worker_accessors(repo_path: str, local_only: bool = True):
+    """Open read-only backend accessors in a newly started worker process.
+
+    Parameters
+    ----------
+    repo_path : str
+        path to the hangar repository directory data is read from.
+    local_only : bool, optional
+        if True (default), only accessors of backends storing data on the
+        local disk are opened.
+    """
+    for backend, accessor in BACKEND_ACCESSOR_MAP.items():
+        if (accessor is None) or (local_only and not BACKEND_IS_LOCAL_MAP[backend]):
+            continue
+        WORKER_ACCESSORS[backend] = accessor(
+            repo_path=Path(repo_path),
+            schema_shape=None,
+            schema_dtype=None)
+        WORKER_ACCESSORS[backend].open(mode='r')
+    atexit.register(close_worker_accessors)
+
+
+def close_worker_accessors():
+    for accessor in WORKER_ACCESSORS.values():
+        accessor.close()
+    WORKER_ACCESSORS.clear()
+
+
+def spec_location(spec) -> tuple:
+    """Sort key placing samples in the order they are stored in backend files.
+    """
+    # backends index samples within a file by one of these (row ids of the lmdb
+    # backends are strings generated in lexicographic order).
+    for attr in ('dataset_idx', 'collection_idx', 'row_idx'):
+        idx = getattr(spec, attr, None)
+        if idx is not None:
+            break
+    return spec.backend, getattr(spec, 'uid', ''), getattr(spec, 'dataset', ''), idx
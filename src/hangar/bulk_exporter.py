@@ -0,0 +1,239 @@
+"""Bulk exporter methods to write large quantities of column data out of Hangar.
+
+Exporting samples one at a time through a checkout (as the ``hangar export``
+CLI does by default) reads, encodes, and writes every sample on a single core.
+The methods in this module distribute the work over a pool of worker
+processes:
+
+1. The backend location of every requested sample is looked up in the parent
+   process, and samples are sorted by location (so samples stored next to each
+   other in a backend file are read together) before being split into batches.
+
+2. Each worker opens its own read-only backend accessors, reads a batch of
+   samples, and either saves every sample through an external ``save`` plugin
+   (one file per sample), or writes the whole batch as a single archive shard
+   (``tar`` of ``.npy`` members, or ``.npz``).
+
+3. Output files are written concurrently by the workers; the parent process
+   only schedules batches and tracks progress.
+"""
+__all__ = ('ARCHIVE_FORMATS', 'run_bulk_export')
+
+import io
+import multiprocessing as mp
+import os
+import tarfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .backends import BACKEND_IS_LOCAL_MAP
+from .backends.worker import WORKER_ACCESSORS, open_worker_accessors, spec_location
+from .constants import DIR_HANGAR
+from .utils import calc_num_process_workers
+
+if TYPE_CHECKING:
+    from .repository import Repository
+
+KeyType = Union[str, int]
+
+# archive formats which batches of samples can be exported into.
+ARCHIVE_FORMATS = ('tar', 'npz')
+
+
+def _sample_detail(key: KeyType) -> str:
+    """Sample name and type formatted as ``sample_name_type:sample_name``.
+    """
+    return f'{type(key).__name__}:{key}'
+
+
+def _read_batch(batch: Sequence[Tuple[KeyType, tuple]]) -> Iterator[Tuple[KeyType, np.ndarray]]:
+    for key, spec in batch:
+        yield key, WORKER_ACCESSORS[spec.backend].read_data(spec)
+
+
+def _npy_bytes(data) -> bytes:
+    buf = io.BytesIO()
+    np.save(buf, data, allow_pickle=False)
+    return buf.getvalue()
+
+
+def _write_tar_shard(fpath: Path, samples: Iterator[Tuple[KeyType, np.ndarray]]):
+    with tarfile.open(fpath, mode='w') as tf:
+        for key, data in samples:
+            raw = _npy_bytes(data)
+            info = tarfile.TarInfo(name=f'{_sample_detail(key)}.npy')
+            info.size = len(raw)
+            tf.addfile(info, io.BytesIO(raw))
+
+
+def _write_npz_shard(fpath: Path, samples: Iterator[Tuple[KeyType, np.ndarray]]):
+    with open(fpath, 'wb') as f:
+        np.savez(f, **{_sample_detail(key): data for key, data in samples})
+
+
+_SHARD_WRITERS: Dict[str, Callable[[Path, Iterator[Tuple[KeyType, np.ndarray]]], None]] = {
+    'tar': _write_tar_shard,
+    'npz': _write_npz_shard,
+}
+
+
+def _export_batch_files(batch, outdir, extension, plugin, plugin_kwargs) -> int:
+    """Save every sample of a batch to its own file via the external plugins.
+    """
+    from . import external
+
+    num = 0
+    for key, data in _read_batch(batch):
+        external.save(data, outdir, _sample_detail(key), extension, plugin, **plugin_kwargs)
+        num += 1
+    return num
+
+
+def _export_batch_shard(batch, fpath, archive) -> int:
+    """Write every sample of a batch to a single archive shard.
+
+    The shard is written to a temporary file which is renamed once complete, so
+    a partially written shard is never left at the final path.
+    """
+    fpath = Path(fpath)
+    tmp_fpath = fpath.with_name(f'.{fpath.name}.tmp')
+    _SHARD_WRITERS[archive](tmp_fpath, _read_batch(batch))
+    os.replace(tmp_fpath, fpath)
+    return len(batch)
+
+
+def run_bulk_export(
+        repo: 'Repository',
+        column: str,
+        outdir: Union[str, Path],
+        *,
+        commit: str = '',
+        keys: Optional[Sequence[KeyType]] = None,
+        extension: Optional[str] = None,
+        plugin: Optional[str] = None,
+        plugin_kwargs: Optional[dict] = None,
+        archive: Optional[str] = None,
+        batch_size: int = 1_000,
+        ncpus: int = 0,
+        progress: Optional[Callable[[int], None]] = None
+) -> List[Path]:
+    """Export the samples of a flat column with multiple worker processes.
+
+    By default every sample is saved to its own file with the external
+    ``save`` plugin selected by ``plugin`` / ``extension`` (exactly as the
+    ``hangar export`` CLI does). If ``archive`` is set, samples are instead
+    written into archive shards of (at most) ``batch_size`` samples each,
+    named ``{column}-{shard_index:05d}.{archive}``:
+
+    *  ``tar``: one ``.npy`` file member per sample.
+
+    *  ``npz``: one array per sample (readable with :func:`numpy.load`).
+
+    Archive members are named ``{key_type}:{key}`` (ie. ``str:foo`` or
+    ``int:10``), following the sample naming convention of the plugins.
+
+    Parameters
+    ----------
+    repo : 'Repository'
+        Initialized repository object to export data from.
+    column : str
+        Name of the (flat) column to export.
+    outdir : Union[str, Path]
+        Existing directory to write exported files into.
+    commit : str, optional
+        Commit digest to export data as it existed at. By default (``''``) the
+        head commit of the staging area branch.
+    keys : Optional[Sequence[KeyType]], optional
+        Sample keys to export. By default, every sample in the column.
+    extension : Optional[str], optional
+        File format to save samples as (when ``archive`` is not set).
+    plugin : Optional[str], optional
+        Name of the save plugin to use, by default inferred from ``extension``.
+    plugin_kwargs : Optional[dict], optional
+        Keyword arguments passed to the save plugin.
+    archive : Optional[str], optional
+        One of :data:`ARCHIVE_FORMATS` to export samples into archive shards
+        rather than individual files, by default None.
+    batch_size : int, optional
+        Number of samples read and written by a worker in one task (and the
+        number of samples per archive shard), by default 1_000.
+    ncpus : int, optional
+        Number of worker processes. If <= 0, then the default is set to
+        ``num_cpus / 2``.
+    progress : Optional[Callable[[int], None]], optional
+        Called with the number of samples exported every time a batch completes.
+
+    Returns
+    -------
+    List[Path]
+        Paths of the archive shards written (empty if ``archive`` is not set).
+
+    Raises
+    ------
+    ValueError
+        If the column is not a flat column, if any requested sample is only
+        a reference to data on a remote server, or if an argument is invalid.
+    KeyError
+        If the column or a requested sample key does not exist.
+    """
+    if batch_size < 1:
+        raise ValueError(f'batch_size: {batch_size} must be >= 1')
+    if (archive is not None) and (archive not in ARCHIVE_FORMATS):
+        raise ValueError(f'archive: {archive} must be one of {ARCHIVE_FORMATS}')
+    outdir = Path(outdir)
+    if not outdir.is_dir():
+        raise ValueError(f'outdir: {outdir} is not an existing directory')
+    plugin_kwargs = plugin_kwargs if plugin_kwargs is not None else {}
+
+    with closing(repo.checkout(commit=commit)) as co:
+        col = co.columns[column]
+        if col.column_layout != 'flat':
+            raise ValueError(f'Column: {column} is not a flat column.')
+        if keys is None:
+            keys = list(col.keys())
+        key_specs = [(key, col.backend_spec(key)) for key in keys]
+
+    remote = [key for key, spec in key_specs if not BACKEND_IS_LOCAL_MAP[spec.backend]]
+    if remote:
+        raise ValueError(
+            f'{len(remote)} samples of column {column} (ie. {remote[:5]}) only reference '
+            f'data on a remote server; fetch the data before exporting.')
+    # read samples stored near each other in backend files together.
+    key_specs.sort(key=lambda key_spec: spec_location(key_spec[1]))
+
+    batches = (key_specs[start:start + batch_size]
+               for start in range(0, len(key_specs), batch_size))
+    shard_paths = []
+    ncpu = calc_num_process_workers(ncpus)
+    with ProcessPoolExecutor(max_workers=ncpu,
+                             mp_context=mp.get_context(),
+                             initializer=open_worker_accessors,
+                             initargs=(str(Path(repo.path, DIR_HANGAR)),)) as pool:
+
+        def submit(shard_idx, batch):
+            if archive is None:
+                return pool.submit(
+                    _export_batch_files, batch, str(outdir), extension, plugin, plugin_kwargs)
+            fpath = outdir.joinpath(f'{column}-{shard_idx:05d}.{archive}')
+            shard_paths.append(fpath)
+            return pool.submit(_export_batch_shard, batch, str(fpath), archive)
+
+        batches = enumerate(batches)
+        pending = deque(submit(*item) for item in islice(batches, 2 * ncpu))
+        try:
+            while pending:
+                num = pending.popleft().result()
+                for item in islice(batches, 1):
+                    pending.append(submit(*item))
+                if progress is not None:
+                    progress(num)
+        finally:
+            for future in pending:
+                future.cancel()
+    return shard_paths
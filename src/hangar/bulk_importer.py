@@ -56,7 +56,7 @@ Rough outline of steps:
     6. If all successful, make isolated data known to repository core,
        otherwise abort to starting state.
 """
-__all__ = ('UDF_Return', 'run_bulk_import')
+__all__ = ('UDF_Return', 'BulkImportReport', 'run_bulk_import', 'run_bulk_import_stream')
 
 import concurrent.futures
 import multiprocessing as mp
@@ -66,17 +66,18 @@ import pickle
 import queue
 import random
 import shutil
-import warnings
+import time
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing, contextmanager
 from inspect import signature, isgeneratorfunction
+from itertools import chain, islice
 from math import ceil
 from operator import attrgetter, methodcaller
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import (
-    NamedTuple, Union, Tuple, List, Iterator,
-    Callable, Dict, Optional, TYPE_CHECKING
+    NamedTuple, Union, Tuple, List, Iterable, Iterator,
+    Callable, Dict, Optional, Set, TYPE_CHECKING
 )
 
 import cloudpickle
@@ -93,19 +94,26 @@ from .records.column_parsers import (
     nested_data_db_key_from_names,
     data_record_db_val_from_digest,
 )
-from .txnctx import TxnRegister
-from .utils import grouper, is_valid_directory_path, bound
+from .txnctx import bulk_put_records
+from .utils import is_valid_directory_path, bound, calc_num_process_workers
 
 if TYPE_CHECKING:
     import lmdb
+    from multiprocessing.shared_memory import SharedMemory
     from . import Repository
     from .typesystem.base import ColumnBase
     from .columns import ModifierTypes
+    from .checkout import WriterCheckout
 
 
 UDF_T = Callable[..., Iterator['UDF_Return']]
 KeyType = Union[str, int]
 
+# ndarray kwargs at least this large are sent to workers through shared memory.
+_SHARED_ARRAY_MIN_NBYTES = 1_000_000
+
+_COMPLETED_MSG = 'Bulk data importer operation completed successfully'
+
 
 # ----------------- User Facing Potions of Bulk Data Loader -------------------
 
@@ -144,6 +152,28 @@ class UDF_Return(NamedTuple):
         return True
 
 
+class BulkImportReport(NamedTuple):
+    """Summary of the work performed by a bulk import operation.
+
+    Attributes
+    ----------
+    num_samples: int
+        number of sample references recorded in the columns.
+    num_data_written: int
+        number of data pieces actually written to backend storage. Samples whose
+        data was already stored in the repository (or was yielded more than once
+        during the import) only record a reference to the existing data.
+    """
+    num_samples: int
+    num_data_written: int
+
+    @property
+    def num_deduplicated(self) -> int:
+        """Number of samples which did not require any data to be written.
+        """
+        return self.num_samples - self.num_data_written
+
+
 def run_bulk_import(
         repo: 'Repository',
         branch_name: str,
@@ -152,8 +182,9 @@ def run_bulk_import(
         udf_kwargs: List[dict],
         *,
         ncpus: int = 0,
-        autocommit: bool = True
-):
+        autocommit: bool = True,
+        single_pass: bool = False
+) -> BulkImportReport:
     """Perform a bulk import operation from a given user-defined function.
 
     In order to provide for arbitrary input data sources along with ensuring
@@ -196,6 +227,13 @@ def run_bulk_import(
        processing time, we recomend trying to yield data pieces which are likely
        to be unique first from the UDF.
 
+    *  If the UDF is expensive to run (ie. decoding images or video), set
+       ``single_pass=True``. Every input is then passed to the UDF exactly once;
+       data is hashed and immediately written by the worker which produced it,
+       unless the digest is already stored in the repository or was claimed by
+       another worker. Data which is mostly duplicated (or already stored) is
+       still only written once, but the UDF can no longer be short circuited.
+
     Warnings
     --------
 
@@ -319,9 +357,15 @@ def run_bulk_import(
     autocommit : bool, optional, default=True
         Control whether a commit should be made after successfully importing the
         specified data to the staging area of the branch.
-    """
-    _BATCH_SIZE = 10  # TODO: Is this necessary?
+    single_pass : bool, optional, default=False
+        If True, run the UDF once per input, hashing and writing data in the
+        same pass rather than constructing (and pruning) a task recipe first.
 
+    Returns
+    -------
+    BulkImportReport
+        number of samples imported and data pieces written to disk.
+    """
     columns: Dict[str, 'ModifierTypes'] = {}
     column_layouts: Dict[str, str] = {}
     schemas: Dict[str, 'ColumnBase'] = {}
@@ -338,52 +382,70 @@ def run_bulk_import(
         _check_user_input_func(columns=columns, udf=udf, udf_kwargs=udf_kwargs)
         serialized_udf = _serialize_udf(udf)
 
-        ncpu = _process_num_cpus(ncpus)
+        ncpu = calc_num_process_workers(ncpus)
         print(f'Using {ncpu} worker processes')
 
-        recipe = _run_prepare_recipe(
-            column_layouts=column_layouts,
-            schemas=schemas,
-            udf=serialized_udf,
-            udf_kwargs=udf_kwargs,
-            ncpu=ncpu,
-            batch_size=_BATCH_SIZE)
-        print('Unifying naieve recipe task set.')
-        unified_recipe = _unify_recipe_contents(recipe)
-        print('Pruning redundant steps & eliminating tasks on data stored in hangar.')
-        reduced_recipe = _reduce_recipe_on_required_digests(recipe, co._hashenv)
-
-        nsteps_reduced_recipe = _num_steps_in_task_list(reduced_recipe)
-        optim_percent = ((len(unified_recipe) - nsteps_reduced_recipe) / len(unified_recipe)) * 100
-        print(f'Reduced recipe workload tasks by: {optim_percent:.2f}%')
-        print(f' - Num tasks for naieve ingest  : {len(unified_recipe)}')
-        print(f' - Num tasks after optimization : {nsteps_reduced_recipe}')
-
         hangardirpth = repo._repo_path
-        if len(reduced_recipe) >= 1:
-            print('Starting multiprocessed data importer.')
-            with TemporaryDirectory(dir=str(hangardirpth)) as tmpdirname:
+        if single_pass:
+            print('Starting single pass multiprocessed data importer.')
+            stored_digests = set(hashs.HashQuery(co._hashenv).gen_all_hash_keys_db())
+            backends = {name: col.backend for name, col in columns.items()}
+            with TemporaryDirectory(dir=str(hangardirpth)) as tmpdirname, mp.Manager() as manager, \
+                    tqdm(total=len(udf_kwargs), desc='Importing data (single pass)') as pbar:
                 tmpdirpth = _mock_hangar_directory_structure(tmpdirname)
-                written_data_steps = _run_write_recipe_data(
+                unified_recipe, written_data_steps = _run_prepare_write_recipe_data(
                     tmp_dir=tmpdirpth,
-                    columns=columns,
+                    backends=backends,
                     schemas=schemas,
+                    column_layouts=column_layouts,
                     udf=serialized_udf,
-                    recipe_tasks=reduced_recipe,
+                    udf_kwargs=udf_kwargs,
+                    stored_digests=stored_digests,
+                    claimed_digests=manager.dict(),
+                    pbar=pbar,
                     ncpu=ncpu,
-                    batch_size=_BATCH_SIZE)
+                    num_tasks=len(udf_kwargs))
+                print(f' - Num samples imported  : {len(unified_recipe)}')
+                print(f' - Num data pieces written : {len(written_data_steps)}')
                 print(f'Finalizing written data pieces in hangar repo directory...')
                 _move_tmpdir_data_files_to_repodir(repodir=hangardirpth, tmpdir=tmpdirpth)
-            _write_digest_to_bespec_mapping(
-                executed_steps=written_data_steps,
-                hashenv=co._hashenv,
-                stagehashenv=co._stagehashenv)
         else:
-            print('No actions requiring the data import remain after optimizations.')
-
-        print(f'Mapping full recipe requested via UDF to optimized task set actually processed.')
-        _write_full_recipe_sample_key_to_digest_mapping(sample_steps=unified_recipe, dataenv=co._stageenv)
+            recipe = _run_prepare_recipe(
+                column_layouts=column_layouts,
+                schemas=schemas,
+                udf=serialized_udf,
+                udf_kwargs=udf_kwargs,
+                ncpu=ncpu)
+            print('Unifying naieve recipe task set.')
+            unified_recipe = _unify_recipe_contents(recipe)
+            print('Pruning redundant steps & eliminating tasks on data stored in hangar.')
+            reduced_recipe = _reduce_recipe_on_required_digests(recipe, co._hashenv)
+
+            nsteps_reduced_recipe = _num_steps_in_task_list(reduced_recipe)
+            optim_percent = ((len(unified_recipe) - nsteps_reduced_recipe) / len(unified_recipe)) * 100
+            print(f'Reduced recipe workload tasks by: {optim_percent:.2f}%')
+            print(f' - Num tasks for naieve ingest  : {len(unified_recipe)}')
+            print(f' - Num tasks after optimization : {nsteps_reduced_recipe}')
+
+            written_data_steps = []
+            if len(reduced_recipe) >= 1:
+                print('Starting multiprocessed data importer.')
+                with TemporaryDirectory(dir=str(hangardirpth)) as tmpdirname:
+                    tmpdirpth = _mock_hangar_directory_structure(tmpdirname)
+                    written_data_steps = _run_write_recipe_data(
+                        tmp_dir=tmpdirpth,
+                        columns=columns,
+                        schemas=schemas,
+                        udf=serialized_udf,
+                        recipe_tasks=reduced_recipe,
+                        ncpu=ncpu)
+                    print(f'Finalizing written data pieces in hangar repo directory...')
+                    _move_tmpdir_data_files_to_repodir(repodir=hangardirpth, tmpdir=tmpdirpth)
+            else:
+                print('No actions requiring the data import remain after optimizations.')
+            print(f'Mapping full recipe requested via UDF to optimized task set actually processed.')
 
+        _record_imported_contents(co, unified_recipe, written_data_steps)
         if autocommit:
             print(f'autocommiting changes.')
             co.commit(f'Auto commit after bulk import of {len(unified_recipe)} samples to '
@@ -391,8 +453,141 @@ def run_bulk_import(
         else:
             print(f'skipping autocommit')
 
-        print('Buld data importer operation completed successfuly')
-        return
+        print(_COMPLETED_MSG)
+        return BulkImportReport(len(unified_recipe), len(written_data_steps))
+
+
+def run_bulk_import_stream(
+        repo: 'Repository',
+        branch_name: str,
+        column_names: List[str],
+        udf: UDF_T,
+        udf_kwargs: Iterable[dict],
+        *,
+        ncpus: int = 0,
+        checkpoint_every: int = 100_000,
+        autocommit: bool = True
+) -> BulkImportReport:
+    """Perform a bulk import operation from an input stream of arbitrary length.
+
+    This is a streaming variant of :func:`run_bulk_import`, accepting any
+    iterable (ie. a generator) of UDF keyword-arg dictionaries rather than a
+    fully materialized list. Inputs are consumed lazily as worker processes
+    become available (at most a few batches of inputs are queued at any time),
+    and every input is passed to the UDF exactly once (as with the
+    ``single_pass`` mode of :func:`run_bulk_import`).
+
+    The import is performed in segments of ``checkpoint_every`` inputs. At the
+    end of each segment, written data and sample references are made known to
+    the repository, and (if ``autocommit``) committed. Only the sample
+    references of the current segment are held in memory.
+
+    Notes
+    -----
+
+    *  Each segment is an all-or-nothing operation. If the import fails, every
+       segment before the failure is kept (and committed if ``autocommit``),
+       while no change made in the failed segment is recorded.
+
+    *  The pre-run sanity check is performed on (at most) the first 100 inputs
+       of the stream only.
+
+    Parameters
+    ----------
+    repo : 'Repository'
+        Initialized repository object to import data into.
+    branch_name : str
+        Name of the branch to checkout and import data into.
+    column_names : List[str]
+        Names of all columns which data should be saved to.
+    udf : UDF_T
+        User-Defined Function (generator style) yielding :class:`~.UDF_Return`
+        instances, see :func:`run_bulk_import`.
+    udf_kwargs : Iterable[dict]
+        Iterable of keyword argument dictionaries which are individually unpacked
+        as inputs into the user-defined function (UDF).
+    ncpus : int, optional, default=0
+        Number of Parallel processes to read data files & write to hangar backend stores
+        in. If <= 0, then the default is set to ``num_cpus / 2``.
+    checkpoint_every : int, optional, default=100_000
+        Number of inputs processed in a segment before a checkpoint is made.
+    autocommit : bool, optional, default=True
+        Control whether a commit should be made at every checkpoint. If False,
+        checkpointed data is recorded in the staging area of the branch.
+
+    Returns
+    -------
+    BulkImportReport
+        number of samples imported and data pieces written to disk (totals
+        over every segment).
+    """
+    _NUM_CHECK_INPUTS = 100
+
+    if checkpoint_every < 1:
+        raise ValueError(f'checkpoint_every: {checkpoint_every} must be >= 1')
+
+    columns: Dict[str, 'ModifierTypes'] = {}
+    schemas: Dict[str, 'ColumnBase'] = {}
+    backends: Dict[str, str] = {}
+    column_layouts: Dict[str, str] = {}
+
+    with closing(repo.checkout(write=True, branch=branch_name)) as co:
+        for name in column_names:
+            _col = co.columns[name]
+            columns[name] = _col
+            schemas[name] = _col._schema
+            backends[name] = _col.backend
+            column_layouts[name] = _col.column_layout
+
+        udf_kwargs = iter(udf_kwargs)
+        head = list(islice(udf_kwargs, _NUM_CHECK_INPUTS))
+        if len(head) == 0:
+            print('No input provided to bulk importer.')
+            return BulkImportReport(0, 0)
+        print(f'Validating Reader Function and Argument Input')
+        _check_user_input_func(columns=columns, udf=udf, udf_kwargs=head)
+        serialized_udf = _serialize_udf(udf)
+        udf_kwargs = chain(head, udf_kwargs)
+
+        ncpu = calc_num_process_workers(ncpus)
+        print(f'Using {ncpu} worker processes')
+
+        hangardirpth = repo._repo_path
+        stored_digests = set(hashs.HashQuery(co._hashenv).gen_all_hash_keys_db())
+        num_checkpoints = num_samples = num_written = 0
+        with mp.Manager() as manager, tqdm(desc='Importing data (streaming)') as pbar:
+            claimed_digests = manager.dict()
+            for first in udf_kwargs:
+                segment = chain((first,), islice(udf_kwargs, checkpoint_every - 1))
+                with TemporaryDirectory(dir=str(hangardirpth)) as tmpdirname:
+                    tmpdirpth = _mock_hangar_directory_structure(tmpdirname)
+                    contents, written_data_steps = _run_prepare_write_recipe_data(
+                        tmp_dir=tmpdirpth,
+                        backends=backends,
+                        schemas=schemas,
+                        column_layouts=column_layouts,
+                        udf=serialized_udf,
+                        udf_kwargs=segment,
+                        stored_digests=stored_digests,
+                        claimed_digests=claimed_digests,
+                        pbar=pbar,
+                        ncpu=ncpu)
+                    _move_tmpdir_data_files_to_repodir(repodir=hangardirpth, tmpdir=tmpdirpth)
+                _record_imported_contents(co, contents, written_data_steps)
+                stored_digests.update(
+                    hash_data_db_key_from_raw_key(step.digest) for step in written_data_steps)
+
+                num_checkpoints += 1
+                num_samples += len(contents)
+                num_written += len(written_data_steps)
+                if autocommit:
+                    co.commit(f'Auto commit after bulk import checkpoint {num_checkpoints} '
+                              f'({len(contents)} samples) to column {column_names} '
+                              f'on branch {branch_name}')
+
+        print(f'Imported {num_samples} samples in {num_checkpoints} checkpoints.')
+        print(_COMPLETED_MSG)
+        return BulkImportReport(num_samples, num_written)
 
 
 # ---------------- Internal Implementation of Bulk Data Loader ----------------
@@ -456,30 +651,6 @@ def _deserialize_udf(raw: bytes) -> UDF_T:
     return udf
 
 
-def _process_num_cpus(ncpus: int) -> int:
-    """Determine how many workerprocesses to spin up in bulk importer
-
-    Parameters
-    ----------
-    ncpus: int
-        User specified number of worker processes. If <= 0 set to num CPU cores / 2.
-
-    Returns
-    -------
-    int
-    """
-    node_cpus = os.cpu_count()
-    if ncpus <= 0:
-        cpu_try = ceil(node_cpus / 2)
-        ncpus = bound(1, node_cpus, cpu_try)
-    elif ncpus > node_cpus:
-        warnings.warn(
-            f'Input number of CPUs exceeds maximum on node. {ncpus} > {node_cpus}',
-            category=UserWarning
-        )
-    return ncpus
-
-
 def _check_user_input_func(
         columns,
         udf: UDF_T,
@@ -578,7 +749,10 @@ class _MPQueue(mpq.Queue):
 
     def safe_put(self, item, timeout=0.5) -> bool:
         try:
-            self.put(item, False, timeout)
+            if timeout is None:
+                self.put(item, False)
+            else:
+                self.put(item, True, timeout)
             return True
         except queue.Full:
             return False
@@ -596,7 +770,304 @@ class _MPQueue(mpq.Queue):
         return num_left
 
 
-class _BatchProcessPrepare(mp.Process):
+# ------------------------- Work Distribution ---------------------------------
+
+
+class _SharedArray(NamedTuple):
+    """Reference to an array argument copied into shared memory by the parent.
+    """
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def _share_large_arrays(task: Union[dict, _Task], shms: List['SharedMemory']) -> Union[dict, _Task]:
+    """Move large ndarray kwargs of a task into shared memory.
+
+    Passing a large array through a ``mp.Queue`` pickles it, pushes it through
+    a pipe, and unpickles it in the worker. Instead, the array is copied once
+    into a shared memory block which the worker copies it back out of. On
+    python versions without :mod:`multiprocessing.shared_memory` (< 3.8) the
+    task is returned unchanged, and arrays are pickled through the queue.
+
+    Parameters
+    ----------
+    task
+        udf kwargs dict or :class:`_Task` to send to a worker.
+    shms
+        list which created shared memory blocks are appended to. The caller
+        must unlink them once the worker is finished with the task.
+    """
+    udf_kwargs = task.udf_kwargs if isinstance(task, _Task) else task
+    if not isinstance(udf_kwargs, dict):
+        return task
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:
+        return task
+
+    shared_kwargs = None
+    for k, v in udf_kwargs.items():
+        if isinstance(v, np.ndarray) and (v.nbytes >= _SHARED_ARRAY_MIN_NBYTES):
+            shm = SharedMemory(create=True, size=v.nbytes)
+            np.ndarray(v.shape, dtype=v.dtype, buffer=shm.buf)[...] = v
+            shms.append(shm)
+            if shared_kwargs is None:
+                shared_kwargs = dict(udf_kwargs)
+            shared_kwargs[k] = _SharedArray(shm.name, v.shape, v.dtype.str)
+    if shared_kwargs is None:
+        return task
+    return task._replace(udf_kwargs=shared_kwargs) if isinstance(task, _Task) else shared_kwargs
+
+
+def _attach_shared_arrays(task: Union[dict, _Task]) -> Union[dict, _Task]:
+    """Inverse of :func:`_share_large_arrays`, run in the worker process.
+    """
+    udf_kwargs = task.udf_kwargs if isinstance(task, _Task) else task
+    if not isinstance(udf_kwargs, dict):
+        return task
+    if not any(isinstance(v, _SharedArray) for v in udf_kwargs.values()):
+        return task
+    from multiprocessing.shared_memory import SharedMemory
+
+    attached_kwargs = dict(udf_kwargs)
+    for k, v in udf_kwargs.items():
+        if isinstance(v, _SharedArray):
+            shm = SharedMemory(name=v.name)
+            try:
+                attached_kwargs[k] = np.ndarray(v.shape, dtype=v.dtype, buffer=shm.buf).copy()
+            finally:
+                shm.close()
+    return task._replace(udf_kwargs=attached_kwargs) if isinstance(task, _Task) else attached_kwargs
+
+
+def _task_payload_nbytes(task: Union[dict, _Task]) -> int:
+    udf_kwargs = task.udf_kwargs if isinstance(task, _Task) else task
+    if not isinstance(udf_kwargs, dict):
+        return 0
+    return sum(v.nbytes for v in udf_kwargs.values() if isinstance(v, np.ndarray))
+
+
+class _AdaptiveBatchSizer(object):
+    """Size batches of tasks sent to workers from the observed task latency.
+
+    Batches are sized so a worker takes about ``target_seconds`` to process
+    each one: large enough that queue overhead is negligible for fast tasks,
+    small enough that slow tasks are spread across every worker. When the
+    total number of tasks is known, batches shrink as the end of the work
+    approaches (at most ``1 / (2 * num_workers)`` of the remaining tasks), so
+    a single worker is never left processing a large batch on its own.
+
+    Parameters
+    ----------
+    num_workers
+        number of worker processes.
+    target_seconds
+        desired time for a worker to process one batch.
+    max_size
+        maximum number of tasks in a batch.
+    max_nbytes
+        maximum size of the array arguments of tasks in a batch.
+    """
+
+    def __init__(self, num_workers: int, *,
+                 target_seconds: float = 0.5,
+                 max_size: int = 1000,
+                 max_nbytes: int = 64_000_000):
+        self.num_workers = num_workers
+        self.target_seconds = target_seconds
+        self.max_size = max_size
+        self.max_nbytes = max_nbytes
+        self.seconds_per_task: Optional[float] = None
+
+    def record(self, num_tasks: int, seconds: float):
+        """Update the task latency estimate with the timing of a processed batch.
+        """
+        if num_tasks <= 0:
+            return
+        latency = seconds / num_tasks
+        if self.seconds_per_task is None:
+            self.seconds_per_task = latency
+        else:
+            self.seconds_per_task = 0.7 * self.seconds_per_task + 0.3 * latency
+
+    def size(self, num_remaining: Optional[int] = None) -> int:
+        """Number of tasks to place in the next batch.
+        """
+        if self.seconds_per_task is None:
+            # latency is measured on small batches before sending larger ones.
+            size = 1
+        else:
+            size = int(self.target_seconds / max(self.seconds_per_task, 1e-6))
+        if num_remaining is not None:
+            size = min(size, ceil(num_remaining / (2 * self.num_workers)))
+        return bound(1, self.max_size, size)
+
+    def next_batch(self, tasks: Iterator, num_remaining: Optional[int] = None) -> list:
+        """Take the tasks of the next batch from an iterator (empty when exhausted).
+        """
+        size = self.size(num_remaining)
+        batch, nbytes = [], 0
+        for task in tasks:
+            batch.append(task)
+            nbytes += _task_payload_nbytes(task)
+            if (len(batch) >= size) or (nbytes >= self.max_nbytes):
+                break
+        return batch
+
+
+class _BatchProcess(mp.Process):
+    """Worker process handling batches of tasks until it receives ``None``.
+
+    Batches are received as ``(batch_id, tasks)`` from the ``in_queue``. For
+    each, ``(batch_id, num_tasks, seconds, result)`` of :meth:`_process_batch`
+    is placed in the ``out_queue``.
+    """
+
+    def __init__(self, in_queue: _MPQueue, out_queue: _MPQueue, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+
+    def _setup(self):
+        pass
+
+    @contextmanager
+    def _enter_backends(self):
+        yield
+
+    def _process_batch(self, batch: list) -> Tuple[int, object]:
+        raise NotImplementedError
+
+    def _input_tasks(self) -> Iterator[Tuple[int, list]]:
+        item = self.in_queue.get()
+        while item is not None:
+            batch_id, batch = item
+            yield batch_id, [_attach_shared_arrays(task) for task in batch]
+            item = self.in_queue.get()
+
+    def run(self):
+        self._setup()
+        with self._enter_backends():
+            for batch_id, batch in self._input_tasks():
+                start = time.perf_counter()
+                num_tasks, result = self._process_batch(batch)
+                self.out_queue.put((batch_id, num_tasks, time.perf_counter() - start, result))
+
+
+def _run_worker_pool(
+        make_worker: Callable[[_MPQueue, _MPQueue], _BatchProcess],
+        tasks: Iterable,
+        on_result: Callable[[int, object], None],
+        *,
+        ncpu: int,
+        num_tasks: Optional[int] = None
+):
+    """Process tasks in a pool of worker processes with adaptively sized batches.
+
+    Batches are created lazily as workers become available; at most
+    ``2 * ncpu`` batches are queued at a time, so ``tasks`` may be an
+    iterator of arbitrary length. Every worker pulls its next batch from the
+    same queue as soon as it is finished with the last, so workers processing
+    slow tasks never hold back the others.
+
+    Parameters
+    ----------
+    make_worker
+        creates a (not yet started) worker process from the input & output queues.
+    tasks
+        tasks to process.
+    on_result
+        called in the parent process with the number of tasks and result of
+        every processed batch.
+    ncpu
+        number of worker processes.
+    num_tasks
+        total number of tasks, if known.
+
+    Raises
+    ------
+    RuntimeError
+        if a worker process fails.
+    """
+    in_queue = _MPQueue(maxsize=2 * ncpu)
+    out_queue = _MPQueue()
+    sizer = _AdaptiveBatchSizer(ncpu)
+    shared: Dict[int, List['SharedMemory']] = {}
+    jobs: List[_BatchProcess] = []
+    counts = {'batches_sent': 0, 'batches_done': 0, 'tasks_sent': 0}
+
+    def check_workers():
+        for j in jobs:
+            if j.exitcode:
+                raise RuntimeError(f'Bulk import worker PID {j.pid} failed with exitcode {j.exitcode}')
+
+    def collect(timeout) -> bool:
+        res = out_queue.safe_get(timeout=timeout)
+        if res is None:
+            check_workers()
+            return False
+        batch_id, num_batch_tasks, seconds, result = res
+        for shm in shared.pop(batch_id, ()):
+            shm.close()
+            shm.unlink()
+        counts['batches_done'] += 1
+        sizer.record(num_batch_tasks, seconds)
+        on_result(num_batch_tasks, result)
+        return True
+
+    def put(item):
+        while not in_queue.safe_put(item, timeout=0.5):
+            collect(timeout=None)
+
+    completed = False
+    try:
+        for _ in range(ncpu):
+            t = make_worker(in_queue, out_queue)
+            jobs.append(t)
+            t.start()
+
+        tasks = iter(tasks)
+        while True:
+            num_remaining = None if num_tasks is None else num_tasks - counts['tasks_sent']
+            batch = sizer.next_batch(tasks, num_remaining)
+            if len(batch) == 0:
+                break
+            batch_id = counts['batches_sent']
+            shms = shared.setdefault(batch_id, [])
+            batch = [_share_large_arrays(task, shms) for task in batch]
+            put((batch_id, batch))
+            counts['batches_sent'] += 1
+            counts['tasks_sent'] += len(batch)
+            while collect(timeout=None):
+                pass
+
+        for _ in jobs:
+            put(None)
+        while counts['batches_done'] < counts['batches_sent']:
+            collect(timeout=0.5)
+        for j in jobs:
+            j.join()
+        check_workers()
+        completed = True
+    finally:
+        for j in jobs:
+            if j.is_alive():
+                if not completed:
+                    print(f'terminating PID {j.pid}')
+                j.terminate()
+        in_queue.safe_close()
+        out_queue.safe_close()
+        for shms in shared.values():
+            for shm in shms:
+                shm.close()
+                shm.unlink()
+
+
+# ------------------------- Worker Processes ----------------------------------
+
+
+class _BatchProcessPrepare(_BatchProcess):
 
     def __init__(
             self,
@@ -628,50 +1099,34 @@ class _BatchProcessPrepare(mp.Process):
             queue containing mp.Queue[List[Tuple[dict, List[_ContentDescriptionPrep]]]]
             mapping kwargs -> content description read in.
         """
-        super().__init__(*args, **kwargs)
+        super().__init__(in_queue, out_queue, *args, **kwargs)
         self.column_layouts = column_layouts
         self._udf_raw: bytes = udf
         self.udf: Optional[UDF_T] = None
-        self.in_queue = in_queue
-        self.out_queue = out_queue
         self.schemas = schemas
 
     def _setup(self):
         self.udf = _deserialize_udf(self._udf_raw)
 
-    def _input_tasks(self) -> Iterator[List[dict]]:
-        udf_kwargs = self.in_queue.safe_get(timeout=2.0)
-        while udf_kwargs is not None:
-            yield udf_kwargs
-            udf_kwargs = self.in_queue.safe_get()
-
-    def run(self):
-        self._setup()
-        for udf_kwargs in self._input_tasks():
-            udf_kwargs_res = (
-                (kwargs, self.udf(**kwargs)) for kwargs in udf_kwargs if isinstance(kwargs, dict)
-            )
-            content_digests = []
-            for kwargs, udf_data_generator in udf_kwargs_res:
-                if kwargs is None:
-                    continue
-
-                udf_kwarg_content_digests = []
-                for udf_iter_idx, udf_return in enumerate(udf_data_generator):
-                    _column = udf_return.column
-                    _key = udf_return.key
-                    _data = udf_return.data
-                    _schema = self.schemas[_column]
-                    _layout = self.column_layouts[_column]
-
-                    iscompat = _schema.verify_data_compatible(_data)
-                    if not iscompat.compatible:
-                        raise ValueError(f'data for key {_key} incompatible due to {iscompat.reason}')
-                    digest = _schema.data_hash_digest(_data)
-                    res = _ContentDescriptionPrep(_column, _layout, _key, digest, udf_iter_idx)
-                    udf_kwarg_content_digests.append(res)
-                content_digests.append((kwargs, udf_kwarg_content_digests))
-            self.out_queue.safe_put(content_digests)
+    def _process_batch(self, udf_kwargs: List[dict]) -> Tuple[int, list]:
+        content_digests = []
+        for kwargs in udf_kwargs:
+            udf_kwarg_content_digests = []
+            for udf_iter_idx, udf_return in enumerate(self.udf(**kwargs)):
+                _column = udf_return.column
+                _key = udf_return.key
+                _data = udf_return.data
+                _schema = self.schemas[_column]
+                _layout = self.column_layouts[_column]
+
+                iscompat = _schema.verify_data_compatible(_data)
+                if not iscompat.compatible:
+                    raise ValueError(f'data for key {_key} incompatible due to {iscompat.reason}')
+                digest = _schema.data_hash_digest(_data)
+                res = _ContentDescriptionPrep(_column, _layout, _key, digest, udf_iter_idx)
+                udf_kwarg_content_digests.append(res)
+            content_digests.append((kwargs, udf_kwarg_content_digests))
+        return len(udf_kwargs), content_digests
 
 
 def _run_prepare_recipe(
@@ -680,67 +1135,36 @@ def _run_prepare_recipe(
         udf: bytes,
         udf_kwargs: List[dict],
         *,
-        ncpu: int = 0,
-        batch_size: int = 10
+        ncpu: int = 0
 ) -> List[Tuple[dict, List[_ContentDescriptionPrep]]]:
 
-    # Setup & populate queue with batched arguments
-    in_queue = _MPQueue()
-    out_queue = _MPQueue()
-    n_queue_tasks = ceil(len(udf_kwargs) / batch_size)
-    for keys_kwargs in grouper(udf_kwargs, batch_size):
-        in_queue.safe_put(keys_kwargs)
-
-    out, jobs = [], []
-    try:
-        # start worker processes
-        for _ in range(ncpu):
-            t = _BatchProcessPrepare(
-                udf=udf,
-                schemas=schemas,
-                column_layouts=column_layouts,
-                in_queue=in_queue,
-                out_queue=out_queue)
-            jobs.append(t)
-            t.start()
+    def make_worker(in_queue, out_queue):
+        return _BatchProcessPrepare(
+            udf=udf,
+            schemas=schemas,
+            column_layouts=column_layouts,
+            in_queue=in_queue,
+            out_queue=out_queue)
 
-        # collect outputs and fill queue with more work if low
-        # terminate if no more work should be done.
-        with tqdm(total=len(udf_kwargs), desc='Constructing task recipe') as pbar:
-            ngroups_processed = 0
-            while ngroups_processed < n_queue_tasks:
-                data_key_location_hash_digests = out_queue.safe_get(timeout=30)
-                if data_key_location_hash_digests is None:
-                    continue
-                ngroups_processed += 1
-                for saved in data_key_location_hash_digests:
-                    pbar.update(1)
-                    out.append(saved)
+    out = []
+    with tqdm(total=len(udf_kwargs), desc='Constructing task recipe') as pbar:
+        def on_result(num_tasks, data_key_location_hash_digests):
+            pbar.update(num_tasks)
+            out.extend(data_key_location_hash_digests)
 
-        in_queue.safe_close()
-        out_queue.safe_close()
-        for j in jobs:
-            try:
-                j.join(timeout=0.2)
-            except mp.TimeoutError:
-                j.terminate()
-    except (KeyboardInterrupt, InterruptedError):
-        in_queue.safe_close()
-        out_queue.safe_close()
-        while jobs:
-            j = jobs.pop()
-            if j.is_alive():
-                print(f'terminating PID {j.pid}')
-                j.terminate()
-            else:
-                exitcode = j.exitcode
-                if exitcode:
-                    print(f'PID {j.pid} exitcode: {exitcode}')
-        raise
+        _run_worker_pool(make_worker, udf_kwargs, on_result, ncpu=ncpu, num_tasks=len(udf_kwargs))
     return out
 
 
-class _BatchProcessWriter(mp.Process):
+def _write_data(backend_instance, data, checksum: Optional[str]) -> bytes:
+    """Write data with a backend, passing along the checksum if precomputed.
+    """
+    if checksum is None:
+        return backend_instance.write_data(data)
+    return backend_instance.write_data(data, checksum=checksum)
+
+
+class _BatchProcessWriter(_BatchProcess):
 
     def __init__(
             self,
@@ -772,13 +1196,11 @@ class _BatchProcessWriter(mp.Process):
         args
         kwargs
         """
-        super().__init__(*args, **kwargs)
+        super().__init__(in_queue, out_queue, *args, **kwargs)
         self._udf_raw: bytes = udf
         self.udf: Optional[UDF_T] = None
         self.backends = backends
         self.backend_instances = {}
-        self.in_queue = in_queue
-        self.out_queue = out_queue
         self.schemas = schemas
         self.tmp_pth = tmp_pth
 
@@ -799,12 +1221,6 @@ class _BatchProcessWriter(mp.Process):
             be_instance = be_instance_map[column_backend]
             self.backend_instances[column_name] = be_instance
 
-    def _input_tasks(self) -> Iterator[List[_Task]]:
-        tasks_list = self.in_queue.safe_get(timeout=2)
-        while tasks_list is not None:
-            yield tasks_list
-            tasks_list = self.in_queue.safe_get()
-
     @contextmanager
     def _enter_backends(self):
         try:
@@ -815,32 +1231,27 @@ class _BatchProcessWriter(mp.Process):
             for be in self.backend_instances.keys():
                 self.backend_instances[be].__exit__()
 
-    def run(self):
-        self._setup()
-        with self._enter_backends():
-            for tasks_list in self._input_tasks():
-                tasks = (
-                    (task, self.udf(**task.udf_kwargs)) for task in tasks_list if isinstance(task, _Task)
-                )
-                written_digests_locations = []
-                for task, applied_udf in tasks:
-                    relevant_udf_indices = iter(task.udf_iter_indices)
+    def _process_batch(self, tasks_list: List[_Task]) -> Tuple[int, list]:
+        written_digests_locations = []
+        for task in tasks_list:
+            applied_udf = self.udf(**task.udf_kwargs)
+            relevant_udf_indices = iter(task.udf_iter_indices)
+            desired_udf_idx = next(relevant_udf_indices)
+            for gen_idx, res in enumerate(applied_udf):
+                if gen_idx < desired_udf_idx:
+                    continue
+
+                column = res.column
+                data = res.data
+                digest, checksum = self.schemas[column].data_hash_digest_checksum(data)
+                location_spec = _write_data(self.backend_instances[column], data, checksum)
+                res = _WrittenContentDescription(digest, location_spec)
+                written_digests_locations.append(res)
+                try:
                     desired_udf_idx = next(relevant_udf_indices)
-                    for gen_idx, res in enumerate(applied_udf):
-                        if gen_idx < desired_udf_idx:
-                            continue
-
-                        column = res.column
-                        data = res.data
-                        digest = self.schemas[column].data_hash_digest(data)
-                        location_spec = self.backend_instances[column].write_data(data)
-                        res = _WrittenContentDescription(digest, location_spec)
-                        written_digests_locations.append(res)
-                        try:
-                            desired_udf_idx = next(relevant_udf_indices)
-                        except StopIteration:
-                            break
-                self.out_queue.safe_put(written_digests_locations)
+                except StopIteration:
+                    break
+        return len(tasks_list), written_digests_locations
 
 
 def _run_write_recipe_data(
@@ -850,70 +1261,164 @@ def _run_write_recipe_data(
         udf: bytes,
         recipe_tasks: List[_Task],
         *,
-        ncpu=0,
-        batch_size=10
+        ncpu=0
 ) -> List[_WrittenContentDescription]:
 
-    # Setup & populate queue with batched arguments
-    in_queue = _MPQueue()
-    out_queue = _MPQueue()
-    n_queue_tasks = ceil(len(recipe_tasks) / batch_size)
-    for keys_kwargs in grouper(recipe_tasks, batch_size):
-        in_queue.put_nowait(keys_kwargs)
-
-    out, jobs = [], []
-    try:
-        # start worker processes
-        backends = {}
-        for col_name, column in columns.items():
-            backends[col_name] = column.backend
-        for _ in range(ncpu):
-            t = _BatchProcessWriter(
-                udf=udf,
-                backends=backends,
-                schemas=schemas,
-                tmp_pth=tmp_dir,
-                in_queue=in_queue,
-                out_queue=out_queue)
-            jobs.append(t)
-            t.start()
+    backends = {}
+    for col_name, column in columns.items():
+        backends[col_name] = column.backend
 
-        # collect outputs and fill queue with more work if low
-        # terminate if no more work should be done.
-        nsteps = _num_steps_in_task_list(recipe_tasks)
-        with tqdm(total=nsteps, desc='Executing Data Import Recipe') as pbar:
-            ngroups_processed = 0
-            while ngroups_processed < n_queue_tasks:
-                data_key_location_hash_digests = out_queue.safe_get(timeout=30)
-                if data_key_location_hash_digests is None:
-                    continue
-                ngroups_processed += 1
-                for saved in data_key_location_hash_digests:
-                    pbar.update(1)
-                    out.append(saved)
-        in_queue.safe_close()
-        out_queue.safe_close()
-        for j in jobs:
-            try:
-                j.join(timeout=0.2)
-            except mp.TimeoutError:
-                j.terminate()
-    except (KeyboardInterrupt, InterruptedError):
-        in_queue.safe_close()
-        out_queue.safe_close()
-        while jobs:
-            j = jobs.pop()
-            if j.is_alive():
-                print(f'terminating PID {j.pid}')
-                j.terminate()
-            else:
-                exitcode = j.exitcode
-                if exitcode:
-                    print(f'PID {j.pid} exitcode: {exitcode}')
-        raise
+    def make_worker(in_queue, out_queue):
+        return _BatchProcessWriter(
+            udf=udf,
+            backends=backends,
+            schemas=schemas,
+            tmp_pth=tmp_dir,
+            in_queue=in_queue,
+            out_queue=out_queue)
+
+    out = []
+    nsteps = _num_steps_in_task_list(recipe_tasks)
+    with tqdm(total=nsteps, desc='Executing Data Import Recipe') as pbar:
+        def on_result(num_tasks, data_key_location_hash_digests):
+            pbar.update(len(data_key_location_hash_digests))
+            out.extend(data_key_location_hash_digests)
+
+        _run_worker_pool(make_worker, recipe_tasks, on_result, ncpu=ncpu, num_tasks=len(recipe_tasks))
     return out
 
 
+class _BatchProcessPrepareWriter(_BatchProcessWriter):
+
+    def __init__(
+            self,
+            udf: bytes,
+            backends: Dict[str, str],
+            schemas: Dict[str, 'ColumnBase'],
+            column_layouts: Dict[str, str],
+            tmp_pth: Path,
+            stored_digests: Set[bytes],
+            claimed_digests: Dict[str, str],
+            in_queue: _MPQueue,
+            out_queue: _MPQueue,
+            *args, **kwargs
+    ):
+        """Read, validate, hash, and write all data generated by UDF(**udf_kwargs) in one pass.
+
+        Parameters
+        ----------
+        udf
+            user provided function yielding UDF_Return instances when iterated over.
+        backends
+            dict mapping column name -> backend code.
+        schemas
+            dict mapping column names -> initialized schema objects.
+        column_layouts
+            dict mapping column names -> column layout string
+        tmp_pth
+            tempdir path to write data to
+        stored_digests
+            db keys of data digests already stored in the repository; this data
+            is not written again.
+        claimed_digests
+            digests shared between all worker processes (a ``mp.Manager().dict()``).
+            The first worker to claim a digest writes the data, every other
+            worker only records the sample reference.
+        in_queue
+            queue contianing work pieces (kwargs) to process via UDF `mp.Queue[List[dict]]`
+        out_queue
+            sample content descriptions and written content descriptions of each batch
+            `mp.Queue[Tuple[List[_ContentDescriptionPrep], List[_WrittenContentDescription]]]`
+        """
+        super().__init__(udf, backends, schemas, tmp_pth, in_queue, out_queue, *args, **kwargs)
+        self.column_layouts = column_layouts
+        self.stored_digests = stored_digests
+        self.claimed_digests = claimed_digests
+        self.written_digests: Set[str] = set()
+
+    def _claim(self, digest: str) -> bool:
+        """Determine if this worker should write the data of some digest.
+        """
+        if digest in self.written_digests:
+            return False
+        if hash_data_db_key_from_raw_key(digest) in self.stored_digests:
+            return False
+        return self.claimed_digests.setdefault(digest, self.name) == self.name
+
+    def _process_batch(self, udf_kwargs: List[dict]) -> Tuple[int, tuple]:
+        content_digests, written_digests_locations = [], []
+        for kwargs in udf_kwargs:
+            for udf_iter_idx, udf_return in enumerate(self.udf(**kwargs)):
+                _column = udf_return.column
+                _data = udf_return.data
+                _schema = self.schemas[_column]
+                iscompat = _schema.verify_data_compatible(_data)
+                if not iscompat.compatible:
+                    raise ValueError(
+                        f'data for key {udf_return.key} incompatible due to {iscompat.reason}')
+                digest, checksum = _schema.data_hash_digest_checksum(_data)
+                content_digests.append(_ContentDescriptionPrep(
+                    _column, self.column_layouts[_column], udf_return.key, digest, udf_iter_idx))
+                if self._claim(digest):
+                    self.written_digests.add(digest)
+                    location_spec = _write_data(self.backend_instances[_column], _data, checksum)
+                    written_digests_locations.append(
+                        _WrittenContentDescription(digest, location_spec))
+        return len(udf_kwargs), (content_digests, written_digests_locations)
+
+
+def _run_prepare_write_recipe_data(
+        tmp_dir: Path,
+        backends: Dict[str, str],
+        schemas: Dict[str, 'ColumnBase'],
+        column_layouts: Dict[str, str],
+        udf: bytes,
+        udf_kwargs: Iterable[dict],
+        stored_digests: Set[bytes],
+        claimed_digests: Dict[str, str],
+        pbar: tqdm,
+        *,
+        ncpu=0,
+        num_tasks: Optional[int] = None
+) -> Tuple[List[_ContentDescriptionPrep], List[_WrittenContentDescription]]:
+    """Import every input with a pool of single pass workers.
+
+    Parameters
+    ----------
+    stored_digests
+        db keys of digests stored in the repository before the import. Read
+        once, up front, and inherited by every worker.
+    claimed_digests
+        digests written during the import, shared between all workers
+        (a ``mp.Manager().dict()``); only the first worker to claim one writes it.
+    """
+    def make_worker(in_queue, out_queue):
+        return _BatchProcessPrepareWriter(
+            udf=udf,
+            backends=backends,
+            schemas=schemas,
+            column_layouts=column_layouts,
+            tmp_pth=tmp_dir,
+            stored_digests=stored_digests,
+            claimed_digests=claimed_digests,
+            in_queue=in_queue,
+            out_queue=out_queue)
+
+    contents, written = [], {}
+
+    def on_result(num_inputs, res):
+        content_digests, written_digests_locations = res
+        contents.extend(content_digests)
+        # a digest is only ever claimed once; keep the first written copy
+        # regardless so duplicated data can never be referenced twice.
+        for saved in written_digests_locations:
+            written.setdefault(saved.digest, saved)
+        pbar.update(num_inputs)
+
+    _run_worker_pool(make_worker, udf_kwargs, on_result, ncpu=ncpu, num_tasks=num_tasks)
+    return contents, list(written.values())
+
+
 def _unify_recipe_contents(recipe: List[Tuple[dict, List[_ContentDescriptionPrep]]]) -> List[_ContentDescriptionPrep]:
     """Flatten and isolate all ContentDescriptionPrep in flat recipe list.
 
@@ -1007,15 +1512,8 @@ def _write_digest_to_bespec_mapping(
         dbDigest = hash_data_db_key_from_raw_key(spec.digest)
         digests_bespecs.append((dbDigest, dbSpec))
 
-    hashtxn = TxnRegister().begin_writer_txn(hashenv)
-    stagehashtxn = TxnRegister().begin_writer_txn(stagehashenv)
-    try:
-        for dbDigest, dbSpec in digests_bespecs:
-            stagehashtxn.put(dbDigest, dbSpec)
-            hashtxn.put(dbDigest, dbSpec)
-    finally:
-        TxnRegister().commit_writer_txn(hashenv)
-        TxnRegister().commit_writer_txn(stagehashenv)
+    bulk_put_records(stagehashenv, digests_bespecs)
+    bulk_put_records(hashenv, digests_bespecs)
 
 
 def _write_full_recipe_sample_key_to_digest_mapping(
@@ -1030,12 +1528,22 @@ def _write_full_recipe_sample_key_to_digest_mapping(
         staging_val = step.db_record_val()
         db_kvs.append((staging_key, staging_val))
 
-    datatxn = TxnRegister().begin_writer_txn(dataenv)
-    try:
-        for dbk, dbv in db_kvs:
-            datatxn.put(dbk, dbv)
-    finally:
-        TxnRegister().commit_writer_txn(dataenv)
+    bulk_put_records(dataenv, db_kvs)
+
+
+def _record_imported_contents(
+        co: 'WriterCheckout',
+        contents: List[_ContentDescriptionPrep],
+        written_data_steps: List[_WrittenContentDescription]
+):
+    """Record written data pieces and the imported samples in a write checkout.
+    """
+    _write_digest_to_bespec_mapping(
+        executed_steps=written_data_steps,
+        hashenv=co._hashenv,
+        stagehashenv=co._stagehashenv)
+    _write_full_recipe_sample_key_to_digest_mapping(
+        sample_steps=contents, dataenv=co._stageenv)
 
 
 def _mock_hangar_directory_structure(dir_name: str) -> Path:
@@ -109,6 +109,7 @@ class ReaderCheckout(GetMixin, CheckoutDictIteration):
         self._refenv = refenv
         self._enter_count = 0
         self._stack: Optional[ExitStack] = None
+        self._read_through = None
 
         self._columns = Columns._from_commit(
             repo_pth=self._repo_path,
@@ -171,6 +172,23 @@ class ReaderCheckout(GetMixin, CheckoutDictIteration):
         self._verify_alive()
         return bool(self._enter_count)
 
+    def _enable_read_through(self, fetcher):
+        """Retrieve remote referenced samples of every column on first access.
+
+        Parameters
+        ----------
+        fetcher : :class:`~.remote.readthrough.RemoteReadThrough`
+            object which retrieves samples from the remote server; closed along
+            with the checkout. Not carried over when columns are pickled for
+            use in other processes.
+        """
+        self._verify_alive()
+        self._read_through = fetcher
+        for column in self._columns.values():
+            remote_be = column._be_fs.get('50')
+            if remote_be is not None:
+                remote_be.read_through = fetcher.bind(column._schema)
+
     @property
     def columns(self) -> Columns:
         """Provides access to column interaction object.
@@ -307,6 +325,8 @@ class ReaderCheckout(GetMixin, CheckoutDictIteration):
         self._verify_alive()
         if isinstance(self._stack, ExitStack):
             self._stack.close()
+        if self._read_through is not None:
+            self._read_through.close()
 
         self._columns._destruct()
         for attr in list(self.__dict__.keys()):
@@ -364,7 +384,9 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
                  stageenv: lmdb.Environment,
                  branchenv: lmdb.Environment,
                  stagehashenv: lmdb.Environment,
-                 mode: str = 'a'):
+                 mode: str = 'a',
+                 *,
+                 trust_fresh_writes: bool = False):
         """Developer documentation of init method.
 
         Parameters
@@ -386,8 +408,12 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             db where the staged hash record data is stored.
         mode : str, optional
             open in write or read only mode, default is 'a' which is write-enabled.
+        trust_fresh_writes : bool, optional, kwarg only
+            skip checksum verification when reading back samples written by this
+            checkout, default is False.
         """
         self._enter_count = 0
+        self._trust_fresh_writes = trust_fresh_writes
         self._repo_path: Path = repo_pth
         self._branch_name = branch_name
         self._writer_lock = str(uuid4())
@@ -443,6 +469,21 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
         self._verify_alive()
         return bool(self._enter_count)
 
+    def _apply_trust_fresh_writes(self, columns):
+        """Enable ``trust_fresh_writes`` on the backend accessors of ``columns``.
+
+        Backends which support it then skip checksum verification when reading
+        a sample written by that same accessor (the checksum was computed from
+        the in-memory data just before the write). Accessors opened later for a
+        column (ie. by ``change_backend``) verify every read as usual.
+        """
+        if not self._trust_fresh_writes:
+            return
+        for column in columns:
+            for be in column._be_fs.values():
+                if hasattr(be, 'trust_fresh_writes'):
+                    be.trust_fresh_writes = True
+
     def _verify_alive(self):
         """Ensures that this class instance holds the writer lock in the database.
 
@@ -523,6 +564,7 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             hashenv=self._hashenv,
             stageenv=self._stageenv,
             stagehashenv=self._stagehashenv)
+        self._apply_trust_fresh_writes(self._columns.values())
         self._differ = WriterUserDiff(
             stageenv=self._stageenv,
             refenv=self._refenv,
@@ -1004,6 +1046,7 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
                 path=self._repo_path, schema=schema, mode='a')
 
         self.columns._columns[column_name] = setup_args
+        self._apply_trust_fresh_writes([setup_args])
         return self.columns[column_name]
 
     def merge(self, message: str, dev_branch: str) -> str:
@@ -1047,6 +1090,7 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             hashenv=self._hashenv,
             stageenv=self._stageenv,
             stagehashenv=self._stagehashenv)
+        self._apply_trust_fresh_writes(self._columns.values())
         self._differ = WriterUserDiff(
             stageenv=self._stageenv,
             refenv=self._refenv,
@@ -1165,6 +1209,7 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             hashenv=self._hashenv,
             stageenv=self._stageenv,
             stagehashenv=self._stagehashenv)
+        self._apply_trust_fresh_writes(self._columns.values())
         self._differ = WriterUserDiff(
             stageenv=self._stageenv,
             refenv=self._refenv,
@@ -15,6 +15,7 @@ Also see (1) from http://click.pocoo.org/7/setuptools/#setuptools-integration
 """
 import os
 import time
+from contextlib import closing
 from pathlib import Path
 
 import click
@@ -22,7 +23,9 @@ import numpy as np
 
 from hangar import Repository, __version__
 
-from .utils import parse_custom_arguments, StrOrIntType
+from .utils import (
+    iter_import_files, make_plugin_import_udf, parse_custom_arguments, StrOrIntType
+)
 
 
 pass_repo = click.make_pass_decorator(Repository, ensure=True)
@@ -296,8 +299,10 @@ def fetch_records(repo: Repository, remote, branch):
               help='specify any number of column keys to fetch data for.')
 @click.option('--all-history', '-a', 'all_', is_flag=True, default=False, required=False,
               help='Retrieve data referenced in every parent commit accessible to the STARTPOINT')
+@click.option('--bandwidth-limit', default=None, required=False,
+              help='maximum average transfer rate, ie. "10MB" (per second).')
 @pass_repo
-def fetch_data(repo: Repository, remote, startpoint, column, all_):
+def fetch_data(repo: Repository, remote, startpoint, column, all_, bandwidth_limit):
     """Get data from REMOTE referenced by STARTPOINT (short-commit or branch).
 
     The default behavior is to only download a single commit's data or the HEAD
@@ -322,18 +327,21 @@ def fetch_data(repo: Repository, remote, startpoint, column, all_):
     commits = repo.remote.fetch_data(remote=remote,
                                      commit=commit,
                                      column_names=column,
-                                     retrieve_all_history=all_)
+                                     retrieve_all_history=all_,
+                                     bandwidth_limit=bandwidth_limit)
     click.echo(f'completed data for commits: {commits}')
 
 
 @main.command()
 @click.argument('remote', nargs=1, required=True)
 @click.argument('branch', nargs=1, required=True)
+@click.option('--bandwidth-limit', default=None, required=False,
+              help='maximum average transfer rate, ie. "10MB" (per second).')
 @pass_repo
-def push(repo: Repository, remote, branch):
+def push(repo: Repository, remote, branch, bandwidth_limit):
     """Upload local BRANCH commit history / data to REMOTE server.
     """
-    commit_hash = repo.remote.push(remote=remote, branch=branch)
+    commit_hash = repo.remote.push(remote=remote, branch=branch, bandwidth_limit=bandwidth_limit)
     click.echo(f'Push data for commit hash: {commit_hash}')
 
 
@@ -455,6 +463,66 @@ def log(repo: Repository, startpoint):
         click.echo(repo.log(commit=base_commit))
 
 
+@main.command()
+@click.argument('startpoint', required=False, default=None)
+@click.option('--json', 'json_', is_flag=True, default=False,
+              help='output the statistics as a json document')
+@pass_repo
+def stats(repo: Repository, startpoint, json_):
+    """Display disk usage of the repository and data at STARTPOINT (short-digest or name).
+
+    Reports the size of the data files stored by each backend, and the size of
+    the data referenced by each column of the commit (counting every record,
+    and every unique piece of data once). If no argument is passed in, the
+    staging area branch HEAD will be used as the starting point.
+    """
+    import json
+    from hangar.records.commiting import expand_short_commit_digest
+    from hangar.utils import format_bytes
+
+    if startpoint is None:
+        res = repo.storage_stats()
+    elif startpoint in repo.list_branches():
+        res = repo.storage_stats(branch=startpoint)
+    else:
+        base_commit = expand_short_commit_digest(repo._env.refenv, startpoint)
+        res = repo.storage_stats(commit=base_commit)
+
+    if json_:
+        out = res._asdict()
+        out['backends'] = {k: v._asdict() for k, v in res.backends.items()}
+        if res.commit is not None:
+            out['commit'] = res.commit._asdict()
+            out['commit']['dedup_ratio'] = res.commit.dedup_ratio
+            out['commit']['columns'] = {
+                k: dict(v._asdict(), dedup_ratio=v.dedup_ratio)
+                for k, v in res.commit.columns.items()}
+        click.echo(json.dumps(out, indent=2))
+        return
+
+    click.echo(f'Disk Usage: {format_bytes(res.nbytes)} (data: {format_bytes(res.data_nbytes)}, '
+               f'staged: {format_bytes(res.staged_nbytes)}, '
+               f'records: {format_bytes(res.metadata_nbytes)})')
+    click.echo(f'{"Backend":<10}{"Files":>10}{"Size":>12}')
+    for backend, be_stats in sorted(res.backends.items()):
+        click.echo(f'{backend:<10}{be_stats.num_files:>10}{format_bytes(be_stats.nbytes):>12}')
+    if res.commit is None:
+        click.echo('No commits made')
+        return
+
+    cmt = res.commit
+    click.echo(f'Commit: {cmt.commit}')
+    click.echo(f'{"Column":<20}{"Records":>10}{"Pieces":>10}{"Logical":>12}{"Unique":>12}{"Dedup":>8}')
+    rows = sorted(cmt.columns.items()) + [('TOTAL', cmt)]
+    for name, col in rows:
+        click.echo(f'{name:<20}{col.num_data_records:>10}{col.num_data_pieces:>10}'
+                   f'{format_bytes(col.logical_nbytes):>12}{format_bytes(col.unique_nbytes):>12}'
+                   f'{col.dedup_ratio:>8.2f}')
+    if cmt.num_unresolved > 0:
+        click.echo(f'{cmt.num_unresolved} data pieces are only referenced on a remote '
+                   f'server and are not counted.')
+
+
 @main.command()
 @pass_repo
 def status(repo: Repository):
@@ -555,7 +623,10 @@ def branch_remove(repo: Repository, name, force):
               help='port to start the server on. default in `50051`')
 @click.option('--timeout', default=60 * 60 * 24, required=False, show_default=True,
               help='time (in seconds) before server is stopped automatically')
-def server(overwrite, ip, port, timeout):
+@click.option('--read-workers', default=None, type=click.IntRange(min=0), required=False,
+              help='number of processes which read and compress data sent to clients. '
+                   'default is the `fetch_read_workers` server config value.')
+def server(overwrite, ip, port, timeout, read_workers):
     """Start a hangar server, initializing one if does not exist.
 
     The server is configured to top working in 24 Hours from the time it was
@@ -576,7 +647,8 @@ def server(overwrite, ip, port, timeout):
 
     P = os.getcwd()
     ip_port = f'{ip}:{port}'
-    server, hangserver, channel_address = serve(P, overwrite, channel_address=ip_port)
+    server, hangserver, channel_address = serve(
+        P, overwrite, channel_address=ip_port, fetch_read_workers=read_workers)
     server.start()
     click.echo(f'Hangar Server Started')
     click.echo(f'* Start Time: {time.asctime()}')
@@ -608,13 +680,30 @@ def server(overwrite, ip, port, timeout):
 @click.option('--plugin', default=None, help='override auto-infered plugin')
 @click.option('--overwrite', is_flag=True,
               help='overwrite data samples with the same name as the imported data file ')
+@click.option('-r', '--recursive', is_flag=True, default=False,
+              help='import files in all sub directories of PATH')
+@click.option('--include', multiple=True,
+              help='only import files (relative to PATH) matching this glob pattern')
+@click.option('--exclude', multiple=True,
+              help='skip files (relative to PATH) matching this glob pattern')
+@click.option('-j', '--jobs', type=click.IntRange(min=0), default=1, show_default=True,
+              help=('number of worker processes loading & writing data. If > 1 (or 0, which '
+                    'selects half the available CPUs) files are imported by the bulk importer.'))
 @pass_repo
 @click.pass_context
-def import_data(ctx, repo: Repository, column, path, branch, plugin, overwrite):
+def import_data(ctx, repo: Repository, column, path, branch, plugin, overwrite,
+                recursive, include, exclude, jobs):
     """Import file or directory of files at PATH to COLUMN in the staging area.
 
-    If passing in a directory, all files in the directory will be imported, if
-    passing in a file, just that files specified will be imported.
+    If passing in a directory, all files in the directory will be imported (or
+    all files in the directory tree with ``--recursive``), if passing in a
+    file, just that files specified will be imported. Files in a directory can
+    be selected with ``--include`` / ``--exclude`` glob patterns.
+
+    With ``--jobs`` other than 1, files are loaded and written by multiple
+    processes via the bulk importer; data already stored in the repository (or
+    repeated in the imported files) is only written once. The import is then
+    all-or-nothing: an invalid sample aborts it rather than being skipped.
     """
     # TODO: ignore warning through env variable
     from types import GeneratorType
@@ -628,12 +717,15 @@ def import_data(ctx, repo: Repository, column, path, branch, plugin, overwrite):
         raise click.ClickException(f'Branch name: {branch} does not exist, Exiting.')
     click.echo(f'Writing to branch: {branch}')
 
+    files = iter_import_files(Path(path), recursive=recursive, include=include, exclude=exclude)
+    if jobs != 1:
+        _bulk_import_data(repo, branch, column, files, plugin, overwrite, jobs, kwargs)
+        return
+
     co = repo.checkout(write=True, branch=branch)
     try:
         active_aset = co.columns.get(column)
-        p = Path(path)
-        files = [f.resolve() for f in p.iterdir()] if p.is_dir() else [p.resolve()]
-        with active_aset as aset, click.progressbar(files) as filesBar:
+        with active_aset as aset, click.progressbar(list(files)) as filesBar:
             for f in filesBar:
                 ext = ''.join(f.suffixes).strip('.')  # multi-suffix files (tar.bz2)
                 loaded = external.load(f, plugin=plugin, extension=ext, **kwargs)
@@ -652,6 +744,44 @@ def import_data(ctx, repo: Repository, column, path, branch, plugin, overwrite):
         co.close()
 
 
+def _bulk_import_data(repo, branch, column, files, plugin, overwrite, jobs, plugin_kwargs):
+    """Import files to a column with the multiprocess bulk importer.
+    """
+    from hangar.bulk_importer import run_bulk_import_stream
+
+    co = repo.checkout(write=True, branch=branch)
+    try:
+        aset = co.columns.get(column)
+        if aset.column_layout != 'flat':
+            raise click.ClickException(
+                f'Column: {column} is not a flat column; only flat columns can be '
+                f'imported with --jobs.')
+        skip_keys = set() if overwrite else set(aset.keys())
+    except (ValueError, KeyError) as e:
+        raise click.ClickException(e)
+    finally:
+        co.close()
+
+    num_files = 0
+
+    def udf_kwargs():
+        nonlocal num_files
+        for f in files:
+            num_files += 1
+            yield {'fpath': f}
+
+    udf = make_plugin_import_udf(column, plugin=plugin, plugin_kwargs=plugin_kwargs,
+                                 skip_keys=skip_keys)
+    try:
+        report = run_bulk_import_stream(
+            repo, branch, [column], udf, udf_kwargs(), ncpus=jobs, autocommit=False)
+    except (ValueError, KeyError, TypeError) as e:
+        raise click.ClickException(e)
+    click.echo(f'Imported {report.num_samples} samples from {num_files} files '
+               f'({report.num_data_written} data pieces written, '
+               f'{report.num_deduplicated} deduplicated).')
+
+
 @main.command(name='export',
               context_settings=dict(allow_extra_args=True, ignore_unknown_options=True, ))
 @click.argument('column', nargs=1, required=True)
@@ -678,9 +808,17 @@ def import_data(ctx, repo: Repository, column, path, branch, plugin, overwrite):
               required=False,
               help='File format of output file')
 @click.option('--plugin', required=False, help='override auto-inferred plugin')
+@click.option('-j', '--jobs', type=click.IntRange(min=0), default=1, show_default=True,
+              help=('number of worker processes reading & writing samples. If > 1 (or 0, '
+                    'which selects half the available CPUs) samples are exported in parallel.'))
+@click.option('--archive', type=click.Choice(['tar', 'npz']), default=None,
+              help='write samples into tar / npz archive shards instead of one file per sample')
+@click.option('--batch-size', type=click.IntRange(min=1), default=1000, show_default=True,
+              help='samples read & written per worker task (and per archive shard)')
 @pass_repo
 @click.pass_context
-def export_data(ctx, repo: Repository, column, outdir, startpoint, sample, format_, plugin):
+def export_data(ctx, repo: Repository, column, outdir, startpoint, sample, format_, plugin,
+                jobs, archive, batch_size):
     """Export COLUMN sample data as it existed a STARTPOINT to some format and path.
 
     Specifying which sample to be exported is possible by using the switch
@@ -697,6 +835,12 @@ def export_data(ctx, repo: Repository, column, outdir, startpoint, sample, forma
        2. if the sample name is ``sample1`` - ``str:sample1`` or ``sample1``
 
        3. if the sample name is an int, let say 10 - ``int:10``
+
+    With ``--jobs`` other than 1 (or ``--archive``), samples of a flat column
+    are read, encoded and written by a pool of worker processes. With
+    ``--archive tar`` / ``--archive npz``, batches of ``--batch-size`` samples
+    are written into archive shards named ``COLUMN-00000.tar`` (etc.) rather
+    than saved through a plugin one file per sample.
     """
     from hangar.records.commiting import expand_short_commit_digest
     from hangar.records.heads import get_branch_head_commit, get_staging_branch_head
@@ -711,11 +855,16 @@ def export_data(ctx, repo: Repository, column, outdir, startpoint, sample, forma
         branch_name = get_staging_branch_head(repo._env.branchenv)
         base_commit = get_branch_head_commit(repo._env.branchenv, branch_name)
 
+    extension = format_.lstrip('.') if format_ else None
+    if (jobs != 1) or (archive is not None):
+        _bulk_export_data(repo, column, outdir, base_commit, sample, extension, plugin,
+                          jobs, archive, batch_size, kwargs)
+        return
+
     co = repo.checkout(commit=base_commit)
     try:
         aset = co.columns.get(column)
         sampleNames = [sample] if sample is not None else list(aset.keys())
-        extension = format_.lstrip('.') if format_ else None
         with aset, click.progressbar(sampleNames) as sNamesBar:
             for sampleN in sNamesBar:
                 data = aset[sampleN]
@@ -730,6 +879,31 @@ def export_data(ctx, repo: Repository, column, outdir, startpoint, sample, forma
         co.close()
 
 
+def _bulk_export_data(repo, column, outdir, commit, sample, extension, plugin,
+                      jobs, archive, batch_size, plugin_kwargs):
+    """Export samples of a column with the multiprocess bulk exporter.
+    """
+    from hangar.bulk_exporter import run_bulk_export
+
+    with closing(repo.checkout(commit=commit)) as co:
+        try:
+            num_samples = 1 if sample is not None else len(co.columns[column])
+        except KeyError as e:
+            raise click.ClickException(e)
+
+    keys = [sample] if sample is not None else None
+    with click.progressbar(length=num_samples, label='exporting samples') as bar:
+        try:
+            shards = run_bulk_export(
+                repo, column, outdir, commit=commit, keys=keys, extension=extension,
+                plugin=plugin, plugin_kwargs=plugin_kwargs, archive=archive,
+                batch_size=batch_size, ncpus=jobs, progress=bar.update)
+        except Exception as e:
+            raise click.ClickException(e)
+    if archive is not None:
+        click.echo(f'Exported {num_samples} samples into {len(shards)} {archive} shards in {outdir}')
+
+
 @main.command(name='view',
               context_settings=dict(allow_extra_args=True, ignore_unknown_options=True, ))
 @click.argument('column', nargs=1, type=str, required=True)
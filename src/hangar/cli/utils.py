@@ -1,3 +1,8 @@
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
 import click
 
 
@@ -49,3 +54,95 @@ def parse_custom_arguments(click_args: list) -> dict:
             raise RuntimeError(f"Could not parse argument {key}. It should be prefixed with `--`")
         parsed[key[2:]] = val
     return parsed
+
+
+def iter_import_files(path: Path,
+                      recursive: bool = False,
+                      include: Sequence[str] = (),
+                      exclude: Sequence[str] = ()) -> Iterator[Path]:
+    """Lazily walk the files selected for import at some path.
+
+    Parameters
+    ----------
+    path : Path
+        file or directory to import. If a file, it is the only path yielded
+        (filters are not applied to it).
+    recursive : bool, optional
+        if True, walk all sub directories of ``path``, by default False
+    include : Sequence[str], optional
+        glob patterns (matched against the file path relative to ``path``); if
+        given, only files matching at least one pattern are yielded.
+    exclude : Sequence[str], optional
+        glob patterns (matched against the file path relative to ``path``);
+        files matching any pattern are skipped.
+
+    Returns
+    -------
+    Iterator[Path]
+        resolved paths of the selected files, in sorted order per directory.
+    """
+    path = Path(path)
+    if not path.is_dir():
+        yield path.resolve()
+        return
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        if not recursive:
+            dirs.clear()
+        for fname in sorted(files):
+            fpath = Path(root, fname)
+            rel = fpath.relative_to(path).as_posix()
+            if include and not any(fnmatch(rel, pat) for pat in include):
+                continue
+            if any(fnmatch(rel, pat) for pat in exclude):
+                continue
+            yield fpath.resolve()
+
+
+def make_plugin_import_udf(column: str,
+                           plugin: Optional[str] = None,
+                           plugin_kwargs: Optional[dict] = None,
+                           skip_keys: Optional[set] = None):
+    """Create a bulk importer UDF loading files with the external plugins.
+
+    The UDF accepts a single ``fpath`` argument and yields every
+    ``(data, name)`` pair the load plugin returns for that file as a sample
+    of ``column``.
+
+    Parameters
+    ----------
+    column : str
+        name of the column the loaded samples are imported to.
+    plugin : Optional[str], optional
+        name of the plugin to load files with. By default the plugin is
+        inferred from the file extension.
+    plugin_kwargs : Optional[dict], optional
+        keyword arguments passed to the load plugin.
+    skip_keys : Optional[set], optional
+        sample names which are not yielded (ie. samples which already exist and
+        should not be overwritten).
+
+    Returns
+    -------
+    Callable[..., Iterator[UDF_Return]]
+        generator function suitable for :func:`~hangar.bulk_importer.run_bulk_import`
+    """
+    from types import GeneratorType
+    from hangar import external
+    from hangar.bulk_importer import UDF_Return
+
+    plugin_kwargs = plugin_kwargs if plugin_kwargs is not None else {}
+    skip_keys = skip_keys if skip_keys is not None else set()
+
+    def plugin_import_udf(fpath):
+        fpath = Path(fpath)
+        ext = ''.join(fpath.suffixes).strip('.')  # multi-suffix files (tar.bz2)
+        loaded = external.load(fpath, plugin=plugin, extension=ext, **plugin_kwargs)
+        if not isinstance(loaded, GeneratorType):
+            loaded = [loaded]
+        for arr, fname in loaded:
+            if fname not in skip_keys:
+                yield UDF_Return(column=column, key=fname, data=arr)
+
+    return plugin_import_udf
@@ -22,6 +22,7 @@ from ..typesystem import (
     BytesVariableShape
 )
 from ..backends import BACKEND_IS_LOCAL_MAP, backend_decoder
+from ..backends.remote_50 import REMOTE_50_ReferenceSpec
 
 
 # --------------- methods common to all column layout types -------------------
@@ -84,6 +85,8 @@ def _flat_load_sample_keys_and_specs(column_name, txnctx):
             hashKey = hash_data_db_key_from_raw_key(dataSpec.digest)
             hash_ref = hashTxn.get(hashKey)
             be_loc = backend_decoder(hash_ref)
+            if be_loc.backend == '50':
+                be_loc = REMOTE_50_ReferenceSpec(be_loc.backend, be_loc.schema_hash, dataSpec.digest)
             sspecs[asetNames.sample] = be_loc
     seen_bes.update((spc.backend for spc in sspecs.values()))
     return (sspecs, seen_bes)
@@ -171,6 +174,8 @@ def _nested_load_sample_keys_and_specs(column_name, txnctx):
             hashKey = hash_data_db_key_from_raw_key(dataSpec.digest)
             hash_ref = hashTxn.get(hashKey)
             be_loc = backend_decoder(hash_ref)
+            if be_loc.backend == '50':
+                be_loc = REMOTE_50_ReferenceSpec(be_loc.backend, be_loc.schema_hash, dataSpec.digest)
             sspecs[asetNames.sample].update({asetNames.subsample: be_loc})
             seen_bes.add(be_loc.backend)
     return (sspecs, seen_bes)
@@ -342,6 +342,45 @@ class FlatSampleReader:
         _islocal_func = op_attrgetter('islocal')
         return tuple(valfilterfalse(_islocal_func, self._samples).keys())
 
+    def backend_spec(self, key: KeyType):
+        """Location of the data of a sample in the backend it is stored in.
+
+        Parameters
+        ----------
+        key : KeyType
+            Sample key to find the backend location of.
+
+        Returns
+        -------
+        spec
+            backend specification of the sample data (the ``backend`` code,
+            and the file / index the data is stored at).
+
+        Raises
+        ------
+        KeyError
+            if no sample with the requested key exists.
+        """
+        try:
+            return self._samples[key]
+        except KeyError:
+            raise KeyError(f'No sample with key: {key} exists in column: {self.column}') from None
+
+    @property
+    def _read_through(self):
+        """Remote read-through object of the column, if it was enabled.
+        """
+        remote_be = self._be_fs.get('50')
+        return getattr(remote_be, 'read_through', None)
+
+    def _hint_remote_reads(self, keys: Iterable[KeyType]):
+        """Inform read-through of the sample keys which will be read next (in order).
+        """
+        read_through = self._read_through
+        if read_through is not None:
+            specs = (self._samples[key] for key in keys)
+            read_through.hint([spec for spec in specs if not spec.islocal])
+
     def _mode_local_aware_key_looper(self, local: bool) -> Iterable[KeyType]:
         """Generate keys for iteration with dict update safety ensured.
 
@@ -470,7 +509,7 @@ class FlatSampleWriter(FlatSampleReader):
         if not isCompat.compatible:
             raise ValueError(isCompat.reason)
 
-    def _perform_set(self, key, value):
+    def _perform_set(self, key, value, full_hash=None, checksum=None):
         """Internal write method. Assumes all arguments validated and context is open
 
         Parameters
@@ -479,8 +518,14 @@ class FlatSampleWriter(FlatSampleReader):
             sample key to store
         value
             data to store
+        full_hash
+            digest of ``value`` if already computed, by default None
+        checksum
+            backend checksum of ``value`` if already computed (along with
+            ``full_hash``), by default None
         """
-        full_hash = self._schema.data_hash_digest(value)
+        if full_hash is None:
+            full_hash, checksum = self._schema.data_hash_digest_checksum(value)
 
         hashKey = hash_data_db_key_from_raw_key(full_hash)
         # check if data record already exists with given key
@@ -495,7 +540,10 @@ class FlatSampleWriter(FlatSampleReader):
         # write new data if data hash does not exist
         existingHashVal = self._txnctx.hashTxn.get(hashKey, default=False)
         if existingHashVal is False:
-            hashVal = self._be_fs[self._schema.backend].write_data(value)
+            if checksum is None:
+                hashVal = self._be_fs[self._schema.backend].write_data(value)
+            else:
+                hashVal = self._be_fs[self._schema.backend].write_data(value, checksum=checksum)
             self._txnctx.hashTxn.put(hashKey, hashVal)
             self._txnctx.stageHashTxn.put(hashKey, hashVal)
             hash_spec = backend_decoder(hashVal)
@@ -620,8 +668,10 @@ class FlatSampleWriter(FlatSampleReader):
 
             for key, val in other.items():
                 self._set_arg_validate(key, val)
-            for key, val in other.items():
-                self._perform_set(key, val)
+            # hash the whole batch at once (in parallel for large ndarray batches)
+            digests = self._schema.data_hash_digests_checksums(list(other.values()))
+            for (key, val), (full_hash, checksum) in zip(other.items(), digests):
+                self._perform_set(key, val, full_hash, checksum)
 
     def __delitem__(self, key: KeyType) -> None:
         """Remove a sample from the column. Convenience method to :meth:`delete`.
@@ -417,7 +417,7 @@ class FlatSubsampleWriter(FlatSubsampleReader):
         if not isCompat.compatible:
             raise ValueError(isCompat.reason)
 
-    def _perform_set(self, key, value):
+    def _perform_set(self, key, value, full_hash=None, checksum=None):
         """Internal write method. Assumes all arguments validated and cm open.
 
         Parameters
@@ -426,9 +426,14 @@ class FlatSubsampleWriter(FlatSubsampleReader):
             subsample key to store
         value
             data to store
+        full_hash
+            digest of ``value`` if already computed, by default None
+        checksum
+            backend checksum of ``value`` if already computed (along with
+            ``full_hash``), by default None
         """
-        # full_hash = ndarray_hasher_tcode_0(value)
-        full_hash = self._schema.data_hash_digest(value)
+        if full_hash is None:
+            full_hash, checksum = self._schema.data_hash_digest_checksum(value)
         hashKey = hash_data_db_key_from_raw_key(full_hash)
 
         # check if data record already exists with given key
@@ -444,7 +449,10 @@ class FlatSubsampleWriter(FlatSubsampleReader):
         existingHashVal = self._txnctx.hashTxn.get(hashKey, default=False)
         if existingHashVal is False:
             backendCode = self._schema.backend
-            hashVal = self._be_fs[backendCode].write_data(value)
+            if checksum is None:
+                hashVal = self._be_fs[backendCode].write_data(value)
+            else:
+                hashVal = self._be_fs[backendCode].write_data(value, checksum=checksum)
             self._txnctx.hashTxn.put(hashKey, hashVal)
             self._txnctx.stageHashTxn.put(hashKey, hashVal)
             hash_spec = backend_decoder(hashVal)
@@ -567,8 +575,10 @@ class FlatSubsampleWriter(FlatSubsampleReader):
 
             for key, val in other.items():
                 self._set_arg_validate(key, val)
-            for key, val in other.items():
-                self._perform_set(key, val)
+            # hash the whole batch at once (in parallel for large ndarray batches)
+            digests = self._schema.data_hash_digests_checksums(list(other.values()))
+            for (key, val), (full_hash, checksum) in zip(other.items(), digests):
+                self._perform_set(key, val, full_hash, checksum)
 
     def __delitem__(self, key: KeyType):
         """Remove a subsample from the column.`.
@@ -917,6 +927,23 @@ class NestedSampleReader:
         _remote_keys_func = op_attrgetter('remote_reference_keys')
         return tuple(valfilter(_remote_keys_func, self._samples).keys())
 
+    @property
+    def _read_through(self):
+        """Remote read-through object of the column, if it was enabled.
+        """
+        remote_be = self._be_fs.get('50')
+        return getattr(remote_be, 'read_through', None)
+
+    def _hint_remote_reads(self, keys: Iterable[KeyType]):
+        """Inform read-through of the sample keys which will be read next (in order).
+
+        Every subsample of each sample is hinted.
+        """
+        read_through = self._read_through
+        if read_through is not None:
+            specs = (spec for key in keys for spec in self._samples[key]._subsamples.values())
+            read_through.hint([spec for spec in specs if not spec.islocal])
+
     @property
     def contains_subsamples(self) -> bool:
         """Bool indicating if sub-samples are contained in this column container.
@@ -16,6 +16,7 @@ K_INT = f'#'  # must be length 1 value
 K_BRANCH = f'branch{SEP_KEY}'
 K_HEAD = 'head'
 K_REMOTES = f'remote{SEP_KEY}'
+K_REMOTE_FILTER = f'remotefilter{SEP_KEY}'
 K_STGARR = f'a{SEP_KEY}'
 K_STGMETA = f'l{SEP_KEY}'
 K_SCHEMA = f's{SEP_KEY}'
@@ -33,6 +34,7 @@ DIR_DATA = 'data'
 DIR_DATA_STORE = 'store_data'
 DIR_DATA_STAGE = 'stage_data'
 DIR_DATA_REMOTE = 'remote_data'
+DIR_SAMPLE_CACHE = 'sample_cache'
 
 # configuration file names:
 
@@ -56,6 +58,12 @@ LMDB_HASH_NAME = 'hash.lmdb'
 LMDB_BRANCH_NAME = 'branch.lmdb'
 LMDB_STAGE_REF_NAME = 'stage_ref.lmdb'
 LMDB_STAGE_HASH_NAME = 'stage_hash.lmdb'
+LMDB_TRANSFER_JOURNAL_NAME = 'transfer_journal.lmdb'
+LMDB_STORAGE_LEDGER_NAME = 'storage_ledger.lmdb'
+
+# record of backend files verified by the last successful integrity check
+
+INTEGRITY_VERIFIED_LOG_NAME = 'integrity_verified.jsonl'
 
 # readme file
 
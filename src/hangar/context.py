@@ -5,7 +5,8 @@ import platform
 import shutil
 import tempfile
 import warnings
-from typing import MutableMapping, Optional
+from typing import MutableMapping, Optional, Union
+from weakref import WeakValueDictionary
 
 import lmdb
 
@@ -22,6 +23,7 @@ from .constants import (
     LMDB_SETTINGS,
     LMDB_STAGE_HASH_NAME,
     LMDB_STAGE_REF_NAME,
+    LMDB_STORAGE_LEDGER_NAME,
     README_FILE_NAME,
 )
 from .records.commiting import unpack_commit_ref
@@ -42,6 +44,9 @@ from .utils import readme_contents, is_64bits
 
 class Environments(object):
 
+    # environments currently open in this process, keyed by the resolved repo path
+    _opened: MutableMapping[str, 'Environments'] = WeakValueDictionary()
+
     def __init__(self, pth: Path):
 
         self.repo_path: Path = pth
@@ -50,6 +55,7 @@ class Environments(object):
         self.stageenv: Optional[lmdb.Environment] = None
         self.branchenv: Optional[lmdb.Environment] = None
         self.stagehashenv: Optional[lmdb.Environment] = None
+        self.ledgerenv: Optional[lmdb.Environment] = None
         self.cmtenv: MutableMapping[str, lmdb.Environment] = {}
         self._startup()
 
@@ -65,6 +71,23 @@ class Environments(object):
         ret = True if isinstance(self.refenv, lmdb.Environment) else False
         return ret
 
+    @classmethod
+    def opened(cls, repo_path: Union[str, Path]) -> Optional['Environments']:
+        """Environments of the repository at ``repo_path`` open in this process.
+
+        Parameters
+        ----------
+        repo_path : Union[str, Path]
+            path to the hangar directory of the repository.
+
+        Returns
+        -------
+        Optional[Environments]
+            the open environments, or None if the repository environments
+            are not currently open in this process.
+        """
+        return cls._opened.get(os.path.realpath(repo_path))
+
     def _startup(self) -> bool:
         """When first access to the Repo starts, attempt to open the db envs.
 
@@ -221,20 +244,26 @@ class Environments(object):
         stage_pth = str(self.repo_path.joinpath(LMDB_STAGE_REF_NAME))
         branch_pth = str(self.repo_path.joinpath(LMDB_BRANCH_NAME))
         stagehash_pth = str(self.repo_path.joinpath(LMDB_STAGE_HASH_NAME))
+        ledger_pth = str(self.repo_path.joinpath(LMDB_STORAGE_LEDGER_NAME))
 
         self.refenv = lmdb.open(path=ref_pth, **LMDB_SETTINGS)
         self.hashenv = lmdb.open(path=hash_pth, **LMDB_SETTINGS)
         self.stageenv = lmdb.open(path=stage_pth, **LMDB_SETTINGS)
         self.branchenv = lmdb.open(path=branch_pth, **LMDB_SETTINGS)
         self.stagehashenv = lmdb.open(path=stagehash_pth, **LMDB_SETTINGS)
+        self.ledgerenv = lmdb.open(path=ledger_pth, **LMDB_SETTINGS)
+        self._opened[os.path.realpath(self.repo_path)] = self
 
     def _close_environments(self):
 
+        if self.opened(self.repo_path) is self:
+            del self._opened[os.path.realpath(self.repo_path)]
         self.refenv.close()
         self.hashenv.close()
         self.stageenv.close()
         self.branchenv.close()
         self.stagehashenv.close()
+        self.ledgerenv.close()
         for env in self.cmtenv.values():
             if platform.system() == 'Windows':
                 envpth = env.path()
@@ -10,11 +10,18 @@ if typing.TYPE_CHECKING:
     KeyType = Union[str, int, List, Tuple]
 
 
+def _local_only(column) -> bool:
+    """If only keys of locally available data can be read from the column.
+    """
+    return column._read_through is None
+
+
 class HangarDataset:
     """Dataset class that does the initial checks to verify whether the provided
     columns can be arranged together as a dataset. These verifications are done on the
     keys of each column. If ``keys`` argument is ``None``, initializer of this class
-    makes the key list by checking the local keys across all columns.
+    makes the key list by checking the local keys across all columns (or every key
+    for columns read from a checkout with ``read_through_remote`` enabled).
     If ``keys`` argument is provided, then it assumes the provided keys are valid and
     restrain from doing any more check on it.
     It provides the ``__getitem__`` accessor for downstream process to consume the
@@ -66,18 +73,18 @@ class HangarDataset:
             for idx, col in enumerate(self._columns.values()):
                 # only match top level keys, even for nested columns
                 if idx == 0:
-                    standard_keys = set(col.keys(local=True))
+                    standard_keys = set(col.keys(local=_local_only(col)))
                     if len(standard_keys) == 0:
                         raise RuntimeError("No local data found")
                 else:
-                    key_set = set(col.keys(local=True))
+                    key_set = set(col.keys(local=_local_only(col)))
                     if len(standard_keys.symmetric_difference(key_set)) != 0:
                         raise KeyError("Keys from multiple columns couldn't be matched. "
                                        "Pass keys explicitly while creating dataset")
                 if col.column_layout == 'flat':
-                    column_keys = (sample for sample in col.keys(local=True))
+                    column_keys = (sample for sample in col.keys(local=_local_only(col)))
                 elif col.column_layout == 'nested':
-                    column_keys = ((sample, ...) for sample in col.keys(local=True))
+                    column_keys = ((sample, ...) for sample in col.keys(local=_local_only(col)))
                 else:
                     raise RuntimeError(f'unknown column layout: {col}')
 
@@ -110,3 +117,24 @@ class HangarDataset:
                 )
             res = (column[key] for column, key in zip(self.columns.values(), keys))
             return tuple(res)
+
+    def prefetch(self, indices: Sequence[int]):
+        """Hint the order samples will be read in to columns which read through to
+        a remote, so that upcoming samples are retrieved alongside each miss.
+
+        Parameters
+        ----------
+        indices
+            dataset indices which will be passed to :meth:`index_get` next.
+        """
+        columns = tuple(self.columns.values())
+        if all(_local_only(col) for col in columns):
+            return
+        keys = [self._keys[index] for index in indices]
+        if len(columns) == 1:
+            keys = [(key,) for key in keys]
+        for idx, col in enumerate(columns):
+            col_keys = (key[idx] for key in keys)
+            if col.column_layout == 'nested':
+                col_keys = (key[0] if isinstance(key, tuple) else key for key in col_keys)
+            col._hint_remote_reads(col_keys)
@@ -136,6 +136,7 @@ class NumpyDataset:
     def __iter__(self):
         if self._shuffle:
             random.shuffle(self._indices)
+        self._dataset.prefetch(self._indices)
         if self._num_batches is None:
             for i in self._indices:
                 yield self._dataset.index_get(i)
@@ -25,6 +25,7 @@ def yield_data(dataset: HangarDataset, indices: list,
                shuffle: bool) -> Tuple['np.ndarray']:
     if shuffle:
         random.shuffle(indices)
+    dataset.prefetch(indices)
     for i in indices:
         out = dataset.index_get(i)
         yield out if isinstance(out, tuple) else (out,)
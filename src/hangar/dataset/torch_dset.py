@@ -27,6 +27,9 @@ class TorchDataset(torch.utils.data.Dataset):
         self.dataset = hangar_dataset
         self.column_names = list(hangar_dataset.columns.keys())
         self._as_dict = as_dict
+        # only takes effect in the main process; columns pickled into
+        # DataLoader worker processes do not read through to the remote.
+        self.dataset.prefetch(range(len(hangar_dataset)))
 
     def __len__(self) -> int:
         return len(self.dataset)
@@ -1,5 +1,14 @@
-from pathlib import Path
+import json
+import multiprocessing as mp
+import os
 import warnings
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple, Union
 
 import lmdb
 from tqdm import tqdm
@@ -9,43 +18,237 @@ from ..records import (
     hash_schema_db_key_from_raw_key,
 )
 from ..backends import BACKEND_ACCESSOR_MAP
+from ..backends.worker import WORKER_ACCESSORS, open_worker_accessors, spec_location
+from ..constants import INTEGRITY_VERIFIED_LOG_NAME
 from ..txnctx import TxnRegister
+from ..utils import calc_num_process_workers
 from ..records import commiting, hashmachine, hashs, parsing, queries, heads
 from ..op_state import report_corruption_risk_on_parsing_error
 
 
-@report_corruption_risk_on_parsing_error
-def _verify_column_integrity(hashenv: lmdb.Environment, repo_path: Path):
+def _verify_file_records(accessor, records: List[tuple]) -> List[dict]:
+    """Read and rehash every data piece stored in a single backend file.
+
+    Returns
+    -------
+    List[dict]
+        description of each data piece which could not be read or whose
+        calculated digest does not match the recorded one (empty if intact).
+    """
+    corrupt = []
+    for digest, spec in records:
+        try:
+            data = accessor.read_data(spec)
+            tcode = hashmachine.hash_type_code_from_digest(digest)
+            calc_digest = hashmachine.hash_func_from_tcode(tcode)(data)
+        except Exception as e:
+            corrupt.append({'digest': digest, 'spec': str(spec), 'error': str(e)})
+            continue
+        if calc_digest != digest:
+            corrupt.append({
+                'digest': digest,
+                'spec': str(spec),
+                'error': (f'Data corruption detected for array. Expected digest `{digest}` '
+                          f'currently mapped to spec `{spec}`. Found digest `{calc_digest}`')})
+    return corrupt
+
+
+def _verify_file_records_in_worker(records: List[tuple]) -> List[dict]:
+    return _verify_file_records(WORKER_ACCESSORS[records[0][1].backend], records)
+
+
+def _group_data_records_by_file(hashenv: lmdb.Environment) -> Tuple[Dict[str, List[tuple]], int]:
+    """Group (digest, spec) of every local data piece by the backend file storing it.
 
+    Records in each group are sorted by location within the file, so every file
+    is read sequentially. Returns the groups (keyed by ``{backend}:{uid}``) and
+    the number of data pieces only referenced on a remote server.
+    """
+    nremote = 0
+    files = defaultdict(list)
     hq = hashs.HashQuery(hashenv)
-    narrays, nremote = hq.num_data_records(), 0
-    array_kvs = hq.gen_all_data_digests_and_parsed_backend_specs()
-    try:
-        bes = {}
-        for digest, spec in tqdm(array_kvs, total=narrays, desc='verifying column data'):
-            if spec.backend not in bes:
-                bes[spec.backend] = BACKEND_ACCESSOR_MAP[spec.backend](repo_path, None, None)
-                bes[spec.backend].open(mode='r')
-            if spec.islocal is False:
-                nremote += 1
+    for digest, spec in hq.gen_all_data_digests_and_parsed_backend_specs():
+        if spec.islocal is False:
+            nremote += 1
+            continue
+        files[f'{spec.backend}:{spec.uid}'].append((digest, spec))
+    for records in files.values():
+        records.sort(key=lambda record: spec_location(record[1]))
+    return dict(files), nremote
+
+
+def _read_verified_files_log(fpath: Optional[Path]) -> Dict[str, int]:
+    """Read ``{file: num_data_pieces}`` of files recorded as verified in a log.
+
+    Logs are JSON lines files; a partially written last line (ie. if a run was
+    killed while appending to a checkpoint) is ignored.
+    """
+    verified = {}
+    if (fpath is None) or (not fpath.is_file()):
+        return verified
+    with open(fpath, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
                 continue
-            data = bes[spec.backend].read_data(spec)
-            tcode = hashmachine.hash_type_code_from_digest(digest)
+            verified[record['file']] = record['num_data_pieces']
+    return verified
 
-            hash_func = hashmachine.hash_func_from_tcode(tcode)
-            calc_digest = hash_func(data)
-            if calc_digest != digest:
-                raise RuntimeError(
-                    f'Data corruption detected for array. Expected digest `{digest}` '
-                    f'currently mapped to spec `{spec}`. Found digest `{calc_digest}`')
-        if nremote > 0:
-            warnings.warn(
-                'Can not verify integrity of partially fetched array data references. '
-                f'For complete proof, fetch all remote data locally. Did not verify '
-                f'{nremote}/{narrays} arrays', RuntimeWarning)
+
+def _write_verified_files_log(fpath: Path, verified: Dict[str, int]):
+    tmp_fpath = fpath.with_name(f'.{fpath.name}.tmp')
+    with open(tmp_fpath, 'w') as f:
+        for fname, num in sorted(verified.items()):
+            f.write(json.dumps({'file': fname, 'num_data_pieces': num}) + '\n')
+    os.replace(tmp_fpath, fpath)
+
+
+@report_corruption_risk_on_parsing_error
+def _verify_column_integrity(hashenv: lmdb.Environment,
+                             repo_path: Path,
+                             *,
+                             ncpus: int = 1,
+                             checkpoint: Optional[Path] = None,
+                             incremental: bool = False,
+                             report: Optional[dict] = None):
+    """Read and rehash every locally stored data piece, one backend file at a time.
+
+    Parameters
+    ----------
+    hashenv : lmdb.Environment
+        db where the hash records are stored.
+    repo_path : Path
+        path to the repository ``.hangar`` directory.
+    ncpus : int, optional
+        Number of processes verifying backend files in parallel. If 1 (default)
+        verification is performed in this process. If <= 0, ``num_cpus / 2``.
+    checkpoint : Optional[Path], optional
+        JSON lines file which every backend file is appended to once verified.
+        Files already recorded (with the same number of data pieces) are
+        skipped, so an interrupted run resumes where it left off. Removed once
+        every file is verified. By default None (no checkpoint).
+    incremental : bool, optional
+        Only verify backend files which were not verified (with the same number
+        of data pieces) by the last successful run, by default False.
+    report : Optional[dict], optional
+        If provided, updated with a machine-readable summary of the run.
+
+    Raises
+    ------
+    RuntimeError
+        If any data piece cannot be read or does not match its recorded digest
+        (once every file has been verified).
+    """
+    report = report if report is not None else {}
+    log_fpath = Path(repo_path, INTEGRITY_VERIFIED_LOG_NAME)
+    previously_verified = _read_verified_files_log(log_fpath) if incremental else {}
+    checkpointed = _read_verified_files_log(checkpoint)
+    files, nremote = _group_data_records_by_file(hashenv)
+
+    skipped, to_verify = {}, {}
+    for fname, records in files.items():
+        num = len(records)
+        if (previously_verified.get(fname) == num) or (checkpointed.get(fname) == num):
+            skipped[fname] = num
+        else:
+            to_verify[fname] = records
+
+    file_reports = [{'file': fname, 'num_data_pieces': num, 'status': 'skipped'}
+                    for fname, num in skipped.items()]
+    corrupt = []
+    verified = {}
+    ckpt_f = open(checkpoint, 'a') if checkpoint is not None else None
+    try:
+        for fname, file_corrupt in tqdm(
+                _gen_verified_files(to_verify, repo_path, ncpus),
+                total=len(to_verify), desc='verifying column data files'):
+            num = len(to_verify[fname])
+            file_reports.append({
+                'file': fname,
+                'num_data_pieces': num,
+                'status': 'corrupt' if file_corrupt else 'verified'})
+            if file_corrupt:
+                corrupt.extend(dict(file=fname, **c) for c in file_corrupt)
+                continue
+            verified[fname] = num
+            if ckpt_f is not None:
+                ckpt_f.write(json.dumps({'file': fname, 'num_data_pieces': num}) + '\n')
+                ckpt_f.flush()
     finally:
-        for be in bes.keys():
-            bes[be].close()
+        if ckpt_f is not None:
+            ckpt_f.close()
+
+    report.update({
+        'num_files': len(files),
+        'num_files_verified': len(verified),
+        'num_files_skipped': len(skipped),
+        'num_data_pieces_verified': sum(verified.values()),
+        'num_data_pieces_remote': nremote,
+        'files': sorted(file_reports, key=lambda r: r['file']),
+        'corrupt': corrupt,
+    })
+    if corrupt:
+        ncorrupt_files = sum(r['status'] == 'corrupt' for r in file_reports)
+        raise RuntimeError(
+            f'{len(corrupt)} corrupt data pieces found in {ncorrupt_files} backend '
+            f'files. First: {corrupt[0]["error"]}')
+
+    verified.update(skipped)
+    _write_verified_files_log(log_fpath, verified)
+    if checkpoint is not None:
+        checkpoint.unlink()
+    if nremote > 0:
+        warnings.warn(
+            'Can not verify integrity of partially fetched array data references. '
+            f'For complete proof, fetch all remote data locally. Did not verify '
+            f'{nremote}/{nremote + sum(len(r) for r in files.values())} arrays', RuntimeWarning)
+
+
+def _gen_verified_files(files: Dict[str, List[tuple]], repo_path: Path, ncpus: int):
+    """Yield ``(file, corrupt)`` for each backend file as its verification completes.
+    """
+    if not files:
+        return
+    if ncpus == 1:
+        bes = {}
+        try:
+            for fname, records in files.items():
+                backend = records[0][1].backend
+                if backend not in bes:
+                    bes[backend] = BACKEND_ACCESSOR_MAP[backend](repo_path, None, None)
+                    bes[backend].open(mode='r')
+                yield fname, _verify_file_records(bes[backend], records)
+        finally:
+            for be in bes.values():
+                be.close()
+        return
+
+    ncpu = calc_num_process_workers(ncpus)
+    with ProcessPoolExecutor(max_workers=ncpu,
+                             mp_context=mp.get_context(),
+                             initializer=open_worker_accessors,
+                             initargs=(str(repo_path),)) as pool:
+        items = iter(files.items())
+        pending = {}
+
+        def submit_next(n):
+            for fname, records in islice(items, n):
+                pending[pool.submit(_verify_file_records_in_worker, records)] = fname
+
+        # keep a bounded number of files queued so results stream back in order
+        # of completion without scheduling every file up front.
+        submit_next(2 * ncpu)
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fname = pending.pop(future)
+                    yield fname, future.result()
+                submit_next(len(done))
+        finally:
+            for future in pending:
+                future.cancel()
 
 
 @report_corruption_risk_on_parsing_error
@@ -166,10 +369,39 @@ def _verify_branch_integrity(branchenv: lmdb.Environment, refenv: lmdb.Environme
 def run_verification(branchenv: lmdb.Environment,
                      hashenv: lmdb.Environment,
                      refenv: lmdb.Environment,
-                     repo_path: Path):
+                     repo_path: Path,
+                     *,
+                     ncpus: int = 1,
+                     checkpoint: Optional[Union[str, Path]] = None,
+                     incremental: bool = False,
+                     report: Optional[Union[str, Path]] = None):
+    """Run every integrity check, optionally writing a JSON report of the results.
 
-    _verify_branch_integrity(branchenv, refenv)
-    _verify_commit_tree_integrity(refenv)
-    _verify_commit_ref_digests_exist(hashenv, refenv)
-    _verify_schema_integrity(hashenv)
-    _verify_column_integrity(hashenv, repo_path)
+    See :func:`_verify_column_integrity` for the meaning of ``ncpus``,
+    ``checkpoint`` and ``incremental``. If ``report`` is set, a JSON document
+    is written to that path whether the verification passes or fails.
+    """
+    checkpoint = Path(checkpoint) if checkpoint is not None else None
+    summary = {
+        'status': 'failed',
+        'mode': 'incremental' if incremental else 'full',
+        'started': datetime.now(timezone.utc).isoformat(),
+        'error': None,
+    }
+    start = perf_counter()
+    try:
+        _verify_branch_integrity(branchenv, refenv)
+        _verify_commit_tree_integrity(refenv)
+        _verify_commit_ref_digests_exist(hashenv, refenv)
+        _verify_schema_integrity(hashenv)
+        _verify_column_integrity(hashenv, repo_path, ncpus=ncpus, checkpoint=checkpoint,
+                                 incremental=incremental, report=summary)
+        summary['status'] = 'passed'
+    except RuntimeError as e:
+        summary['error'] = str(e)
+        raise
+    finally:
+        summary['elapsed_seconds'] = round(perf_counter() - start, 3)
+        if report is not None:
+            with open(report, 'w') as f:
+                json.dump(summary, f, indent=2)
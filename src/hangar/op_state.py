@@ -141,7 +141,7 @@ def report_corruption_risk_on_parsing_error(func):
     """
     def wrapped(*args, **kwargs):
         try:
-            func(*args, **kwargs)
+            return func(*args, **kwargs)
         except RuntimeError as e:
             raise e
         except Exception as e:
@@ -1,4 +1,4 @@
-from .hashmachine import hash_func_from_tcode
+from .hashmachine import hash_func_from_tcode, hash_ndarrays
 from .column_parsers import *
 from .recordstructs import (
     CompatibleData,
@@ -11,6 +11,7 @@ from .recordstructs import (
 
 __all__ = column_parsers.__all__ + [
     'hash_func_from_tcode',
+    'hash_ndarrays',
     'CompatibleData',
     'ColumnSchemaKey',
     'FlatColumnDataKey',
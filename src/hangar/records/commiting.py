@@ -37,6 +37,7 @@ from ..constants import (
     SEP_KEY,
 )
 from ..txnctx import TxnRegister
+from .ledger import record_commit, record_store_files
 
 """
 Reading commit specifications and parents.
@@ -551,8 +552,10 @@ def commit_records(message, branchenv, stageenv, refenv, repo_path: Path,
         headBranchName = get_staging_branch_head(branchenv)
         set_branch_head_commit(branchenv, headBranchName, commit_hash)
     else:
+        headBranchName = merge_master
         set_staging_branch_head(branchenv=branchenv, branch_name=merge_master)
         set_branch_head_commit(branchenv, merge_master, commit_hash)
+    record_commit(repo_path, commit_hash, stageenv, refenv, branch=headBranchName)
 
     return commit_hash
 
@@ -663,6 +666,7 @@ def move_process_data_to_store(repo_path: Path, *, remote_operation: bool = Fals
         if not fpth.parent.is_dir():
             fpth.parent.mkdir()
         fpth.touch()
+    record_store_files(repo_path, store_fps)
 
     # reset before releasing control.
     shutil.rmtree(process_dir)
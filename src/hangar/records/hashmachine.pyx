@@ -1,8 +1,21 @@
 import array
 from cpython cimport array
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from hashlib import blake2b
+from xxhash import xxh64
+
+# Arrays are fed to the hashers in blocks of this many bytes so both hashers
+# read a block while it is still in cache (a single pass over main memory).
+# hashlib & xxhash release the GIL while hashing blocks of this size.
+DEF HASH_BLOCK_NBYTES = 262_144
+
+# Batches with less data than this are hashed in the calling thread.
+DEF THREADED_MIN_NBYTES = 4_194_304
 
 
 cpdef str hash_type_code_from_digest(str digest):
@@ -37,6 +50,12 @@ cdef bytes ser_int_list(list lst):
     return res.data.as_chars[:n*sizeof(int)]
 
 
+cdef bytes ndarray_other_info(array):
+    cdef list shape = list(array.shape)
+    shape.append(array.dtype.num)
+    return ser_int_list(shape)
+
+
 def ndarray_hasher_tcode_0(array not None):
     """Generate the hex digest of some array data.
 
@@ -57,19 +76,95 @@ def ndarray_hasher_tcode_0(array not None):
         hex digest of the array data with typecode prepended by '{tcode}='.
     """
     cdef str digest
-    cdef bytes other_info
-    cdef list shape = []
-
-    shape = list(array.shape)
-    shape.append(array.dtype.num)
-    other_info = ser_int_list(shape)
 
     hasher = blake2b(array, digest_size=20)
-    hasher.update(other_info)
+    hasher.update(ndarray_other_info(array))
     digest = hasher.hexdigest()
     return f'0={digest}'
 
 
+cpdef tuple ndarray_hasher_checksum_tcode_0(array):
+    """Generate the hex digest and xxh64 checksum of array data in one pass.
+
+    The digest is identical to :func:`ndarray_hasher_tcode_0` and the checksum
+    to ``xxhash.xxh64_hexdigest(array)`` (as recorded by the backends), but the
+    array bytes are only read from memory once: both hashers are updated block
+    by block.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        (C contiguous) array data to take the hash of
+
+    Returns
+    -------
+    tuple
+        two-tuple of (hex digest with typecode prepended by '{tcode}=',
+        xxh64 hex digest of the array bytes).
+    """
+    cdef Py_ssize_t start, nbytes
+
+    if not array.flags.c_contiguous:
+        raise ValueError('ndarray is not C-contiguous')
+    hasher = blake2b(digest_size=20)
+    checksummer = xxh64()
+    nbytes = array.nbytes
+    # (empty arrays cannot be cast to a flat byte view)
+    view = memoryview(array).cast('B') if nbytes > 0 else b''
+    for start in range(0, nbytes, HASH_BLOCK_NBYTES):
+        block = view[start:start + HASH_BLOCK_NBYTES]
+        hasher.update(block)
+        checksummer.update(block)
+    hasher.update(ndarray_other_info(array))
+    return f'0={hasher.hexdigest()}', checksummer.hexdigest()
+
+
+_HASH_POOL = None
+_HASH_POOL_LOCK = threading.Lock()
+
+
+def _hash_pool():
+    global _HASH_POOL
+    if _HASH_POOL is None:
+        with _HASH_POOL_LOCK:
+            if _HASH_POOL is None:
+                _HASH_POOL = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1, thread_name_prefix='hangar-hash')
+    return _HASH_POOL
+
+
+def hash_ndarrays(list arrays, bint checksums=False):
+    """Generate the hex digests of a batch of arrays, in parallel threads.
+
+    Batches holding enough data are split between the threads of a shared
+    pool (hashing releases the GIL, so it scales across cores); small batches
+    are hashed in the calling thread.
+
+    Parameters
+    ----------
+    arrays : list
+        arrays to take the hash of.
+    checksums : bool, optional
+        if True, also compute the xxh64 checksum of each array (in the same
+        pass over memory). By default False.
+
+    Returns
+    -------
+    list
+        hex digest of each array (as :func:`ndarray_hasher_tcode_0`). If
+        ``checksums``, two-tuples of (hex digest, xxh64 checksum) as
+        :func:`ndarray_hasher_checksum_tcode_0` instead.
+    """
+    cdef Py_ssize_t nbytes = 0
+
+    func = ndarray_hasher_checksum_tcode_0 if checksums else ndarray_hasher_tcode_0
+    for arr in arrays:
+        nbytes += arr.nbytes
+    if (len(arrays) < 2) or (nbytes < THREADED_MIN_NBYTES) or ((os.cpu_count() or 1) < 2):
+        return [func(arr) for arr in arrays]
+    return list(_hash_pool().map(func, arrays))
+
+
 # ------------------------------ Schema ---------------------------------------
 
 
@@ -6,6 +6,7 @@ import lmdb
 
 from .parsing import (
     remote_db_key_from_raw_key,
+    remote_filter_db_key_from_raw_key,
     remote_db_val_from_raw_val,
     remote_raw_key_from_db_key,
     remote_raw_val_from_db_val,
@@ -634,6 +635,7 @@ def remove_remote(branchenv: lmdb.Environment, name: str) -> str:
     branchTxn = TxnRegister().begin_writer_txn(branchenv)
     try:
         dbVal = branchTxn.pop(dbKey)
+        branchTxn.delete(remote_filter_db_key_from_raw_key(name))
     finally:
         TxnRegister().commit_writer_txn(branchenv)
 
@@ -645,6 +647,53 @@ def remove_remote(branchenv: lmdb.Environment, name: str) -> str:
     return remote_address
 
 
+def set_remote_filter(branchenv: lmdb.Environment, name: str, filter_json: str):
+    """Record the partial clone filter used when fetching from a remote.
+
+    Parameters
+    ----------
+    branchenv : lmdb.Environment
+        db where the branch (and remote) records are stored.
+    name : str
+        name of the remote the filter applies to.
+    filter_json : str
+        serialized filter. If empty, any recorded filter is removed.
+    """
+    dbKey = remote_filter_db_key_from_raw_key(name)
+    branchTxn = TxnRegister().begin_writer_txn(branchenv)
+    try:
+        if filter_json:
+            branchTxn.put(dbKey, filter_json.encode())
+        else:
+            branchTxn.delete(dbKey)
+    finally:
+        TxnRegister().commit_writer_txn(branchenv)
+
+
+def get_remote_filter(branchenv: lmdb.Environment, name: str) -> str:
+    """Retrieve the partial clone filter recorded for a remote.
+
+    Parameters
+    ----------
+    branchenv : lmdb.Environment
+        db where the branch (and remote) records are stored.
+    name : str
+        name of the remote.
+
+    Returns
+    -------
+    str
+        serialized filter, or empty string if no filter is recorded.
+    """
+    dbKey = remote_filter_db_key_from_raw_key(name)
+    branchTxn = TxnRegister().begin_reader_txn(branchenv)
+    try:
+        dbVal = branchTxn.get(dbKey, default=b'')
+    finally:
+        TxnRegister().abort_reader_txn(branchenv)
+    return bytes(dbVal).decode()
+
+
 def get_remote_names(branchenv):
     """get a list of all remotes in the repository.
 
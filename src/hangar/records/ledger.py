@@ -0,0 +1,614 @@
+"""Incrementally maintained ledger of the storage used by a repository.
+
+Walking the repository directory to total the size of (potentially millions
+of) data files is prohibitively slow for large repositories. Instead, the size
+of every backend data file is recorded once, at the time it is moved into the
+store (when a commit is made, or data is fetched from a remote), and the
+storage statistics of a commit are recorded once, when the commit is made (or
+the first time they are requested for commits made elsewhere). The
+statistics of a new commit are derived from those of its parent and the
+records changed since, so only the diff of each commit is traversed. All
+queries are then answered from these records.
+
+Records are kept in the ledger lmdb environment of the repository (opened with
+the other repository dbs in :class:`~hangar.context.Environments`):
+
+* ``f:{backend}:{uid}`` -> nbytes of a stored backend data file
+* ``b:{backend}`` -> json encoded ``[num_files, nbytes]`` totals of a backend
+* ``d:{digest}`` -> nbytes of a data piece (the size of the stored value)
+* ``c:{commit}`` -> json encoded storage statistics of a commit
+* ``t:{branch}`` -> digest of the commit reference counts are kept for on a
+  branch (the last commit recorded on it)
+* ``r:{branch}:{digest}:{column}`` -> number of records of a column
+  referencing a data piece in the commit tracked on the branch
+* ``g:{branch}:{digest}`` -> number of records referencing a data piece in the
+  commit tracked on the branch
+* ``initialized`` -> set once files stored before the ledger existed are recorded
+"""
+import json
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import lmdb
+import numpy as np
+
+from .hashs import HashQuery
+from .column_parsers import (
+    data_record_digest_val_from_db_val,
+    dynamic_layout_data_record_from_db_key,
+    hash_data_db_key_from_raw_key,
+)
+from .queries import RecordQuery
+from ..backends import BACKEND_ACCESSOR_MAP, backend_decoder
+from ..constants import (
+    DIR_DATA,
+    DIR_DATA_REMOTE,
+    DIR_DATA_STAGE,
+    DIR_DATA_STORE,
+    LMDB_SETTINGS,
+    LMDB_STORAGE_LEDGER_NAME,
+)
+from ..txnctx import TxnRegister
+from ..utils import folder_size
+
+_K_INITIALIZED = b'initialized'
+
+
+class BackendStorageStats(NamedTuple):
+    """Number of stored data files (and their size) of a backend.
+    """
+    num_files: int
+    nbytes: int
+
+
+class ColumnStorageStats(NamedTuple):
+    """Size of the data referenced by a column at some commit.
+
+    ``logical_nbytes`` counts the data of every record (as if there was no
+    deduplication), ``unique_nbytes`` counts every unique data piece once.
+    """
+    num_data_records: int
+    num_data_pieces: int
+    logical_nbytes: int
+    unique_nbytes: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        return (self.logical_nbytes / self.unique_nbytes) if self.unique_nbytes else 1.0
+
+
+class CommitStorageStats(NamedTuple):
+    """Size of the data reachable from (ie. checked out by) a commit.
+
+    ``num_unresolved`` data pieces are only referenced on a remote server (in a
+    partially fetched repository); their size is not known or counted.
+    """
+    commit: str
+    num_data_records: int
+    num_data_pieces: int
+    logical_nbytes: int
+    unique_nbytes: int
+    num_unresolved: int
+    columns: Dict[str, ColumnStorageStats]
+
+    @property
+    def dedup_ratio(self) -> float:
+        return (self.logical_nbytes / self.unique_nbytes) if self.unique_nbytes else 1.0
+
+
+class StorageStats(NamedTuple):
+    """Disk space used by a repository, with a breakdown by backend.
+
+    ``data_nbytes`` is the size of all data files in the store, and
+    ``staged_nbytes`` the size of data files written since the last commit
+    (or fetch). ``metadata_nbytes`` is the size of the record databases.
+    """
+    nbytes: int
+    data_nbytes: int
+    staged_nbytes: int
+    metadata_nbytes: int
+    backends: Dict[str, BackendStorageStats]
+    commit: Optional[CommitStorageStats]
+
+
+def _dumps(obj) -> bytes:
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _data_file_nbytes(repo_path: Path, backend: str, name: str) -> int:
+    """Size of the data file a ``{process/store dir}/{backend}/{name}`` entry refers to.
+    """
+    pth = Path(repo_path, DIR_DATA, backend, name)
+    if pth.is_file():
+        return pth.stat().st_size
+    # lmdb backends store a directory of files for each data "file".
+    pth = pth.with_name(Path(name).stem)
+    if pth.is_dir():
+        return folder_size(pth, recurse=True)
+    return 0
+
+
+def _process_dir_nbytes(process_dir: Path) -> int:
+    """Size of the data files linked from a stage or remote process directory.
+    """
+    nbytes = 0
+    if not process_dir.is_dir():
+        return nbytes
+    for be_pth in process_dir.iterdir():
+        if be_pth.is_dir():
+            for fpth in be_pth.iterdir():
+                if not fpth.stem.startswith('.'):
+                    nbytes += _data_file_nbytes(process_dir.parent, be_pth.name, fpth.name)
+    return nbytes
+
+
+def _count_data_record(changes: Counter, key: bytes, val: bytes, num: int):
+    """Add ``num`` to the count of the (column, digest) of a data record in ``changes``.
+    """
+    if key[:2] in (b'f:', b'n:'):
+        column = dynamic_layout_data_record_from_db_key(key).column
+        changes[column, data_record_digest_val_from_db_val(val).digest] += num
+
+
+def _delete_prefixed(txn: lmdb.Transaction, prefix: bytes):
+    with txn.cursor() as cur:
+        if cur.set_range(prefix):
+            while cur.key().startswith(prefix) and cur.delete():
+                pass
+
+
+def _copy_prefixed(txn: lmdb.Transaction, prefix: bytes, new_prefix: bytes):
+    """Copy every record whose key starts with ``prefix`` to a key starting with ``new_prefix``.
+    """
+    items = []
+    with txn.cursor() as cur:
+        if cur.set_range(prefix):
+            for k, v in cur.iternext():
+                if not k.startswith(prefix):
+                    break
+                items.append((new_prefix + k[len(prefix):], v))
+    for k, v in items:
+        txn.put(k, v)
+
+
+def _update_refs(txn: lmdb.Transaction, key: bytes, num: int) -> int:
+    """Add ``num`` to a reference count.
+
+    Returns 1 if the data piece is newly referenced, -1 if it is no longer
+    referenced, otherwise 0.
+    """
+    before = int(txn.get(key, b'0'))
+    after = before + num
+    if after > 0:
+        txn.put(key, str(after).encode())
+    else:
+        txn.delete(key)
+    return (after > 0) - (before > 0)
+
+
+class StorageLedger(object):
+    """Record the size of stored data files and commits for O(1) size queries.
+
+    Parameters
+    ----------
+    repo_path
+        path to the repository directory the ledger is stored within.
+    ledgerenv
+        db where the ledger records are stored.
+    """
+
+    def __init__(self, repo_path: Path, ledgerenv: lmdb.Environment):
+        self._repo_path = Path(repo_path)
+        self._env: lmdb.Environment = ledgerenv
+        self._record_existing_store_files()
+
+    # ---------------------------- data files ---------------------------------
+
+    def _record_existing_store_files(self):
+        """Record files which were stored before the ledger was created (once).
+        """
+        txn = TxnRegister().begin_reader_txn(self._env)
+        try:
+            initialized = txn.get(_K_INITIALIZED) is not None
+        finally:
+            TxnRegister().abort_reader_txn(self._env)
+        if initialized:
+            return
+
+        store_dir = Path(self._repo_path, DIR_DATA_STORE)
+        store_fps = []
+        if store_dir.is_dir():
+            for be_pth in store_dir.iterdir():
+                if be_pth.is_dir():
+                    store_fps.extend(be_pth.iterdir())
+        self.record_store_files(store_fps)
+        txn = TxnRegister().begin_writer_txn(self._env)
+        try:
+            txn.put(_K_INITIALIZED, b'1')
+        finally:
+            TxnRegister().commit_writer_txn(self._env)
+
+    def record_store_files(self, store_fps: Iterable[Path]):
+        """Record the size of data files just moved into the store directory.
+
+        Parameters
+        ----------
+        store_fps : Iterable[Path]
+            ``store_data/{backend}/{name}`` paths of the stored files. Files
+            which have already been recorded are ignored.
+        """
+        txn = TxnRegister().begin_writer_txn(self._env)
+        try:
+            totals = {}
+            for fpth in store_fps:
+                backend, name = fpth.parent.name, fpth.name
+                if name.startswith('.'):
+                    continue
+                fkey = f'f:{backend}:{Path(name).stem}'.encode()
+                if txn.get(fkey) is not None:
+                    continue
+                if backend not in totals:
+                    raw = txn.get(f'b:{backend}'.encode())
+                    totals[backend] = json.loads(raw) if raw is not None else [0, 0]
+                nbytes = _data_file_nbytes(self._repo_path, backend, name)
+                txn.put(fkey, str(nbytes).encode())
+                totals[backend][0] += 1
+                totals[backend][1] += nbytes
+            for backend, total in totals.items():
+                txn.put(f'b:{backend}'.encode(), _dumps(total))
+        finally:
+            TxnRegister().commit_writer_txn(self._env)
+
+    def backend_stats(self) -> Dict[str, BackendStorageStats]:
+        """Number and size of the stored data files of every backend.
+        """
+        res = {}
+        txn = TxnRegister().begin_reader_txn(self._env)
+        try:
+            with txn.cursor() as cur:
+                if cur.set_range(b'b:'):
+                    for k, v in cur.iternext():
+                        if not k.startswith(b'b:'):
+                            break
+                        res[k[2:].decode()] = BackendStorageStats(*json.loads(v))
+        finally:
+            TxnRegister().abort_reader_txn(self._env)
+        return res
+
+    def storage_stats(self, commit: Optional[CommitStorageStats] = None) -> StorageStats:
+        """Disk space used by the repository.
+
+        Only the (few) files written since the last commit or fetch, and the
+        record databases in the repository directory are inspected on disk.
+        """
+        backends = self.backend_stats()
+        data_nbytes = sum(be.nbytes for be in backends.values())
+        staged_nbytes = _process_dir_nbytes(Path(self._repo_path, DIR_DATA_STAGE))
+        staged_nbytes += _process_dir_nbytes(Path(self._repo_path, DIR_DATA_REMOTE))
+        metadata_nbytes = folder_size(self._repo_path, recurse=False)
+        return StorageStats(
+            nbytes=data_nbytes + staged_nbytes + metadata_nbytes,
+            data_nbytes=data_nbytes,
+            staged_nbytes=staged_nbytes,
+            metadata_nbytes=metadata_nbytes,
+            backends=backends,
+            commit=commit)
+
+    # ----------------------------- commits -----------------------------------
+
+    def _data_piece_nbytes(self, digests: Iterable[str], schemas: Dict[str, dict],
+                           digest_columns: Dict[str, str],
+                           hashenv: lmdb.Environment) -> Dict[str, int]:
+        """Size of each data piece, computing (and recording) any not yet known.
+
+        The size of arrays is determined from the shape recorded in their
+        backend spec; str and bytes values are read from their backend. Data
+        pieces only referenced on a remote server are omitted.
+        """
+        res, missing = {}, []
+        txn = TxnRegister().begin_reader_txn(self._env)
+        try:
+            for digest in digests:
+                raw = txn.get(f'd:{digest}'.encode())
+                if raw is None:
+                    missing.append(digest)
+                else:
+                    res[digest] = int(raw)
+        finally:
+            TxnRegister().abort_reader_txn(self._env)
+        if not missing:
+            return res
+
+        computed = {}
+        with ExitStack() as stack:
+            bes = {}
+            hashtxn = TxnRegister().begin_reader_txn(hashenv)
+            stack.callback(TxnRegister().abort_reader_txn, hashenv)
+            for digest in missing:
+                spec = backend_decoder(hashtxn.get(hash_data_db_key_from_raw_key(digest)))
+                if spec.islocal is False:
+                    continue
+                schema = schemas[digest_columns[digest]]
+                if schema['column_type'] == 'ndarray':
+                    nbytes = int(np.prod(spec.shape)) * np.dtype(schema['dtype']).itemsize
+                else:
+                    if spec.backend not in bes:
+                        bes[spec.backend] = BACKEND_ACCESSOR_MAP[spec.backend](
+                            self._repo_path, None, None)
+                        bes[spec.backend].open(mode='r')
+                        stack.callback(bes[spec.backend].close)
+                    data = bes[spec.backend].read_data(spec)
+                    nbytes = len(data.encode() if isinstance(data, str) else data)
+                computed[digest] = nbytes
+
+        txn = TxnRegister().begin_writer_txn(self._env)
+        try:
+            for digest, nbytes in computed.items():
+                txn.put(f'd:{digest}'.encode(), str(nbytes).encode())
+        finally:
+            TxnRegister().commit_writer_txn(self._env)
+        res.update(computed)
+        return res
+
+    def _recorded_commit_stats(self, commit: str) -> Optional[CommitStorageStats]:
+        txn = TxnRegister().begin_reader_txn(self._env)
+        try:
+            raw = txn.get(f'c:{commit}'.encode())
+        finally:
+            TxnRegister().abort_reader_txn(self._env)
+        if raw is None:
+            return None
+        spec = json.loads(raw)
+        spec['columns'] = {k: ColumnStorageStats(*v) for k, v in spec['columns'].items()}
+        return CommitStorageStats(**spec)
+
+    def _put_commit_stats(self, txn: lmdb.Transaction, stats: CommitStorageStats):
+        raw = stats._asdict()
+        raw['columns'] = {k: list(v) for k, v in stats.columns.items()}
+        txn.put(f'c:{stats.commit}'.encode(), _dumps(raw))
+
+    def _tracking_branch(self, commit: str, branch: str) -> Optional[str]:
+        """Name of a branch the reference counts of ``commit`` are kept on.
+
+        ``branch`` is preferred if its reference counts are those of the
+        commit. None if no branch keeps them.
+        """
+        txn = TxnRegister().begin_reader_txn(self._env)
+        try:
+            if txn.get(f't:{branch}'.encode()) == commit.encode():
+                return branch
+            with txn.cursor() as cur:
+                if cur.set_range(b't:'):
+                    for k, v in cur.iternext():
+                        if not k.startswith(b't:'):
+                            break
+                        if v == commit.encode():
+                            return k[2:].decode()
+        finally:
+            TxnRegister().abort_reader_txn(self._env)
+        return None
+
+    def _record_commit_stats(self, commit: str, dataenv: lmdb.Environment,
+                             hashenv: lmdb.Environment, *,
+                             track: Optional[str]) -> CommitStorageStats:
+        """Compute and record the storage statistics of a commit from every record.
+
+        If ``track`` is the name of a branch, the reference counts kept on
+        that branch are reset to those of the commit.
+        """
+        rq = RecordQuery(dataenv)
+        hq = HashQuery(hashenv)
+        schemas = {key.column: hq.get_schema_digest_spec(val.digest)
+                   for key, val in rq.schema_specs().items()}
+        column_digests: Dict[str, List[str]] = {}
+        digest_columns = {}
+        for column in schemas:
+            digests = [rec.digest for _, rec in rq.column_data_records(column)]
+            column_digests[column] = digests
+            for digest in digests:
+                digest_columns.setdefault(digest, column)
+
+        nbytes = self._data_piece_nbytes(digest_columns.keys(), schemas, digest_columns, hashenv)
+        columns = {}
+        for column, digests in column_digests.items():
+            unique = set(digests)
+            columns[column] = ColumnStorageStats(
+                num_data_records=len(digests),
+                num_data_pieces=len(unique),
+                logical_nbytes=sum(nbytes.get(d, 0) for d in digests),
+                unique_nbytes=sum(nbytes.get(d, 0) for d in unique))
+        stats = CommitStorageStats(
+            commit=commit,
+            num_data_records=sum(c.num_data_records for c in columns.values()),
+            num_data_pieces=len(digest_columns),
+            logical_nbytes=sum(c.logical_nbytes for c in columns.values()),
+            unique_nbytes=sum(nbytes.values()),
+            num_unresolved=len(digest_columns) - len(nbytes),
+            columns=columns)
+
+        txn = TxnRegister().begin_writer_txn(self._env)
+        try:
+            self._put_commit_stats(txn, stats)
+            if track is not None:
+                _delete_prefixed(txn, f'r:{track}:'.encode())
+                _delete_prefixed(txn, f'g:{track}:'.encode())
+                refs = Counter()
+                for column, digests in column_digests.items():
+                    for digest, count in Counter(digests).items():
+                        txn.put(f'r:{track}:{digest}:{column}'.encode(), str(count).encode())
+                        refs[digest] += count
+                for digest, count in refs.items():
+                    txn.put(f'g:{track}:{digest}'.encode(), str(count).encode())
+                txn.put(f't:{track}'.encode(), commit.encode())
+        finally:
+            TxnRegister().commit_writer_txn(self._env)
+        return stats
+
+    def record_commit(self, commit: str, dataenv: lmdb.Environment,
+                      refenv: lmdb.Environment, hashenv: lmdb.Environment, *,
+                      branch: str) -> CommitStorageStats:
+        """Record the storage statistics of a newly made commit.
+
+        The statistics are derived from those of the (master) parent commit
+        and the records changed since, using the reference counts kept for the
+        parent on ``branch`` (or copied from another branch they are kept on).
+        They are computed from every record of the commit if it has no parent,
+        or if no branch keeps the reference counts of the parent.
+
+        Parameters
+        ----------
+        commit : str
+            digest of the commit.
+        dataenv : lmdb.Environment
+            db holding the (unpacked) records of the commit (ie. the staging
+            area immediately after the commit is made).
+        refenv : lmdb.Environment
+            db where the commit records are stored.
+        hashenv : lmdb.Environment
+            db where the hash records are stored.
+        branch : str
+            name of the branch the commit was made on (the merge master
+            branch for merge commits).
+        """
+        from ..diff import diff_envs
+        from .commiting import get_commit_ancestors, tmp_cmt_env
+
+        parent = get_commit_ancestors(refenv, commit).master_ancestor
+        parent_stats = self._recorded_commit_stats(parent) if parent else None
+        if (parent_stats is None) or (parent_stats.num_unresolved > 0):
+            return self._record_commit_stats(commit, dataenv, hashenv, track=branch)
+        tracking = self._tracking_branch(parent, branch)
+        if tracking is None:
+            return self._record_commit_stats(commit, dataenv, hashenv, track=branch)
+
+        # net change in the number of records of a column referencing a data piece.
+        changes = Counter()
+        with tmp_cmt_env(refenv, parent) as parentenv:
+            diff = diff_envs(parentenv, dataenv)
+            parenttxn = TxnRegister().begin_reader_txn(parentenv)
+            try:
+                for key, val in diff.added:
+                    _count_data_record(changes, key, val, 1)
+                for key, val in diff.deleted:
+                    _count_data_record(changes, key, val, -1)
+                for key, val in diff.mutated:
+                    _count_data_record(changes, key, parenttxn.get(key), -1)
+                    _count_data_record(changes, key, val, 1)
+            finally:
+                TxnRegister().abort_reader_txn(parentenv)
+        changes = {k: num for k, num in changes.items() if num != 0}
+
+        # data pieces referenced by the parent are recorded; only added data
+        # pieces (of columns in the commit) may need to be computed.
+        rq = RecordQuery(dataenv)
+        hq = HashQuery(hashenv)
+        schemas = {key.column: hq.get_schema_digest_spec(val.digest)
+                   for key, val in rq.schema_specs().items()}
+        digest_columns = {}
+        for column, digest in changes:
+            digest_columns.setdefault(digest, column)
+        nbytes = self._data_piece_nbytes(digest_columns.keys(), schemas, digest_columns, hashenv)
+
+        columns = {column: list(parent_stats.columns.get(column, (0, 0, 0, 0)))
+                   for column in schemas}
+        num_data_pieces = parent_stats.num_data_pieces
+        unique_nbytes = parent_stats.unique_nbytes
+        num_unresolved = 0
+        txn = TxnRegister().begin_writer_txn(self._env)
+        try:
+            if tracking != branch:
+                # the branch starts from (a copy of) the counts kept on another branch.
+                for prefix in ('r', 'g'):
+                    _delete_prefixed(txn, f'{prefix}:{branch}:'.encode())
+                    _copy_prefixed(txn, f'{prefix}:{tracking}:'.encode(),
+                                   f'{prefix}:{branch}:'.encode())
+            refs = Counter()
+            for (column, digest), num in changes.items():
+                refs[digest] += num
+                size = nbytes.get(digest, 0)
+                # records of removed columns are all deleted; their stats are dropped.
+                stats = columns.setdefault(column, [0, 0, 0, 0])
+                stats[0] += num
+                stats[2] += num * size
+                added = _update_refs(txn, f'r:{branch}:{digest}:{column}'.encode(), num)
+                stats[1] += added
+                stats[3] += added * size
+            for digest, num in refs.items():
+                added = _update_refs(txn, f'g:{branch}:{digest}'.encode(), num)
+                num_data_pieces += added
+                if digest in nbytes:
+                    unique_nbytes += added * nbytes[digest]
+                elif added > 0:
+                    num_unresolved += 1
+
+            columns = {k: ColumnStorageStats(*columns[k]) for k in schemas}
+            stats = CommitStorageStats(
+                commit=commit,
+                num_data_records=sum(c.num_data_records for c in columns.values()),
+                num_data_pieces=num_data_pieces,
+                logical_nbytes=sum(c.logical_nbytes for c in columns.values()),
+                unique_nbytes=unique_nbytes,
+                num_unresolved=num_unresolved,
+                columns=columns)
+            self._put_commit_stats(txn, stats)
+            txn.put(f't:{branch}'.encode(), commit.encode())
+        finally:
+            TxnRegister().commit_writer_txn(self._env)
+        return stats
+
+    def commit_stats(self, commit: str, refenv: lmdb.Environment,
+                     hashenv: lmdb.Environment) -> CommitStorageStats:
+        """Storage statistics of a commit; computed (and recorded) if not yet known.
+
+        Statistics which were recorded while some data pieces were only
+        referenced on a remote server are recomputed, since that data may have
+        been fetched since.
+        """
+        stats = self._recorded_commit_stats(commit)
+        if (stats is not None) and (stats.num_unresolved == 0):
+            return stats
+
+        from .commiting import tmp_cmt_env
+
+        with tmp_cmt_env(refenv, commit) as cmtrefenv:
+            return self._record_commit_stats(commit, cmtrefenv, hashenv, track=None)
+
+
+def record_store_files(repo_path: Path, store_fps: Iterable[Path]):
+    """Record the size of data files just moved into the store directory.
+
+    The ledger env of the repository environments open in this process is
+    used; if there are none (ie. a remote server process), it is opened for
+    the duration of the call.
+    """
+    from ..context import Environments
+
+    envs = Environments.opened(repo_path)
+    if envs is not None:
+        StorageLedger(repo_path, envs.ledgerenv).record_store_files(store_fps)
+        return
+
+    ledgerenv = lmdb.open(path=str(Path(repo_path, LMDB_STORAGE_LEDGER_NAME)), **LMDB_SETTINGS)
+    try:
+        StorageLedger(repo_path, ledgerenv).record_store_files(store_fps)
+    finally:
+        ledgerenv.close()
+
+
+def record_commit(repo_path: Path, commit: str, dataenv: lmdb.Environment,
+                  refenv: lmdb.Environment, *, branch: str) -> Optional[CommitStorageStats]:
+    """Record the storage statistics of a newly made commit.
+
+    Nothing is recorded if the repository environments are not open in this
+    process; the statistics are then computed the first time they are
+    requested.
+    """
+    from ..context import Environments
+
+    envs = Environments.opened(repo_path)
+    if envs is None:
+        return None
+    ledger = StorageLedger(repo_path, envs.ledgerenv)
+    return ledger.record_commit(commit, dataenv, refenv, envs.hashenv, branch=branch)
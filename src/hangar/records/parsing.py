@@ -14,6 +14,7 @@ from ..constants import (
     K_BRANCH,
     K_HEAD,
     K_REMOTES,
+    K_REMOTE_FILTER,
     K_VERSION,
     K_WLOCK,
     SEP_CMT,
@@ -277,6 +278,22 @@ def remote_raw_val_from_db_val(db_val: bytes) -> str:
     return db_val.decode()
 
 
+def remote_filter_db_key_from_raw_key(remote_name: str) -> bytes:
+    """Get the db key of the partial clone filter recorded for a remote name
+
+    Parameters
+    ----------
+    remote_name : str
+        name of the remote location
+
+    Returns
+    -------
+    bytes
+        db key allowing access to the filter recorded for the remote
+    """
+    return f'{K_REMOTE_FILTER}{remote_name}'.encode()
+
+
 """
 Commit Parsing Methods
 -----------------------
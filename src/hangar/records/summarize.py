@@ -16,9 +16,10 @@ from .heads import (
 )
 from .queries import RecordQuery
 from .hashs import HashQuery
+from .ledger import StorageLedger
 from ..diff import DiffOut, Changes
 from ..txnctx import TxnRegister
-from ..utils import format_bytes, file_size, folder_size, unique_everseen
+from ..utils import format_bytes, file_size, unique_everseen
 from ..diagnostics import graphing
 
 
@@ -228,7 +229,7 @@ def summary(env, *, branch='', commit='') -> StringIO:
     with tmp_cmt_env(env.refenv, cmt) as cmtrefenv:
         query = RecordQuery(cmtrefenv)
 
-        nbytes = folder_size(env.repo_path, recurse=True)
+        nbytes = StorageLedger(env.repo_path, env.ledgerenv).storage_stats().nbytes
         humanBytes = format_bytes(nbytes)
         buf = StringIO()
         buf.write(f'Summary of Contents Contained in Data Repository \n')
@@ -0,0 +1,999 @@
+"""Asynchronous (``asyncio``) client for the hangar server built on ``grpc.aio``.
+
+:class:`AsyncHangarClient` exposes the same operations as
+:class:`~.client.HangarClient`, but as coroutines which can be awaited from a
+running event loop. Where the synchronous client spreads batches of a data
+transfer over a thread pool, this client issues the batch RPCs concurrently
+from the event loop; the number in flight at any time is bounded by a
+semaphore (``max_concurrent_rpcs``) rather than by a number of threads.
+
+Reading, (de)compressing, and writing local data are blocking operations;
+they run in the default executor of the event loop (see
+:meth:`asyncio.loop.run_in_executor`) so the loop keeps serving other
+transfers in the meantime. Samples are written to the data writer under a lock.
+
+:class:`AsyncRemotes` (``repo.remote.aio``) awaits whole ``fetch``,
+``fetch_data``, and ``push`` operations built on this client:
+
+    >>> branch = await repo.remote.aio.fetch('origin', 'master')
+    >>> commits = await repo.remote.aio.fetch_data('origin', branch=branch)
+"""
+import asyncio
+import logging
+import math
+import os
+import tempfile
+import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial as bind
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import blosc
+import grpc
+import grpc.aio
+import lmdb
+
+from . import chunks, hangar_service_pb2, hangar_service_pb2_grpc, partial
+from .codecs import AUTO_CODEC, ThroughputMeter, select_codec
+from .content import ContentReader, ContentWriter, DataWriter
+from .journal import TransferJournal, checkpoint_batches
+from .. import constants as c
+from .client import (
+    channel_options,
+    client_config_from_reply,
+    data_type_from_backend,
+    write_received_frame,
+)
+from ..backends import BACKEND_ACCESSOR_MAP, backend_decoder
+from ..context import Environments
+from ..records import DataRecordVal, commiting, hashs, hash_data_db_key_from_raw_key
+from ..records import heads, queries, summarize
+from ..remotes import missing_schema_digest_map, select_commits_data_records
+from ..txnctx import TxnRegister
+
+if TYPE_CHECKING:
+    from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+# default maximum number of data transfer RPCs in flight at once. Kept below
+# the default ``max_concurrent_rpcs`` the server accepts.
+DEFAULT_MAX_CONCURRENT_RPCS = 8
+
+
+async def _reassemble_data_frames(messages):
+    """Join chunked messages of a response stream back into compressed frames.
+
+    Frames sent in a single message are yielded as received, without copying.
+    """
+    frame, offset = None, 0
+    async for message in messages:
+        if offset == 0:
+            if len(message.raw_data) == message.nbytes:
+                yield message.raw_data
+                continue
+            frame = bytearray(message.nbytes)
+        size = len(message.raw_data)
+        frame[offset:offset + size] = message.raw_data
+        offset += size
+        if offset == message.nbytes:
+            yield frame
+            frame, offset = None, 0
+
+
+def _run_blocking(func, *args, **kwargs):
+    """Run a blocking call in the default executor of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, bind(func, *args, **kwargs))
+
+
+@contextmanager
+def _unpacked_commit_refs(refenv: lmdb.Environment, commit: str):
+    with tempfile.TemporaryDirectory() as tempD:
+        tmpDB = lmdb.open(path=os.path.join(tempD, 'test.lmdb'), **c.LMDB_SETTINGS)
+        try:
+            commiting.unpack_commit_ref(refenv, tmpDB, commit)
+            yield tmpDB
+        finally:
+            tmpDB.close()
+
+
+def _commit_schema_hashes(refenv: lmdb.Environment, commit: str,
+                          tmpDB: lmdb.Environment = None) -> List[str]:
+    if tmpDB is None:
+        with _unpacked_commit_refs(refenv, commit) as tmpDB:
+            return _commit_schema_hashes(refenv, commit, tmpDB)
+    return list(set(queries.RecordQuery(tmpDB).schema_hashes()))
+
+
+def _commit_data_hash_to_schema_hash(refenv: lmdb.Environment, commit: str,
+                                     tmpDB: lmdb.Environment = None) -> Dict[str, str]:
+    if tmpDB is None:
+        with _unpacked_commit_refs(refenv, commit) as tmpDB:
+            return _commit_data_hash_to_schema_hash(refenv, commit, tmpDB)
+    return queries.RecordQuery(tmpDB).data_hash_to_schema_hash()
+
+
+async def _reassemble_hash_record_replies(replies) -> List[chunks.DataIdent]:
+    hBytes, offset = None, 0
+    async for reply in replies:
+        if hBytes is None:
+            hBytes = bytearray(reply.total_byte_size)
+        size = len(reply.hashs)
+        hBytes[offset: offset + size] = reply.hashs
+        offset += size
+    raw_idents = chunks.deserialize_record_pack(blosc.decompress(hBytes))
+    return [chunks.deserialize_ident(raw) for raw in raw_idents]
+
+
+class AsyncHangarClient(object):
+    """Asynchronous client which connects and handles data transfer to the hangar server.
+
+    The connection is established (and the client configuration retrieved
+    from the server) when entering the ``async with`` block, or by awaiting
+    :meth:`connect`.
+
+    Parameters
+    ----------
+    envs : Environments
+        environment handles to manage all required calls to the local
+        repostory state.
+    address : str
+        IP:PORT where the hangar server can be reached.
+    auth_username : str, optional, kwarg-only
+        credentials to use for authentication.
+    auth_password : str, optional, kwarg-only, by default ''.
+        credentials to use for authentication, by default ''.
+    wait_for_ready_timeout : float, optional, kwarg-only, by default 5.
+        time in seconds to wait for the server to become available before
+        raising an error.
+    max_concurrent_rpcs : int, optional, kwarg-only
+        maximum number of data transfer RPCs in flight at once.
+    """
+
+    def __init__(self,
+                 envs: Environments,
+                 address: str,
+                 *,
+                 auth_username: str = '',
+                 auth_password: str = '',
+                 wait_for_ready_timeout: float = 5,
+                 max_concurrent_rpcs: int = DEFAULT_MAX_CONCURRENT_RPCS):
+        if max_concurrent_rpcs < 1:
+            raise ValueError(f'max_concurrent_rpcs: {max_concurrent_rpcs} must be >= 1')
+
+        self.env: Environments = envs
+        self.address: str = address
+        self.wait_ready_timeout: float = abs(wait_for_ready_timeout + 0.001)
+        self.max_concurrent_rpcs = max_concurrent_rpcs
+        self.fetch_meter = ThroughputMeter()
+        self.push_meter = ThroughputMeter()
+
+        self.channel: Optional[grpc.aio.Channel] = None
+        self.stub: Optional[hangar_service_pb2_grpc.HangarServiceStub] = None
+        self.metadata = ()
+        if (auth_username != '') and (auth_password != ''):
+            self.metadata = ((auth_username, auth_password),)
+
+        self.cfg: dict = {}
+        self._rFs: BACKEND_ACCESSOR_MAP = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._data_writer_lock = Lock()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def connect(self):
+        """Retrieve client configuration from the server and set up the channel.
+
+        Raises
+        ------
+        ConnectionError
+            If the server could not be reached within ``wait_for_ready_timeout``.
+        """
+        async with grpc.aio.insecure_channel(self.address) as tmp_channel:
+            tmp_stub = hangar_service_pb2_grpc.HangarServiceStub(tmp_channel)
+            request = hangar_service_pb2.GetClientConfigRequest()
+            try:
+                response = await tmp_stub.GetClientConfig(
+                    request, metadata=self.metadata,
+                    timeout=self.wait_ready_timeout, wait_for_ready=True)
+            except grpc.aio.AioRpcError as err:
+                if err.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    err = ConnectionError(
+                        f'Server did not connect after: {self.wait_ready_timeout} sec.')
+                logger.error(err)
+                raise err
+        self.cfg.update(client_config_from_reply(response))
+
+        self.channel = grpc.aio.insecure_channel(
+            self.address,
+            options=channel_options(self.cfg),
+            compression=self.cfg['enable_compression'])
+        self.stub = hangar_service_pb2_grpc.HangarServiceStub(self.channel)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_rpcs)
+
+        for backend, accessor in BACKEND_ACCESSOR_MAP.items():
+            if accessor is not None:
+                self._rFs[backend] = accessor(
+                    repo_path=self.env.repo_path,
+                    schema_shape=None,
+                    schema_dtype=None)
+                self._rFs[backend].open(mode='r')
+
+    async def close(self):
+        """Close reader file handles and the GRPC channel connection, invalidating this instance.
+        """
+        for backend_accessor in self._rFs.values():
+            backend_accessor.close()
+        self._rFs.clear()
+        if self.channel is not None:
+            await self.channel.close()
+            self.channel = None
+
+    async def ping_pong(self) -> str:
+        """Ping server to ensure that connection is working
+
+        Returns
+        -------
+        str
+            Should be value 'PONG'
+        """
+        request = hangar_service_pb2.PingRequest()
+        response = await self.stub.PING(request, metadata=self.metadata)
+        return response.result
+
+    async def server_stats(self) -> Dict[str, int]:
+        """Retrieve counters describing server operation (sample cache use, etc).
+        """
+        request = hangar_service_pb2.GetServerStatsRequest()
+        response = await self.stub.GetServerStats(request, metadata=self.metadata)
+        return dict(response.stats)
+
+    # ------------------------- branches / commits / schemas -----------------
+
+    async def push_branch_record(self, name: str, head: str
+                                 ) -> hangar_service_pb2.PushBranchRecordReply:
+        """Create a branch (if new) or update the server branch HEAD to new commit.
+        """
+        rec = hangar_service_pb2.BranchRecord(name=name, commit=head)
+        request = hangar_service_pb2.PushBranchRecordRequest(rec=rec)
+        return await self.stub.PushBranchRecord(request, metadata=self.metadata)
+
+    async def fetch_branch_record(self, name: str
+                                  ) -> hangar_service_pb2.FetchBranchRecordReply:
+        """Get the latest head commit the server knows about for a given branch
+        """
+        rec = hangar_service_pb2.BranchRecord(name=name)
+        request = hangar_service_pb2.FetchBranchRecordRequest(rec=rec)
+        return await self.stub.FetchBranchRecord(request, metadata=self.metadata)
+
+    async def push_commit_record(self, commit: str, parentVal: bytes, specVal: bytes,
+                                 refVal: bytes) -> hangar_service_pb2.PushCommitReply:
+        """Push a new commit reference to the server.
+        """
+        cIter = chunks.clientCommitChunkedIterator(commit=commit,
+                                                   parentVal=parentVal,
+                                                   specVal=specVal,
+                                                   refVal=refVal)
+        return await self.stub.PushCommit(cIter, metadata=self.metadata)
+
+    async def fetch_commit_record(self, commit: str) -> Tuple[str, bytes, bytes, bytes]:
+        """get the refs for a commit digest
+
+        Returns
+        -------
+        Tuple[str, bytes, bytes, bytes]
+            ['commit hash', 'parentVal', 'specVal', 'refVal']
+        """
+        request = hangar_service_pb2.FetchCommitRequest(commit=commit)
+        refVal, offset, reply = None, 0, None
+        async for reply in self.stub.FetchCommit(request, metadata=self.metadata):
+            if refVal is None:
+                refVal = bytearray(reply.total_byte_size)
+                specVal = reply.record.spec
+                parentVal = reply.record.parent
+            size = len(reply.record.ref)
+            refVal[offset: offset + size] = reply.record.ref
+            offset += size
+
+        if reply.error.code != 0:
+            logger.error(reply.error)
+            return False
+        return (commit, parentVal, specVal, refVal)
+
+    async def fetch_schema(self, schema_hash: str) -> Tuple[str, bytes]:
+        """get the schema specification for a schema hash
+
+        Returns
+        -------
+        Tuple[str, bytes]
+            ['schema hash', 'schemaVal']
+        """
+        schema_rec = hangar_service_pb2.SchemaRecord(digest=schema_hash)
+        request = hangar_service_pb2.FetchSchemaRequest(rec=schema_rec)
+        reply = await self.stub.FetchSchema(request, metadata=self.metadata)
+        if reply.error.code != 0:
+            logger.error(reply.error)
+            return False
+        return (schema_hash, reply.rec.blob)
+
+    async def push_schema(self, schema_hash: str,
+                          schemaVal: bytes) -> hangar_service_pb2.PushSchemaReply:
+        """push a schema hash record to the remote server
+        """
+        rec = hangar_service_pb2.SchemaRecord(digest=schema_hash, blob=schemaVal)
+        request = hangar_service_pb2.PushSchemaRequest(rec=rec)
+        return await self.stub.PushSchema(request, metadata=self.metadata)
+
+    async def fetch_find_missing_commits(self, branch_name: str):
+        c_commits = commiting.list_all_commits(self.env.refenv)
+        branch_rec = hangar_service_pb2.BranchRecord(name=branch_name)
+        request = hangar_service_pb2.FindMissingCommitsRequest()
+        request.commits.extend(c_commits)
+        request.branch.CopyFrom(branch_rec)
+        return await self.stub.FetchFindMissingCommits(request, metadata=self.metadata)
+
+    async def push_find_missing_commits(self, branch_name: str):
+        branch_commits = summarize.list_history(
+            refenv=self.env.refenv,
+            branchenv=self.env.branchenv,
+            branch_name=branch_name)
+        branch_rec = hangar_service_pb2.BranchRecord(
+            name=branch_name, commit=branch_commits['head'])
+        request = hangar_service_pb2.FindMissingCommitsRequest()
+        request.commits.extend(branch_commits['order'])
+        request.branch.CopyFrom(branch_rec)
+        return await self.stub.PushFindMissingCommits(request, metadata=self.metadata)
+
+    async def fetch_find_missing_schemas(self, commit: str, c_schemas: Sequence[str] = None):
+        if c_schemas is None:
+            c_schemas = set(await _run_blocking(
+                hashs.HashQuery(self.env.hashenv).list_all_schema_digests))
+        request = hangar_service_pb2.FindMissingSchemasRequest()
+        request.commit = commit
+        request.schema_digests.extend(c_schemas)
+        return await self.stub.FetchFindMissingSchemas(request, metadata=self.metadata)
+
+    async def fetch_find_missing_hash_records(
+            self, commit: str, raw_pack: bytes = None,
+            partial_filter: Optional[partial.PartialCloneFilter] = None
+    ) -> List[chunks.DataIdent]:
+        """Data hash records (and schemas) in a server commit which do not exist on the client.
+
+        Parameters
+        ----------
+        commit
+            commit on the server whose records are compared.
+        raw_pack
+            serialized record pack of every local hash digest; computed if not
+            provided (pass it in when querying many commits at once).
+        partial_filter
+            partial clone filter selecting the samples whose records are
+            returned (None for every sample).
+        """
+        if raw_pack is None:
+            raw_pack = await _run_blocking(self._local_hash_record_pack)
+        pb2_func = hangar_service_pb2.FindMissingHashRecordsRequest
+        cIter = chunks.missingHashRequestIterator(
+            commit, raw_pack, pb2_func, filter=partial.filter_to_json(partial_filter))
+        replies = self.stub.FetchFindMissingHashRecords(cIter, metadata=self.metadata)
+        return await _reassemble_hash_record_replies(replies)
+
+    async def push_find_missing_schemas(self, commit: str, tmpDB: lmdb.Environment = None):
+        c_schemas = await _run_blocking(_commit_schema_hashes, self.env.refenv, commit, tmpDB)
+        request = hangar_service_pb2.FindMissingSchemasRequest()
+        request.commit = commit
+        request.schema_digests.extend(c_schemas)
+        return await self.stub.PushFindMissingSchemas(request, metadata=self.metadata)
+
+    async def push_find_missing_hash_records(self, commit: str, tmpDB: lmdb.Environment = None
+                                             ) -> List[Tuple[str, str]]:
+        """(digest, schema hash) of data records in a client commit which do not exist on the server.
+        """
+        c_hashs_schemas = await _run_blocking(
+            _commit_data_hash_to_schema_hash, self.env.refenv, commit, tmpDB)
+        c_hashs_raw = [chunks.serialize_ident(digest, '') for digest in c_hashs_schemas]
+        raw_pack = chunks.serialize_record_pack(c_hashs_raw)
+        pb2_func = hangar_service_pb2.FindMissingHashRecordsRequest
+        cIter = chunks.missingHashRequestIterator(commit, raw_pack, pb2_func)
+        replies = self.stub.PushFindMissingHashRecords(cIter, metadata=self.metadata)
+        s_missing = await _reassemble_hash_record_replies(replies)
+        return [(ident.digest, c_hashs_schemas[ident.digest]) for ident in s_missing]
+
+    def _local_hash_record_pack(self) -> bytes:
+        all_hashs = hashs.HashQuery(self.env.hashenv).list_all_hash_keys_raw()
+        all_hashs_raw = [chunks.serialize_ident(digest, '') for digest in all_hashs]
+        return chunks.serialize_record_pack(all_hashs_raw)
+
+    async def fetch_missing_commit_contents(
+            self, commits: Sequence[str], pbar: 'tqdm' = None,
+            partial_filter: Optional[partial.PartialCloneFilter] = None):
+        """Concurrently retrieve everything but data for commits which are missing locally.
+
+        Data hash records are only retrieved for samples selected by the
+        ``partial_filter`` (if set).
+
+        Returns
+        -------
+        Tuple[List[Tuple[str, bytes]], Dict[str, str], List[Tuple[str, bytes, bytes, bytes]]]
+            (schema hash, schemaVal) of each schema missing locally, map of data
+            digest -> schema hash of each data record missing locally, and
+            (commit, parentVal, specVal, refVal) of each commit in order.
+
+        See Also
+        --------
+        :meth:`.client.HangarClient.fetch_missing_commit_contents`
+        """
+        c_schemas = list(set(await _run_blocking(
+            hashs.HashQuery(self.env.hashenv).list_all_schema_digests)))
+        raw_pack = await _run_blocking(self._local_hash_record_pack)
+
+        async def find_missing(commit):
+            async with self._semaphore:
+                schema_res = await self.fetch_find_missing_schemas(commit, c_schemas)
+                idents = await self.fetch_find_missing_hash_records(
+                    commit, raw_pack, partial_filter)
+            return list(schema_res.schema_digests), idents
+
+        async def fetch_commit(commit):
+            async with self._semaphore:
+                res = await self.fetch_commit_record(commit)
+            if pbar is not None:
+                pbar.update(1)
+            return res
+
+        async def fetch_schema(schema_hash):
+            async with self._semaphore:
+                return await self.fetch_schema(schema_hash)
+
+        m_schemas, m_hashes = set(), {}
+        for schemas, idents in await asyncio.gather(*map(find_missing, commits)):
+            m_schemas.update(schemas)
+            m_hashes.update(idents)
+        schemaRecs, commitRecs = await asyncio.gather(
+            asyncio.gather(*map(fetch_schema, sorted(m_schemas))),
+            asyncio.gather(*map(fetch_commit, commits)))
+        return list(schemaRecs), m_hashes, list(commitRecs)
+
+    async def fetch_filtered_data(self, commit: str,
+                                  partial_filter: Optional[partial.PartialCloneFilter]
+                                  ) -> List[chunks.DataIdent]:
+        """Data hash records (and schemas) of the samples in a server commit selected by a filter.
+
+        See Also
+        --------
+        :meth:`.client.HangarClient.fetch_filtered_data`
+        """
+        request = hangar_service_pb2.FindFilteredDataRequest(
+            commit=commit, filter=partial.filter_to_json(partial_filter))
+        replies = self.stub.FetchFindFilteredData(request, metadata=self.metadata)
+        return await _reassemble_hash_record_replies(replies)
+
+    # ------------------------------ data -------------------------------------
+
+    async def fetch_data_origin(self, digests: Sequence[str]
+                                ) -> List[hangar_service_pb2.DataOriginReply]:
+        requestIter = (hangar_service_pb2.DataOriginRequest(digest=digest) for digest in digests)
+        replies = self.stub.FetchFindDataOrigin(requestIter, metadata=self.metadata)
+        return [reply async for reply in replies]
+
+    async def fetch_data(
+            self,
+            origins: Sequence[hangar_service_pb2.DataOriginReply],
+            datawriter_cm: 'DataWriter',
+            schema: str,
+            pbar: 'tqdm' = None
+    ) -> List[str]:
+        """Fetch data hash digests for a particular schema.
+
+        Origins are split into batches of (at most) the ``fetch_batch_size``
+        configured by the server; at most ``max_concurrent_rpcs`` batches are
+        requested via ``FetchDataBatch`` at once. Every received sample is
+        verified against its requested digest before being written. Frames
+        are decompressed, verified, and written in the default executor of
+        the event loop.
+
+        Parameters
+        ----------
+        origins
+            data origin replies of the samples to retrieve.
+        datawriter_cm
+            data writer (opened as a context manager) to write samples with.
+        schema
+            schema hash of the samples.
+        pbar
+            progress bar updated as samples are written, by default None.
+
+        Returns
+        -------
+        List[str]
+            digests of written samples.
+
+        Raises
+        ------
+        RuntimeError
+            if received digest != requested or what was reported to be sent.
+        """
+        async def fetch_write_batch(batch):
+            requested = {pb.uri: pb for pb in batch}
+            request = hangar_service_pb2.FetchDataBatchRequest(
+                uris=list(requested.keys()),
+                codec=select_codec(AUTO_CODEC, self.fetch_meter, self.cfg['codecs']),
+                raw_chunks=self.cfg.get('fetch_raw_chunks', False))
+            written_digests = []
+            async with self._semaphore:
+                replies = self.stub.FetchDataBatch(request, metadata=self.metadata)
+                with self.fetch_meter.timer() as timer:
+                    async for frame in _reassemble_data_frames(replies):
+                        timer.add_frame(frame)
+                        digests = await _run_blocking(
+                            write_received_frame, frame, requested, datawriter_cm, schema,
+                            self._data_writer_lock)
+                        written_digests.extend(digests)
+                        if pbar is not None:
+                            pbar.update(len(digests))
+            if len(requested) > 0:
+                raise RuntimeError(f'requested uris were not received: {list(requested.keys())}')
+            return written_digests
+
+        # digest order lets the server cache packed frames shared between clients.
+        origins = sorted(origins, key=lambda pb: pb.uri)
+        batch_size = max(1, min(self.cfg['fetch_batch_size'],
+                                math.ceil(len(origins) / self.max_concurrent_rpcs)))
+        batches = [origins[i:i + batch_size] for i in range(0, len(origins), batch_size)]
+        saved_digests = []
+        for batch_digests in await asyncio.gather(*map(fetch_write_batch, batches)):
+            saved_digests.extend(batch_digests)
+        return saved_digests
+
+    async def push_data_begin_context(self):
+        request = hangar_service_pb2.PushBeginContextRequest()
+        return await self.stub.PushBeginContext(request, metadata=self.metadata)
+
+    async def push_data_end_context(self):
+        request = hangar_service_pb2.PushEndContextRequest()
+        return await self.stub.PushEndContext(request, metadata=self.metadata)
+
+    async def push_data(self, schema_hash: str, digests: Sequence[str],
+                        pbar: 'tqdm' = None) -> int:
+        """Given a schema and digest list, read the data and send to the server
+
+        Data is sent in batches of (at most) ``push_batch_size`` samples; at
+        most ``max_concurrent_rpcs`` batches are sent via ``PushDataBatch`` at
+        once. Samples are read and compressed into frames in the default
+        executor of the event loop.
+        Should be called between :meth:`push_data_begin_context` and
+        :meth:`push_data_end_context`.
+
+        Returns
+        -------
+        int
+            number of samples sent.
+
+        Raises
+        ------
+        KeyError
+            if one of the input digests does not exist on the client
+        """
+        specs = await _run_blocking(self._backend_locations, digests)
+        request_stack = [
+            hangar_service_pb2.PushFindDataOriginRequest(
+                data_type=data_type_from_backend(specs[digest]),
+                digest=digest,
+                compression_is_desired=True)
+            for digest in digests]
+        replies = self.stub.PushFindDataOrigin(iter(request_stack), metadata=self.metadata)
+        replies = [reply async for reply in replies]
+
+        def records_iterator(batch):
+            for reply in batch:
+                be_loc = specs[reply.digest]
+                yield self._rFs[be_loc.backend].read_data(be_loc), reply.uri
+
+        async def request_messages(frames):
+            while True:
+                frame = await _run_blocking(next, frames, None)
+                if frame is None:
+                    return
+                for message in chunks.dataFrameChunkedIterator(
+                        [frame], hangar_service_pb2.PushDataBatchRequest,
+                        max_message_nbytes=self.cfg['max_message_nbytes'],
+                        schema_hash=schema_hash):
+                    yield message
+
+        async def push_batch(batch):
+            codec = select_codec(self.cfg['push_codec'], self.push_meter, self.cfg['codecs'])
+            async with self._semaphore:
+                with self.push_meter.timer() as timer:
+                    frames = timer.count_frames(chunks.pack_record_frames(
+                        records_iterator(batch), self.cfg['push_frame_nbytes'], codec))
+                    await self.stub.PushDataBatch(
+                        request_messages(frames), metadata=self.metadata)
+            if pbar is not None:
+                pbar.update(len(batch))
+            return len(batch)
+
+        batch_size = max(1, min(self.cfg['push_batch_size'],
+                                math.ceil(len(replies) / self.max_concurrent_rpcs)))
+        batches = [replies[i:i + batch_size] for i in range(0, len(replies), batch_size)]
+        return sum(await asyncio.gather(*map(push_batch, batches)))
+
+    def _backend_locations(self, digests: Sequence[str]) -> Dict[str, object]:
+        """Map of digest -> backend location spec of local data.
+        """
+        specs = {}
+        hashTxn = TxnRegister().begin_reader_txn(self.env.hashenv)
+        try:
+            for digest in digests:
+                hashKey = hash_data_db_key_from_raw_key(digest)
+                hashVal = hashTxn.get(hashKey, default=False)
+                if not hashVal:
+                    raise KeyError(f'No hash record with key: {hashKey}')
+                specs[digest] = backend_decoder(hashVal)
+        finally:
+            TxnRegister().abort_reader_txn(self.env.hashenv)
+        return specs
+
+
+class AsyncRemotes(object):
+    """Awaitable versions of the :class:`~hangar.remotes.Remotes` transfer operations.
+
+    Accessed as ``repo.remote.aio``. Each operation connects an
+    :class:`AsyncHangarClient` to the remote for its duration, and follows the
+    same steps (and records the same transfer journal entries) as its
+    synchronous counterpart. Local reads and writes run in the default
+    executor of the event loop.
+
+    Parameters
+    ----------
+    env : Environments
+        environment handles of the local repository.
+    max_concurrent_rpcs : int, optional, kwarg-only
+        maximum number of data transfer RPCs in flight at once.
+    """
+
+    def __init__(self, env: Environments, *,
+                 max_concurrent_rpcs: int = DEFAULT_MAX_CONCURRENT_RPCS):
+        self._env: Environments = env
+        self._repo_path = env.repo_path
+        self.max_concurrent_rpcs = max_concurrent_rpcs
+
+    def _client(self, remote: str, **kwargs) -> AsyncHangarClient:
+        address = heads.get_remote_address(self._env.branchenv, name=remote)
+        return AsyncHangarClient(self._env, address,
+                                 max_concurrent_rpcs=self.max_concurrent_rpcs, **kwargs)
+
+    def _record_fetched_contents(self, schemaRecs, m_hashes, commitRecs, partial_filter):
+        CW = ContentWriter(self._env)
+        if partial_filter is not None:
+            # samples not selected by the filter are referenced from the commit refs.
+            m_hashes.update(partial.unrecorded_references(
+                (refVal for *_, refVal in commitRecs), self._env.hashenv))
+        for schema_hash, schemaVal in schemaRecs:
+            CW.schema(schema_hash, schemaVal)
+        with DataWriter(self._env) as DW_CM:
+            DW_CM.remote_references(m_hashes.items())
+        # Commit references are written last so partial fetches are never visible
+        for cmt, parentVal, specVal, refVal in commitRecs:
+            CW.commit(cmt, parentVal, specVal, refVal)
+
+    async def fetch(self, remote: str, branch: str, *,
+                    partial_filter: Optional[partial.PartialCloneFilter] = None) -> str:
+        """Retrieve new commits made on a remote repository branch.
+
+        See :meth:`~hangar.remotes.Remotes.fetch` for details of the operation.
+
+        Parameters
+        ----------
+        remote
+            name of the remote repository to fetch from (ie. ``origin``)
+        branch
+            name of the branch to fetch the commit references for.
+        partial_filter
+            partial clone filter selecting the samples whose data hash records
+            are retrieved; recorded for the remote if set. If None (default),
+            the filter recorded for the remote is used.
+
+        Returns
+        -------
+        str
+            Name of the branch which stores the retrieved commits.
+        """
+        if partial_filter is None:
+            partial_filter = partial.filter_from_json(
+                heads.get_remote_filter(self._env.branchenv, name=remote))
+        else:
+            partial_filter = partial.normalize_filter(partial_filter)
+            heads.set_remote_filter(self._env.branchenv, name=remote,
+                                    filter_json=partial.filter_to_json(partial_filter))
+
+        async with self._client(remote) as client:
+            try:
+                s_branch = await client.fetch_branch_record(branch)
+            except grpc.RpcError as rpc_error:
+                if rpc_error.code() == grpc.StatusCode.NOT_FOUND:
+                    # branch does not exist on remote
+                    logger.error(rpc_error.details())
+                raise rpc_error
+            sHEAD = s_branch.rec.commit
+            try:
+                cHEAD = heads.get_branch_head_commit(self._env.branchenv, branch)
+            except ValueError:
+                pass  # branch does not exist on local client
+            else:
+                c_bhistory = summarize.list_history(
+                    self._env.refenv, self._env.branchenv, branch_name=branch)
+                if sHEAD == cHEAD:
+                    warnings.warn(f'NoOp:  {sHEAD} == client HEAD {cHEAD}', UserWarning)
+                    return branch
+                elif sHEAD in c_bhistory['order']:
+                    warnings.warn(
+                        f'REJECTED: remote HEAD: {sHEAD} behind local: {cHEAD}', UserWarning)
+                    return branch
+
+            m_cmts = (await client.fetch_find_missing_commits(branch)).commits
+            schemaRecs, m_hashes, commitRecs = await client.fetch_missing_commit_contents(
+                m_cmts, partial_filter=partial_filter)
+            await _run_blocking(
+                self._record_fetched_contents, schemaRecs, m_hashes, commitRecs, partial_filter)
+
+        # Update (or create) remote branch pointer with new HEAD commit
+        fetchBranchName = f'{remote}/{branch}'
+        try:
+            heads.create_branch(self._env.branchenv, name=fetchBranchName, base_commit=sHEAD)
+        except ValueError:
+            heads.set_branch_head_commit(
+                self._env.branchenv, branch_name=fetchBranchName, commit_hash=sHEAD)
+        return fetchBranchName
+
+    async def fetch_data(self,
+                         remote: str,
+                         branch: str = None,
+                         commit: str = None,
+                         *,
+                         column_names: Optional[Sequence[str]] = None,
+                         partial_filter: Optional[partial.PartialCloneFilter] = None,
+                         retrieve_all_history: bool = False) -> List[str]:
+        """Retrieve the data for some commit which exists in a `partial` state.
+
+        See :meth:`~hangar.remotes.Remotes.fetch_data` for details of the
+        operation and its arguments. Data is written (and the transfer journal
+        checkpointed) in batches; an interrupted transfer is resumed by the
+        next call with the same arguments.
+
+        Returns
+        -------
+        List[str]
+            commit hashes of the data which was returned.
+
+        Raises
+        ------
+        ValueError
+            if branch and commit args are set simultaneously.
+        ValueError
+            if specified commit does not exist in the repository.
+        ValueError
+            if branch name does not exist in the repository.
+        """
+        if all([branch, commit]):
+            raise ValueError(f'``branch`` and ``commit`` args cannot be set simultaneously')
+        if branch is not None:
+            cmt = heads.get_branch_head_commit(self._env.branchenv, branch_name=branch)
+        else:
+            cmt = commit
+            if not commiting.check_commit_hash_in_history(self._env.refenv, commit):
+                raise ValueError(f'specified commit: {commit} does not exist in the repo.')
+        if partial_filter is None:
+            partial_filter = partial.filter_from_json(
+                heads.get_remote_filter(self._env.branchenv, name=remote))
+        else:
+            partial_filter = partial.normalize_filter(partial_filter)
+        if column_names is not None:
+            column_names = sorted(column_names)
+            if partial_filter is not None:
+                if partial_filter.columns is not None:
+                    column_names = sorted(set(column_names).intersection(partial_filter.columns))
+                partial_filter = partial_filter._replace(columns=tuple(column_names))
+
+        run_key = TransferJournal.run_key(
+            'fetch_data', remote, commit=cmt, column_names=column_names,
+            retrieve_all_history=retrieve_all_history,
+            partial_filter=partial.filter_to_json(partial_filter))
+        journal = TransferJournal(self._repo_path)
+        try:
+            async with self._client(remote) as client:
+                resumed = journal.resume_run(run_key)
+                if resumed is not None:
+                    meta, pending = resumed
+                    commits = meta['commits']
+                    selectedDataRecords = set(
+                        DataRecordVal(digest) for digests in pending.values() for digest in digests)
+                else:
+                    if retrieve_all_history is True:
+                        hist = summarize.list_history(
+                            self._env.refenv, self._env.branchenv, commit_hash=cmt)
+                        commits = hist['order']
+                    else:
+                        commits = [cmt]
+                    if partial_filter is not None:
+                        # samples selected by the filter are found by the server.
+                        selectedDataRecords = set()
+                        for commit in commits:
+                            selectedDataRecords.update(
+                                DataRecordVal(ident.digest) for ident in
+                                await client.fetch_filtered_data(commit, partial_filter))
+                    else:
+                        selectedDataRecords = await _run_blocking(
+                            select_commits_data_records, self._env.refenv, commits, column_names)
+
+                m_schema_hash_map = await _run_blocking(
+                    missing_schema_digest_map, selectedDataRecords, self._env.hashenv)
+                if resumed is None:
+                    journal.begin_run(run_key, 'fetch_data', remote, m_schema_hash_map,
+                                      commits=commits)
+
+                # the write txn of a data writer is begun and committed in one thread.
+                with ThreadPoolExecutor(max_workers=1) as txn_executor:
+                    loop = asyncio.get_running_loop()
+                    for schema, hashes in m_schema_hash_map.items():
+                        for batch in checkpoint_batches(hashes):
+                            origins = await client.fetch_data_origin(batch)
+                            DW_CM = DataWriter(self._env)
+                            await loop.run_in_executor(txn_executor, DW_CM.__enter__)
+                            try:
+                                await client.fetch_data(origins, DW_CM, schema)
+                            finally:
+                                await loop.run_in_executor(txn_executor, DW_CM.__exit__)
+                            await _run_blocking(commiting.move_process_data_to_store,
+                                                self._repo_path, remote_operation=True)
+                            journal.checkpoint(run_key, schema, batch)
+            summary = journal.finish_run(run_key)
+            logger.info(f'fetched {summary.num_samples} samples in {summary.elapsed:.2f} sec '
+                        f'({summary.samples_per_sec:.1f} samples/sec)')
+        except BaseException:
+            journal.suspend_run(run_key)
+            raise
+        finally:
+            journal.close()
+        return commits
+
+    async def push(self, remote: str, branch: str,
+                   *, username: str = '', password: str = '') -> str:
+        """push changes made on a local repository to a remote repository.
+
+        See :meth:`~hangar.remotes.Remotes.push` for details of the operation.
+        An interrupted push is resumed by the next call with the same
+        arguments.
+
+        Parameters
+        ----------
+        remote
+            name of the remote repository to make the push on.
+        branch
+            Name of the branch to push to the remote. If the branch name does
+            not exist on the remote, the it will be created
+        username
+            credentials to use for authentication if repository push restrictions
+            are enabled, by default ''.
+        password
+            credentials to use for authentication if repository push restrictions
+            are enabled, by default ''.
+
+        Returns
+        -------
+        str
+            Name of the branch which was pushed
+        """
+        cHEAD = heads.get_branch_head_commit(self._env.branchenv, branch)
+        CR = ContentReader(self._env)
+        client = self._client(remote, auth_username=username, auth_password=password)
+        async with client:
+            c_bhistory = summarize.list_history(refenv=self._env.refenv,
+                                                branchenv=self._env.branchenv,
+                                                branch_name=branch)
+            try:
+                s_branch = await client.fetch_branch_record(branch)
+            except grpc.RpcError as rpc_error:
+                # Do not raise if error due to branch not existing on server
+                if rpc_error.code() != grpc.StatusCode.NOT_FOUND:
+                    raise rpc_error
+            else:
+                sHEAD = s_branch.rec.commit
+                if sHEAD == cHEAD:
+                    warnings.warn(
+                        f'NoOp: server HEAD: {sHEAD} == client HEAD: {cHEAD}', UserWarning)
+                    return branch
+                elif (sHEAD not in c_bhistory['order']) and (sHEAD != ''):
+                    warnings.warn(
+                        f'REJECTED: server branch has commits not on client', UserWarning)
+                    return branch
+
+            try:
+                # First push op verifies user permissions if push restricted (NOT SECURE)
+                m_commits = (await client.push_find_missing_commits(branch)).commits
+            except grpc.RpcError as rpc_error:
+                if rpc_error.code() == grpc.StatusCode.PERMISSION_DENIED:
+                    raise PermissionError(f'{rpc_error.code()}: {rpc_error.details()}')
+                raise rpc_error
+
+            run_key = TransferJournal.run_key('push', remote, branch=branch, head=cHEAD)
+            journal = TransferJournal(self._repo_path)
+            try:
+                resumed = journal.resume_run(run_key)
+                if resumed is not None:
+                    meta, m_schema_hashs = resumed
+                    m_commits, m_schemas = meta['commits'], meta['schemas']
+                else:
+                    m_schemas = set()
+                    m_schema_hashs = defaultdict(set)
+                    for commit in m_commits:
+                        schema_res = await client.push_find_missing_schemas(commit)
+                        m_schemas.update(schema_res.schema_digests)
+                        for hsh, schema in await client.push_find_missing_hash_records(commit):
+                            m_schema_hashs[schema].add(hsh)
+                    m_commits, m_schemas = list(m_commits), list(m_schemas)
+                    journal.begin_run(run_key, 'push', remote, m_schema_hashs,
+                                      commits=m_commits, schemas=m_schemas)
+
+                for m_schema in m_schemas:
+                    schemaVal = CR.schema(m_schema)
+                    if not schemaVal:
+                        raise KeyError(f'no schema with hash: {m_schema} exists')
+                    await client.push_schema(m_schema, schemaVal)
+                journal.update_meta(run_key, schemas=[])
+                for dataSchema, dataHashes in m_schema_hashs.items():
+                    for batch in checkpoint_batches(dataHashes):
+                        await client.push_data_begin_context()
+                        try:
+                            await client.push_data(dataSchema, batch)
+                        finally:
+                            await client.push_data_end_context()
+                        journal.checkpoint(run_key, dataSchema, batch)
+                for idx, commit in enumerate(m_commits):
+                    cmtContent = CR.commit(commit)
+                    if not cmtContent:
+                        raise KeyError(f'no commit with hash: {commit} exists')
+                    await client.push_commit_record(commit=cmtContent.commit,
+                                                    parentVal=cmtContent.cmtParentVal,
+                                                    specVal=cmtContent.cmtSpecVal,
+                                                    refVal=cmtContent.cmtRefVal)
+                    journal.update_meta(run_key, commits=m_commits[idx + 1:])
+                summary = journal.finish_run(run_key)
+                logger.info(f'pushed {summary.num_samples} samples in {summary.elapsed:.2f} sec '
+                            f'({summary.samples_per_sec:.1f} samples/sec)')
+            except BaseException:
+                journal.suspend_run(run_key)
+                raise
+            finally:
+                journal.close()
+
+            # update local remote HEAD pointer
+            branchHead = heads.get_branch_head_commit(self._env.branchenv, branch)
+            try:
+                await client.push_branch_record(branch, branchHead)
+            except grpc.RpcError as rpc_error:
+                # Do not raise if error due to branch not existing on server
+                if rpc_error.code() != grpc.StatusCode.ALREADY_EXISTS:
+                    logger.warning(f'CODE: {rpc_error.code()} DETAILS:{rpc_error.details()}')
+                else:
+                    raise rpc_error
+            else:
+                cRemoteBranch = f'{remote}/{branch}'
+                if cRemoteBranch not in heads.get_branch_names(self._env.branchenv):
+                    heads.create_branch(branchenv=self._env.branchenv,
+                                        name=cRemoteBranch,
+                                        base_commit=branchHead)
+                else:
+                    heads.set_branch_head_commit(branchenv=self._env.branchenv,
+                                                 branch_name=cRemoteBranch,
+                                                 commit_hash=branchHead)
+        return branch
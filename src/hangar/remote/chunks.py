@@ -1,39 +1,86 @@
+import json
 import math
 import struct
 from io import BytesIO
-from typing import NamedTuple, List, Union, Tuple, Iterable
+from typing import NamedTuple, List, Optional, Union, Tuple, Iterable, Iterator, Sequence
 
 import blosc
 import numpy as np
+from xxhash import xxh64_intdigest
 
 from . import hangar_service_pb2
+from .codecs import DEFAULT_CODEC, WireCodec, compress, parse_codec
+from ..backends.hdf5_01 import HDF5_01_RawChunks
 from ..utils import set_blosc_nthreads
 
 set_blosc_nthreads()
 
 
-def chunk_bytes(bytesData, *, chunkSize: int = 32_000) -> Iterable[bytes]:
+# largest message grpc receives unless a channel is configured otherwise.
+DEFAULT_MAX_MESSAGE_NBYTES = 4_194_304
+
+# room left in each message for fields other than the chunked payload.
+MESSAGE_HEADROOM_NBYTES = 65_536
+
+
+def adaptive_chunk_size(nbytes: int, max_message_nbytes: int = DEFAULT_MAX_MESSAGE_NBYTES) -> int:
+    """Size of chunks a payload is split into so it is sent in the fewest messages.
+
+    Payloads which fit in a single message are not split. Larger payloads are
+    split into equally sized chunks, each of which fits within the maximum
+    message size (less some headroom for the other fields of the message).
+
+    Parameters
+    ----------
+    nbytes
+        size of the payload.
+    max_message_nbytes
+        maximum size of a message the receiver accepts.
+
+    Returns
+    -------
+    int
+        number of bytes in each chunk (the last may be smaller).
+    """
+    max_chunk_nbytes = max(max_message_nbytes - MESSAGE_HEADROOM_NBYTES, MESSAGE_HEADROOM_NBYTES)
+    num_chunks = max(1, math.ceil(nbytes / max_chunk_nbytes))
+    return max(1, math.ceil(nbytes / num_chunks))
+
+
+def chunk_bytes(bytesData, *, chunkSize: Optional[int] = None,
+                max_message_nbytes: int = DEFAULT_MAX_MESSAGE_NBYTES) -> Iterable[bytes]:
     """Slice a bytestring into subelements and store the data in a list
 
     Arguments
     ---------
         bytesData : bytes
             bytestring buffer of the array data
-        chunkSize : int, optional, kwarg-only
-            number of bytes which each chunk should be split into.
+        chunkSize : Optional[int], optional, kwarg-only
+            number of bytes which each chunk should be split into. By default,
+            the size is chosen by :func:`adaptive_chunk_size`.
+        max_message_nbytes : int, optional, kwarg-only
+            maximum size of a message the receiver accepts (only used when
+            ``chunkSize`` is not set).
 
     Yields
     ------
     bytes
-        data split into 32kb chunk sizes.
+        data split into chunks. A ``bytes`` payload which fits in a single
+        chunk is yielded as is (without copying).
     """
-    numIters = math.ceil(len(bytesData) / chunkSize)
-    currentStart = 0
-    currentEnd = chunkSize
-    for i in range(numIters):
-        yield bytesData[currentStart:currentEnd]
-        currentStart += chunkSize
-        currentEnd += chunkSize
+    nbytes = len(bytesData)
+    if chunkSize is None:
+        chunkSize = adaptive_chunk_size(nbytes, max_message_nbytes)
+    if (nbytes <= chunkSize) and isinstance(bytesData, bytes):
+        if nbytes > 0:
+            yield bytesData
+        return
+
+    # protobuf bytes fields only accept ``bytes``; a memoryview avoids copying
+    # the remainder of the buffer on every slice.
+    view = memoryview(bytesData)
+    for start in range(0, nbytes, chunkSize):
+        yield bytes(view[start:start + chunkSize])
 
 
 def clientCommitChunkedIterator(commit: str, parentVal: bytes, specVal: bytes,
@@ -72,7 +119,7 @@ def clientCommitChunkedIterator(commit: str, parentVal: bytes, specVal: bytes,
 
 def tensorChunkedIterator(buf, uncomp_nbytes, pb2_request,
                           *,
-                          err=None, chunkSize: int = 32_000):
+                          err=None, chunkSize: Optional[int] = None):
 
     compBytes = blosc.compress(
         buf, clevel=3, cname='blosclz', shuffle=blosc.NOSHUFFLE)
@@ -103,13 +150,14 @@ def missingHashIterator(commit, hash_bytes, err, pb2_func):
         yield rpc_method
 
 
-def missingHashRequestIterator(commit, hash_bytes, pb2_func):
+def missingHashRequestIterator(commit, hash_bytes, pb2_func, **kwargs):
     comp_bytes = blosc.compress(
         hash_bytes, cname='zlib', clevel=3, typesize=1, shuffle=blosc.SHUFFLE)
 
     rpc_method = pb2_func(
         commit=commit,
-        total_byte_size=len(comp_bytes))
+        total_byte_size=len(comp_bytes),
+        **kwargs)
 
     chunkIterator = chunk_bytes(comp_bytes)
     for bchunk in chunkIterator:
@@ -126,7 +174,7 @@ class DataIdent(NamedTuple):
 
 
 class DataRecord(NamedTuple):
-    data: Union[np.ndarray, str, bytes]
+    data: Union[np.ndarray, str, bytes, HDF5_01_RawChunks]
     digest: str
     schema: str
 
@@ -170,6 +218,39 @@ def _deserialize_bytes(data: bytes) -> bytes:
     return data
 
 
+def _serialize_raw_chunks(raw: HDF5_01_RawChunks) -> bytes:
+    """
+    len_header header_json chunk1_bytes chunk2_bytes ... chunkN_bytes
+    """
+    header = json.dumps({
+        'checksum': raw.checksum,
+        'shape': raw.shape,
+        'dtype': raw.dtype,
+        'row_shape': raw.row_shape,
+        'chunk_shape': raw.chunk_shape,
+        'filters': raw.filters,
+        'chunks': [(offset, filter_mask, len(data)) for offset, filter_mask, data in raw.chunks],
+    }).encode()
+    return b''.join([struct.pack('<Q', len(header)), header, *(c[2] for c in raw.chunks)])
+
+
+def _deserialize_raw_chunks(raw: bytes) -> HDF5_01_RawChunks:
+    headerLen = struct.unpack('<Q', raw[:8])[0]
+    header = json.loads(raw[8:8 + headerLen])
+    cursorPos, raw_chunks = 8 + headerLen, []
+    for offset, filter_mask, nbytes in header['chunks']:
+        raw_chunks.append((tuple(offset), filter_mask, raw[cursorPos:cursorPos + nbytes]))
+        cursorPos += nbytes
+    filters = tuple((fid, flags, tuple(cd)) for fid, flags, cd in header['filters'])
+    return HDF5_01_RawChunks(checksum=header['checksum'],
+                             shape=tuple(header['shape']),
+                             dtype=header['dtype'],
+                             row_shape=tuple(header['row_shape']),
+                             chunk_shape=tuple(header['chunk_shape']),
+                             filters=filters,
+                             chunks=tuple(raw_chunks))
+
+
 def serialize_ident(digest: str, schema: str) -> bytes:
     """
     len_digest len_schema digest_str schema_str
@@ -189,24 +270,29 @@ def deserialize_ident(raw: bytes) -> DataIdent:
     return DataIdent(digest, schema)
 
 
-def serialize_data(data: Union[np.ndarray, str, bytes]) -> Tuple[int, bytes]:
+def serialize_data(data: Union[np.ndarray, str, bytes, HDF5_01_RawChunks]) -> Tuple[int, bytes]:
     if isinstance(data, np.ndarray):
         return (0, _serialize_arr(data))
     elif isinstance(data, str):
         return (2, _serialize_str(data))
     elif isinstance(data, bytes):
         return (3, _serialize_bytes(data))
+    elif isinstance(data, HDF5_01_RawChunks):
+        return (4, _serialize_raw_chunks(data))
     else:
         raise TypeError(type(data))
 
 
-def deserialize_data(dtype_code: int, raw_data: bytes) -> Union[np.ndarray, str, bytes]:
+def deserialize_data(dtype_code: int,
+                     raw_data: bytes) -> Union[np.ndarray, str, bytes, HDF5_01_RawChunks]:
     if dtype_code == 0:
         return _deserialize_arr(raw_data)
     elif dtype_code == 2:
         return _deserialize_str(raw_data)
     elif dtype_code == 3:
         return _deserialize_bytes(raw_data)
+    elif dtype_code == 4:
+        return _deserialize_raw_chunks(raw_data)
     else:
         raise ValueError(f'dtype_code unknown {dtype_code}')
 
@@ -251,3 +337,160 @@ def deserialize_record_pack(raw: bytes) -> List[bytes]:
         recs.append(raw[cursorPos+8:cursorPos+8+lenRec])
         cursorPos += (8 + lenRec)
     return recs
+
+
+# ------------------------ batched data frames ----------------------------
+
+
+def pack_record_frames(
+        records: Iterable[Tuple[Union[np.ndarray, str, bytes], str]],
+        max_frame_nbytes: int,
+        codec: Union[str, WireCodec] = DEFAULT_CODEC,
+) -> Iterator[Tuple[bytes, int]]:
+    """Pack (data, digest) records into compressed multi-sample frames.
+
+    Records are accumulated (in order) until the serialized size of the frame
+    reaches ``max_frame_nbytes``, at which point the frame is compressed as a
+    single blob and emitted. A record which is larger than the budget by itself
+    is sent alone in its own frame.
+
+    Parameters
+    ----------
+    records
+        iterable of two-tuples containing (data, digest) of each sample.
+    max_frame_nbytes
+        maximum number of uncompressed bytes to pack into a frame.
+    codec
+        wire codec (or name of the codec) frames are compressed with. Shuffle
+        filters use the item size of the arrays in a frame if they all share
+        one.
+
+    Yields
+    ------
+    Tuple[bytes, int]
+        compressed frame and the number of records packed within it.
+    """
+    if isinstance(codec, str):
+        codec = parse_codec(codec)
+    max_frame_nbytes = min(max_frame_nbytes, blosc.MAX_BUFFERSIZE)
+    frame, frame_nbytes, itemsizes = [], 0, set()
+    for data, digest in records:
+        raw = serialize_record(data, digest, '')
+        raw_nbytes = len(raw) + 8  # record length is prefixed in the pack
+        if frame and (frame_nbytes + raw_nbytes > max_frame_nbytes):
+            yield _compress_record_frame(frame, codec, itemsizes), len(frame)
+            frame, frame_nbytes, itemsizes = [], 0, set()
+        frame.append(raw)
+        frame_nbytes += raw_nbytes
+        itemsizes.add(data.itemsize if isinstance(data, np.ndarray) else 1)
+    if frame:
+        yield _compress_record_frame(frame, codec, itemsizes), len(frame)
+
+
+def _compress_record_frame(frame: List[bytes], codec: WireCodec, itemsizes: set) -> bytes:
+    raw_pack = serialize_record_pack(frame)
+    typesize = itemsizes.pop() if len(itemsizes) == 1 else 1
+    return compress(raw_pack, codec, typesize)
+
+
+def frame_segments(records: Sequence[Tuple[str, bytes]],
+                   sizes: Sequence[int],
+                   segment_nbytes: int,
+                   *,
+                   max_segment_records: int = 1_024) -> List[List[Tuple[str, bytes]]]:
+    """Split (digest, value) records into segments at content defined boundaries.
+
+    A segment ends after a record with probability ``size / segment_nbytes``,
+    decided by the hash of its digest, so segments hold ``segment_nbytes`` of
+    data on average. Boundaries only depend on the digests (and the sizes
+    stored alongside them); any two requests for overlapping ranges of sorted
+    digests split the overlap into the same segments, which is what allows
+    packed frames to be cached.
+
+    Parameters
+    ----------
+    records
+        two-tuples of (digest, value), typically sorted by digest.
+    sizes
+        estimated nbytes of each record.
+    segment_nbytes
+        average nbytes of data in a segment.
+    max_segment_records
+        average number of records in a segment when the records are small,
+        optional, default 1_024.
+
+    Returns
+    -------
+    List[List[Tuple[str, bytes]]]
+        segments of records, in input order.
+    """
+    segments, segment = [], []
+    for record, size in zip(records, sizes):
+        segment.append(record)
+        probability = max(size / segment_nbytes, 1 / max_segment_records)
+        if xxh64_intdigest(record[0].encode()) < probability * 2 ** 64:
+            segments.append(segment)
+            segment = []
+    if segment:
+        segments.append(segment)
+    return segments
+
+
+def unpack_record_frame(frame: bytes) -> List[DataRecord]:
+    """Decompress a frame created by :func:`pack_record_frames` into records.
+    """
+    raw_pack = blosc.decompress(frame)
+    return [deserialize_record(raw) for raw in deserialize_record_pack(raw_pack)]
+
+
+def dataFrameChunkedIterator(frames: Iterable[Tuple[bytes, int]], pb2_func, *,
+                             max_message_nbytes: int = DEFAULT_MAX_MESSAGE_NBYTES,
+                             **fields):
+    """Generator splitting compressed data frames into chunked messages.
+
+    Each frame is sent in as few messages as ``max_message_nbytes`` (the
+    largest message the receiver accepts) allows. Any additional keyword
+    ``fields`` are set on every message generated.
+    """
+    for frame, num_records in frames:
+        message = pb2_func(num_records=num_records, nbytes=len(frame), **fields)
+        for raw_chunk in chunk_bytes(frame, max_message_nbytes=max_message_nbytes):
+            message.raw_data = raw_chunk
+            yield message
+
+
+def reassemble_data_frames(messages) -> Iterator[Union[bytes, bytearray]]:
+    """Join chunked messages back into the compressed frames they were cut from.
+
+    Frames sent in a single message are yielded as received, without copying.
+    """
+    frame, offset = None, 0
+    for message in messages:
+        if offset == 0:
+            if len(message.raw_data) == message.nbytes:
+                yield message.raw_data
+                continue
+            frame = bytearray(message.nbytes)
+        size = len(message.raw_data)
+        frame[offset:offset + size] = message.raw_data
+        offset += size
+        if offset == message.nbytes:
+            yield frame
+            frame, offset = None, 0
+
+
+def reassemble_single_frame(messages) -> Tuple[object, Union[bytes, bytearray]]:
+    """Join chunked messages holding one frame, returning the first message with it.
+
+    The first message carries the values of every non chunked field.
+    """
+    first = []
+
+    def tap(messages):
+        for message in messages:
+            if not first:
+                first.append(message)
+            yield message
+
+    frame, = reassemble_data_frames(tap(messages))
+    return first[0], frame
@@ -1,20 +1,26 @@
 import concurrent.futures
 import logging
+import math
 import os
 import tempfile
 import time
 from threading import Lock
-from typing import Tuple, Sequence, List, Iterable, TYPE_CHECKING
+from typing import ContextManager, Dict, Tuple, Sequence, List, Iterable, Optional, Union, TYPE_CHECKING
 
 import blosc
 import grpc
 import lmdb
+import numpy as np
 from tqdm import tqdm
+from xxhash import xxh64_hexdigest
 
-from . import chunks, hangar_service_pb2, hangar_service_pb2_grpc
+from . import chunks, hangar_service_pb2, hangar_service_pb2_grpc, partial, reconcile
+from .codecs import AUTO_CODEC, ThroughputMeter, select_codec
 from .header_manipulator_client_interceptor import header_adder_interceptor
+from .scheduler import TransferScheduler, largest_first_batches, sample_size_hint
 from .. import constants as c
 from ..backends import BACKEND_ACCESSOR_MAP, backend_decoder
+from ..backends.hdf5_01 import RAW_CHUNKS_SUPPORTED, HDF5_01_RawChunks, decode_raw_chunks
 from ..context import Environments
 from ..records import commiting, hashs, hash_data_db_key_from_raw_key, queries, summarize
 from ..records.hashmachine import hash_func_from_tcode
@@ -30,6 +36,174 @@ set_blosc_nthreads()
 logger = logging.getLogger(__name__)
 
 
+#: Client configuration used for any value the server does not send; older
+#: servers only reply with a subset of these keys.
+DEFAULT_CLIENT_CONFIG = {
+    'push_max_nbytes': '600_000_000',
+    'fetch_batch_size': '1_000',
+    'push_batch_size': '1_000',
+    'push_frame_nbytes': '16_000_000',
+    'optimization_target': 'blend',
+    'enable_compression': 'NoCompression',
+    'codecs': 'blosclz',
+    'push_codec': AUTO_CODEC,
+    'fetch_raw_chunks': '0',
+    # servers which do not negotiate a message size accept the grpc default.
+    'max_message_nbytes': str(chunks.DEFAULT_MAX_MESSAGE_NBYTES),
+}
+
+
+def client_config_from_reply(reply: hangar_service_pb2.GetClientConfigReply) -> dict:
+    """Parse the client configuration sent by the server.
+
+    Keys missing from (or empty in) the reply take their value from
+    :data:`DEFAULT_CLIENT_CONFIG`.
+    """
+    def value(key: str) -> str:
+        return reply.config.get(key) or DEFAULT_CLIENT_CONFIG[key]
+
+    cfg = {}
+    cfg['push_max_nbytes'] = int(value('push_max_nbytes'))
+    cfg['fetch_batch_size'] = int(value('fetch_batch_size'))
+    cfg['push_batch_size'] = int(value('push_batch_size'))
+    cfg['push_frame_nbytes'] = int(value('push_frame_nbytes'))
+    cfg['optimization_target'] = value('optimization_target')
+    cfg['codecs'] = value('codecs').split(',')
+    cfg['push_codec'] = value('push_codec')
+    cfg['fetch_raw_chunks'] = RAW_CHUNKS_SUPPORTED and bool(int(value('fetch_raw_chunks')))
+    cfg['max_message_nbytes'] = int(value('max_message_nbytes'))
+
+    enable_compression = value('enable_compression')
+    if enable_compression == 'NoCompression':
+        compression_val = grpc.Compression.NoCompression
+    elif enable_compression == 'Deflate':
+        compression_val = grpc.Compression.Deflate
+    elif enable_compression == 'Gzip':
+        compression_val = grpc.Compression.Gzip
+    else:
+        compression_val = grpc.Compression.NoCompression
+    cfg['enable_compression'] = compression_val
+    return cfg
+
+
+def channel_options(cfg: dict) -> List[Tuple[str, Union[str, int]]]:
+    """Options of the channel used after the client configuration was received.
+    """
+    return [
+        ('grpc.optimization_target', cfg['optimization_target']),
+        ('grpc.max_send_message_length', cfg['max_message_nbytes']),
+        ('grpc.max_receive_message_length', cfg['max_message_nbytes']),
+        ("grpc.keepalive_time_ms", 1000 * 60 * 1),
+        ("grpc.keepalive_timeout_ms", 1000 * 10),
+        ("grpc.http2_min_sent_ping_interval_without_data_ms", 1000 * 10),
+        ("grpc.http2_max_pings_without_data", 0),
+        ("grpc.keepalive_permit_without_calls", 1),
+    ]
+
+
+def data_type_from_backend(be_loc) -> int:
+    """Type of the data stored at a backend location, as sent to the server.
+    """
+    if be_loc.backend in ['01', '00', '10']:
+        return hangar_service_pb2.DataType.NP_ARRAY
+    elif be_loc.backend == '30':
+        return hangar_service_pb2.DataType.STR
+    elif be_loc.backend == '31':
+        return hangar_service_pb2.DataType.BYTES
+    else:
+        raise TypeError(be_loc)
+
+
+def verify_raw_chunks(pb: hangar_service_pb2.DataOriginReply,
+                      raw: HDF5_01_RawChunks) -> np.ndarray:
+    """Decode the raw chunks of a sample and verify its digest and checksum.
+
+    Returns
+    -------
+    np.ndarray
+        decoded sample data.
+
+    Raises
+    ------
+    RuntimeError
+        if the digest of the decoded data != requested, or its checksum !=
+        the checksum sent along with the chunks.
+    """
+    data = decode_raw_chunks(raw)
+    hash_func = hash_func_from_tcode(str(pb.data_type))
+    received_hash = hash_func(data)
+    if received_hash != pb.digest:
+        raise RuntimeError(f'MANGLED! got: {received_hash} != requested: {pb.digest}')
+    received_checksum = xxh64_hexdigest(data)
+    if received_checksum != raw.checksum:
+        raise RuntimeError(f'MANGLED! checksum: {received_checksum} != sent: {raw.checksum}')
+    return data
+
+
+def write_received_frame(frame: bytes,
+                         requested: dict,
+                         dw_cm: 'DataWriter',
+                         schema: str,
+                         lock: ContextManager) -> List[str]:
+    """Verify and write every sample in a frame received from ``FetchDataBatch``.
+
+    Samples received as raw ``HDF5_01`` chunks are decoded and verified with
+    :func:`verify_raw_chunks` before anything is written; the compressed
+    chunks are then written as received when the local files are compatible
+    (skipping compression), otherwise the decoded array is written.
+
+    Parameters
+    ----------
+    frame
+        compressed frame of records.
+    requested
+        map of uri -> ``DataOriginReply`` of samples not yet received; records
+        are removed as they are written.
+    dw_cm
+        data writer (opened as a context manager) to write samples with.
+    schema
+        schema digest samples are written for.
+    lock
+        held while each sample is written.
+
+    Returns
+    -------
+    List[str]
+        digests of written samples.
+
+    Raises
+    ------
+    ValueError
+        if a received record was not requested.
+    RuntimeError
+        if the digest of received data != requested.
+    """
+    written_digests = []
+    for record in chunks.unpack_record_frame(frame):
+        try:
+            pb = requested.pop(record.digest)
+        except KeyError:
+            raise ValueError(f'received uri: {record.digest} was not requested')
+        data = record.data
+        if isinstance(data, HDF5_01_RawChunks):
+            raw, data = data, verify_raw_chunks(pb, data)
+            with lock:
+                written_digest = dw_cm.raw_chunks(schema, data_digest=pb.digest, raw=raw)
+                if written_digest is None:
+                    written_digest = dw_cm.data(schema, data_digest=pb.digest, data=data)
+            written_digests.append(written_digest)
+            continue
+
+        hash_func = hash_func_from_tcode(str(pb.data_type))
+        received_hash = hash_func(data)
+        if received_hash != pb.digest:
+            raise RuntimeError(f'MANGLED! got: {received_hash} != requested: {pb.digest}')
+        with lock:
+            written_digest = dw_cm.data(schema, data_digest=received_hash, data=data)
+        written_digests.append(written_digest)
+    return written_digests
+
+
 class HangarClient(object):
     """Client which connects and handles data transfer to the hangar server.
 
@@ -67,6 +241,8 @@ class HangarClient(object):
         self.wait_ready: bool = wait_for_ready
         self.wait_ready_timeout: float = abs(wait_for_ready_timeout + 0.001)
         self.data_writer_lock = Lock()
+        self.fetch_meter = ThroughputMeter()
+        self.push_meter = ThroughputMeter()
 
         self.channel: grpc.Channel = None
         self.stub: hangar_service_pb2_grpc.HangarServiceStub = None
@@ -96,19 +272,7 @@ class HangarClient(object):
             try:
                 request = hangar_service_pb2.GetClientConfigRequest()
                 response = tmp_stub.GetClientConfig(request)
-                self.cfg['push_max_nbytes'] = int(response.config['push_max_nbytes'])
-                self.cfg['optimization_target'] = response.config['optimization_target']
-
-                enable_compression = response.config['enable_compression']
-                if enable_compression == 'NoCompression':
-                    compression_val = grpc.Compression.NoCompression
-                elif enable_compression == 'Deflate':
-                    compression_val = grpc.Compression.Deflate
-                elif enable_compression == 'Gzip':
-                    compression_val = grpc.Compression.Gzip
-                else:
-                    compression_val = grpc.Compression.NoCompression
-                self.cfg['enable_compression'] = compression_val
+                self.cfg.update(client_config_from_reply(response))
 
             except grpc.RpcError as err:
                 if not (err.code() == grpc.StatusCode.UNAVAILABLE) and (self.wait_ready is True):
@@ -127,14 +291,7 @@ class HangarClient(object):
         tmp_insec_channel.close()
         configured_channel = grpc.insecure_channel(
             self.address,
-            options=[
-                ('grpc.optimization_target', self.cfg['optimization_target']),
-                ("grpc.keepalive_time_ms", 1000 * 60 * 1),
-                ("grpc.keepalive_timeout_ms", 1000 * 10),
-                ("grpc.http2_min_sent_ping_interval_without_data_ms", 1000 * 10),
-                ("grpc.http2_max_pings_without_data", 0),
-                ("grpc.keepalive_permit_without_calls", 1),
-            ],
+            options=channel_options(self.cfg),
             compression=self.cfg['enable_compression'])
         self.channel = grpc.intercept_channel(configured_channel, self.header_adder_int)
         self.stub = hangar_service_pb2_grpc.HangarServiceStub(self.channel)
@@ -158,6 +315,18 @@ class HangarClient(object):
         response: hangar_service_pb2.PingReply = self.stub.PING(request)
         return response.result
 
+    def server_stats(self) -> Dict[str, int]:
+        """Retrieve counters describing server operation (sample cache use, etc).
+
+        Returns
+        -------
+        Dict[str, int]
+            map of counter name -> value.
+        """
+        request = hangar_service_pb2.GetServerStatsRequest()
+        response: hangar_service_pb2.GetServerStatsReply = self.stub.GetServerStats(request)
+        return dict(response.stats)
+
     def push_branch_record(self, name: str, head: str
                            ) -> hangar_service_pb2.PushBranchRecordReply:
         """Create a branch (if new) or update the server branch HEAD to new commit.
@@ -307,16 +476,22 @@ class HangarClient(object):
             origins: Sequence[hangar_service_pb2.DataOriginReply],
             datawriter_cm: 'DataWriter',
             schema: str,
-            pbar: 'tqdm'
+            pbar: 'tqdm',
+            scheduler: Optional[TransferScheduler] = None
     ) -> Sequence[str]:
         """Fetch data hash digests for a particular schema.
 
-        As the total size of the data to be transferred isn't known before this
-        operation occurs, if more tensor data digests are requested then the
-        Client is configured to allow in memory at a time, only a portion of the
-        requested digests will actually be materialized. The received digests
-        are listed as the return value of this function, be sure to check that
-        all requested digests have been received!
+        Requested origins are split into batches of (at most) the
+        ``fetch_batch_size`` configured by the server, largest samples first.
+        Each batch is retrieved in a single ``FetchDataBatch`` call, where the
+        server streams back compressed frames packing many samples together.
+        Batches are requested concurrently by the transfer ``scheduler``; every
+        received sample is verified against its requested digest before being
+        written. A batch which fails with a transient error is retried,
+        requesting only the samples which were not yet received. When enabled
+        by the server (``fetch_raw_chunks``), samples stored in ``HDF5_01`` are
+        received as compressed chunks, which are decoded to verify the sample
+        but written as received.
 
         Parameters
         ----------
@@ -324,6 +499,9 @@ class HangarClient(object):
         datawriter_cm : 'DataWriter',
         schema : str,
         pbar : 'tqdm'
+        scheduler : Optional[TransferScheduler]
+            schedules the batches and collects transfer statistics. If None
+            (default), a new scheduler is created.
 
         Returns
         -------
@@ -338,54 +516,50 @@ class HangarClient(object):
             _ = DW_CM.data(schema, data_digest=returned_digest, data=returned_data)
         """
 
-        def fetch_write_data_parallel(
-                pb: 'hangar_service_pb2.DataOriginReply',
+        if scheduler is None:
+            scheduler = TransferScheduler('fetch_data')
+
+        def fetch_write_batch_parallel(
+                batch: Tuple[Sequence['hangar_service_pb2.DataOriginReply'], dict, List[str]],
                 dw_cm: 'DataWriter',
                 schema: str,
                 lock: 'Lock'
-        ) -> str:
-            requested_uri = pb.uri
-            request = hangar_service_pb2.FetchDataRequest(uri=requested_uri)
-            replies = self.stub.FetchData(request)
-            for idx, reply in enumerate(replies):
-                if idx == 0:
-                    dBytes = bytearray(reply.nbytes)
-                    offset = 0
-                    if reply.uri != requested_uri:
-                        raise ValueError(f'requested uri: {requested_uri}, returned: {reply.uri}')
-                size = len(reply.raw_data)
-                if size > 0:
-                    dBytes[offset:offset + size] = reply.raw_data
-                    offset += size
-
-            if pb.compression is True:
-                codex = pb.compression_opts['id']
-                if codex == 'blosc':
-                    returned_raw = blosc.decompress(dBytes)
-                else:
-                    raise ValueError(f'compression id: {codex}')
-            else:
-                returned_raw = dBytes
-
-            dtype_code = pb.data_type
-            returned_data = chunks.deserialize_data(dtype_code, returned_raw)
-            hash_func = hash_func_from_tcode(str(dtype_code))
-            received_hash = hash_func(returned_data)
-            if received_hash != pb.digest:
-                raise RuntimeError(f'MANGLED! got: {received_hash} != requested: {pb.digest}')
-            with lock:
-                written_digest = dw_cm.data(
-                    schema, data_digest=received_hash, data=returned_data)
-            return written_digest
+        ) -> List[str]:
+            # samples received before a failed attempt are not requested again.
+            _, requested, written_digests = batch
+            request = hangar_service_pb2.FetchDataBatchRequest(
+                uris=list(requested.keys()),
+                codec=select_codec(AUTO_CODEC, self.fetch_meter, self.cfg['codecs']),
+                raw_chunks=self.cfg.get('fetch_raw_chunks', False))
+            replies = self.stub.FetchDataBatch(request)
+            with self.fetch_meter.timer() as timer:
+                for frame in chunks.reassemble_data_frames(replies):
+                    timer.add_frame(frame)
+                    scheduler.transferred_frame(frame)
+                    written_digests.extend(
+                        write_received_frame(frame, requested, dw_cm, schema, lock))
+            if len(requested) > 0:
+                raise RuntimeError(f'requested uris were not received: {list(requested.keys())}')
+            return written_digests
+
+        # spread small requests across all workers, large ones in capped batches.
+        # largest samples are requested first so they do not hold up the end of
+        # the transfer; digest order (among samples of the same size) lets the
+        # server cache packed frames shared between clients.
+        nWorkers = scheduler.max_concurrency
+        batch_size = max(1, min(self.cfg['fetch_batch_size'], math.ceil(len(origins) / nWorkers)))
+        batches = largest_first_batches(
+            origins, [max(1, pb.num_elements) for pb in origins], lambda pb: pb.uri, batch_size)
+        batches = [(batch, {pb.uri: pb for pb in batch}, []) for batch in batches]
+
+        def fetch_batch(batch):
+            return fetch_write_batch_parallel(batch, datawriter_cm, schema, self.data_writer_lock)
 
         saved_digests = []
-        nWorkers = calc_num_threadpool_workers()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=nWorkers) as executor:
-            futures = [executor.submit(fetch_write_data_parallel,
-                pb, datawriter_cm, schema, self.data_writer_lock) for pb in origins]
-            for future in concurrent.futures.as_completed(futures):
-                saved_digests.append(future.result())
-                pbar.update(1)
+        for batch_digests in scheduler.run(batches, fetch_batch, size=lambda b: len(b[0])):
+            saved_digests.extend(batch_digests)
+            scheduler.stats.record_samples(len(batch_digests))
+            pbar.update(len(batch_digests))
         return saved_digests
 
     def fetch_data_origin(self, digests: Sequence[str]) -> List[hangar_service_pb2.DataOriginReply]:
@@ -427,9 +601,14 @@ class HangarClient(object):
         return reply
 
     def push_data(self, schema_hash: str, digests: Sequence[str],
-                  pbar: tqdm = None) -> hangar_service_pb2.PushDataReply:
+                  pbar: tqdm = None,
+                  scheduler: Optional[TransferScheduler] = None):
         """Given a schema and digest list, read the data and send to the server
 
+        Data is sent in batches (largest samples first) scheduled concurrently
+        by the transfer ``scheduler``; a batch failing with a transient error
+        is sent again, without the samples the server already stored.
+
         Parameters
         ----------
         schema_hash : str
@@ -438,11 +617,9 @@ class HangarClient(object):
             iterable of digests to be read in and sent to the server
         pbar : tqdm, optional
             progress bar instance to be updated as the operation occurs, by default None
-
-        Returns
-        -------
-        hangar_service_pb2.PushDataReply
-            standard error proto indicating success
+        scheduler : Optional[TransferScheduler]
+            schedules the batches and collects transfer statistics. If None
+            (default), a new scheduler is created.
 
         Raises
         ------
@@ -452,6 +629,8 @@ class HangarClient(object):
             if the server received corrupt data
         """
         CONFIG_COMPRESSION_IS_DESIRED = True
+        if scheduler is None:
+            scheduler = TransferScheduler('push')
         try:
             specs = {}
             request_stack = []
@@ -465,17 +644,8 @@ class HangarClient(object):
                 be_loc = backend_decoder(hashVal)
                 specs[digest] = be_loc  # saving for later so no recompute cost
 
-                if be_loc.backend in ['01', '00', '10']:
-                    dtype = hangar_service_pb2.DataType.NP_ARRAY
-                elif be_loc.backend == '30':
-                    dtype = hangar_service_pb2.DataType.STR
-                elif be_loc.backend == '31':
-                    dtype = hangar_service_pb2.DataType.BYTES
-                else:
-                    raise TypeError(be_loc)
-
                 _request = hangar_service_pb2.PushFindDataOriginRequest(
-                    data_type=dtype,
+                    data_type=data_type_from_backend(be_loc),
                     digest=digest,
                     compression_is_desired=CONFIG_COMPRESSION_IS_DESIRED)
                 request_stack.append(_request)
@@ -494,46 +664,46 @@ class HangarClient(object):
             for k in self._rFs.keys():
                 self._rFs[k].__enter__()
 
-            def push_request_iterator(raw, uri, data_type, schema_hash):
-                push_request = hangar_service_pb2.PushDataRequest(
-                    uri=uri,
-                    nbytes=len(raw),
-                    data_type=data_type,
-                    schema_hash=schema_hash)
-                for raw_chunk in chunks.chunk_bytes(raw):
-                    push_request.raw_data = raw_chunk
-                    yield push_request
-
-            def push_data_parallel(reply):
-                be_loc = specs[reply.digest]
-                data = self._rFs[be_loc.backend].read_data(be_loc)
-                _, raw_data = chunks.serialize_data(data)
-
-                if reply.compression_expected is True:
-                    compressed_record = blosc.compress(
-                        raw_data, clevel=3, cname='blosclz', shuffle=blosc.NOSHUFFLE)
-                else:
-                    compressed_record = raw_data
-
-                if be_loc.backend in ['01', '00', '10']:
-                    dtype = hangar_service_pb2.DataType.NP_ARRAY
-                elif be_loc.backend == '30':
-                    dtype = hangar_service_pb2.DataType.STR
-                elif be_loc.backend == '31':
-                    dtype = hangar_service_pb2.DataType.BYTES
-                else:
-                    raise TypeError(be_loc)
-
-                pushDataIter = push_request_iterator(compressed_record, reply.uri, dtype, schema_hash)
-                push_data_response = self.stub.PushData(pushDataIter)
-                return push_data_response
-
-            nWorkers = calc_num_threadpool_workers()
-            with concurrent.futures.ThreadPoolExecutor(max_workers=nWorkers) as executor:
-                push_futures = tuple((executor.submit(push_data_parallel, reply) for reply in replies))
-                for future in concurrent.futures.as_completed(push_futures):
-                    _ = future.result()
-                    pbar.update(1)
+            def push_data_parallel(batch):
+                # samples the server stored before a failed attempt are not sent again.
+                replies, pending, sent_digests = batch
+                if sent_digests:
+                    request = hangar_service_pb2.PushDataReceivedRequest(digests=sent_digests)
+                    received = set(self.stub.PushDataReceived(request).digests)
+                    pending[:] = [reply for reply in pending if reply.digest not in received]
+                    sent_digests.clear()
+
+                def records_iterator(replies):
+                    for reply in replies:
+                        be_loc = specs[reply.digest]
+                        data = self._rFs[be_loc.backend].read_data(be_loc)
+                        sent_digests.append(reply.digest)
+                        yield data, reply.uri
+
+                codec = select_codec(self.cfg['push_codec'], self.push_meter, self.cfg['codecs'])
+                with self.push_meter.timer() as timer:
+                    frames = chunks.pack_record_frames(
+                        records_iterator(pending), self.cfg['push_frame_nbytes'], codec)
+                    frames = scheduler.count_frames(timer.count_frames(frames))
+                    pushDataIter = chunks.dataFrameChunkedIterator(
+                        frames, hangar_service_pb2.PushDataBatchRequest,
+                        max_message_nbytes=self.cfg['max_message_nbytes'], schema_hash=schema_hash)
+                    self.stub.PushDataBatch(pushDataIter)
+                return len(replies)
+
+            # spread small requests across all workers, large ones in capped batches,
+            # sending the largest samples first.
+            replies = list(replies)
+            nWorkers = scheduler.max_concurrency
+            batch_size = max(1, min(self.cfg['push_batch_size'], math.ceil(len(replies) / nWorkers)))
+            batches = largest_first_batches(
+                replies, [sample_size_hint(specs[reply.digest]) for reply in replies],
+                lambda reply: reply.digest, batch_size)
+            batches = [(batch, list(batch), []) for batch in batches]
+            for num_pushed in scheduler.run(batches, push_data_parallel, size=lambda b: len(b[0])):
+                scheduler.stats.record_samples(num_pushed)
+                if pbar is not None:
+                    pbar.update(num_pushed)
 
         except grpc.RpcError as rpc_error:
             logger.error(rpc_error)
@@ -567,14 +737,93 @@ class HangarClient(object):
         reply = self.stub.PushFindMissingCommits(request)
         return reply
 
-    def fetch_find_missing_hash_records(self, commit):
+    def _reconcile_hash_records(self, stub_method, commit: str,
+                                digests: reconcile.FingerprintedDigests,
+                                filter_json: str = '') -> Optional[bytes]:
+        """Exchange tables of increasing size until the difference to a server commit decodes.
 
+        Parameters
+        ----------
+        stub_method
+            reconciliation rpc to call.
+        commit
+            commit on the server whose data hash records are compared against.
+        digests
+            data hash digests summarized on the client side.
+        filter_json
+            serialized partial clone filter selecting the server records which
+            are compared against (empty for all).
+
+        Returns
+        -------
+        Optional[bytes]
+            decompressed reply of the server once the difference was decoded. None
+            if the server does not have the commit, or if the difference is so
+            large that sending every digest is cheaper.
+        """
+        full_nbytes = sum(len(digest) + 8 for digest in digests.digests)
+        num_cells = reconcile.table_num_cells(0)
+        while (num_cells * reconcile.CELL_NBYTES) < (full_nbytes // 2):
+            table = digests.table(num_cells).to_bytes()
+            cIter = chunks.dataFrameChunkedIterator(
+                [(table, len(digests))], hangar_service_pb2.ReconcileHashRecordsRequest,
+                commit=commit, num_cells=num_cells, filter=filter_json)
+            try:
+                reply, raw = chunks.reassemble_single_frame(stub_method(cIter))
+            except grpc.RpcError as rpc_error:
+                if rpc_error.code() == grpc.StatusCode.NOT_FOUND:
+                    return None
+                raise rpc_error
+            if reply.decoded:
+                return blosc.decompress(raw)
+            # difference is at least as large as the difference in number of records.
+            num_diff = max(2 * num_cells / reconcile.CELLS_PER_DIFF,
+                           abs(len(digests) - reply.num_records))
+            num_cells = reconcile.table_num_cells(int(num_diff))
+        return None
+
+    def _commit_data_digests(self, commit: str,
+                             partial_filter: Optional[partial.PartialCloneFilter] = None
+                             ) -> List[str]:
+        with tempfile.TemporaryDirectory() as tempD:
+            tmpDF = os.path.join(tempD, 'test.lmdb')
+            tmpDB = lmdb.open(path=tmpDF, **c.LMDB_SETTINGS)
+            commiting.unpack_commit_ref(self.env.refenv, tmpDB, commit)
+            recQuery = queries.RecordQuery(tmpDB)
+            c_hashes = list(partial.select_data_hash_to_schema_hash(recQuery, partial_filter))
+            tmpDB.close()
+        return c_hashes
+
+    def _local_hash_record_pack(self) -> bytes:
         all_hashs = hashs.HashQuery(self.env.hashenv).list_all_hash_keys_raw()
         all_hashs_raw = [chunks.serialize_ident(digest, '') for digest in all_hashs]
-        raw_pack = chunks.serialize_record_pack(all_hashs_raw)
+        return chunks.serialize_record_pack(all_hashs_raw)
+
+    def _filter_local_hash_records(self, idents: Iterable[chunks.DataIdent]) -> List[chunks.DataIdent]:
+        keyIdents = {hash_data_db_key_from_raw_key(ident.digest): ident for ident in idents}
+        existing = hashs.HashQuery(self.env.hashenv).intersect_keys_db(set(keyIdents))
+        return [ident for key, ident in keyIdents.items() if key not in existing]
+
+    def _fetch_reconcile_hash_records(self, commit: str, c_digests: reconcile.FingerprintedDigests,
+                                      partial_filter: Optional[partial.PartialCloneFilter] = None
+                                      ) -> Optional[List[chunks.DataIdent]]:
+        raw_pack = self._reconcile_hash_records(
+            self.stub.FetchReconcileHashRecords, commit, c_digests,
+            partial.filter_to_json(partial_filter))
+        if raw_pack is None:
+            return None
+        return [chunks.deserialize_ident(raw) for raw in chunks.deserialize_record_pack(raw_pack)]
+
+    def _fetch_full_hash_records(self, commit: str, raw_pack: bytes,
+                                 partial_filter: Optional[partial.PartialCloneFilter] = None
+                                 ) -> List[chunks.DataIdent]:
         pb2_func = hangar_service_pb2.FindMissingHashRecordsRequest
-        cIter = chunks.missingHashRequestIterator(commit, raw_pack, pb2_func)
-        responses = self.stub.FetchFindMissingHashRecords(cIter)
+        cIter = chunks.missingHashRequestIterator(
+            commit, raw_pack, pb2_func, filter=partial.filter_to_json(partial_filter))
+        return self._reassemble_hash_records(self.stub.FetchFindMissingHashRecords(cIter))
+
+    @staticmethod
+    def _reassemble_hash_records(responses) -> List[chunks.DataIdent]:
         for idx, response in enumerate(responses):
             if idx == 0:
                 hBytes, offset = bytearray(response.total_byte_size), 0
@@ -587,7 +836,124 @@ class HangarClient(object):
         idents = [chunks.deserialize_ident(raw) for raw in raw_idents]
         return idents
 
-    def push_find_missing_hash_records(self, commit, tmpDB: lmdb.Environment = None):
+    def fetch_find_missing_hash_records(self, commit, base_commit: Optional[str] = None,
+                                        partial_filter: Optional[partial.PartialCloneFilter] = None):
+        """Data hash records (and schemas) in a server commit which do not exist on the client.
+
+        If a ``base_commit`` existing on the client is provided, the records are
+        found via set reconciliation against the records in that commit, falling
+        back to sending every client hash digest if the difference is too large.
+        If a ``partial_filter`` is provided, only records of samples selected
+        by the filter are returned.
+        """
+        if base_commit:
+            c_digests = reconcile.FingerprintedDigests(
+                self._commit_data_digests(base_commit, partial_filter))
+            idents = self._fetch_reconcile_hash_records(commit, c_digests, partial_filter)
+            if idents is not None:
+                # records not in the base commit may still exist locally (ie. on another branch)
+                return self._filter_local_hash_records(idents)
+        return self._fetch_full_hash_records(
+            commit, self._local_hash_record_pack(), partial_filter)
+
+    def fetch_filtered_data(self, commit: str, partial_filter: Optional[partial.PartialCloneFilter]
+                            ) -> List[chunks.DataIdent]:
+        """Data hash records (and schemas) of the samples in a server commit selected by a filter.
+
+        Parameters
+        ----------
+        commit
+            commit on the server to select samples from.
+        partial_filter
+            partial clone filter selecting samples (None selects every sample).
+
+        Returns
+        -------
+        List[chunks.DataIdent]
+            digest and schema hash of every selected sample.
+        """
+        request = hangar_service_pb2.FindFilteredDataRequest(
+            commit=commit, filter=partial.filter_to_json(partial_filter))
+        return self._reassemble_hash_records(self.stub.FetchFindFilteredData(request))
+
+    def fetch_missing_commit_contents(self, commits: Sequence[str],
+                                      base_commit: Optional[str] = None,
+                                      pbar: tqdm = None,
+                                      partial_filter: Optional[partial.PartialCloneFilter] = None):
+        """Concurrently retrieve everything but data for commits which are missing locally.
+
+        Local records are read once up front; the per commit requests (missing
+        schemas, missing data hash records, schema specs, and commit records)
+        are then made with bounded concurrency.
+
+        Parameters
+        ----------
+        commits
+            commit digests existing on the server and not on the client.
+        base_commit
+            commit existing on the client to reconcile missing data hash records
+            against, see :meth:`fetch_find_missing_hash_records`.
+        pbar
+            progress bar updated as each commit record is received.
+        partial_filter
+            partial clone filter selecting the samples whose data hash records
+            are retrieved. Commit records are always retrieved in full.
+
+        Returns
+        -------
+        Tuple[List[Tuple[str, bytes]], Dict[str, str], List[Tuple[str, bytes, bytes, bytes]]]
+            (schema hash, schemaVal) of each schema missing locally, map of data
+            digest -> schema hash of each data record missing locally, and
+            (commit, parentVal, specVal, refVal) of each commit in order.
+        """
+        c_schemas = list(set(hashs.HashQuery(self.env.hashenv).list_all_schema_digests()))
+        c_digests = None
+        if base_commit:
+            c_digests = reconcile.FingerprintedDigests(
+                self._commit_data_digests(base_commit, partial_filter))
+
+        def find_missing(commit):
+            m_schemas = self._fetch_find_missing_schemas(commit, c_schemas).schema_digests
+            idents = None
+            if c_digests is not None:
+                idents = self._fetch_reconcile_hash_records(commit, c_digests, partial_filter)
+            return commit, list(m_schemas), idents
+
+        m_schemas, m_hashes, fallback = set(), {}, []
+        nWorkers = calc_num_threadpool_workers()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=nWorkers) as executor:
+            for commit, schemas, idents in executor.map(find_missing, commits):
+                m_schemas.update(schemas)
+                if idents is None:
+                    fallback.append(commit)
+                else:
+                    m_hashes.update(idents)
+            if fallback:
+                raw_pack = self._local_hash_record_pack()
+                for idents in executor.map(
+                        lambda cmt: self._fetch_full_hash_records(cmt, raw_pack, partial_filter),
+                        fallback):
+                    m_hashes.update(idents)
+
+            schemaRecs = list(executor.map(self.fetch_schema, sorted(m_schemas)))
+            commitRecs = []
+            for commitRec in executor.map(self.fetch_commit_record, commits):
+                commitRecs.append(commitRec)
+                if pbar is not None:
+                    pbar.update(1)
+
+        m_hashes = dict(self._filter_local_hash_records(
+            chunks.DataIdent(digest, schema) for digest, schema in m_hashes.items()))
+        return schemaRecs, m_hashes, commitRecs
+
+    def push_find_missing_hash_records(self, commit, tmpDB: lmdb.Environment = None,
+                                       base_commit: Optional[str] = None):
+        """Data hash records (and schemas) in a client commit which do not exist on the server.
+
+        If a ``base_commit`` existing on the server is provided, candidate records
+        are found via set reconciliation against the records in that commit, and
+        only those candidates are checked against every record on the server.
+        """
 
         if tmpDB is None:
             with tempfile.TemporaryDirectory() as tempD:
@@ -601,6 +967,16 @@ class HangarClient(object):
             c_hashs_schemas = queries.RecordQuery(tmpDB).data_hash_to_schema_hash()
             c_hashes = list(set(c_hashs_schemas.keys()))
 
+        if base_commit:
+            c_digests = reconcile.FingerprintedDigests(c_hashes)
+            raw_fps = self._reconcile_hash_records(
+                self.stub.PushReconcileHashRecords, base_commit, c_digests)
+            if raw_fps is not None:
+                c_only = np.frombuffer(raw_fps, dtype=np.uint64).reshape(-1, 2)
+                c_hashes = c_digests.lookup(c_only)
+                if len(c_hashes) == 0:
+                    return []
+
         c_hashs_raw = [chunks.serialize_ident(digest, '') for digest in c_hashes]
         raw_pack = chunks.serialize_record_pack(c_hashs_raw)
         pb2_func = hangar_service_pb2.FindMissingHashRecordsRequest
@@ -623,7 +999,9 @@ class HangarClient(object):
     def fetch_find_missing_schemas(self, commit):
         c_schemaset = set(hashs.HashQuery(self.env.hashenv).list_all_schema_digests())
         c_schemas = list(c_schemaset)
+        return self._fetch_find_missing_schemas(commit, c_schemas)
 
+    def _fetch_find_missing_schemas(self, commit, c_schemas: List[str]):
         request = hangar_service_pb2.FindMissingSchemasRequest()
         request.commit = commit
         request.schema_digests.extend(c_schemas)
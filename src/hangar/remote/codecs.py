@@ -0,0 +1,229 @@
+"""Wire compression codecs negotiated between clients and the server.
+
+Every frame of sample data is compressed with blosc. The blosc header records
+which compressor, level, shuffle filter, and typesize produced a frame, so a
+receiver decompresses any frame without being told the codec; only the sender
+needs to choose one. A codec is named ``'<cname>:<clevel>:<shuffle>'``, where
+``cname`` is a blosc compressor (or ``'none'``, which only copies data into a
+blosc container), and ``shuffle`` is one of ``noshuffle``, ``shuffle``, or
+``bitshuffle``. Shuffle filters are applied with the item size of the arrays
+packed in a frame.
+
+When a codec is not pinned by configuration, the sender picks one based on the
+throughput measured for previous transfers over the same connection
+(:class:`ThroughputMeter`): on fast links compression costs more time than it
+saves, while slow links benefit from stronger compression. Throughput is
+measured in uncompressed bytes, so a stronger codec (which shrinks the bytes
+on the wire) does not look like a slower link and push the choice toward even
+stronger compression.
+"""
+import time
+from threading import Lock
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
+
+import blosc
+
+from ..utils import set_blosc_nthreads
+
+set_blosc_nthreads()
+
+AUTO_CODEC = 'auto'
+DEFAULT_CODEC = 'blosclz:3:noshuffle'
+
+SUPPORTED_COMPRESSORS = ('none', *blosc.compressor_list())
+
+_SHUFFLE_FILTERS = {
+    'noshuffle': blosc.NOSHUFFLE,
+    'shuffle': blosc.SHUFFLE,
+    'bitshuffle': blosc.BITSHUFFLE,
+}
+
+# (minimum measured bytes / second, codec) in order of decreasing throughput.
+CODEC_LADDER: Tuple[Tuple[float, str], ...] = (
+    (400e6, 'none:0:noshuffle'),
+    (100e6, 'lz4:1:shuffle'),
+    (25e6, 'zstd:1:shuffle'),
+    (0.0, 'zstd:5:bitshuffle'),
+)
+
+
+class WireCodec(NamedTuple):
+    cname: str
+    clevel: int
+    shuffle: str
+
+    @property
+    def name(self) -> str:
+        return f'{self.cname}:{self.clevel}:{self.shuffle}'
+
+
+def parse_codec(name: str) -> WireCodec:
+    """Parse and validate the name of a codec.
+
+    Parameters
+    ----------
+    name
+        codec name formatted as ``'<cname>:<clevel>:<shuffle>'``.
+
+    Returns
+    -------
+    WireCodec
+        parsed codec.
+
+    Raises
+    ------
+    ValueError
+        if the name is not formatted correctly, or names an unsupported
+        compressor, level, or shuffle filter.
+    """
+    try:
+        cname, clevel, shuffle = name.split(':')
+        clevel = int(clevel)
+    except ValueError:
+        raise ValueError(f'codec: {name} must be formatted as `<cname>:<clevel>:<shuffle>`')
+    if cname not in SUPPORTED_COMPRESSORS:
+        raise ValueError(f'codec: {name} compressor not in {SUPPORTED_COMPRESSORS}')
+    if shuffle not in _SHUFFLE_FILTERS:
+        raise ValueError(f'codec: {name} shuffle not in {tuple(_SHUFFLE_FILTERS)}')
+    if not (0 <= clevel <= 9):
+        raise ValueError(f'codec: {name} clevel must be in range [0, 9]')
+    if cname == 'none':
+        clevel = 0
+    return WireCodec(cname, clevel, shuffle)
+
+
+def compress(raw: bytes, codec: WireCodec, typesize: int = 1) -> bytes:
+    """Compress a frame with a codec.
+
+    Parameters
+    ----------
+    raw
+        serialized frame.
+    codec
+        codec to compress with.
+    typesize
+        item size of the data in ``raw`` the shuffle filter operates on.
+
+    Returns
+    -------
+    bytes
+        blosc compressed frame.
+    """
+    if codec.cname == 'none':
+        return blosc.compress(raw, typesize=1, clevel=0, shuffle=blosc.NOSHUFFLE)
+    return blosc.compress(
+        raw,
+        typesize=max(1, min(typesize, blosc.MAX_TYPESIZE)),
+        clevel=codec.clevel,
+        cname=codec.cname,
+        shuffle=_SHUFFLE_FILTERS[codec.shuffle])
+
+
+def codec_for_throughput(nbytes_per_sec: Optional[float],
+                         supported: Iterable[str] = SUPPORTED_COMPRESSORS) -> str:
+    """Select the codec best suited to the measured link throughput.
+
+    Parameters
+    ----------
+    nbytes_per_sec
+        measured throughput of the link. If None (nothing was measured yet),
+        the default codec is used.
+    supported
+        compressors supported by the receiving side.
+
+    Returns
+    -------
+    str
+        name of the selected codec.
+    """
+    if nbytes_per_sec is None:
+        return DEFAULT_CODEC
+    supported = set(supported)
+    for min_nbytes_per_sec, name in CODEC_LADDER:
+        if (nbytes_per_sec >= min_nbytes_per_sec) and (name.split(':')[0] in supported):
+            return name
+    return DEFAULT_CODEC
+
+
+def select_codec(pinned: str, meter: 'ThroughputMeter',
+                 supported: Iterable[str] = SUPPORTED_COMPRESSORS) -> str:
+    """Codec pinned by configuration, or the best one for the measured throughput.
+    """
+    if pinned != AUTO_CODEC:
+        return parse_codec(pinned).name
+    return codec_for_throughput(meter.nbytes_per_sec, supported)
+
+
+def uncompressed_nbytes(frame: bytes) -> int:
+    """Size of the data in a blosc compressed frame, read from its header.
+
+    Unlike ``blosc.get_cbuffer_sizes`` this accepts the (mutable) bytearrays
+    frames are reassembled into.
+    """
+    return int.from_bytes(frame[4:8], 'little')
+
+
+class ThroughputMeter(object):
+    """Thread safe moving average of the throughput of completed transfers.
+
+    Parameters
+    ----------
+    smoothing
+        weight of the newest measurement in the moving average.
+    """
+
+    def __init__(self, smoothing: float = 0.3):
+        self.smoothing = smoothing
+        self._lock = Lock()
+        self._nbytes_per_sec: Optional[float] = None
+
+    @property
+    def nbytes_per_sec(self) -> Optional[float]:
+        return self._nbytes_per_sec
+
+    def record(self, nbytes: int, seconds: float):
+        """Add a measurement of ``nbytes`` transferred in ``seconds``.
+        """
+        if seconds <= 0:
+            return
+        rate = nbytes / seconds
+        with self._lock:
+            if self._nbytes_per_sec is None:
+                self._nbytes_per_sec = rate
+            else:
+                self._nbytes_per_sec += self.smoothing * (rate - self._nbytes_per_sec)
+
+    def timer(self) -> '_TransferTimer':
+        """Context manager timing a transfer; set ``nbytes`` on it before exit.
+        """
+        return _TransferTimer(self)
+
+
+class _TransferTimer(object):
+
+    __slots__ = ('_meter', '_start', 'nbytes')
+
+    def __init__(self, meter: ThroughputMeter):
+        self._meter = meter
+        self._start = None
+        self.nbytes = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def add_frame(self, frame: bytes):
+        """Count the uncompressed size of a frame transferred while timing.
+        """
+        self.nbytes += uncompressed_nbytes(frame)
+
+    def count_frames(self, frames: Iterable[Tuple[bytes, int]]) -> Iterator[Tuple[bytes, int]]:
+        """Pass (frame, num_records) pairs through, adding up the size of each frame.
+        """
+        for frame, num_records in frames:
+            self.add_frame(frame)
+            yield frame, num_records
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self._meter.record(self.nbytes, time.perf_counter() - self._start)
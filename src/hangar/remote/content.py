@@ -1,7 +1,9 @@
-from typing import NamedTuple, Union, Optional
+from typing import Iterable, List, NamedTuple, Union, Optional, Tuple
 
 import numpy as np
 
+from ..backends.hdf5_01 import HDF5_01_RawChunks
+from ..backends.remote_50 import remote_50_encode
 from ..columns.constructors import open_file_handles, column_type_object_from_schema
 from ..context import Environments
 from ..records import (
@@ -10,7 +12,7 @@ from ..records import (
     hash_schema_db_key_from_raw_key,
     hash_data_db_key_from_raw_key
 )
-from ..txnctx import TxnRegister
+from ..txnctx import TxnRegister, putmulti_sorted
 
 
 class ContentWriter(object):
@@ -97,6 +99,15 @@ class ContentWriter(object):
 
 
 class DataWriter:
+    """Write data pieces received from (or sent to) a remote into the hash db.
+
+    Hash records of written samples are buffered and flushed in sorted order
+    (see :func:`~hangar.txnctx.putmulti_sorted`) every ``flush_every``
+    records and when the context manager exits, rather than being placed in
+    the hash db txn one at a time.
+    """
+
+    flush_every: int = 10_000
 
     def __init__(self, envs):
 
@@ -105,6 +116,7 @@ class DataWriter:
 
         self._schema_hash_be_accessors = {}
         self._schema_hash_objects = {}
+        self._pending_records = {}
         self._is_cm = False
 
     def __enter__(self):
@@ -115,7 +127,10 @@ class DataWriter:
     def __exit__(self, *exc):
         for be in self._schema_hash_be_accessors.values():
             be.close()
-        self.txnctx.commit_writer_txn(self.env.hashenv)
+        try:
+            self._flush_records()
+        finally:
+            self.txnctx.commit_writer_txn(self.env.hashenv)
         self._schema_hash_be_accessors.clear()
         self._schema_hash_objects.clear()
         self._is_cm = False
@@ -125,6 +140,36 @@ class DataWriter:
     def is_cm(self):
         return self._is_cm
 
+    def received(self, digests: Iterable[str]) -> List[str]:
+        """Digests which have a hash record written by this writer (or before it).
+
+        Parameters
+        ----------
+        digests
+            data digests to look up.
+
+        Returns
+        -------
+        List[str]
+            the ``digests`` written (or not yet flushed) in the open context.
+        """
+        found = []
+        for digest in digests:
+            hashKey = hash_data_db_key_from_raw_key(digest)
+            if (hashKey in self._pending_records) or self.hashTxn.get(hashKey, default=False):
+                found.append(digest)
+        return found
+
+    def _put_record(self, hashKey: bytes, hashVal: bytes):
+        self._pending_records[hashKey] = hashVal
+        if len(self._pending_records) >= self.flush_every:
+            self._flush_records()
+
+    def _flush_records(self):
+        if self._pending_records:
+            putmulti_sorted(self.hashTxn, self._pending_records.items())
+            self._pending_records.clear()
+
     def _open_new_backend(self, schema):
         be_accessor = open_file_handles(backends=[schema.backend],
                                         path=self.env.repo_path,
@@ -199,9 +244,72 @@ class DataWriter:
         be_accessor = self._schema_hash_be_accessors[final_schema_hash]
         hashVal = be_accessor.write_data(data, remote_operation=True)
         hashKey = hash_data_db_key_from_raw_key(data_digest)
-        self.hashTxn.put(hashKey, hashVal)
+        self._put_record(hashKey, hashVal)
         return data_digest
 
+    def raw_chunks(self,
+                   schema_hash: str,
+                   data_digest: str,
+                   raw: HDF5_01_RawChunks) -> Optional[str]:
+        """Write the compressed chunks of an ``HDF5_01`` sample without decoding them.
+
+        Parameters
+        ----------
+        schema_hash
+            schema_hash currently being written
+        data_digest
+            digest to write. The data is not hashed, it must be verified by
+            the caller before this method is called (its hash record is
+            committed with the rest of the records written by this writer).
+        raw
+            compressed chunks of the sample read from a remote repository.
+
+        Returns
+        -------
+        Optional[str]
+            data digest written by this method, or None if the schema does not
+            store data in the ``HDF5_01`` backend, or the chunks are not
+            compatible with the files it writes (in which case nothing is
+            written and the data must be decoded and written with
+            :meth:`data`).
+        """
+        if schema_hash not in self._schema_hash_objects:
+            self._get_schema_object(schema_hash)
+        schema = self._schema_hash_objects[schema_hash]
+        if schema.backend != '01':
+            return None
+        if schema_hash not in self._schema_hash_be_accessors:
+            self._open_new_backend(schema)
+
+        be_accessor = self._schema_hash_be_accessors[schema_hash]
+        hashVal = be_accessor.write_raw_chunks(raw, remote_operation=True)
+        if hashVal is None:
+            return None
+        hashKey = hash_data_db_key_from_raw_key(data_digest)
+        self._put_record(hashKey, hashVal)
+        return data_digest
+
+    def remote_references(self, digests_schemas: Iterable[Tuple[str, str]]) -> int:
+        """Bulk write ``REMOTE_50`` records for data which exists on a remote server.
+
+        Records are sorted and appended with a single cursor operation. Any data
+        digest which already has a record is left untouched.
+
+        Parameters
+        ----------
+        digests_schemas
+            two-tuples of (data digest, schema hash) for each remote data piece.
+
+        Returns
+        -------
+        int
+            number of records written.
+        """
+        self._flush_records()
+        items = [(hash_data_db_key_from_raw_key(digest), remote_50_encode(schema_hash))
+                 for digest, schema_hash in digests_schemas]
+        return putmulti_sorted(self.hashTxn, items, overwrite=False)
+
 
 RawCommitContent = NamedTuple('RawCommitContent', [('commit', str),
                                                    ('cmtParentVal', bytes),
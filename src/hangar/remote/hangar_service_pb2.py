@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='hangar',
   syntax='proto3',
   serialized_options=b'H\001',
-  serialized_pb=b'\n\x14hangar_service.proto\x12\x06hangar\".\n\x17PushBeginContextRequest\x12\x13\n\x0b\x63lient_uuid\x18\x01 \x01(\t\"8\n\x15PushBeginContextReply\x12\x1f\n\x03\x65rr\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\",\n\x15PushEndContextRequest\x12\x13\n\x0b\x63lient_uuid\x18\x01 \x01(\t\"6\n\x13PushEndContextReply\x12\x1f\n\x03\x65rr\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"+\n\nErrorProto\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x03\x12\x0f\n\x07message\x18\x02 \x01(\t\",\n\x0c\x42ranchRecord\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ommit\x18\x02 \x01(\t\"*\n\nHashRecord\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0e\n\x06\x64igest\x18\x02 \x01(\t\"9\n\x0c\x43ommitRecord\x12\x0e\n\x06parent\x18\x01 \x01(\x0c\x12\x0b\n\x03ref\x18\x02 \x01(\x0c\x12\x0c\n\x04spec\x18\x03 \x01(\x0c\",\n\x0cSchemaRecord\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\x12\x0c\n\x04\x62lob\x18\x02 \x01(\x0c\"#\n\x11\x44\x61taOriginRequest\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\"\x90\x02\n\x0f\x44\x61taOriginReply\x12&\n\x08location\x18\x01 \x01(\x0e\x32\x14.hangar.DataLocation\x12#\n\tdata_type\x18\x02 \x01(\x0e\x32\x10.hangar.DataType\x12\x0e\n\x06\x64igest\x18\x03 \x01(\t\x12\x0b\n\x03uri\x18\x04 \x01(\t\x12\x13\n\x0b\x63ompression\x18\x05 \x01(\x08\x12\x46\n\x10\x63ompression_opts\x18\x06 \x03(\x0b\x32,.hangar.DataOriginReply.CompressionOptsEntry\x1a\x36\n\x14\x43ompressionOptsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"p\n\x19PushFindDataOriginRequest\x12#\n\tdata_type\x18\x01 \x01(\x0e\x32\x10.hangar.DataType\x12\x0e\n\x06\x64igest\x18\x02 \x01(\t\x12\x1e\n\x16\x63ompression_is_desired\x18\x03 \x01(\x08\"\x9d\x02\n\x17PushFindDataOriginReply\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\x12&\n\x08location\x18\x02 \x01(\x0e\x32\x14.hangar.DataLocation\x12\x0b\n\x03uri\x18\x03 \x01(\t\x12\x1c\n\x14\x63ompression_expected\x18\x05 \x01(\x08\x12_\n\x19\x63ompression_opts_expected\x18\x06 \x03(\x0b\x32<.hangar.PushFindDataOriginReply.CompressionOptsExpectedEntry\x1a>\n\x1c\x43ompressionOptsExpectedEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\r\n\x0bPingRequest\"\x1b\n\tPingReply\x12\x0e\n\x06result\x18\x01 \x01(\t\"\x18\n\x16GetClientConfigRequest\"\xa2\x01\n\x14GetClientConfigReply\x12\x38\n\x06\x63onfig\x18\x01 \x03(\x0b\x32(.hangar.GetClientConfigReply.ConfigEntry\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.hangar.ErrorProto\x1a-\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"=\n\x18\x46\x65tchBranchRecordRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.BranchRecord\"^\n\x16\x46\x65tchBranchRecordReply\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.BranchRecord\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.hangar.ErrorProto\"\x1f\n\x10\x46\x65tchDataRequest\x12\x0b\n\x03uri\x18\x01 \x01(\t\"b\n\x0e\x46\x65tchDataReply\x12\x0b\n\x03uri\x18\x01 \x01(\t\x12\x10\n\x08raw_data\x18\x02 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x03 \x01(\x03\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.hangar.ErrorProto\"$\n\x12\x46\x65tchCommitRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\"\x84\x01\n\x10\x46\x65tchCommitReply\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x17\n\x0ftotal_byte_size\x18\x02 \x01(\x03\x12$\n\x06record\x18\x03 \x01(\x0b\x32\x14.hangar.CommitRecord\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.hangar.ErrorProto\"7\n\x12\x46\x65tchSchemaRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.SchemaRecord\"X\n\x10\x46\x65tchSchemaReply\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.SchemaRecord\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.hangar.ErrorProto\"<\n\x17PushBranchRecordRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.BranchRecord\":\n\x15PushBranchRecordReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"z\n\x0fPushDataRequest\x12\x0b\n\x03uri\x18\x01 \x01(\t\x12\x10\n\x08raw_data\x18\x02 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x03 \x01(\x03\x12#\n\tdata_type\x18\x04 \x01(\x0e\x32\x10.hangar.DataType\x12\x13\n\x0bschema_hash\x18\x05 \x01(\t\"2\n\rPushDataReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"b\n\x11PushCommitRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x17\n\x0ftotal_byte_size\x18\x02 \x01(\x03\x12$\n\x06record\x18\x03 \x01(\x0b\x32\x14.hangar.CommitRecord\"4\n\x0fPushCommitReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"6\n\x11PushSchemaRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.SchemaRecord\"4\n\x0fPushSchemaReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"R\n\x19\x46indMissingCommitsRequest\x12\x0f\n\x07\x63ommits\x18\x01 \x03(\t\x12$\n\x06\x62ranch\x18\x02 \x01(\x0b\x32\x14.hangar.BranchRecord\"s\n\x17\x46indMissingCommitsReply\x12\x0f\n\x07\x63ommits\x18\x01 \x03(\t\x12$\n\x06\x62ranch\x18\x02 \x01(\x0b\x32\x14.hangar.BranchRecord\x12!\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x12.hangar.ErrorProto\"W\n\x1d\x46indMissingHashRecordsRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\r\n\x05hashs\x18\x02 \x01(\x0c\x12\x17\n\x0ftotal_byte_size\x18\x03 \x01(\x03\"x\n\x1b\x46indMissingHashRecordsReply\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\r\n\x05hashs\x18\x02 \x01(\x0c\x12\x17\n\x0ftotal_byte_size\x18\x03 \x01(\x03\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.hangar.ErrorProto\"C\n\x19\x46indMissingSchemasRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x16\n\x0eschema_digests\x18\x02 \x03(\t\"d\n\x17\x46indMissingSchemasReply\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x16\n\x0eschema_digests\x18\x02 \x03(\t\x12!\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x12.hangar.ErrorProto*F\n\x0c\x44\x61taLocation\x12\x11\n\rREMOTE_SERVER\x10\x00\x12\t\n\x05MINIO\x10\x01\x12\x06\n\x02S3\x10\x02\x12\x07\n\x03GCS\x10\x03\x12\x07\n\x03\x41\x42S\x10\x04*8\n\x08\x44\x61taType\x12\x0c\n\x08NP_ARRAY\x10\x00\x12\n\n\x06SCHEMA\x10\x01\x12\x07\n\x03STR\x10\x02\x12\t\n\x05\x42YTES\x10\x03\x32\x9a\r\n\rHangarService\x12\x30\n\x04PING\x12\x13.hangar.PingRequest\x1a\x11.hangar.PingReply\"\x00\x12Q\n\x0fGetClientConfig\x12\x1e.hangar.GetClientConfigRequest\x1a\x1c.hangar.GetClientConfigReply\"\x00\x12W\n\x11\x46\x65tchBranchRecord\x12 .hangar.FetchBranchRecordRequest\x1a\x1e.hangar.FetchBranchRecordReply\"\x00\x12\x41\n\tFetchData\x12\x18.hangar.FetchDataRequest\x1a\x16.hangar.FetchDataReply\"\x00\x30\x01\x12G\n\x0b\x46\x65tchCommit\x12\x1a.hangar.FetchCommitRequest\x1a\x18.hangar.FetchCommitReply\"\x00\x30\x01\x12\x45\n\x0b\x46\x65tchSchema\x12\x1a.hangar.FetchSchemaRequest\x1a\x18.hangar.FetchSchemaReply\"\x00\x12T\n\x10PushBranchRecord\x12\x1f.hangar.PushBranchRecordRequest\x1a\x1d.hangar.PushBranchRecordReply\"\x00\x12>\n\x08PushData\x12\x17.hangar.PushDataRequest\x1a\x15.hangar.PushDataReply\"\x00(\x01\x12\x44\n\nPushCommit\x12\x19.hangar.PushCommitRequest\x1a\x17.hangar.PushCommitReply\"\x00(\x01\x12\x42\n\nPushSchema\x12\x19.hangar.PushSchemaRequest\x1a\x17.hangar.PushSchemaReply\"\x00\x12_\n\x17\x46\x65tchFindMissingCommits\x12!.hangar.FindMissingCommitsRequest\x1a\x1f.hangar.FindMissingCommitsReply\"\x00\x12o\n\x1b\x46\x65tchFindMissingHashRecords\x12%.hangar.FindMissingHashRecordsRequest\x1a#.hangar.FindMissingHashRecordsReply\"\x00(\x01\x30\x01\x12_\n\x17\x46\x65tchFindMissingSchemas\x12!.hangar.FindMissingSchemasRequest\x1a\x1f.hangar.FindMissingSchemasReply\"\x00\x12^\n\x16PushFindMissingCommits\x12!.hangar.FindMissingCommitsRequest\x1a\x1f.hangar.FindMissingCommitsReply\"\x00\x12n\n\x1aPushFindMissingHashRecords\x12%.hangar.FindMissingHashRecordsRequest\x1a#.hangar.FindMissingHashRecordsReply\"\x00(\x01\x30\x01\x12^\n\x16PushFindMissingSchemas\x12!.hangar.FindMissingSchemasRequest\x1a\x1f.hangar.FindMissingSchemasReply\"\x00\x12O\n\x13\x46\x65tchFindDataOrigin\x12\x19.hangar.DataOriginRequest\x1a\x17.hangar.DataOriginReply\"\x00(\x01\x30\x01\x12^\n\x12PushFindDataOrigin\x12!.hangar.PushFindDataOriginRequest\x1a\x1f.hangar.PushFindDataOriginReply\"\x00(\x01\x30\x01\x12T\n\x10PushBeginContext\x12\x1f.hangar.PushBeginContextRequest\x1a\x1d.hangar.PushBeginContextReply\"\x00\x12N\n\x0ePushEndContext\x12\x1d.hangar.PushEndContextRequest\x1a\x1b.hangar.PushEndContextReply\"\x00\x42\x02H\x01\x62\x06proto3'
+  serialized_pb=b'\n\x14hangar_service.proto\x12\x06hangar\".\n\x17PushBeginContextRequest\x12\x13\n\x0b\x63lient_uuid\x18\x01 \x01(\t\"8\n\x15PushBeginContextReply\x12\x1f\n\x03\x65rr\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\",\n\x15PushEndContextRequest\x12\x13\n\x0b\x63lient_uuid\x18\x01 \x01(\t\"6\n\x13PushEndContextReply\x12\x1f\n\x03\x65rr\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"+\n\nErrorProto\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x03\x12\x0f\n\x07message\x18\x02 \x01(\t\",\n\x0c\x42ranchRecord\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ommit\x18\x02 \x01(\t\"*\n\nHashRecord\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0e\n\x06\x64igest\x18\x02 \x01(\t\"9\n\x0c\x43ommitRecord\x12\x0e\n\x06parent\x18\x01 \x01(\x0c\x12\x0b\n\x03ref\x18\x02 \x01(\x0c\x12\x0c\n\x04spec\x18\x03 \x01(\x0c\",\n\x0cSchemaRecord\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\x12\x0c\n\x04\x62lob\x18\x02 \x01(\x0c\"#\n\x11\x44\x61taOriginRequest\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\"\xa6\x02\n\x0f\x44\x61taOriginReply\x12&\n\x08location\x18\x01 \x01(\x0e\x32\x14.hangar.DataLocation\x12#\n\tdata_type\x18\x02 \x01(\x0e\x32\x10.hangar.DataType\x12\x0e\n\x06\x64igest\x18\x03 \x01(\t\x12\x0b\n\x03uri\x18\x04 \x01(\t\x12\x13\n\x0b\x63ompression\x18\x05 \x01(\x08\x12\x46\n\x10\x63ompression_opts\x18\x06 \x03(\x0b\x32,.hangar.DataOriginReply.CompressionOptsEntry\x12\x14\n\x0cnum_elements\x18\x07 \x01(\x03\x1a\x36\n\x14\x43ompressionOptsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"p\n\x19PushFindDataOriginRequest\x12#\n\tdata_type\x18\x01 \x01(\x0e\x32\x10.hangar.DataType\x12\x0e\n\x06\x64igest\x18\x02 \x01(\t\x12\x1e\n\x16\x63ompression_is_desired\x18\x03 \x01(\x08\"\x9d\x02\n\x17PushFindDataOriginReply\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\x12&\n\x08location\x18\x02 \x01(\x0e\x32\x14.hangar.DataLocation\x12\x0b\n\x03uri\x18\x03 \x01(\t\x12\x1c\n\x14\x63ompression_expected\x18\x05 \x01(\x08\x12_\n\x19\x63ompression_opts_expected\x18\x06 \x03(\x0b\x32<.hangar.PushFindDataOriginReply.CompressionOptsExpectedEntry\x1a>\n\x1c\x43ompressionOptsExpectedEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\r\n\x0bPingRequest\"\x1b\n\tPingReply\x12\x0e\n\x06result\x18\x01 \x01(\t\"\x18\n\x16GetClientConfigRequest\"\xa2\x01\n\x14GetClientConfigReply\x12\x38\n\x06\x63onfig\x18\x01 \x03(\x0b\x32(.hangar.GetClientConfigReply.ConfigEntry\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.hangar.ErrorProto\x1a-\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x17\n\x15GetServerStatsRequest\"\x9d\x01\n\x13GetServerStatsReply\x12\x35\n\x05stats\x18\x01 \x03(\x0b\x32&.hangar.GetServerStatsReply.StatsEntry\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.hangar.ErrorProto\x1a,\n\nStatsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"=\n\x18\x46\x65tchBranchRecordRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.BranchRecord\"^\n\x16\x46\x65tchBranchRecordReply\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.BranchRecord\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.hangar.ErrorProto\"\x1f\n\x10\x46\x65tchDataRequest\x12\x0b\n\x03uri\x18\x01 \x01(\t\"b\n\x0e\x46\x65tchDataReply\x12\x0b\n\x03uri\x18\x01 \x01(\t\x12\x10\n\x08raw_data\x18\x02 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x03 \x01(\x03\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.hangar.ErrorProto\"H\n\x15\x46\x65tchDataBatchRequest\x12\x0c\n\x04uris\x18\x01 \x03(\t\x12\r\n\x05\x63odec\x18\x02 \x01(\t\x12\x12\n\nraw_chunks\x18\x03 \x01(\x08\"o\n\x13\x46\x65tchDataBatchReply\x12\x13\n\x0bnum_records\x18\x01 \x01(\x03\x12\x10\n\x08raw_data\x18\x02 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x03 \x01(\x03\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.hangar.ErrorProto\"$\n\x12\x46\x65tchCommitRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\"\x84\x01\n\x10\x46\x65tchCommitReply\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x17\n\x0ftotal_byte_size\x18\x02 \x01(\x03\x12$\n\x06record\x18\x03 \x01(\x0b\x32\x14.hangar.CommitRecord\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.hangar.ErrorProto\"7\n\x12\x46\x65tchSchemaRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.SchemaRecord\"X\n\x10\x46\x65tchSchemaReply\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.SchemaRecord\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.hangar.ErrorProto\"<\n\x17PushBranchRecordRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.BranchRecord\":\n\x15PushBranchRecordReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"z\n\x0fPushDataRequest\x12\x0b\n\x03uri\x18\x01 \x01(\t\x12\x10\n\x08raw_data\x18\x02 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x03 \x01(\x03\x12#\n\tdata_type\x18\x04 \x01(\x0e\x32\x10.hangar.DataType\x12\x13\n\x0bschema_hash\x18\x05 \x01(\t\"2\n\rPushDataReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"*\n\x17PushDataReceivedRequest\x12\x0f\n\x07\x64igests\x18\x01 \x03(\t\"K\n\x15PushDataReceivedReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\x12\x0f\n\x07\x64igests\x18\x02 \x03(\t\"b\n\x14PushDataBatchRequest\x12\x13\n\x0bschema_hash\x18\x01 \x01(\t\x12\x13\n\x0bnum_records\x18\x02 \x01(\x03\x12\x10\n\x08raw_data\x18\x03 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x04 \x01(\x03\"b\n\x11PushCommitRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x17\n\x0ftotal_byte_size\x18\x02 \x01(\x03\x12$\n\x06record\x18\x03 \x01(\x0b\x32\x14.hangar.CommitRecord\"4\n\x0fPushCommitReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"6\n\x11PushSchemaRequest\x12!\n\x03rec\x18\x01 \x01(\x0b\x32\x14.hangar.SchemaRecord\"4\n\x0fPushSchemaReply\x12!\n\x05\x65rror\x18\x01 \x01(\x0b\x32\x12.hangar.ErrorProto\"R\n\x19\x46indMissingCommitsRequest\x12\x0f\n\x07\x63ommits\x18\x01 \x03(\t\x12$\n\x06\x62ranch\x18\x02 \x01(\x0b\x32\x14.hangar.BranchRecord\"s\n\x17\x46indMissingCommitsReply\x12\x0f\n\x07\x63ommits\x18\x01 \x03(\t\x12$\n\x06\x62ranch\x18\x02 \x01(\x0b\x32\x14.hangar.BranchRecord\x12!\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x12.hangar.ErrorProto\"g\n\x1d\x46indMissingHashRecordsRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\r\n\x05hashs\x18\x02 \x01(\x0c\x12\x17\n\x0ftotal_byte_size\x18\x03 \x01(\x03\x12\x0e\n\x06\x66ilter\x18\x04 \x01(\t\"x\n\x1b\x46indMissingHashRecordsReply\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\r\n\x05hashs\x18\x02 \x01(\x0c\x12\x17\n\x0ftotal_byte_size\x18\x03 \x01(\x03\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.hangar.ErrorProto\"9\n\x17\x46indFilteredDataRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x0e\n\x06\x66ilter\x18\x02 \x01(\t\"\x87\x01\n\x1bReconcileHashRecordsRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x13\n\x0bnum_records\x18\x02 \x01(\x03\x12\x11\n\tnum_cells\x18\x03 \x01(\x03\x12\x10\n\x08raw_data\x18\x04 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x05 \x01(\x03\x12\x0e\n\x06\x66ilter\x18\x06 \x01(\t\"\x96\x01\n\x19ReconcileHashRecordsReply\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x13\n\x0bnum_records\x18\x02 \x01(\x03\x12\x0f\n\x07\x64\x65\x63oded\x18\x03 \x01(\x08\x12\x10\n\x08raw_data\x18\x04 \x01(\x0c\x12\x0e\n\x06nbytes\x18\x05 \x01(\x03\x12!\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x12.hangar.ErrorProto\"C\n\x19\x46indMissingSchemasRequest\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x16\n\x0eschema_digests\x18\x02 \x03(\t\"d\n\x17\x46indMissingSchemasReply\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\t\x12\x16\n\x0eschema_digests\x18\x02 \x03(\t\x12!\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x12.hangar.ErrorProto*F\n\x0c\x44\x61taLocation\x12\x11\n\rREMOTE_SERVER\x10\x00\x12\t\n\x05MINIO\x10\x01\x12\x06\n\x02S3\x10\x02\x12\x07\n\x03GCS\x10\x03\x12\x07\n\x03\x41\x42S\x10\x04*8\n\x08\x44\x61taType\x12\x0c\n\x08NP_ARRAY\x10\x00\x12\n\n\x06SCHEMA\x10\x01\x12\x07\n\x03STR\x10\x02\x12\t\n\x05\x42YTES\x10\x03\x32\x94\x12\n\rHangarService\x12\x30\n\x04PING\x12\x13.hangar.PingRequest\x1a\x11.hangar.PingReply\"\x00\x12Q\n\x0fGetClientConfig\x12\x1e.hangar.GetClientConfigRequest\x1a\x1c.hangar.GetClientConfigReply\"\x00\x12N\n\x0eGetServerStats\x12\x1d.hangar.GetServerStatsRequest\x1a\x1b.hangar.GetServerStatsReply\"\x00\x12W\n\x11\x46\x65tchBranchRecord\x12 .hangar.FetchBranchRecordRequest\x1a\x1e.hangar.FetchBranchRecordReply\"\x00\x12\x41\n\tFetchData\x12\x18.hangar.FetchDataRequest\x1a\x16.hangar.FetchDataReply\"\x00\x30\x01\x12P\n\x0e\x46\x65tchDataBatch\x12\x1d.hangar.FetchDataBatchRequest\x1a\x1b.hangar.FetchDataBatchReply\"\x00\x30\x01\x12G\n\x0b\x46\x65tchCommit\x12\x1a.hangar.FetchCommitRequest\x1a\x18.hangar.FetchCommitReply\"\x00\x30\x01\x12\x45\n\x0b\x46\x65tchSchema\x12\x1a.hangar.FetchSchemaRequest\x1a\x18.hangar.FetchSchemaReply\"\x00\x12T\n\x10PushBranchRecord\x12\x1f.hangar.PushBranchRecordRequest\x1a\x1d.hangar.PushBranchRecordReply\"\x00\x12>\n\x08PushData\x12\x17.hangar.PushDataRequest\x1a\x15.hangar.PushDataReply\"\x00(\x01\x12H\n\rPushDataBatch\x12\x1c.hangar.PushDataBatchRequest\x1a\x15.hangar.PushDataReply\"\x00(\x01\x12T\n\x10PushDataReceived\x12\x1f.hangar.PushDataReceivedRequest\x1a\x1d.hangar.PushDataReceivedReply\"\x00\x12\x44\n\nPushCommit\x12\x19.hangar.PushCommitRequest\x1a\x17.hangar.PushCommitReply\"\x00(\x01\x12\x42\n\nPushSchema\x12\x19.hangar.PushSchemaRequest\x1a\x17.hangar.PushSchemaReply\"\x00\x12_\n\x17\x46\x65tchFindMissingCommits\x12!.hangar.FindMissingCommitsRequest\x1a\x1f.hangar.FindMissingCommitsReply\"\x00\x12o\n\x1b\x46\x65tchFindMissingHashRecords\x12%.hangar.FindMissingHashRecordsRequest\x1a#.hangar.FindMissingHashRecordsReply\"\x00(\x01\x30\x01\x12_\n\x17\x46\x65tchFindMissingSchemas\x12!.hangar.FindMissingSchemasRequest\x1a\x1f.hangar.FindMissingSchemasReply\"\x00\x12i\n\x19\x46\x65tchReconcileHashRecords\x12#.hangar.ReconcileHashRecordsRequest\x1a!.hangar.ReconcileHashRecordsReply\"\x00(\x01\x30\x01\x12\x61\n\x15\x46\x65tchFindFilteredData\x12\x1f.hangar.FindFilteredDataRequest\x1a#.hangar.FindMissingHashRecordsReply\"\x00\x30\x01\x12^\n\x16PushFindMissingCommits\x12!.hangar.FindMissingCommitsRequest\x1a\x1f.hangar.FindMissingCommitsReply\"\x00\x12n\n\x1aPushFindMissingHashRecords\x12%.hangar.FindMissingHashRecordsRequest\x1a#.hangar.FindMissingHashRecordsReply\"\x00(\x01\x30\x01\x12^\n\x16PushFindMissingSchemas\x12!.hangar.FindMissingSchemasRequest\x1a\x1f.hangar.FindMissingSchemasReply\"\x00\x12h\n\x18PushReconcileHashRecords\x12#.hangar.ReconcileHashRecordsRequest\x1a!.hangar.ReconcileHashRecordsReply\"\x00(\x01\x30\x01\x12O\n\x13\x46\x65tchFindDataOrigin\x12\x19.hangar.DataOriginRequest\x1a\x17.hangar.DataOriginReply\"\x00(\x01\x30\x01\x12^\n\x12PushFindDataOrigin\x12!.hangar.PushFindDataOriginRequest\x1a\x1f.hangar.PushFindDataOriginReply\"\x00(\x01\x30\x01\x12T\n\x10PushBeginContext\x12\x1f.hangar.PushBeginContextRequest\x1a\x1d.hangar.PushBeginContextReply\"\x00\x12N\n\x0ePushEndContext\x12\x1d.hangar.PushEndContextRequest\x1a\x1b.hangar.PushEndContextReply\"\x00\x42\x02H\x01\x62\x06proto3'
 )
 
 _DATALOCATION = _descriptor.EnumDescriptor(
@@ -51,8 +51,8 @@ _DATALOCATION = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=3186,
-  serialized_end=3256,
+  serialized_start=4167,
+  serialized_end=4237,
 )
 _sym_db.RegisterEnumDescriptor(_DATALOCATION)
 
@@ -82,8 +82,8 @@ _DATATYPE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=3258,
-  serialized_end=3314,
+  serialized_start=4239,
+  serialized_end=4295,
 )
 _sym_db.RegisterEnumDescriptor(_DATATYPE)
 
@@ -485,8 +485,8 @@ _DATAORIGINREPLY_COMPRESSIONOPTSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=736,
-  serialized_end=790,
+  serialized_start=758,
+  serialized_end=812,
 )
 
 _DATAORIGINREPLY = _descriptor.Descriptor(
@@ -538,6 +538,13 @@ _DATAORIGINREPLY = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_elements', full_name='hangar.DataOriginReply.num_elements', index=6,
+      number=7, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -551,7 +558,7 @@ _DATAORIGINREPLY = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=518,
-  serialized_end=790,
+  serialized_end=812,
 )
 
 
@@ -595,8 +602,8 @@ _PUSHFINDDATAORIGINREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=792,
-  serialized_end=904,
+  serialized_start=814,
+  serialized_end=926,
 )
 
 
@@ -633,8 +640,8 @@ _PUSHFINDDATAORIGINREPLY_COMPRESSIONOPTSEXPECTEDENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1130,
-  serialized_end=1192,
+  serialized_start=1152,
+  serialized_end=1214,
 )
 
 _PUSHFINDDATAORIGINREPLY = _descriptor.Descriptor(
@@ -691,8 +698,8 @@ _PUSHFINDDATAORIGINREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=907,
-  serialized_end=1192,
+  serialized_start=929,
+  serialized_end=1214,
 )
 
 
@@ -715,8 +722,8 @@ _PINGREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1194,
-  serialized_end=1207,
+  serialized_start=1216,
+  serialized_end=1229,
 )
 
 
@@ -746,8 +753,8 @@ _PINGREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1209,
-  serialized_end=1236,
+  serialized_start=1231,
+  serialized_end=1258,
 )
 
 
@@ -770,8 +777,8 @@ _GETCLIENTCONFIGREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1238,
-  serialized_end=1262,
+  serialized_start=1260,
+  serialized_end=1284,
 )
 
 
@@ -808,8 +815,8 @@ _GETCLIENTCONFIGREPLY_CONFIGENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1382,
-  serialized_end=1427,
+  serialized_start=1404,
+  serialized_end=1449,
 )
 
 _GETCLIENTCONFIGREPLY = _descriptor.Descriptor(
@@ -845,8 +852,107 @@ _GETCLIENTCONFIGREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1265,
-  serialized_end=1427,
+  serialized_start=1287,
+  serialized_end=1449,
+)
+
+
+_GETSERVERSTATSREQUEST = _descriptor.Descriptor(
+  name='GetServerStatsRequest',
+  full_name='hangar.GetServerStatsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1451,
+  serialized_end=1474,
+)
+
+
+_GETSERVERSTATSREPLY_STATSENTRY = _descriptor.Descriptor(
+  name='StatsEntry',
+  full_name='hangar.GetServerStatsReply.StatsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='hangar.GetServerStatsReply.StatsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='hangar.GetServerStatsReply.StatsEntry.value', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1590,
+  serialized_end=1634,
+)
+
+_GETSERVERSTATSREPLY = _descriptor.Descriptor(
+  name='GetServerStatsReply',
+  full_name='hangar.GetServerStatsReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='stats', full_name='hangar.GetServerStatsReply.stats', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='hangar.GetServerStatsReply.error', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETSERVERSTATSREPLY_STATSENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1477,
+  serialized_end=1634,
 )
 
 
@@ -876,8 +982,8 @@ _FETCHBRANCHRECORDREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1429,
-  serialized_end=1490,
+  serialized_start=1636,
+  serialized_end=1697,
 )
 
 
@@ -914,8 +1020,8 @@ _FETCHBRANCHRECORDREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1492,
-  serialized_end=1586,
+  serialized_start=1699,
+  serialized_end=1793,
 )
 
 
@@ -945,8 +1051,8 @@ _FETCHDATAREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1588,
-  serialized_end=1619,
+  serialized_start=1795,
+  serialized_end=1826,
 )
 
 
@@ -997,8 +1103,105 @@ _FETCHDATAREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1621,
-  serialized_end=1719,
+  serialized_start=1828,
+  serialized_end=1926,
+)
+
+
+_FETCHDATABATCHREQUEST = _descriptor.Descriptor(
+  name='FetchDataBatchRequest',
+  full_name='hangar.FetchDataBatchRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='uris', full_name='hangar.FetchDataBatchRequest.uris', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='codec', full_name='hangar.FetchDataBatchRequest.codec', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_chunks', full_name='hangar.FetchDataBatchRequest.raw_chunks', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1928,
+  serialized_end=2000,
+)
+
+
+_FETCHDATABATCHREPLY = _descriptor.Descriptor(
+  name='FetchDataBatchReply',
+  full_name='hangar.FetchDataBatchReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='num_records', full_name='hangar.FetchDataBatchReply.num_records', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_data', full_name='hangar.FetchDataBatchReply.raw_data', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nbytes', full_name='hangar.FetchDataBatchReply.nbytes', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='hangar.FetchDataBatchReply.error', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2002,
+  serialized_end=2113,
 )
 
 
@@ -1028,8 +1231,8 @@ _FETCHCOMMITREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1721,
-  serialized_end=1757,
+  serialized_start=2115,
+  serialized_end=2151,
 )
 
 
@@ -1080,8 +1283,8 @@ _FETCHCOMMITREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1760,
-  serialized_end=1892,
+  serialized_start=2154,
+  serialized_end=2286,
 )
 
 
@@ -1111,8 +1314,8 @@ _FETCHSCHEMAREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1894,
-  serialized_end=1949,
+  serialized_start=2288,
+  serialized_end=2343,
 )
 
 
@@ -1149,8 +1352,8 @@ _FETCHSCHEMAREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1951,
-  serialized_end=2039,
+  serialized_start=2345,
+  serialized_end=2433,
 )
 
 
@@ -1180,8 +1383,8 @@ _PUSHBRANCHRECORDREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2041,
-  serialized_end=2101,
+  serialized_start=2435,
+  serialized_end=2495,
 )
 
 
@@ -1211,8 +1414,8 @@ _PUSHBRANCHRECORDREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2103,
-  serialized_end=2161,
+  serialized_start=2497,
+  serialized_end=2555,
 )
 
 
@@ -1270,8 +1473,8 @@ _PUSHDATAREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2163,
-  serialized_end=2285,
+  serialized_start=2557,
+  serialized_end=2679,
 )
 
 
@@ -1301,8 +1504,129 @@ _PUSHDATAREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2287,
-  serialized_end=2337,
+  serialized_start=2681,
+  serialized_end=2731,
+)
+
+
+_PUSHDATARECEIVEDREQUEST = _descriptor.Descriptor(
+  name='PushDataReceivedRequest',
+  full_name='hangar.PushDataReceivedRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='digests', full_name='hangar.PushDataReceivedRequest.digests', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2733,
+  serialized_end=2775,
+)
+
+
+_PUSHDATARECEIVEDREPLY = _descriptor.Descriptor(
+  name='PushDataReceivedReply',
+  full_name='hangar.PushDataReceivedReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='error', full_name='hangar.PushDataReceivedReply.error', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='digests', full_name='hangar.PushDataReceivedReply.digests', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2777,
+  serialized_end=2852,
+)
+
+
+_PUSHDATABATCHREQUEST = _descriptor.Descriptor(
+  name='PushDataBatchRequest',
+  full_name='hangar.PushDataBatchRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='schema_hash', full_name='hangar.PushDataBatchRequest.schema_hash', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_records', full_name='hangar.PushDataBatchRequest.num_records', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_data', full_name='hangar.PushDataBatchRequest.raw_data', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nbytes', full_name='hangar.PushDataBatchRequest.nbytes', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2854,
+  serialized_end=2952,
 )
 
 
@@ -1346,8 +1670,8 @@ _PUSHCOMMITREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2339,
-  serialized_end=2437,
+  serialized_start=2954,
+  serialized_end=3052,
 )
 
 
@@ -1377,8 +1701,8 @@ _PUSHCOMMITREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2439,
-  serialized_end=2491,
+  serialized_start=3054,
+  serialized_end=3106,
 )
 
 
@@ -1408,8 +1732,8 @@ _PUSHSCHEMAREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2493,
-  serialized_end=2547,
+  serialized_start=3108,
+  serialized_end=3162,
 )
 
 
@@ -1439,8 +1763,8 @@ _PUSHSCHEMAREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2549,
-  serialized_end=2601,
+  serialized_start=3164,
+  serialized_end=3216,
 )
 
 
@@ -1477,8 +1801,8 @@ _FINDMISSINGCOMMITSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2603,
-  serialized_end=2685,
+  serialized_start=3218,
+  serialized_end=3300,
 )
 
 
@@ -1522,8 +1846,8 @@ _FINDMISSINGCOMMITSREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2687,
-  serialized_end=2802,
+  serialized_start=3302,
+  serialized_end=3417,
 )
 
 
@@ -1555,6 +1879,13 @@ _FINDMISSINGHASHRECORDSREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='hangar.FindMissingHashRecordsRequest.filter', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1567,8 +1898,8 @@ _FINDMISSINGHASHRECORDSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2804,
-  serialized_end=2891,
+  serialized_start=3419,
+  serialized_end=3522,
 )
 
 
@@ -1619,8 +1950,178 @@ _FINDMISSINGHASHRECORDSREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2893,
-  serialized_end=3013,
+  serialized_start=3524,
+  serialized_end=3644,
+)
+
+
+_FINDFILTEREDDATAREQUEST = _descriptor.Descriptor(
+  name='FindFilteredDataRequest',
+  full_name='hangar.FindFilteredDataRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='commit', full_name='hangar.FindFilteredDataRequest.commit', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='hangar.FindFilteredDataRequest.filter', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3646,
+  serialized_end=3703,
+)
+
+
+_RECONCILEHASHRECORDSREQUEST = _descriptor.Descriptor(
+  name='ReconcileHashRecordsRequest',
+  full_name='hangar.ReconcileHashRecordsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='commit', full_name='hangar.ReconcileHashRecordsRequest.commit', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_records', full_name='hangar.ReconcileHashRecordsRequest.num_records', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_cells', full_name='hangar.ReconcileHashRecordsRequest.num_cells', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_data', full_name='hangar.ReconcileHashRecordsRequest.raw_data', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nbytes', full_name='hangar.ReconcileHashRecordsRequest.nbytes', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='hangar.ReconcileHashRecordsRequest.filter', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3706,
+  serialized_end=3841,
+)
+
+
+_RECONCILEHASHRECORDSREPLY = _descriptor.Descriptor(
+  name='ReconcileHashRecordsReply',
+  full_name='hangar.ReconcileHashRecordsReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='commit', full_name='hangar.ReconcileHashRecordsReply.commit', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_records', full_name='hangar.ReconcileHashRecordsReply.num_records', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='decoded', full_name='hangar.ReconcileHashRecordsReply.decoded', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_data', full_name='hangar.ReconcileHashRecordsReply.raw_data', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nbytes', full_name='hangar.ReconcileHashRecordsReply.nbytes', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='hangar.ReconcileHashRecordsReply.error', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3844,
+  serialized_end=3994,
 )
 
 
@@ -1657,8 +2158,8 @@ _FINDMISSINGSCHEMASREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3015,
-  serialized_end=3082,
+  serialized_start=3996,
+  serialized_end=4063,
 )
 
 
@@ -1702,8 +2203,8 @@ _FINDMISSINGSCHEMASREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3084,
-  serialized_end=3184,
+  serialized_start=4065,
+  serialized_end=4165,
 )
 
 _PUSHBEGINCONTEXTREPLY.fields_by_name['err'].message_type = _ERRORPROTO
@@ -1719,10 +2220,14 @@ _PUSHFINDDATAORIGINREPLY.fields_by_name['compression_opts_expected'].message_typ
 _GETCLIENTCONFIGREPLY_CONFIGENTRY.containing_type = _GETCLIENTCONFIGREPLY
 _GETCLIENTCONFIGREPLY.fields_by_name['config'].message_type = _GETCLIENTCONFIGREPLY_CONFIGENTRY
 _GETCLIENTCONFIGREPLY.fields_by_name['error'].message_type = _ERRORPROTO
+_GETSERVERSTATSREPLY_STATSENTRY.containing_type = _GETSERVERSTATSREPLY
+_GETSERVERSTATSREPLY.fields_by_name['stats'].message_type = _GETSERVERSTATSREPLY_STATSENTRY
+_GETSERVERSTATSREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _FETCHBRANCHRECORDREQUEST.fields_by_name['rec'].message_type = _BRANCHRECORD
 _FETCHBRANCHRECORDREPLY.fields_by_name['rec'].message_type = _BRANCHRECORD
 _FETCHBRANCHRECORDREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _FETCHDATAREPLY.fields_by_name['error'].message_type = _ERRORPROTO
+_FETCHDATABATCHREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _FETCHCOMMITREPLY.fields_by_name['record'].message_type = _COMMITRECORD
 _FETCHCOMMITREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _FETCHSCHEMAREQUEST.fields_by_name['rec'].message_type = _SCHEMARECORD
@@ -1732,6 +2237,7 @@ _PUSHBRANCHRECORDREQUEST.fields_by_name['rec'].message_type = _BRANCHRECORD
 _PUSHBRANCHRECORDREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _PUSHDATAREQUEST.fields_by_name['data_type'].enum_type = _DATATYPE
 _PUSHDATAREPLY.fields_by_name['error'].message_type = _ERRORPROTO
+_PUSHDATARECEIVEDREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _PUSHCOMMITREQUEST.fields_by_name['record'].message_type = _COMMITRECORD
 _PUSHCOMMITREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _PUSHSCHEMAREQUEST.fields_by_name['rec'].message_type = _SCHEMARECORD
@@ -1740,6 +2246,7 @@ _FINDMISSINGCOMMITSREQUEST.fields_by_name['branch'].message_type = _BRANCHRECORD
 _FINDMISSINGCOMMITSREPLY.fields_by_name['branch'].message_type = _BRANCHRECORD
 _FINDMISSINGCOMMITSREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _FINDMISSINGHASHRECORDSREPLY.fields_by_name['error'].message_type = _ERRORPROTO
+_RECONCILEHASHRECORDSREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 _FINDMISSINGSCHEMASREPLY.fields_by_name['error'].message_type = _ERRORPROTO
 DESCRIPTOR.message_types_by_name['PushBeginContextRequest'] = _PUSHBEGINCONTEXTREQUEST
 DESCRIPTOR.message_types_by_name['PushBeginContextReply'] = _PUSHBEGINCONTEXTREPLY
@@ -1758,10 +2265,14 @@ DESCRIPTOR.message_types_by_name['PingRequest'] = _PINGREQUEST
 DESCRIPTOR.message_types_by_name['PingReply'] = _PINGREPLY
 DESCRIPTOR.message_types_by_name['GetClientConfigRequest'] = _GETCLIENTCONFIGREQUEST
 DESCRIPTOR.message_types_by_name['GetClientConfigReply'] = _GETCLIENTCONFIGREPLY
+DESCRIPTOR.message_types_by_name['GetServerStatsRequest'] = _GETSERVERSTATSREQUEST
+DESCRIPTOR.message_types_by_name['GetServerStatsReply'] = _GETSERVERSTATSREPLY
 DESCRIPTOR.message_types_by_name['FetchBranchRecordRequest'] = _FETCHBRANCHRECORDREQUEST
 DESCRIPTOR.message_types_by_name['FetchBranchRecordReply'] = _FETCHBRANCHRECORDREPLY
 DESCRIPTOR.message_types_by_name['FetchDataRequest'] = _FETCHDATAREQUEST
 DESCRIPTOR.message_types_by_name['FetchDataReply'] = _FETCHDATAREPLY
+DESCRIPTOR.message_types_by_name['FetchDataBatchRequest'] = _FETCHDATABATCHREQUEST
+DESCRIPTOR.message_types_by_name['FetchDataBatchReply'] = _FETCHDATABATCHREPLY
 DESCRIPTOR.message_types_by_name['FetchCommitRequest'] = _FETCHCOMMITREQUEST
 DESCRIPTOR.message_types_by_name['FetchCommitReply'] = _FETCHCOMMITREPLY
 DESCRIPTOR.message_types_by_name['FetchSchemaRequest'] = _FETCHSCHEMAREQUEST
@@ -1770,6 +2281,9 @@ DESCRIPTOR.message_types_by_name['PushBranchRecordRequest'] = _PUSHBRANCHRECORDR
 DESCRIPTOR.message_types_by_name['PushBranchRecordReply'] = _PUSHBRANCHRECORDREPLY
 DESCRIPTOR.message_types_by_name['PushDataRequest'] = _PUSHDATAREQUEST
 DESCRIPTOR.message_types_by_name['PushDataReply'] = _PUSHDATAREPLY
+DESCRIPTOR.message_types_by_name['PushDataReceivedRequest'] = _PUSHDATARECEIVEDREQUEST
+DESCRIPTOR.message_types_by_name['PushDataReceivedReply'] = _PUSHDATARECEIVEDREPLY
+DESCRIPTOR.message_types_by_name['PushDataBatchRequest'] = _PUSHDATABATCHREQUEST
 DESCRIPTOR.message_types_by_name['PushCommitRequest'] = _PUSHCOMMITREQUEST
 DESCRIPTOR.message_types_by_name['PushCommitReply'] = _PUSHCOMMITREPLY
 DESCRIPTOR.message_types_by_name['PushSchemaRequest'] = _PUSHSCHEMAREQUEST
@@ -1778,6 +2292,9 @@ DESCRIPTOR.message_types_by_name['FindMissingCommitsRequest'] = _FINDMISSINGCOMM
 DESCRIPTOR.message_types_by_name['FindMissingCommitsReply'] = _FINDMISSINGCOMMITSREPLY
 DESCRIPTOR.message_types_by_name['FindMissingHashRecordsRequest'] = _FINDMISSINGHASHRECORDSREQUEST
 DESCRIPTOR.message_types_by_name['FindMissingHashRecordsReply'] = _FINDMISSINGHASHRECORDSREPLY
+DESCRIPTOR.message_types_by_name['FindFilteredDataRequest'] = _FINDFILTEREDDATAREQUEST
+DESCRIPTOR.message_types_by_name['ReconcileHashRecordsRequest'] = _RECONCILEHASHRECORDSREQUEST
+DESCRIPTOR.message_types_by_name['ReconcileHashRecordsReply'] = _RECONCILEHASHRECORDSREPLY
 DESCRIPTOR.message_types_by_name['FindMissingSchemasRequest'] = _FINDMISSINGSCHEMASREQUEST
 DESCRIPTOR.message_types_by_name['FindMissingSchemasReply'] = _FINDMISSINGSCHEMASREPLY
 DESCRIPTOR.enum_types_by_name['DataLocation'] = _DATALOCATION
@@ -1927,6 +2444,28 @@ GetClientConfigReply = _reflection.GeneratedProtocolMessageType('GetClientConfig
 _sym_db.RegisterMessage(GetClientConfigReply)
 _sym_db.RegisterMessage(GetClientConfigReply.ConfigEntry)
 
+GetServerStatsRequest = _reflection.GeneratedProtocolMessageType('GetServerStatsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETSERVERSTATSREQUEST,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.GetServerStatsRequest)
+  })
+_sym_db.RegisterMessage(GetServerStatsRequest)
+
+GetServerStatsReply = _reflection.GeneratedProtocolMessageType('GetServerStatsReply', (_message.Message,), {
+
+  'StatsEntry' : _reflection.GeneratedProtocolMessageType('StatsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _GETSERVERSTATSREPLY_STATSENTRY,
+    '__module__' : 'hangar_service_pb2'
+    # @@protoc_insertion_point(class_scope:hangar.GetServerStatsReply.StatsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _GETSERVERSTATSREPLY,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.GetServerStatsReply)
+  })
+_sym_db.RegisterMessage(GetServerStatsReply)
+_sym_db.RegisterMessage(GetServerStatsReply.StatsEntry)
+
 FetchBranchRecordRequest = _reflection.GeneratedProtocolMessageType('FetchBranchRecordRequest', (_message.Message,), {
   'DESCRIPTOR' : _FETCHBRANCHRECORDREQUEST,
   '__module__' : 'hangar_service_pb2'
@@ -1955,6 +2494,20 @@ FetchDataReply = _reflection.GeneratedProtocolMessageType('FetchDataReply', (_me
   })
 _sym_db.RegisterMessage(FetchDataReply)
 
+FetchDataBatchRequest = _reflection.GeneratedProtocolMessageType('FetchDataBatchRequest', (_message.Message,), {
+  'DESCRIPTOR' : _FETCHDATABATCHREQUEST,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.FetchDataBatchRequest)
+  })
+_sym_db.RegisterMessage(FetchDataBatchRequest)
+
+FetchDataBatchReply = _reflection.GeneratedProtocolMessageType('FetchDataBatchReply', (_message.Message,), {
+  'DESCRIPTOR' : _FETCHDATABATCHREPLY,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.FetchDataBatchReply)
+  })
+_sym_db.RegisterMessage(FetchDataBatchReply)
+
 FetchCommitRequest = _reflection.GeneratedProtocolMessageType('FetchCommitRequest', (_message.Message,), {
   'DESCRIPTOR' : _FETCHCOMMITREQUEST,
   '__module__' : 'hangar_service_pb2'
@@ -2011,6 +2564,27 @@ PushDataReply = _reflection.GeneratedProtocolMessageType('PushDataReply', (_mess
   })
 _sym_db.RegisterMessage(PushDataReply)
 
+PushDataReceivedRequest = _reflection.GeneratedProtocolMessageType('PushDataReceivedRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PUSHDATARECEIVEDREQUEST,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.PushDataReceivedRequest)
+  })
+_sym_db.RegisterMessage(PushDataReceivedRequest)
+
+PushDataReceivedReply = _reflection.GeneratedProtocolMessageType('PushDataReceivedReply', (_message.Message,), {
+  'DESCRIPTOR' : _PUSHDATARECEIVEDREPLY,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.PushDataReceivedReply)
+  })
+_sym_db.RegisterMessage(PushDataReceivedReply)
+
+PushDataBatchRequest = _reflection.GeneratedProtocolMessageType('PushDataBatchRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PUSHDATABATCHREQUEST,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.PushDataBatchRequest)
+  })
+_sym_db.RegisterMessage(PushDataBatchRequest)
+
 PushCommitRequest = _reflection.GeneratedProtocolMessageType('PushCommitRequest', (_message.Message,), {
   'DESCRIPTOR' : _PUSHCOMMITREQUEST,
   '__module__' : 'hangar_service_pb2'
@@ -2067,6 +2641,27 @@ FindMissingHashRecordsReply = _reflection.GeneratedProtocolMessageType('FindMiss
   })
 _sym_db.RegisterMessage(FindMissingHashRecordsReply)
 
+FindFilteredDataRequest = _reflection.GeneratedProtocolMessageType('FindFilteredDataRequest', (_message.Message,), {
+  'DESCRIPTOR' : _FINDFILTEREDDATAREQUEST,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.FindFilteredDataRequest)
+  })
+_sym_db.RegisterMessage(FindFilteredDataRequest)
+
+ReconcileHashRecordsRequest = _reflection.GeneratedProtocolMessageType('ReconcileHashRecordsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _RECONCILEHASHRECORDSREQUEST,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.ReconcileHashRecordsRequest)
+  })
+_sym_db.RegisterMessage(ReconcileHashRecordsRequest)
+
+ReconcileHashRecordsReply = _reflection.GeneratedProtocolMessageType('ReconcileHashRecordsReply', (_message.Message,), {
+  'DESCRIPTOR' : _RECONCILEHASHRECORDSREPLY,
+  '__module__' : 'hangar_service_pb2'
+  # @@protoc_insertion_point(class_scope:hangar.ReconcileHashRecordsReply)
+  })
+_sym_db.RegisterMessage(ReconcileHashRecordsReply)
+
 FindMissingSchemasRequest = _reflection.GeneratedProtocolMessageType('FindMissingSchemasRequest', (_message.Message,), {
   'DESCRIPTOR' : _FINDMISSINGSCHEMASREQUEST,
   '__module__' : 'hangar_service_pb2'
@@ -2086,6 +2681,7 @@ DESCRIPTOR._options = None
 _DATAORIGINREPLY_COMPRESSIONOPTSENTRY._options = None
 _PUSHFINDDATAORIGINREPLY_COMPRESSIONOPTSEXPECTEDENTRY._options = None
 _GETCLIENTCONFIGREPLY_CONFIGENTRY._options = None
+_GETSERVERSTATSREPLY_STATSENTRY._options = None
 
 _HANGARSERVICE = _descriptor.ServiceDescriptor(
   name='HangarService',
@@ -2093,8 +2689,8 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=3317,
-  serialized_end=5007,
+  serialized_start=4298,
+  serialized_end=6622,
   methods=[
   _descriptor.MethodDescriptor(
     name='PING',
@@ -2114,10 +2710,19 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
     output_type=_GETCLIENTCONFIGREPLY,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetServerStats',
+    full_name='hangar.HangarService.GetServerStats',
+    index=2,
+    containing_service=None,
+    input_type=_GETSERVERSTATSREQUEST,
+    output_type=_GETSERVERSTATSREPLY,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='FetchBranchRecord',
     full_name='hangar.HangarService.FetchBranchRecord',
-    index=2,
+    index=3,
     containing_service=None,
     input_type=_FETCHBRANCHRECORDREQUEST,
     output_type=_FETCHBRANCHRECORDREPLY,
@@ -2126,16 +2731,25 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='FetchData',
     full_name='hangar.HangarService.FetchData',
-    index=3,
+    index=4,
     containing_service=None,
     input_type=_FETCHDATAREQUEST,
     output_type=_FETCHDATAREPLY,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='FetchDataBatch',
+    full_name='hangar.HangarService.FetchDataBatch',
+    index=5,
+    containing_service=None,
+    input_type=_FETCHDATABATCHREQUEST,
+    output_type=_FETCHDATABATCHREPLY,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='FetchCommit',
     full_name='hangar.HangarService.FetchCommit',
-    index=4,
+    index=6,
     containing_service=None,
     input_type=_FETCHCOMMITREQUEST,
     output_type=_FETCHCOMMITREPLY,
@@ -2144,7 +2758,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='FetchSchema',
     full_name='hangar.HangarService.FetchSchema',
-    index=5,
+    index=7,
     containing_service=None,
     input_type=_FETCHSCHEMAREQUEST,
     output_type=_FETCHSCHEMAREPLY,
@@ -2153,7 +2767,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushBranchRecord',
     full_name='hangar.HangarService.PushBranchRecord',
-    index=6,
+    index=8,
     containing_service=None,
     input_type=_PUSHBRANCHRECORDREQUEST,
     output_type=_PUSHBRANCHRECORDREPLY,
@@ -2162,16 +2776,34 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushData',
     full_name='hangar.HangarService.PushData',
-    index=7,
+    index=9,
     containing_service=None,
     input_type=_PUSHDATAREQUEST,
     output_type=_PUSHDATAREPLY,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='PushDataBatch',
+    full_name='hangar.HangarService.PushDataBatch',
+    index=10,
+    containing_service=None,
+    input_type=_PUSHDATABATCHREQUEST,
+    output_type=_PUSHDATAREPLY,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PushDataReceived',
+    full_name='hangar.HangarService.PushDataReceived',
+    index=11,
+    containing_service=None,
+    input_type=_PUSHDATARECEIVEDREQUEST,
+    output_type=_PUSHDATARECEIVEDREPLY,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='PushCommit',
     full_name='hangar.HangarService.PushCommit',
-    index=8,
+    index=12,
     containing_service=None,
     input_type=_PUSHCOMMITREQUEST,
     output_type=_PUSHCOMMITREPLY,
@@ -2180,7 +2812,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushSchema',
     full_name='hangar.HangarService.PushSchema',
-    index=9,
+    index=13,
     containing_service=None,
     input_type=_PUSHSCHEMAREQUEST,
     output_type=_PUSHSCHEMAREPLY,
@@ -2189,7 +2821,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='FetchFindMissingCommits',
     full_name='hangar.HangarService.FetchFindMissingCommits',
-    index=10,
+    index=14,
     containing_service=None,
     input_type=_FINDMISSINGCOMMITSREQUEST,
     output_type=_FINDMISSINGCOMMITSREPLY,
@@ -2198,7 +2830,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='FetchFindMissingHashRecords',
     full_name='hangar.HangarService.FetchFindMissingHashRecords',
-    index=11,
+    index=15,
     containing_service=None,
     input_type=_FINDMISSINGHASHRECORDSREQUEST,
     output_type=_FINDMISSINGHASHRECORDSREPLY,
@@ -2207,16 +2839,34 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='FetchFindMissingSchemas',
     full_name='hangar.HangarService.FetchFindMissingSchemas',
-    index=12,
+    index=16,
     containing_service=None,
     input_type=_FINDMISSINGSCHEMASREQUEST,
     output_type=_FINDMISSINGSCHEMASREPLY,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='FetchReconcileHashRecords',
+    full_name='hangar.HangarService.FetchReconcileHashRecords',
+    index=17,
+    containing_service=None,
+    input_type=_RECONCILEHASHRECORDSREQUEST,
+    output_type=_RECONCILEHASHRECORDSREPLY,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='FetchFindFilteredData',
+    full_name='hangar.HangarService.FetchFindFilteredData',
+    index=18,
+    containing_service=None,
+    input_type=_FINDFILTEREDDATAREQUEST,
+    output_type=_FINDMISSINGHASHRECORDSREPLY,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='PushFindMissingCommits',
     full_name='hangar.HangarService.PushFindMissingCommits',
-    index=13,
+    index=19,
     containing_service=None,
     input_type=_FINDMISSINGCOMMITSREQUEST,
     output_type=_FINDMISSINGCOMMITSREPLY,
@@ -2225,7 +2875,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushFindMissingHashRecords',
     full_name='hangar.HangarService.PushFindMissingHashRecords',
-    index=14,
+    index=20,
     containing_service=None,
     input_type=_FINDMISSINGHASHRECORDSREQUEST,
     output_type=_FINDMISSINGHASHRECORDSREPLY,
@@ -2234,16 +2884,25 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushFindMissingSchemas',
     full_name='hangar.HangarService.PushFindMissingSchemas',
-    index=15,
+    index=21,
     containing_service=None,
     input_type=_FINDMISSINGSCHEMASREQUEST,
     output_type=_FINDMISSINGSCHEMASREPLY,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='PushReconcileHashRecords',
+    full_name='hangar.HangarService.PushReconcileHashRecords',
+    index=22,
+    containing_service=None,
+    input_type=_RECONCILEHASHRECORDSREQUEST,
+    output_type=_RECONCILEHASHRECORDSREPLY,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='FetchFindDataOrigin',
     full_name='hangar.HangarService.FetchFindDataOrigin',
-    index=16,
+    index=23,
     containing_service=None,
     input_type=_DATAORIGINREQUEST,
     output_type=_DATAORIGINREPLY,
@@ -2252,7 +2911,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushFindDataOrigin',
     full_name='hangar.HangarService.PushFindDataOrigin',
-    index=17,
+    index=24,
     containing_service=None,
     input_type=_PUSHFINDDATAORIGINREQUEST,
     output_type=_PUSHFINDDATAORIGINREPLY,
@@ -2261,7 +2920,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushBeginContext',
     full_name='hangar.HangarService.PushBeginContext',
-    index=18,
+    index=25,
     containing_service=None,
     input_type=_PUSHBEGINCONTEXTREQUEST,
     output_type=_PUSHBEGINCONTEXTREPLY,
@@ -2270,7 +2929,7 @@ _HANGARSERVICE = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushEndContext',
     full_name='hangar.HangarService.PushEndContext',
-    index=19,
+    index=26,
     containing_service=None,
     input_type=_PUSHENDCONTEXTREQUEST,
     output_type=_PUSHENDCONTEXTREPLY,
@@ -221,6 +221,7 @@ class DataOriginReply(google___protobuf___message___Message):
     digest: typing___Text = ...
     uri: typing___Text = ...
     compression: builtin___bool = ...
+    num_elements: builtin___int = ...
 
     @property
     def compression_opts(self) -> typing___MutableMapping[typing___Text, typing___Text]: ...
@@ -233,8 +234,9 @@ class DataOriginReply(google___protobuf___message___Message):
         uri : typing___Optional[typing___Text] = None,
         compression : typing___Optional[builtin___bool] = None,
         compression_opts : typing___Optional[typing___Mapping[typing___Text, typing___Text]] = None,
+        num_elements : typing___Optional[builtin___int] = None,
         ) -> None: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"compression",b"compression",u"compression_opts",b"compression_opts",u"data_type",b"data_type",u"digest",b"digest",u"location",b"location",u"uri",b"uri"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"compression",b"compression",u"compression_opts",b"compression_opts",u"data_type",b"data_type",u"digest",b"digest",u"location",b"location",u"num_elements",b"num_elements",u"uri",b"uri"]) -> None: ...
 type___DataOriginReply = DataOriginReply
 
 class PushFindDataOriginRequest(google___protobuf___message___Message):
@@ -342,6 +344,44 @@ class GetClientConfigReply(google___protobuf___message___Message):
     def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"error",b"error"]) -> None: ...
 type___GetClientConfigReply = GetClientConfigReply
 
+class GetServerStatsRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    def __init__(self,
+        ) -> None: ...
+type___GetServerStatsRequest = GetServerStatsRequest
+
+class GetServerStatsReply(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class StatsEntry(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        key: typing___Text = ...
+        value: builtin___int = ...
+
+        def __init__(self,
+            *,
+            key : typing___Optional[typing___Text] = None,
+            value : typing___Optional[builtin___int] = None,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
+    type___StatsEntry = StatsEntry
+
+
+    @property
+    def stats(self) -> typing___MutableMapping[typing___Text, builtin___int]: ...
+
+    @property
+    def error(self) -> type___ErrorProto: ...
+
+    def __init__(self,
+        *,
+        stats : typing___Optional[typing___Mapping[typing___Text, builtin___int]] = None,
+        error : typing___Optional[type___ErrorProto] = None,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"error",b"error",u"stats",b"stats"]) -> None: ...
+type___GetServerStatsReply = GetServerStatsReply
+
 class FetchBranchRecordRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
 
@@ -405,6 +445,41 @@ class FetchDataReply(google___protobuf___message___Message):
     def ClearField(self, field_name: typing_extensions___Literal[u"error",b"error",u"nbytes",b"nbytes",u"raw_data",b"raw_data",u"uri",b"uri"]) -> None: ...
 type___FetchDataReply = FetchDataReply
 
+class FetchDataBatchRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    uris: google___protobuf___internal___containers___RepeatedScalarFieldContainer[typing___Text] = ...
+    codec: typing___Text = ...
+    raw_chunks: builtin___bool = ...
+
+    def __init__(self,
+        *,
+        uris : typing___Optional[typing___Iterable[typing___Text]] = None,
+        codec : typing___Optional[typing___Text] = None,
+        raw_chunks : typing___Optional[builtin___bool] = None,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"codec",b"codec",u"raw_chunks",b"raw_chunks",u"uris",b"uris"]) -> None: ...
+type___FetchDataBatchRequest = FetchDataBatchRequest
+
+class FetchDataBatchReply(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    num_records: builtin___int = ...
+    raw_data: builtin___bytes = ...
+    nbytes: builtin___int = ...
+
+    @property
+    def error(self) -> type___ErrorProto: ...
+
+    def __init__(self,
+        *,
+        num_records : typing___Optional[builtin___int] = None,
+        raw_data : typing___Optional[builtin___bytes] = None,
+        nbytes : typing___Optional[builtin___int] = None,
+        error : typing___Optional[type___ErrorProto] = None,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"error",b"error",u"nbytes",b"nbytes",u"num_records",b"num_records",u"raw_data",b"raw_data"]) -> None: ...
+type___FetchDataBatchReply = FetchDataBatchReply
+
 class FetchCommitRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     commit: typing___Text = ...
@@ -531,6 +606,50 @@ class PushDataReply(google___protobuf___message___Message):
     def ClearField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> None: ...
 type___PushDataReply = PushDataReply
 
+class PushDataReceivedRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    digests: google___protobuf___internal___containers___RepeatedScalarFieldContainer[typing___Text] = ...
+
+    def __init__(self,
+        *,
+        digests : typing___Optional[typing___Iterable[typing___Text]] = None,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"digests",b"digests"]) -> None: ...
+type___PushDataReceivedRequest = PushDataReceivedRequest
+
+class PushDataReceivedReply(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    digests: google___protobuf___internal___containers___RepeatedScalarFieldContainer[typing___Text] = ...
+
+    @property
+    def error(self) -> type___ErrorProto: ...
+
+    def __init__(self,
+        *,
+        error : typing___Optional[type___ErrorProto] = None,
+        digests : typing___Optional[typing___Iterable[typing___Text]] = None,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"digests",b"digests",u"error",b"error"]) -> None: ...
+type___PushDataReceivedReply = PushDataReceivedReply
+
+class PushDataBatchRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    schema_hash: typing___Text = ...
+    num_records: builtin___int = ...
+    raw_data: builtin___bytes = ...
+    nbytes: builtin___int = ...
+
+    def __init__(self,
+        *,
+        schema_hash : typing___Optional[typing___Text] = None,
+        num_records : typing___Optional[builtin___int] = None,
+        raw_data : typing___Optional[builtin___bytes] = None,
+        nbytes : typing___Optional[builtin___int] = None,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"nbytes",b"nbytes",u"num_records",b"num_records",u"raw_data",b"raw_data",u"schema_hash",b"schema_hash"]) -> None: ...
+type___PushDataBatchRequest = PushDataBatchRequest
+
 class PushCommitRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     commit: typing___Text = ...
@@ -632,14 +751,16 @@ class FindMissingHashRecordsRequest(google___protobuf___message___Message):
     commit: typing___Text = ...
     hashs: builtin___bytes = ...
     total_byte_size: builtin___int = ...
+    filter: typing___Text = ...
 
     def __init__(self,
         *,
         commit : typing___Optional[typing___Text] = None,
         hashs : typing___Optional[builtin___bytes] = None,
         total_byte_size : typing___Optional[builtin___int] = None,
+        filter : typing___Optional[typing___Text] = None,
         ) -> None: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"commit",b"commit",u"hashs",b"hashs",u"total_byte_size",b"total_byte_size"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"commit",b"commit",u"filter",b"filter",u"hashs",b"hashs",u"total_byte_size",b"total_byte_size"]) -> None: ...
 type___FindMissingHashRecordsRequest = FindMissingHashRecordsRequest
 
 class FindMissingHashRecordsReply(google___protobuf___message___Message):
@@ -662,6 +783,64 @@ class FindMissingHashRecordsReply(google___protobuf___message___Message):
     def ClearField(self, field_name: typing_extensions___Literal[u"commit",b"commit",u"error",b"error",u"hashs",b"hashs",u"total_byte_size",b"total_byte_size"]) -> None: ...
 type___FindMissingHashRecordsReply = FindMissingHashRecordsReply
 
+class FindFilteredDataRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    commit: typing___Text = ...
+    filter: typing___Text = ...
+
+    def __init__(self,
+        *,
+        commit : typing___Optional[typing___Text] = None,
+        filter : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"commit",b"commit",u"filter",b"filter"]) -> None: ...
+type___FindFilteredDataRequest = FindFilteredDataRequest
+
+class ReconcileHashRecordsRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    commit: typing___Text = ...
+    num_records: builtin___int = ...
+    num_cells: builtin___int = ...
+    raw_data: builtin___bytes = ...
+    nbytes: builtin___int = ...
+    filter: typing___Text = ...
+
+    def __init__(self,
+        *,
+        commit : typing___Optional[typing___Text] = None,
+        num_records : typing___Optional[builtin___int] = None,
+        num_cells : typing___Optional[builtin___int] = None,
+        raw_data : typing___Optional[builtin___bytes] = None,
+        nbytes : typing___Optional[builtin___int] = None,
+        filter : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"commit",b"commit",u"filter",b"filter",u"nbytes",b"nbytes",u"num_cells",b"num_cells",u"num_records",b"num_records",u"raw_data",b"raw_data"]) -> None: ...
+type___ReconcileHashRecordsRequest = ReconcileHashRecordsRequest
+
+class ReconcileHashRecordsReply(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    commit: typing___Text = ...
+    num_records: builtin___int = ...
+    decoded: builtin___bool = ...
+    raw_data: builtin___bytes = ...
+    nbytes: builtin___int = ...
+
+    @property
+    def error(self) -> type___ErrorProto: ...
+
+    def __init__(self,
+        *,
+        commit : typing___Optional[typing___Text] = None,
+        num_records : typing___Optional[builtin___int] = None,
+        decoded : typing___Optional[builtin___bool] = None,
+        raw_data : typing___Optional[builtin___bytes] = None,
+        nbytes : typing___Optional[builtin___int] = None,
+        error : typing___Optional[type___ErrorProto] = None,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
+    def ClearField(self, field_name: typing_extensions___Literal[u"commit",b"commit",u"decoded",b"decoded",u"error",b"error",u"nbytes",b"nbytes",u"num_records",b"num_records",u"raw_data",b"raw_data"]) -> None: ...
+type___ReconcileHashRecordsReply = ReconcileHashRecordsReply
+
 class FindMissingSchemasRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     commit: typing___Text = ...
@@ -23,6 +23,11 @@ class HangarServiceStub(object):
                 request_serializer=hangar__service__pb2.GetClientConfigRequest.SerializeToString,
                 response_deserializer=hangar__service__pb2.GetClientConfigReply.FromString,
                 )
+        self.GetServerStats = channel.unary_unary(
+                '/hangar.HangarService/GetServerStats',
+                request_serializer=hangar__service__pb2.GetServerStatsRequest.SerializeToString,
+                response_deserializer=hangar__service__pb2.GetServerStatsReply.FromString,
+                )
         self.FetchBranchRecord = channel.unary_unary(
                 '/hangar.HangarService/FetchBranchRecord',
                 request_serializer=hangar__service__pb2.FetchBranchRecordRequest.SerializeToString,
@@ -33,6 +38,11 @@ class HangarServiceStub(object):
                 request_serializer=hangar__service__pb2.FetchDataRequest.SerializeToString,
                 response_deserializer=hangar__service__pb2.FetchDataReply.FromString,
                 )
+        self.FetchDataBatch = channel.unary_stream(
+                '/hangar.HangarService/FetchDataBatch',
+                request_serializer=hangar__service__pb2.FetchDataBatchRequest.SerializeToString,
+                response_deserializer=hangar__service__pb2.FetchDataBatchReply.FromString,
+                )
         self.FetchCommit = channel.unary_stream(
                 '/hangar.HangarService/FetchCommit',
                 request_serializer=hangar__service__pb2.FetchCommitRequest.SerializeToString,
@@ -53,6 +63,16 @@ class HangarServiceStub(object):
                 request_serializer=hangar__service__pb2.PushDataRequest.SerializeToString,
                 response_deserializer=hangar__service__pb2.PushDataReply.FromString,
                 )
+        self.PushDataBatch = channel.stream_unary(
+                '/hangar.HangarService/PushDataBatch',
+                request_serializer=hangar__service__pb2.PushDataBatchRequest.SerializeToString,
+                response_deserializer=hangar__service__pb2.PushDataReply.FromString,
+                )
+        self.PushDataReceived = channel.unary_unary(
+                '/hangar.HangarService/PushDataReceived',
+                request_serializer=hangar__service__pb2.PushDataReceivedRequest.SerializeToString,
+                response_deserializer=hangar__service__pb2.PushDataReceivedReply.FromString,
+                )
         self.PushCommit = channel.stream_unary(
                 '/hangar.HangarService/PushCommit',
                 request_serializer=hangar__service__pb2.PushCommitRequest.SerializeToString,
@@ -78,6 +98,16 @@ class HangarServiceStub(object):
                 request_serializer=hangar__service__pb2.FindMissingSchemasRequest.SerializeToString,
                 response_deserializer=hangar__service__pb2.FindMissingSchemasReply.FromString,
                 )
+        self.FetchReconcileHashRecords = channel.stream_stream(
+                '/hangar.HangarService/FetchReconcileHashRecords',
+                request_serializer=hangar__service__pb2.ReconcileHashRecordsRequest.SerializeToString,
+                response_deserializer=hangar__service__pb2.ReconcileHashRecordsReply.FromString,
+                )
+        self.FetchFindFilteredData = channel.unary_stream(
+                '/hangar.HangarService/FetchFindFilteredData',
+                request_serializer=hangar__service__pb2.FindFilteredDataRequest.SerializeToString,
+                response_deserializer=hangar__service__pb2.FindMissingHashRecordsReply.FromString,
+                )
         self.PushFindMissingCommits = channel.unary_unary(
                 '/hangar.HangarService/PushFindMissingCommits',
                 request_serializer=hangar__service__pb2.FindMissingCommitsRequest.SerializeToString,
@@ -93,6 +123,11 @@ class HangarServiceStub(object):
                 request_serializer=hangar__service__pb2.FindMissingSchemasRequest.SerializeToString,
                 response_deserializer=hangar__service__pb2.FindMissingSchemasReply.FromString,
                 )
+        self.PushReconcileHashRecords = channel.stream_stream(
+                '/hangar.HangarService/PushReconcileHashRecords',
+                request_serializer=hangar__service__pb2.ReconcileHashRecordsRequest.SerializeToString,
+                response_deserializer=hangar__service__pb2.ReconcileHashRecordsReply.FromString,
+                )
         self.FetchFindDataOrigin = channel.stream_stream(
                 '/hangar.HangarService/FetchFindDataOrigin',
                 request_serializer=hangar__service__pb2.DataOriginRequest.SerializeToString,
@@ -130,6 +165,12 @@ class HangarServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetServerStats(self, request, context):
+        """Missing associated documentation comment in .proto file"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def FetchBranchRecord(self, request, context):
         """Missing associated documentation comment in .proto file"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -142,6 +183,12 @@ class HangarServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def FetchDataBatch(self, request, context):
+        """Missing associated documentation comment in .proto file"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def FetchCommit(self, request, context):
         """Missing associated documentation comment in .proto file"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -166,6 +213,18 @@ class HangarServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PushDataBatch(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PushDataReceived(self, request, context):
+        """Missing associated documentation comment in .proto file"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def PushCommit(self, request_iterator, context):
         """Missing associated documentation comment in .proto file"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -196,6 +255,18 @@ class HangarServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def FetchReconcileHashRecords(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FetchFindFilteredData(self, request, context):
+        """Missing associated documentation comment in .proto file"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def PushFindMissingCommits(self, request, context):
         """Missing associated documentation comment in .proto file"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -214,6 +285,12 @@ class HangarServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PushReconcileHashRecords(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def FetchFindDataOrigin(self, request_iterator, context):
         """Missing associated documentation comment in .proto file"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -251,6 +328,11 @@ def add_HangarServiceServicer_to_server(servicer, server):
                     request_deserializer=hangar__service__pb2.GetClientConfigRequest.FromString,
                     response_serializer=hangar__service__pb2.GetClientConfigReply.SerializeToString,
             ),
+            'GetServerStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetServerStats,
+                    request_deserializer=hangar__service__pb2.GetServerStatsRequest.FromString,
+                    response_serializer=hangar__service__pb2.GetServerStatsReply.SerializeToString,
+            ),
             'FetchBranchRecord': grpc.unary_unary_rpc_method_handler(
                     servicer.FetchBranchRecord,
                     request_deserializer=hangar__service__pb2.FetchBranchRecordRequest.FromString,
@@ -261,6 +343,11 @@ def add_HangarServiceServicer_to_server(servicer, server):
                     request_deserializer=hangar__service__pb2.FetchDataRequest.FromString,
                     response_serializer=hangar__service__pb2.FetchDataReply.SerializeToString,
             ),
+            'FetchDataBatch': grpc.unary_stream_rpc_method_handler(
+                    servicer.FetchDataBatch,
+                    request_deserializer=hangar__service__pb2.FetchDataBatchRequest.FromString,
+                    response_serializer=hangar__service__pb2.FetchDataBatchReply.SerializeToString,
+            ),
             'FetchCommit': grpc.unary_stream_rpc_method_handler(
                     servicer.FetchCommit,
                     request_deserializer=hangar__service__pb2.FetchCommitRequest.FromString,
@@ -281,6 +368,16 @@ def add_HangarServiceServicer_to_server(servicer, server):
                     request_deserializer=hangar__service__pb2.PushDataRequest.FromString,
                     response_serializer=hangar__service__pb2.PushDataReply.SerializeToString,
             ),
+            'PushDataBatch': grpc.stream_unary_rpc_method_handler(
+                    servicer.PushDataBatch,
+                    request_deserializer=hangar__service__pb2.PushDataBatchRequest.FromString,
+                    response_serializer=hangar__service__pb2.PushDataReply.SerializeToString,
+            ),
+            'PushDataReceived': grpc.unary_unary_rpc_method_handler(
+                    servicer.PushDataReceived,
+                    request_deserializer=hangar__service__pb2.PushDataReceivedRequest.FromString,
+                    response_serializer=hangar__service__pb2.PushDataReceivedReply.SerializeToString,
+            ),
             'PushCommit': grpc.stream_unary_rpc_method_handler(
                     servicer.PushCommit,
                     request_deserializer=hangar__service__pb2.PushCommitRequest.FromString,
@@ -306,6 +403,16 @@ def add_HangarServiceServicer_to_server(servicer, server):
                     request_deserializer=hangar__service__pb2.FindMissingSchemasRequest.FromString,
                     response_serializer=hangar__service__pb2.FindMissingSchemasReply.SerializeToString,
             ),
+            'FetchReconcileHashRecords': grpc.stream_stream_rpc_method_handler(
+                    servicer.FetchReconcileHashRecords,
+                    request_deserializer=hangar__service__pb2.ReconcileHashRecordsRequest.FromString,
+                    response_serializer=hangar__service__pb2.ReconcileHashRecordsReply.SerializeToString,
+            ),
+            'FetchFindFilteredData': grpc.unary_stream_rpc_method_handler(
+                    servicer.FetchFindFilteredData,
+                    request_deserializer=hangar__service__pb2.FindFilteredDataRequest.FromString,
+                    response_serializer=hangar__service__pb2.FindMissingHashRecordsReply.SerializeToString,
+            ),
             'PushFindMissingCommits': grpc.unary_unary_rpc_method_handler(
                     servicer.PushFindMissingCommits,
                     request_deserializer=hangar__service__pb2.FindMissingCommitsRequest.FromString,
@@ -321,6 +428,11 @@ def add_HangarServiceServicer_to_server(servicer, server):
                     request_deserializer=hangar__service__pb2.FindMissingSchemasRequest.FromString,
                     response_serializer=hangar__service__pb2.FindMissingSchemasReply.SerializeToString,
             ),
+            'PushReconcileHashRecords': grpc.stream_stream_rpc_method_handler(
+                    servicer.PushReconcileHashRecords,
+                    request_deserializer=hangar__service__pb2.ReconcileHashRecordsRequest.FromString,
+                    response_serializer=hangar__service__pb2.ReconcileHashRecordsReply.SerializeToString,
+            ),
             'FetchFindDataOrigin': grpc.stream_stream_rpc_method_handler(
                     servicer.FetchFindDataOrigin,
                     request_deserializer=hangar__service__pb2.DataOriginRequest.FromString,
@@ -383,6 +495,22 @@ class HangarService(object):
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def GetServerStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/hangar.HangarService/GetServerStats',
+            hangar__service__pb2.GetServerStatsRequest.SerializeToString,
+            hangar__service__pb2.GetServerStatsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def FetchBranchRecord(request,
             target,
@@ -415,6 +543,22 @@ class HangarService(object):
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def FetchDataBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/hangar.HangarService/FetchDataBatch',
+            hangar__service__pb2.FetchDataBatchRequest.SerializeToString,
+            hangar__service__pb2.FetchDataBatchReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def FetchCommit(request,
             target,
@@ -479,6 +623,38 @@ class HangarService(object):
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def PushDataBatch(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/hangar.HangarService/PushDataBatch',
+            hangar__service__pb2.PushDataBatchRequest.SerializeToString,
+            hangar__service__pb2.PushDataReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PushDataReceived(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/hangar.HangarService/PushDataReceived',
+            hangar__service__pb2.PushDataReceivedRequest.SerializeToString,
+            hangar__service__pb2.PushDataReceivedReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def PushCommit(request_iterator,
             target,
@@ -559,6 +735,38 @@ class HangarService(object):
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def FetchReconcileHashRecords(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/hangar.HangarService/FetchReconcileHashRecords',
+            hangar__service__pb2.ReconcileHashRecordsRequest.SerializeToString,
+            hangar__service__pb2.ReconcileHashRecordsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def FetchFindFilteredData(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/hangar.HangarService/FetchFindFilteredData',
+            hangar__service__pb2.FindFilteredDataRequest.SerializeToString,
+            hangar__service__pb2.FindMissingHashRecordsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def PushFindMissingCommits(request,
             target,
@@ -607,6 +815,22 @@ class HangarService(object):
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def PushReconcileHashRecords(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/hangar.HangarService/PushReconcileHashRecords',
+            hangar__service__pb2.ReconcileHashRecordsRequest.SerializeToString,
+            hangar__service__pb2.ReconcileHashRecordsReply.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def FetchFindDataOrigin(request_iterator,
             target,
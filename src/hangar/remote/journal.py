@@ -0,0 +1,234 @@
+"""Persistent journal recording the progress of remote data transfers.
+
+Long running ``fetch_data`` and ``push`` operations record the set of data
+digests they still need to transfer when they start, and remove entries as
+each batch of samples is durably committed. Should the operation be
+interrupted, rerunning the same operation resumes from the journal without
+renegotiating (or re-transferring) what was already completed.
+
+Records are kept in an lmdb environment in the repository directory:
+
+* ``r:{run_key}`` -> json encoded run spec (operation, remote, meta, counts)
+* ``p:{run_key}:{group}:{digest}`` -> b'' for every item still pending
+* ``s:{finished_time}:{run_key}`` -> json encoded summary of a finished run
+"""
+import json
+import time
+from contextlib import contextmanager
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import lmdb
+
+from ..constants import LMDB_SETTINGS, LMDB_TRANSFER_JOURNAL_NAME
+
+
+class TransferSummary(NamedTuple):
+    """Throughput summary of a completed (possibly resumed) transfer run.
+    """
+    run_key: str
+    operation: str
+    remote: str
+    num_samples: int
+    elapsed: float
+    samples_per_sec: float
+    num_resumes: int
+    finished: float
+
+
+# number of samples transferred between durable progress checkpoints
+CHECKPOINT_NUM_SAMPLES = 10_000
+
+
+def checkpoint_batches(digests: Sequence[str]) -> List[List[str]]:
+    """Split digests (in sorted order) into the batches checkpointed after transfer.
+    """
+    digests = sorted(digests)
+    return [digests[i:i + CHECKPOINT_NUM_SAMPLES]
+            for i in range(0, len(digests), CHECKPOINT_NUM_SAMPLES)]
+
+
+def _dumps(obj) -> bytes:
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(raw: bytes):
+    return json.loads(raw)
+
+
+class TransferJournal(object):
+    """Record pending items of a transfer run so it can be resumed if interrupted.
+
+    Parameters
+    ----------
+    repo_path
+        path to the repository directory the journal is stored within.
+    """
+
+    def __init__(self, repo_path: Path):
+        self._path = Path(repo_path, LMDB_TRANSFER_JOURNAL_NAME)
+        self._env: lmdb.Environment = lmdb.open(str(self._path), **LMDB_SETTINGS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._env.close()
+
+    @staticmethod
+    def run_key(operation: str, remote: str, **spec) -> str:
+        """Deterministic key identifying a transfer from its arguments.
+        """
+        raw = _dumps({'operation': operation, 'remote': remote, 'spec': spec})
+        return blake2b(raw, digest_size=10).hexdigest()
+
+    @staticmethod
+    def _pending_prefix(run_key: str, group: str = '') -> bytes:
+        if group:
+            return f'p:{run_key}:{group}:'.encode()
+        return f'p:{run_key}:'.encode()
+
+    @contextmanager
+    def _update_run(self, txn: lmdb.Transaction, run_key: str):
+        runKey = f'r:{run_key}'.encode()
+        spec = _loads(txn.get(runKey))
+        yield spec
+        txn.put(runKey, _dumps(spec))
+
+    def begin_run(self, run_key: str, operation: str, remote: str,
+                  pending: Dict[str, Iterable[str]], **meta):
+        """Record a new run along with every item which needs to be transferred.
+
+        Parameters
+        ----------
+        run_key
+            key identifying the run, see :meth:`run_key`.
+        operation
+            name of the transfer operation (ie. ``fetch_data``, ``push``).
+        remote
+            name of the remote the transfer is made with.
+        pending
+            map of group name (typically a schema digest) to the digests in that
+            group which need to be transferred.
+        **meta
+            any json serializable values the operation needs to resume.
+        """
+        num_pending = 0
+        with self._env.begin(write=True) as txn:
+            with txn.cursor() as cur:
+                items = []
+                for group, digests in pending.items():
+                    prefix = self._pending_prefix(run_key, group)
+                    items.extend((prefix + digest.encode(), b'') for digest in digests)
+                items.sort()
+                num_pending = len(items)
+                cur.putmulti(items, dupdata=False, overwrite=True)
+            spec = {
+                'operation': operation,
+                'remote': remote,
+                'meta': meta,
+                'started': time.time(),
+                'elapsed': 0.0,
+                'num_pending': num_pending,
+                'num_completed': 0,
+                'num_resumes': 0,
+            }
+            txn.put(f'r:{run_key}'.encode(), _dumps(spec))
+
+    def resume_run(self, run_key: str) -> Optional[Tuple[dict, Dict[str, List[str]]]]:
+        """Read back the meta info and pending items of an unfinished run.
+
+        Returns
+        -------
+        Optional[Tuple[dict, Dict[str, List[str]]]]
+            None if no unfinished run exists with this key, otherwise two-tuple
+            of meta values recorded for the run and map of group -> pending
+            digests.
+        """
+        pending = {}
+        with self._env.begin(write=True) as txn:
+            if txn.get(f'r:{run_key}'.encode()) is None:
+                return None
+            with self._update_run(txn, run_key) as spec:
+                spec['num_resumes'] += 1
+                spec['started'] = time.time()
+                meta = spec['meta']
+            prefix = self._pending_prefix(run_key)
+            with txn.cursor() as cur:
+                isRec = cur.set_range(prefix)
+                while isRec and cur.key().startswith(prefix):
+                    group, digest = cur.key()[len(prefix):].decode().split(':', 1)
+                    pending.setdefault(group, []).append(digest)
+                    isRec = cur.next()
+        return meta, pending
+
+    def update_meta(self, run_key: str, **meta):
+        """Overwrite some meta values recorded for a run.
+        """
+        with self._env.begin(write=True) as txn:
+            with self._update_run(txn, run_key) as spec:
+                spec['meta'].update(meta)
+
+    def checkpoint(self, run_key: str, group: str, digests: Iterable[str]):
+        """Mark items in a group as completed (durably transferred).
+        """
+        prefix = self._pending_prefix(run_key, group)
+        num_completed = 0
+        with self._env.begin(write=True) as txn:
+            for digest in digests:
+                num_completed += txn.delete(prefix + digest.encode())
+            with self._update_run(txn, run_key) as spec:
+                spec['num_completed'] += num_completed
+
+    def finish_run(self, run_key: str) -> TransferSummary:
+        """Remove a completed run from the journal, recording its throughput summary.
+        """
+        finished = time.time()
+        with self._env.begin(write=True) as txn:
+            runKey = f'r:{run_key}'.encode()
+            spec = _loads(txn.get(runKey))
+            txn.delete(runKey)
+            prefix = self._pending_prefix(run_key)
+            with txn.cursor() as cur:
+                isRec = cur.set_range(prefix)
+                while isRec and cur.key().startswith(prefix):
+                    isRec = cur.delete()
+
+            elapsed = spec['elapsed'] + (finished - spec['started'])
+            num_samples = spec['num_completed']
+            summary = TransferSummary(
+                run_key=run_key,
+                operation=spec['operation'],
+                remote=spec['remote'],
+                num_samples=num_samples,
+                elapsed=elapsed,
+                samples_per_sec=(num_samples / elapsed) if elapsed > 0 else 0.0,
+                num_resumes=spec['num_resumes'],
+                finished=finished)
+            txn.put(f's:{finished:017.6f}:{run_key}'.encode(), _dumps(summary._asdict()))
+        return summary
+
+    def suspend_run(self, run_key: str):
+        """Accumulate time spent in a run which is being interrupted.
+        """
+        with self._env.begin(write=True) as txn:
+            if txn.get(f'r:{run_key}'.encode()) is None:
+                return
+            with self._update_run(txn, run_key) as spec:
+                spec['elapsed'] += time.time() - spec['started']
+
+    def summaries(self) -> List[TransferSummary]:
+        """Throughput summaries of all finished runs, oldest first.
+        """
+        res = []
+        with self._env.begin(write=False) as txn:
+            with txn.cursor() as cur:
+                isRec = cur.set_range(b's:')
+                while isRec and cur.key().startswith(b's:'):
+                    res.append(TransferSummary(**_loads(cur.value())))
+                    isRec = cur.next()
+        return res
@@ -0,0 +1,281 @@
+"""Partial clone filters selecting the samples a clone of a remote transfers.
+
+A partial clone only asks the server about the samples it is interested in:
+some columns, sample keys with a prefix or within a range, and samples no
+larger than some size. The filter is sent along with the requests negotiating
+data hash records and selecting data to fetch, so the server only sends the
+records (and later the data) of selected samples.
+
+Commit references are always transferred in full; the digest of a commit
+covers every record it references, and checkouts verify it. Samples which
+are not selected are referenced locally without contacting the server (the
+data digest and schema of every sample is listed in the commit references),
+so they appear in checkouts as samples whose data lives on the remote.
+"""
+import json
+import os
+import tempfile
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+import lmdb
+import numpy as np
+
+from ..backends import backend_decoder
+from ..constants import LMDB_SETTINGS
+from ..records import (
+    hash_data_db_key_from_raw_key,
+    hash_schema_db_key_from_raw_key,
+    schema_spec_from_db_val,
+)
+from ..records.hashs import HashQuery
+from ..records.parsing import commit_ref_raw_val_from_db_val
+from ..records.queries import RecordQuery
+from ..txnctx import TxnRegister
+
+KeyType = Union[str, int]
+
+
+class PartialCloneFilter(NamedTuple):
+    """Samples selected by a partial clone.
+
+    A sample is selected if its column is listed in ``columns``, its key
+    starts with one of the ``key_prefixes`` or lies within one of the
+    ``key_ranges``, and its data is no larger than ``max_sample_nbytes``.
+    Options set to None do not restrict the selection.
+
+    Attributes
+    ----------
+    columns
+        names of the columns to select samples from.
+    key_prefixes
+        prefixes of (the string form of) selected sample keys.
+    key_ranges
+        ``(start, stop)`` half open ranges of selected sample keys. Only keys
+        of the same type as the bounds (``str`` or ``int``) are in a range.
+    max_sample_nbytes
+        maximum size of the data of a selected sample. Only the size of
+        ndarray samples is known when records are selected; string and bytes
+        samples always pass this check.
+    """
+    columns: Optional[Tuple[str, ...]] = None
+    key_prefixes: Optional[Tuple[str, ...]] = None
+    key_ranges: Optional[Tuple[Tuple[KeyType, KeyType], ...]] = None
+    max_sample_nbytes: Optional[int] = None
+
+    def selects_key(self, key: KeyType) -> bool:
+        if (self.key_prefixes is None) and (self.key_ranges is None):
+            return True
+        if any(str(key).startswith(prefix) for prefix in (self.key_prefixes or ())):
+            return True
+        for start, stop in (self.key_ranges or ()):
+            if isinstance(key, type(start)) and (start <= key < stop):
+                return True
+        return False
+
+
+def normalize_filter(filt: Optional[PartialCloneFilter]) -> Optional[PartialCloneFilter]:
+    """Validate a filter, converting its options to sorted tuples.
+
+    Parameters
+    ----------
+    filt
+        filter to validate.
+
+    Returns
+    -------
+    Optional[PartialCloneFilter]
+        equivalent filter, or None if ``filt`` is None or selects every sample.
+
+    Raises
+    ------
+    TypeError
+        if ``filt`` is not a :class:`PartialCloneFilter`, or an option has
+        the wrong type.
+    ValueError
+        if a key range or the maximum sample size is invalid.
+    """
+    if filt is None:
+        return None
+    if not isinstance(filt, PartialCloneFilter):
+        raise TypeError(f'filter: {filt} must be a PartialCloneFilter')
+
+    columns, key_prefixes, key_ranges = filt.columns, filt.key_prefixes, filt.key_ranges
+    if columns is not None:
+        if isinstance(columns, str) or not all(isinstance(col, str) for col in columns):
+            raise TypeError(f'columns: {columns} must be a sequence of str')
+        columns = tuple(sorted(set(columns)))
+    if key_prefixes is not None:
+        if isinstance(key_prefixes, str) or not all(isinstance(p, str) for p in key_prefixes):
+            raise TypeError(f'key_prefixes: {key_prefixes} must be a sequence of str')
+        key_prefixes = tuple(sorted(set(key_prefixes)))
+    if key_ranges is not None:
+        ranges = set()
+        for key_range in key_ranges:
+            try:
+                start, stop = key_range
+            except (TypeError, ValueError):
+                raise TypeError(f'key range: {key_range} must be a (start, stop) pair')
+            if (type(start) not in (str, int)) or (type(start) is not type(stop)):
+                raise TypeError(f'key range: {key_range} bounds must both be str or int')
+            if not (start <= stop):
+                raise ValueError(f'key range: {key_range} start must be <= stop')
+            ranges.add((start, stop))
+        key_ranges = tuple(sorted(ranges, key=lambda r: (isinstance(r[0], str), r)))
+    max_sample_nbytes = filt.max_sample_nbytes
+    if max_sample_nbytes is not None:
+        if isinstance(max_sample_nbytes, bool) or not isinstance(max_sample_nbytes, int):
+            raise TypeError(f'max_sample_nbytes: {max_sample_nbytes} must be int')
+        if max_sample_nbytes < 0:
+            raise ValueError(f'max_sample_nbytes: {max_sample_nbytes} must be >= 0')
+
+    filt = PartialCloneFilter(columns, key_prefixes, key_ranges, max_sample_nbytes)
+    if filt == PartialCloneFilter():
+        return None
+    return filt
+
+
+def filter_to_json(filt: Optional[PartialCloneFilter]) -> str:
+    """Serialize a filter for the wire (or local storage); '' for no filter.
+    """
+    if filt is None:
+        return ''
+    return json.dumps(filt._asdict(), sort_keys=True)
+
+
+def filter_from_json(raw: str) -> Optional[PartialCloneFilter]:
+    """Deserialize a filter created by :func:`filter_to_json`.
+
+    Raises
+    ------
+    ValueError
+        if ``raw`` does not describe a valid filter.
+    """
+    if not raw:
+        return None
+    try:
+        opts = json.loads(raw)
+        if opts.get('key_ranges') is not None:
+            opts['key_ranges'] = [tuple(key_range) for key_range in opts['key_ranges']]
+        filt = PartialCloneFilter(**opts)
+    except (TypeError, ValueError, AttributeError) as e:
+        raise ValueError(f'invalid partial clone filter: {raw}') from e
+    return normalize_filter(filt)
+
+
+def select_data_hash_to_schema_hash(recQuery: RecordQuery,
+                                    filt: Optional[PartialCloneFilter]) -> Dict[str, str]:
+    """Map data digest -> schema digest of samples in a commit selected by the columns and keys of a filter.
+
+    The size of samples is not considered, see :func:`drop_oversized`.
+
+    Parameters
+    ----------
+    recQuery
+        record query over the unpacked commit references.
+    filt
+        filter selecting samples; None selects every sample.
+
+    Returns
+    -------
+    Dict[str, str]
+        data digest -> schema digest of every selected sample.
+    """
+    if filt is None:
+        return recQuery.data_hash_to_schema_hash()
+
+    col_schema_digests = {k.column: v.digest for k, v in recQuery.schema_specs().items()}
+    selected = {}
+    for column in recQuery.column_names():
+        if (filt.columns is not None) and (column not in filt.columns):
+            continue
+        schema_hash = col_schema_digests[column]
+        for keyRecord, dataRecord in recQuery.column_data_records(column):
+            if filt.selects_key(keyRecord.sample):
+                selected[dataRecord.digest] = schema_hash
+    return selected
+
+
+def drop_oversized(filt: Optional[PartialCloneFilter],
+                   hash_schemas: Dict[str, str],
+                   hashenv: lmdb.Environment) -> Dict[str, str]:
+    """Remove samples larger than the maximum sample size of a filter.
+
+    Parameters
+    ----------
+    filt
+        filter selecting samples; None keeps every sample.
+    hash_schemas
+        data digest -> schema digest of candidate samples.
+    hashenv
+        db where the hash records of the samples (and the schemas) are stored.
+
+    Returns
+    -------
+    Dict[str, str]
+        data digest -> schema digest of samples whose size is unknown or
+        within the limit.
+    """
+    if (filt is None) or (filt.max_sample_nbytes is None):
+        return hash_schemas
+
+    itemsizes = {}
+    kept = {}
+    hashTxn = TxnRegister().begin_reader_txn(hashenv)
+    try:
+        for schema_hash in set(hash_schemas.values()):
+            schemaVal = hashTxn.get(hash_schema_db_key_from_raw_key(schema_hash))
+            if schemaVal is not None:
+                schema = schema_spec_from_db_val(schemaVal)
+                if schema.get('column_type') == 'ndarray':
+                    itemsizes[schema_hash] = np.dtype(schema['dtype']).itemsize
+        for digest, schema_hash in hash_schemas.items():
+            hashVal = hashTxn.get(hash_data_db_key_from_raw_key(digest))
+            shape = None
+            if (schema_hash in itemsizes) and (hashVal is not None):
+                shape = getattr(backend_decoder(hashVal), 'shape', None)
+            if shape is not None:
+                nbytes = int(np.prod(shape, dtype=np.int64)) * itemsizes[schema_hash]
+                if nbytes > filt.max_sample_nbytes:
+                    continue
+            kept[digest] = schema_hash
+    finally:
+        TxnRegister().abort_reader_txn(hashenv)
+    return kept
+
+
+def unrecorded_references(refVals: Iterable[bytes],
+                          hashenv: lmdb.Environment) -> Dict[str, str]:
+    """Samples referenced by commit records which have no local data hash record.
+
+    Parameters
+    ----------
+    refVals
+        db values of the references of fetched commits.
+    hashenv
+        db where local data hash records are stored.
+
+    Returns
+    -------
+    Dict[str, str]
+        data digest -> schema digest of every referenced sample without a
+        local hash record.
+    """
+    hash_schemas = {}
+    with tempfile.TemporaryDirectory() as tempD:
+        tmpDB = lmdb.open(path=os.path.join(tempD, 'test.lmdb'), **LMDB_SETTINGS)
+        try:
+            for refVal in refVals:
+                with tmpDB.begin(write=True) as txn:
+                    with txn.cursor() as curs:
+                        notEmpty = curs.first()
+                        while notEmpty:
+                            notEmpty = curs.delete()
+                        curs.putmulti(commit_ref_raw_val_from_db_val(refVal).db_kvs, append=True)
+                hash_schemas.update(RecordQuery(tmpDB).data_hash_to_schema_hash())
+        finally:
+            tmpDB.close()
+
+    keyDigests = {hash_data_db_key_from_raw_key(digest): digest for digest in hash_schemas}
+    existing = HashQuery(hashenv).intersect_keys_db(set(keyDigests))
+    return {digest: hash_schemas[digest]
+            for key, digest in keyDigests.items() if key not in existing}
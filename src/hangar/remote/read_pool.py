@@ -0,0 +1,179 @@
+"""Read and compress sample data for the server in a pool of worker processes.
+
+When serving ``FetchDataBatch`` in the server process, every request reads
+samples through the same backend accessors (HDF5 reads are serialized by the
+h5py global lock) and compresses frames under the GIL of that one process, so
+a single server cannot saturate a fast link for many concurrent clones. The
+:class:`ShardedReadPool` splits the samples of a request into shards which are
+read and packed into compressed frames by worker processes, each of which
+opens its own set of read-only backend accessors. The server process is left
+to look up hash records and move bytes over the wire.
+"""
+import math
+import multiprocessing as mp
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+from . import chunks
+from .codecs import DEFAULT_CODEC
+from ..backends import backend_decoder
+from ..backends.worker import WORKER_ACCESSORS, open_worker_accessors
+from ..utils import set_blosc_nthreads
+
+# maximum number of samples read and packed by a worker in a single task.
+DEFAULT_SHARD_SIZE = 250
+
+
+def _init_read_worker(repo_path: str):
+    """Open read-only backend accessors in a newly started worker process.
+    """
+    set_blosc_nthreads()
+    open_worker_accessors(repo_path, local_only=False)
+
+
+def _read_and_pack_shard(shard: Sequence[Tuple[str, bytes]],
+                         max_frame_nbytes: int,
+                         codec: str,
+                         raw_chunks: bool = False) -> List[Tuple[bytes, int]]:
+    """Read the samples of a shard and pack them into compressed frames.
+
+    Parameters
+    ----------
+    shard
+        two-tuples of (digest, hash record value) of samples to read, in the
+        order they should appear in the frames.
+    max_frame_nbytes
+        maximum number of uncompressed bytes to pack into a frame.
+    codec
+        name of the wire codec frames are compressed with.
+    raw_chunks
+        if True, samples stored in the ``HDF5_01`` backend are packed as the
+        compressed chunks read from disk rather than decompressed arrays.
+
+    Returns
+    -------
+    List[Tuple[bytes, int]]
+        compressed frames and the number of records packed within each.
+    """
+    def records_iterator():
+        for uri, hashVal in shard:
+            spec = backend_decoder(hashVal)
+            if raw_chunks and (spec.backend == '01'):
+                yield WORKER_ACCESSORS[spec.backend].read_raw_chunks(spec), uri
+            else:
+                yield WORKER_ACCESSORS[spec.backend].read_data(spec), uri
+
+    return list(chunks.pack_record_frames(records_iterator(), max_frame_nbytes, codec))
+
+
+class ShardedReadPool(object):
+    """Pool of worker processes which read and compress requested samples.
+
+    Parameters
+    ----------
+    repo_path
+        path to the server repository (the directory backend accessors open).
+    num_workers
+        number of worker processes to start.
+    shard_size
+        maximum number of samples read and packed by a worker in one task.
+        Large requests are split into shards of at most this size so every
+        worker contributes and the frames buffered per request stay bounded.
+    """
+
+    def __init__(self, repo_path: Union[str, Path], num_workers: int, *,
+                 shard_size: int = DEFAULT_SHARD_SIZE):
+        if num_workers < 1:
+            raise ValueError(f'num_workers: {num_workers} must be >= 1')
+        if shard_size < 1:
+            raise ValueError(f'shard_size: {shard_size} must be >= 1')
+        self.num_workers = num_workers
+        self.shard_size = shard_size
+        # grpc does not support forking a process once the server is running.
+        self._pool = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=mp.get_context('spawn'),
+            initializer=_init_read_worker,
+            initargs=(str(repo_path),))
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def _shards(self, records: List[Tuple[str, bytes]]) -> Iterator[List[Tuple[str, bytes]]]:
+        size = min(self.shard_size, max(1, math.ceil(len(records) / self.num_workers)))
+        for start in range(0, len(records), size):
+            yield records[start:start + size]
+
+    def packed_shards(self, shards: Iterable[Sequence[Tuple[str, bytes]]],
+                      max_frame_nbytes: int,
+                      codec: str = DEFAULT_CODEC, *,
+                      raw_chunks: bool = False) -> Iterator[List[Tuple[bytes, int]]]:
+        """Frames packed from each shard, in shard order.
+
+        Shards are read concurrently by the workers; at most two shards per
+        worker are in flight (or buffered) at a time, so the stream is only
+        read ahead of the consumer by a bounded amount.
+
+        Parameters
+        ----------
+        shards
+            sequences of (digest, hash record value) of samples to pack together.
+        max_frame_nbytes
+            maximum number of uncompressed bytes to pack into a frame.
+        codec
+            name of the wire codec frames are compressed with.
+        raw_chunks
+            if True, pack the compressed chunks of ``HDF5_01`` samples.
+
+        Yields
+        ------
+        List[Tuple[bytes, int]]
+            compressed frames (and the number of records packed within each)
+            of the next shard.
+        """
+        shards = iter(shards)
+        pending = deque(
+            self._pool.submit(_read_and_pack_shard, shard, max_frame_nbytes, codec, raw_chunks)
+            for shard in islice(shards, 2 * self.num_workers))
+        try:
+            while pending:
+                future = pending.popleft()
+                for shard in islice(shards, 1):
+                    pending.append(
+                        self._pool.submit(
+                            _read_and_pack_shard, shard, max_frame_nbytes, codec, raw_chunks))
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def frames(self, uris: Sequence[str], hashVals: Sequence[bytes],
+               max_frame_nbytes: int,
+               codec: str = DEFAULT_CODEC, *,
+               raw_chunks: bool = False) -> Iterator[Tuple[bytes, int]]:
+        """Compressed frames of the requested samples, in request order.
+
+        Parameters
+        ----------
+        uris
+            digests of samples to send.
+        hashVals
+            hash record value of each sample in ``uris``.
+        max_frame_nbytes
+            maximum number of uncompressed bytes to pack into a frame.
+        codec
+            name of the wire codec frames are compressed with.
+        raw_chunks
+            if True, pack the compressed chunks of ``HDF5_01`` samples.
+
+        Yields
+        ------
+        Tuple[bytes, int]
+            compressed frame and the number of records packed within it.
+        """
+        shards = self._shards(list(zip(uris, hashVals)))
+        for frames in self.packed_shards(shards, max_frame_nbytes, codec, raw_chunks=raw_chunks):
+            yield from frames
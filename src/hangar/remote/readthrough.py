@@ -0,0 +1,191 @@
+"""Lazy retrieval of remote referenced samples as they are read from a checkout.
+
+Normally, samples which only exist on a remote server (``REMOTE_50`` backend
+specs) must be downloaded with ``fetch_data`` before they can be read. When a
+reader checkout is opened with ``read_through_remote`` set, reading such a
+sample instead asks the :class:`RemoteReadThrough` object for it. A miss
+fetches the requested sample along with (up to ``batch_size``) samples which
+were hinted to be read soon, writes them into the local store exactly as
+``fetch_data`` would, and reads the sample back from its local backend. Every
+subsequent read of those samples (from this or any other checkout) is served
+locally.
+
+Hints are provided by the dataset iterators in :mod:`hangar.dataset`, which
+pass along the order samples will be read in each epoch.
+"""
+from collections import deque, defaultdict
+from threading import RLock
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from tqdm import tqdm
+
+from .client import HangarClient
+from .content import DataWriter
+from ..backends import backend_decoder
+from ..columns.common import open_file_handles
+from ..records import hash_data_db_key_from_raw_key
+from ..records.commiting import move_process_data_to_store
+from ..txnctx import TxnRegister
+
+if TYPE_CHECKING:
+    from ..backends.remote_50 import REMOTE_50_ReferenceSpec
+    from ..context import Environments
+
+# maximum number of samples retrieved from the server on a single read miss.
+DEFAULT_BATCH_SIZE = 64
+
+
+class RemoteReadThrough(object):
+    """Fetch remote referenced samples from a server on first access.
+
+    Parameters
+    ----------
+    envs
+        main hangar environment context object.
+    address
+        address of the hangar server samples are retrieved from.
+    batch_size
+        maximum number of samples (the miss plus hinted samples) requested
+        from the server at a time.
+    """
+
+    def __init__(self, envs: 'Environments', address: str, *,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError(f'batch_size: {batch_size} must be >= 1')
+        self.env = envs
+        self.address = address
+        self.batch_size = batch_size
+        self.txnctx = TxnRegister()
+
+        self._lock = RLock()
+        self._client: Optional[HangarClient] = None
+        self._accessors: Dict[Tuple[str, str], object] = {}
+        self.num_fetched = 0
+        self.num_requests = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._close_accessors()
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _close_accessors(self):
+        for accessor in self._accessors.values():
+            accessor.close()
+        self._accessors.clear()
+
+    def bind(self, schema) -> 'ColumnReadThrough':
+        """Read-through object for a single column which knows its schema.
+        """
+        return ColumnReadThrough(self, schema)
+
+    def _local_spec(self, digest: str):
+        hashTxn = self.txnctx.begin_reader_txn(self.env.hashenv)
+        try:
+            hashVal = hashTxn.get(hash_data_db_key_from_raw_key(digest))
+        finally:
+            self.txnctx.abort_reader_txn(self.env.hashenv)
+        return backend_decoder(hashVal)
+
+    def _select_batch(self, spec: 'REMOTE_50_ReferenceSpec',
+                      pending: deque) -> Dict[str, List[str]]:
+        """Group the miss and next pending specs not yet local by schema digest.
+        """
+        batch = defaultdict(list)
+        batch[spec.schema_hash].append(spec.digest)
+        seen = {spec.digest}
+        while pending and (len(seen) < self.batch_size):
+            hinted = pending.popleft()
+            if hinted.digest in seen or self._local_spec(hinted.digest).islocal:
+                continue
+            seen.add(hinted.digest)
+            batch[hinted.schema_hash].append(hinted.digest)
+        return batch
+
+    def _fetch(self, spec: 'REMOTE_50_ReferenceSpec', pending: deque):
+        if self._client is None:
+            self._client = HangarClient(envs=self.env, address=self.address)
+        batch = self._select_batch(spec, pending)
+        num_data = sum(len(digests) for digests in batch.values())
+        with tqdm(total=num_data, disable=True) as pbar:
+            for schema_hash, digests in batch.items():
+                origins = self._client.fetch_data_origin(digests)
+                with DataWriter(self.env) as DW_CM:
+                    self._client.fetch_data(
+                        origins=origins, datawriter_cm=DW_CM, schema=schema_hash, pbar=pbar)
+        move_process_data_to_store(self.env.repo_path, remote_operation=True)
+        # newly written files are only visible to accessors opened after the move.
+        self._close_accessors()
+        self.num_fetched += num_data
+        self.num_requests += 1
+
+    def read(self, spec: 'REMOTE_50_ReferenceSpec', *, schema, pending: Optional[deque] = None):
+        """Read data of a remote referenced sample, fetching it if not yet local.
+
+        Parameters
+        ----------
+        spec
+            remote reference spec recorded for the sample in the checkout.
+        schema
+            column schema object the sample belongs to.
+        pending
+            remote specs hinted to be read next; consumed as they are fetched
+            alongside a miss.
+
+        Returns
+        -------
+        Any
+            data stored for the sample.
+        """
+        with self._lock:
+            be_loc = self._local_spec(spec.digest)
+            if not be_loc.islocal:
+                self._fetch(spec, pending if pending is not None else deque())
+                be_loc = self._local_spec(spec.digest)
+                if not be_loc.islocal:
+                    raise FileNotFoundError(
+                        f'data digest: {spec.digest} was not retrieved from remote: '
+                        f'{self.address}')
+
+            key = (schema.schema_hash_digest(), be_loc.backend)
+            if key not in self._accessors:
+                self._accessors[key] = open_file_handles(
+                    backends={be_loc.backend},
+                    path=self.env.repo_path,
+                    mode='r',
+                    schema=schema)[be_loc.backend]
+            return self._accessors[key].read_data(be_loc)
+
+
+class ColumnReadThrough(object):
+    """Binds a :class:`RemoteReadThrough` to the schema of a single column.
+
+    Instances are set as the ``read_through`` attribute of a column's
+    ``REMOTE_50`` backend handle, and hold the specs hinted for the column.
+    """
+
+    __slots__ = ('_fetcher', '_schema', '_pending')
+
+    def __init__(self, fetcher: RemoteReadThrough, schema):
+        self._fetcher = fetcher
+        self._schema = schema
+        self._pending = deque()
+
+    def hint(self, specs: Iterable['REMOTE_50_ReferenceSpec']):
+        """Set the remote specs which are expected to be read next (in order).
+
+        Replaces any previous hint. Hinted samples are requested from the server
+        alongside the next read miss.
+        """
+        self._pending = deque(spec for spec in specs if hasattr(spec, 'digest'))
+
+    def read(self, spec: 'REMOTE_50_ReferenceSpec'):
+        return self._fetcher.read(spec, schema=self._schema, pending=self._pending)
@@ -0,0 +1,220 @@
+"""Set reconciliation of hash digests via invertible bloom lookup tables.
+
+Rather than sending every digest referenced by a commit to the other side of a
+connection, each side summarizes its digests in an invertible bloom lookup
+table (IBLT) with a fixed number of cells. Subtracting one table from the other
+cancels out every digest both sides share; the (small) symmetric difference
+which remains can be "peeled" back out of the table so long as the table has
+roughly 1.5x as many cells as there are differing digests. The size of the
+exchanged table is therefore proportional to the size of the difference, not
+to the number of digests in the commit.
+
+Digests are mapped to 128 bit fingerprints (two ``uint64`` values) and a third
+``uint64`` checksum which is used to verify that a cell holds exactly one
+fingerprint while peeling. All table operations are vectorized with numpy.
+"""
+from hashlib import blake2b
+from typing import List, Optional, Sequence, Tuple
+
+import blosc
+import numpy as np
+
+# number of cells each fingerprint is inserted into.
+NUM_HASH_FUNCS = 3
+# bytes needed to store a single cell (count, key0, key1, checksum)
+CELL_NBYTES = 32
+# smallest table which is sent to the other side of a connection.
+MIN_NUM_CELLS = 1_024
+# number of cells required per element in the symmetric difference to decode
+# with high probability when using three hash functions.
+CELLS_PER_DIFF = 1.5
+
+_M1 = np.uint64(0xbf58476d1ce4e5b9)
+_M2 = np.uint64(0x94d049bb133111eb)
+_S30, _S27, _S31 = np.uint64(30), np.uint64(27), np.uint64(31)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer; integer overflow in uint64 arrays wraps silently.
+    """
+    x = x ^ (x >> _S30)
+    x = x * _M1
+    x = x ^ (x >> _S27)
+    x = x * _M2
+    return x ^ (x >> _S31)
+
+
+def _checksum(key0: np.ndarray, key1: np.ndarray) -> np.ndarray:
+    return _mix64(key0 ^ _mix64(key1))
+
+
+def _cell_indices(key0: np.ndarray, key1: np.ndarray, num_cells: int) -> np.ndarray:
+    """Index of the cell in each (disjoint) table partition a fingerprint maps to.
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (NUM_HASH_FUNCS, len(key0)).
+    """
+    sub_cells = num_cells // NUM_HASH_FUNCS
+    res = np.empty((NUM_HASH_FUNCS, len(key0)), dtype=np.int64)
+    for i in range(NUM_HASH_FUNCS):
+        h = _mix64(key0 + (key1 * np.uint64(i + 1)))
+        res[i] = (h % np.uint64(sub_cells)).astype(np.int64) + (i * sub_cells)
+    return res
+
+
+def digest_fingerprints(digests: Sequence[str]) -> np.ndarray:
+    """Compute 128 bit fingerprint of each digest.
+
+    Returns
+    -------
+    np.ndarray
+        uint64 array of shape (len(digests), 2)
+    """
+    raw = b''.join([blake2b(d.encode(), digest_size=16).digest() for d in digests])
+    return np.frombuffer(raw, dtype='<u8').reshape(-1, 2).astype(np.uint64)
+
+
+def table_num_cells(num_diff: int) -> int:
+    """Number of cells to use for a table expected to decode ``num_diff`` items.
+    """
+    num_cells = max(MIN_NUM_CELLS, int(num_diff * CELLS_PER_DIFF))
+    return num_cells + (-num_cells % NUM_HASH_FUNCS)
+
+
+class InvertibleBloomTable(object):
+    """Invertible bloom lookup table storing digest fingerprints.
+
+    Parameters
+    ----------
+    num_cells
+        number of cells in the table, must be a multiple of ``NUM_HASH_FUNCS``.
+    """
+
+    def __init__(self, num_cells: int):
+        if (num_cells <= 0) or (num_cells % NUM_HASH_FUNCS):
+            raise ValueError(f'num_cells: {num_cells} not multiple of {NUM_HASH_FUNCS}')
+        self.num_cells = num_cells
+        self.count = np.zeros(num_cells, dtype=np.int64)
+        self.key0 = np.zeros(num_cells, dtype=np.uint64)
+        self.key1 = np.zeros(num_cells, dtype=np.uint64)
+        self.check = np.zeros(num_cells, dtype=np.uint64)
+
+    @classmethod
+    def from_fingerprints(cls, fingerprints: np.ndarray, num_cells: int) -> 'InvertibleBloomTable':
+        table = cls(num_cells)
+        table._update(fingerprints[:, 0], fingerprints[:, 1], 1)
+        return table
+
+    def _update(self, key0: np.ndarray, key1: np.ndarray, sign: int):
+        check = _checksum(key0, key1)
+        for idxs in _cell_indices(key0, key1, self.num_cells):
+            self.count += np.bincount(idxs, minlength=self.num_cells) * sign
+            np.bitwise_xor.at(self.key0, idxs, key0)
+            np.bitwise_xor.at(self.key1, idxs, key1)
+            np.bitwise_xor.at(self.check, idxs, check)
+
+    def subtract(self, other: 'InvertibleBloomTable') -> 'InvertibleBloomTable':
+        """Table holding only fingerprints which are in one of ``self`` / ``other``.
+        """
+        if other.num_cells != self.num_cells:
+            raise ValueError(f'num_cells mismatch {self.num_cells} != {other.num_cells}')
+        res = InvertibleBloomTable(self.num_cells)
+        res.count = self.count - other.count
+        res.key0 = self.key0 ^ other.key0
+        res.key1 = self.key1 ^ other.key1
+        res.check = self.check ^ other.check
+        return res
+
+    def decode(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Peel fingerprints out of a (subtracted) table.
+
+        Returns
+        -------
+        Optional[Tuple[np.ndarray, np.ndarray]]
+            None if the table could not be fully decoded (ie. it is too small to
+            hold the difference). Otherwise two-tuple of fingerprint arrays which
+            were only inserted into the left (``self``) and right (``other``)
+            side of the subtraction.
+        """
+        count, key0, key1, check = self.count.copy(), self.key0.copy(), self.key1.copy(), self.check.copy()
+        left, right = [], []
+        pure = list(np.flatnonzero((np.abs(count) == 1) & (_checksum(key0, key1) == check)))
+        while pure:
+            cell = pure.pop()
+            if abs(count[cell]) != 1:
+                continue
+            k0, k1 = key0[cell:cell + 1].copy(), key1[cell:cell + 1].copy()
+            c = _checksum(k0, k1)
+            if c[0] != check[cell]:
+                continue
+            sign = int(count[cell])
+            (left if sign == 1 else right).append((k0[0], k1[0]))
+            for idx in _cell_indices(k0, k1, self.num_cells)[:, 0]:
+                count[idx] -= sign
+                key0[idx] ^= k0[0]
+                key1[idx] ^= k1[0]
+                check[idx] ^= c[0]
+                if abs(count[idx]) == 1:
+                    pure.append(idx)
+
+        if count.any() or key0.any() or key1.any() or check.any():
+            return None
+        left = np.array(left, dtype=np.uint64).reshape(-1, 2)
+        right = np.array(right, dtype=np.uint64).reshape(-1, 2)
+        return left, right
+
+    def to_bytes(self) -> bytes:
+        raw = np.concatenate([self.count.view(np.uint64), self.key0, self.key1, self.check])
+        return blosc.compress(raw.tobytes(), typesize=8, clevel=3, cname='blosclz',
+                              shuffle=blosc.SHUFFLE)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes, num_cells: int) -> 'InvertibleBloomTable':
+        arr = np.frombuffer(blosc.decompress(raw), dtype=np.uint64)
+        if arr.size != (4 * num_cells):
+            raise ValueError(f'table of size {arr.size} does not have num_cells: {num_cells}')
+        table = cls(num_cells)
+        count, table.key0, table.key1, table.check = (a.copy() for a in np.split(arr, 4))
+        table.count = count.view(np.int64)
+        return table
+
+
+class FingerprintedDigests(object):
+    """Digests of one side of a reconciliation along with their fingerprints.
+
+    Parameters
+    ----------
+    digests
+        hash digests which are summarized.
+    """
+
+    def __init__(self, digests: Sequence[str]):
+        self.digests = list(digests)
+        self.fingerprints = digest_fingerprints(self.digests)
+        self._order = None
+
+    def __len__(self):
+        return len(self.digests)
+
+    def table(self, num_cells: int) -> InvertibleBloomTable:
+        return InvertibleBloomTable.from_fingerprints(self.fingerprints, num_cells)
+
+    def lookup(self, fingerprints: np.ndarray) -> List[str]:
+        """Digests corresponding to (decoded) fingerprints; unknown values are skipped.
+        """
+        if len(self.digests) == 0 or len(fingerprints) == 0:
+            return []
+        if self._order is None:
+            self._order = np.lexsort((self.fingerprints[:, 1], self.fingerprints[:, 0]))
+        sorted_fps = self.fingerprints[self._order]
+        pos = np.searchsorted(sorted_fps[:, 0], fingerprints[:, 0])
+        res = []
+        for p, (k0, k1) in zip(pos, fingerprints):
+            while p < len(sorted_fps) and sorted_fps[p, 0] == k0:
+                if sorted_fps[p, 1] == k1:
+                    res.append(self.digests[self._order[p]])
+                    break
+                p += 1
+        return res
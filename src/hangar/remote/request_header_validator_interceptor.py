@@ -30,20 +30,27 @@ import grpc
 SERVICE_METHOD_TYPES = {
     'PING': 'uu',
     'GetClientConfig': 'uu',
+    'GetServerStats': 'uu',
     'FetchBranchRecord': 'uu',
     'FetchData': 'us',
+    'FetchDataBatch': 'us',
     'FetchCommit': 'us',
     'FetchSchema': 'uu',
     'PushBranchRecord': 'uu',
     'PushData': 'su',
+    'PushDataBatch': 'su',
+    'PushDataReceived': 'uu',
     'PushCommit': 'su',
     'PushSchema': 'uu',
     'FetchFindMissingCommits': 'uu',
     'FetchFindMissingHashRecords': 'ss',
     'FetchFindMissingSchemas': 'uu',
+    'FetchReconcileHashRecords': 'ss',
+    'FetchFindFilteredData': 'us',
     'PushFindMissingCommits': 'uu',
     'PushFindMissingHashRecords': 'ss',
     'PushFindMissingSchemas': 'uu',
+    'PushReconcileHashRecords': 'ss',
     'FetchFindDataOrigin': 'ss',
     'PushFindDataOrigin': 'ss',
     'PushBeginContext': 'uu',
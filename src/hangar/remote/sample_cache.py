@@ -0,0 +1,202 @@
+"""Bounded cache of compressed sample payloads sent by the server.
+
+Sample data is content addressed, so the compressed bytes sent for a digest
+(or for an identical sequence of digests packed into frames) never change.
+When many clients clone the same commit at once, caching those wire payloads
+lets the server skip reading, serializing, and compressing the same samples
+for every client.
+
+Entries are kept in memory up to ``max_nbytes``, evicting the least recently
+used entry first. If a disk tier is configured, entries evicted from memory are
+written to files in ``disk_dir`` (up to ``disk_max_nbytes``, again evicting the
+least recently used), and are moved back into memory on their next hit.
+"""
+import hashlib
+import os
+import shutil
+import struct
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .chunks import serialize_record_pack, deserialize_record_pack
+
+
+def cache_key(method: str, codec: str, digests: Iterable[str]) -> str:
+    """Key identifying the payload sent for a sequence of digests.
+
+    Parameters
+    ----------
+    method
+        name of the rpc method (and any option changing the payload layout).
+    codec
+        name and options of the compressor used to create the payload.
+    digests
+        data digests packed into the payload, in order.
+
+    Returns
+    -------
+    str
+        hex digest identifying the payload.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f'{method}:{codec}'.encode())
+    for digest in digests:
+        hasher.update(b'\x00')
+        hasher.update(digest.encode())
+    return hasher.hexdigest()
+
+
+def pack_frames(frames: Iterable[Tuple[bytes, int]]) -> bytes:
+    """Serialize (frame, num_records) pairs into a single cache payload.
+    """
+    return serialize_record_pack(
+        [b''.join([struct.pack('<i', num_records), frame]) for frame, num_records in frames])
+
+
+def unpack_frames(payload: bytes) -> List[Tuple[bytes, int]]:
+    """Deserialize a payload created by :func:`pack_frames`.
+    """
+    return [(raw[4:], struct.unpack('<i', raw[:4])[0])
+            for raw in deserialize_record_pack(payload)]
+
+
+class CompressedSampleCache(object):
+    """Thread safe LRU cache of compressed payloads with an optional disk tier.
+
+    Parameters
+    ----------
+    max_nbytes
+        maximum size of payloads held in memory.
+    disk_dir
+        directory to write entries evicted from memory to. If None (default),
+        evicted entries are discarded. Any existing contents are removed.
+    disk_max_nbytes
+        maximum size of payloads held on disk.
+    """
+
+    def __init__(self, max_nbytes: int, *,
+                 disk_dir: Optional[Union[str, Path]] = None,
+                 disk_max_nbytes: int = 0):
+        if max_nbytes < 0:
+            raise ValueError(f'max_nbytes: {max_nbytes} must be >= 0')
+        if disk_max_nbytes < 0:
+            raise ValueError(f'disk_max_nbytes: {disk_max_nbytes} must be >= 0')
+        self.max_nbytes = max_nbytes
+        self.disk_max_nbytes = disk_max_nbytes if disk_dir is not None else 0
+        self.disk_dir: Optional[Path] = None
+        if self.disk_max_nbytes > 0:
+            self.disk_dir = Path(disk_dir)
+            if self.disk_dir.exists():
+                shutil.rmtree(self.disk_dir)
+            self.disk_dir.mkdir(parents=True)
+
+        self._lock = Lock()
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._disk: 'OrderedDict[str, int]' = OrderedDict()
+        self._nbytes = 0
+        self._disk_nbytes = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def close(self):
+        with self._lock:
+            self._memory.clear()
+            self._disk.clear()
+            self._nbytes = 0
+            self._disk_nbytes = 0
+            if self.disk_dir is not None:
+                shutil.rmtree(self.disk_dir, ignore_errors=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters describing cache use since it was created.
+
+        Returns
+        -------
+        Dict[str, int]
+            ``hits`` (served from memory or disk), ``disk_hits``, ``misses``,
+            ``evictions`` (entries discarded from the last tier), the number
+            and size of entries in each tier, and their configured maximums.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'num_entries': len(self._memory),
+                'nbytes': self._nbytes,
+                'max_nbytes': self.max_nbytes,
+                'disk_num_entries': len(self._disk),
+                'disk_nbytes': self._disk_nbytes,
+                'disk_max_nbytes': self.disk_max_nbytes,
+            }
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir.joinpath(key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Payload cached for a key, or None if it is not cached.
+        """
+        with self._lock:
+            try:
+                payload = self._memory[key]
+            except KeyError:
+                pass
+            else:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return payload
+
+            if key in self._disk:
+                pth = self._disk_path(key)
+                payload = pth.read_bytes()
+                self._disk_nbytes -= self._disk.pop(key)
+                os.remove(pth)
+                self._hits += 1
+                self._disk_hits += 1
+                self._put_memory(key, payload)
+                return payload
+
+            self._misses += 1
+            return None
+
+    def put(self, key: str, payload: bytes):
+        """Cache the payload for a key, evicting least recently used entries.
+
+        Payloads larger than both tiers are not cached.
+        """
+        payload = bytes(payload)
+        with self._lock:
+            if (key in self._memory) or (key in self._disk):
+                return
+            self._put_memory(key, payload)
+
+    def _put_memory(self, key: str, payload: bytes):
+        nbytes = len(payload)
+        if nbytes > self.max_nbytes:
+            self._put_disk(key, payload)
+            return
+        self._memory[key] = payload
+        self._nbytes += nbytes
+        while self._nbytes > self.max_nbytes:
+            old_key, old_payload = self._memory.popitem(last=False)
+            self._nbytes -= len(old_payload)
+            self._put_disk(old_key, old_payload)
+
+    def _put_disk(self, key: str, payload: bytes):
+        nbytes = len(payload)
+        if nbytes > self.disk_max_nbytes:
+            self._evictions += 1
+            return
+        self._disk_path(key).write_bytes(payload)
+        self._disk[key] = nbytes
+        self._disk_nbytes += nbytes
+        while self._disk_nbytes > self.disk_max_nbytes:
+            old_key, old_nbytes = self._disk.popitem(last=False)
+            os.remove(self._disk_path(old_key))
+            self._disk_nbytes -= old_nbytes
+            self._evictions += 1
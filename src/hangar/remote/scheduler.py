@@ -0,0 +1,393 @@
+"""Schedule the concurrent batches of a remote data transfer.
+
+Every data transfer (``fetch_data``, ``fetch_data_sample``, and ``push``) is
+split into batches of samples, each of which is sent in a single streaming
+rpc. Rather than keeping a fixed number of batches in flight, the
+:class:`TransferScheduler` adapts the concurrency to the throughput observed
+on the link, in the spirit of TCP congestion control (additive increase,
+multiplicative decrease): after every round of batches, concurrency grows by
+one while throughput keeps improving, holds once it plateaus, and is halved
+if throughput drops sharply or an rpc fails with a transient error (which is
+then retried). On a fast link the transfer quickly fans out; on a shared or
+congested one it backs off.
+
+A bandwidth cap (:class:`BandwidthLimiter`) can be set to keep a transfer
+from saturating a link shared with others. Batches are ordered so the largest
+samples are transferred first, keeping a single large sample from being the
+last (and only) thing in flight at the end of the transfer. Metrics of each
+run are collected in a :class:`TransferStats` object.
+"""
+import concurrent.futures
+import time
+from collections import defaultdict, deque
+from threading import Lock
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+)
+
+import blosc
+import grpc
+import numpy as np
+
+from ..utils import calc_num_threadpool_workers, parse_bytes
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# rpc status codes of transient failures; batches failing with these are retried.
+RETRYABLE_STATUS_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+})
+
+# relative throughput gain of a round of batches required to increase concurrency.
+INCREASE_THRESHOLD = 0.05
+# relative throughput loss of a round of batches which halves concurrency.
+DECREASE_THRESHOLD = 0.25
+
+
+def sample_size_hint(spec) -> int:
+    """Relative size of a sample at a backend location.
+
+    Parameters
+    ----------
+    spec
+        backend location spec of the sample.
+
+    Returns
+    -------
+    int
+        number of elements of array samples, 1 if the size is not recorded in
+        the spec (ie. string and bytes samples).
+    """
+    shape = getattr(spec, 'shape', None)
+    if shape is None:
+        return 1
+    return max(1, int(np.prod(shape, dtype=np.int64)))
+
+
+def largest_first_batches(items: Sequence[T], sizes: Sequence[int], key: Callable[[T], str],
+                          batch_size: int) -> List[List[T]]:
+    """Split items into batches, starting with the largest.
+
+    Items are ordered by decreasing size (ties broken by ``key`` so every
+    client requesting the same items forms the same batches), then split
+    into batches of ``batch_size`` items.
+    """
+    order = sorted(range(len(items)), key=lambda i: (-sizes[i], key(items[i])))
+    ordered = [items[i] for i in order]
+    return [ordered[i:i + batch_size] for i in range(0, len(ordered), batch_size)]
+
+
+class TransferStats(object):
+    """Thread safe metrics of a remote transfer run.
+
+    Attributes
+    ----------
+    operation
+        name of the transfer operation.
+    num_samples
+        number of samples transferred.
+    num_batches
+        number of batches (rpcs) completed.
+    nbytes
+        number of (compressed) bytes sent over the wire.
+    raw_nbytes
+        number of bytes before wire compression.
+    retries
+        number of batches retried after a transient failure.
+    max_concurrency
+        largest number of batches in flight at once.
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.num_samples = 0
+        self.num_batches = 0
+        self.nbytes = 0
+        self.raw_nbytes = 0
+        self.retries = 0
+        self.max_concurrency = 0
+        self._batch_seconds = 0.0
+        self._lock = Lock()
+        self._start = time.perf_counter()
+        self._elapsed: Optional[float] = None
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(operation={self.operation!r}, '
+                f'num_samples={self.num_samples}, nbytes={self.nbytes}, '
+                f'elapsed={self.elapsed:.3f}, samples_per_sec={self.samples_per_sec:.1f}, '
+                f'retries={self.retries}, compression_ratio={self.compression_ratio:.2f})')
+
+    def record_frame(self, frame: bytes):
+        """Add the size of a compressed frame (before and after compression).
+        """
+        nbytes = len(frame)
+        raw_nbytes = blosc.get_cbuffer_sizes(frame)[0]
+        with self._lock:
+            self.nbytes += nbytes
+            self.raw_nbytes += raw_nbytes
+
+    def record_samples(self, num_samples: int):
+        with self._lock:
+            self.num_samples += num_samples
+
+    def record_batch(self, seconds: float):
+        with self._lock:
+            self.num_batches += 1
+            self._batch_seconds += seconds
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_concurrency(self, num_in_flight: int):
+        with self._lock:
+            self.max_concurrency = max(self.max_concurrency, num_in_flight)
+
+    def finish(self) -> 'TransferStats':
+        """Stop the clock of the run.
+        """
+        if self._elapsed is None:
+            self._elapsed = time.perf_counter() - self._start
+        return self
+
+    @property
+    def elapsed(self) -> float:
+        if self._elapsed is None:
+            return time.perf_counter() - self._start
+        return self._elapsed
+
+    @property
+    def samples_per_sec(self) -> float:
+        return self.num_samples / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def nbytes_per_sec(self) -> float:
+        return self.nbytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Bytes before / after wire compression (1.0 if nothing was sent).
+        """
+        return self.raw_nbytes / self.nbytes if self.nbytes > 0 else 1.0
+
+    @property
+    def mean_batch_seconds(self) -> float:
+        """Average time from requesting a batch until it was completely transferred.
+        """
+        return self._batch_seconds / self.num_batches if self.num_batches > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Union[str, int, float]]:
+        return {
+            'operation': self.operation,
+            'num_samples': self.num_samples,
+            'num_batches': self.num_batches,
+            'nbytes': self.nbytes,
+            'raw_nbytes': self.raw_nbytes,
+            'retries': self.retries,
+            'max_concurrency': self.max_concurrency,
+            'elapsed': self.elapsed,
+            'samples_per_sec': self.samples_per_sec,
+            'nbytes_per_sec': self.nbytes_per_sec,
+            'compression_ratio': self.compression_ratio,
+            'mean_batch_seconds': self.mean_batch_seconds,
+        }
+
+
+class BandwidthLimiter(object):
+    """Thread safe token bucket limiting the rate bytes are transferred at.
+
+    Parameters
+    ----------
+    nbytes_per_sec
+        maximum average transfer rate.
+    burst_seconds
+        number of seconds worth of bytes which may be sent at once after the
+        link was idle.
+    """
+
+    def __init__(self, nbytes_per_sec: float, burst_seconds: float = 0.25):
+        if nbytes_per_sec <= 0:
+            raise ValueError(f'nbytes_per_sec: {nbytes_per_sec} must be > 0')
+        self.nbytes_per_sec = float(nbytes_per_sec)
+        self.capacity = max(1.0, self.nbytes_per_sec * burst_seconds)
+        self._tokens = self.capacity
+        self._last = time.perf_counter()
+        self._lock = Lock()
+
+    def consume(self, nbytes: int):
+        """Take ``nbytes`` from the bucket, sleeping until the rate allows it.
+        """
+        with self._lock:
+            now = time.perf_counter()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._last) * self.nbytes_per_sec)
+            self._last = now
+            self._tokens -= nbytes
+            deficit = -self._tokens
+        if deficit > 0:
+            time.sleep(deficit / self.nbytes_per_sec)
+
+
+class TransferScheduler(object):
+    """Run the batches of a transfer with adaptive concurrency and a bandwidth cap.
+
+    A scheduler (and the statistics it collects) is meant to span a single
+    transfer operation, which may run several sets of batches.
+
+    Parameters
+    ----------
+    operation
+        name of the transfer operation recorded in the statistics.
+    max_concurrency
+        maximum number of batches in flight at once. If None (default),
+        determined from the number of cpu cores.
+    bandwidth_limit
+        maximum average number of bytes per second transferred, as a number
+        or a string such as ``'10MB'``. If None (default), not limited.
+    max_retries
+        number of times a batch failing with a transient rpc error is retried.
+    retry_backoff
+        seconds to wait before the first retry of a batch, doubling with
+        every further retry.
+    """
+
+    def __init__(self, operation: str = 'transfer', *,
+                 max_concurrency: Optional[int] = None,
+                 bandwidth_limit: Union[None, int, float, str] = None,
+                 max_retries: int = 3,
+                 retry_backoff: float = 0.1):
+        if max_concurrency is None:
+            max_concurrency = calc_num_threadpool_workers()
+        if max_concurrency < 1:
+            raise ValueError(f'max_concurrency: {max_concurrency} must be >= 1')
+        if max_retries < 0:
+            raise ValueError(f'max_retries: {max_retries} must be >= 0')
+        if isinstance(bandwidth_limit, str):
+            bandwidth_limit = parse_bytes(bandwidth_limit)
+
+        self.max_concurrency = max_concurrency
+        self.concurrency = min(max_concurrency, 4)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.limiter = BandwidthLimiter(bandwidth_limit) if bandwidth_limit else None
+        self.stats = TransferStats(operation)
+
+        self._lock = Lock()
+        self._round_start = time.perf_counter()
+        self._round_size = 0
+        self._round_batches = 0
+        self._last_rate: Optional[float] = None
+
+    def throttle(self, nbytes: int):
+        """Wait until ``nbytes`` may be transferred within the bandwidth limit.
+        """
+        if self.limiter is not None:
+            self.limiter.consume(nbytes)
+
+    def transferred_frame(self, frame: bytes):
+        """Record (and throttle) a compressed frame sent or received over the wire.
+        """
+        self.throttle(len(frame))
+        self.stats.record_frame(frame)
+
+    def count_frames(self, frames: Iterable[Tuple[bytes, int]]) -> Iterator[Tuple[bytes, int]]:
+        """Pass (frame, num_records) pairs about to be sent through :meth:`transferred_frame`.
+        """
+        for frame, num_records in frames:
+            self.transferred_frame(frame)
+            yield frame, num_records
+
+    def _completed_round(self, now: float):
+        rate = self._round_size / max(now - self._round_start, 1e-9)
+        if (self._last_rate is None) or (rate >= self._last_rate * (1 + INCREASE_THRESHOLD)):
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+        elif rate < self._last_rate * (1 - DECREASE_THRESHOLD):
+            self.concurrency = max(1, self.concurrency // 2)
+        self._last_rate = rate
+        self._round_start, self._round_size, self._round_batches = now, 0, 0
+
+    def _completed(self, seconds: float, size: int):
+        self.stats.record_batch(seconds)
+        with self._lock:
+            self._round_size += size
+            self._round_batches += 1
+            if self._round_batches >= self.concurrency:
+                self._completed_round(time.perf_counter())
+
+    def _congested(self):
+        with self._lock:
+            self.concurrency = max(1, self.concurrency // 2)
+            self._round_start, self._round_size, self._round_batches = time.perf_counter(), 0, 0
+            self._last_rate = None
+
+    @staticmethod
+    def _timed(func: Callable[[T], R], batch: T) -> Tuple[R, float]:
+        start = time.perf_counter()
+        res = func(batch)
+        return res, time.perf_counter() - start
+
+    def run(self, batches: Sequence[T], func: Callable[[T], R],
+            size: Callable[[T], int] = len) -> Iterator[R]:
+        """Call ``func`` on every batch, yielding results as batches complete.
+
+        Batches are started in order. A batch failing with a transient rpc
+        error is retried (``func`` is called with the same batch object
+        again) after the concurrency is reduced.
+
+        Parameters
+        ----------
+        batches
+            batches of the transfer, in the order they should be started.
+        func
+            transfers a batch.
+        size
+            relative size of a batch (ie. number of samples or elements) used
+            to measure throughput.
+
+        Yields
+        ------
+        R
+            return value of ``func`` for each batch, in order of completion.
+
+        Raises
+        ------
+        grpc.RpcError
+            if a batch fails with a non-transient error, or still fails after
+            ``max_retries`` retries.
+        """
+        pending = deque(enumerate(batches))
+        attempts: Dict[int, int] = defaultdict(int)
+        in_flight: Dict[concurrent.futures.Future, Tuple[int, T]] = {}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            while pending or in_flight:
+                while pending and (len(in_flight) < self.concurrency):
+                    idx, batch = pending.popleft()
+                    in_flight[executor.submit(self._timed, func, batch)] = (idx, batch)
+                self.stats.record_concurrency(len(in_flight))
+
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    idx, batch = in_flight.pop(future)
+                    try:
+                        res, seconds = future.result()
+                    except grpc.RpcError as rpc_error:
+                        if (rpc_error.code() not in RETRYABLE_STATUS_CODES) \
+                                or (attempts[idx] >= self.max_retries):
+                            raise
+                        attempts[idx] += 1
+                        self.stats.record_retry()
+                        self._congested()
+                        time.sleep(self.retry_backoff * 2 ** (attempts[idx] - 1))
+                        pending.appendleft((idx, batch))
+                        continue
+                    self._completed(seconds, size(batch))
+                    yield res
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
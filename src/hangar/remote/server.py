@@ -4,12 +4,13 @@ import shutil
 import tempfile
 import traceback
 import warnings
+from collections import deque
 from concurrent import futures
 from os.path import join as pjoin
 from pathlib import Path
 from pprint import pprint as pp
 from threading import Lock
-from typing import Union, Iterable
+from typing import Dict, Optional, Union, Iterable
 
 import blosc
 import grpc
@@ -19,11 +20,18 @@ from . import (
     chunks,
     hangar_service_pb2,
     hangar_service_pb2_grpc,
+    partial,
+    reconcile,
     request_header_validator_interceptor,
 )
 from .content import ContentWriter, DataWriter
+from .codecs import AUTO_CODEC, DEFAULT_CODEC, SUPPORTED_COMPRESSORS, parse_codec
+from .read_pool import ShardedReadPool
+from .sample_cache import CompressedSampleCache, cache_key, pack_frames, unpack_frames
+from .scheduler import sample_size_hint
 from .. import constants as c
 from ..backends import BACKEND_ACCESSOR_MAP, backend_decoder
+from ..backends.hdf5_01 import RAW_CHUNKS_SUPPORTED
 from ..context import Environments
 from ..records import (
     commiting,
@@ -35,12 +43,16 @@ from ..records import (
     hash_schema_db_key_from_raw_key,
     hash_data_db_key_from_raw_key,
 )
-from ..records.hashmachine import hash_func_from_tcode
+from ..records.hashmachine import hash_func_from_tcode, hash_type_code_from_digest
 from ..txnctx import TxnRegister
-from ..utils import set_blosc_nthreads
+from ..utils import set_blosc_nthreads, calc_num_threadpool_workers
 
 set_blosc_nthreads()
 
+# upper bound on the itemsize of array samples, used to estimate the nbytes of
+# a sample from the shape recorded in its backend spec.
+SAMPLE_ITEMSIZE_BOUND = 8
+
 
 def server_config(server_dir, *, create: bool = True) -> configparser.ConfigParser:
     CFG = configparser.ConfigParser()
@@ -84,7 +96,8 @@ def context_abort_with_handled_error(
 
 class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
 
-    def __init__(self, repo_path: Union[str, bytes, Path], overwrite=False):
+    def __init__(self, repo_path: Union[str, bytes, Path], overwrite=False, *,
+                 fetch_read_workers: Optional[int] = None):
 
         if isinstance(repo_path, (str, bytes)):
             repo_path = Path(repo_path)
@@ -94,7 +107,6 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
             envs = Environments(pth=repo_path)
         self.env: Environments = envs
         self.data_writer_lock = Lock()
-        self.hash_reader_lock = Lock()
 
         try:
             self.env.init_repo(
@@ -121,8 +133,33 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         self.data_dir = pjoin(self.repo_path, c.DIR_DATA)
         self.CW = ContentWriter(self.env)
         self.DW = DataWriter(self.env)
+        self.push_verify_workers = calc_num_threadpool_workers()
+        self.push_verify_pool = futures.ThreadPoolExecutor(
+            max_workers=self.push_verify_workers,
+            thread_name_prefix='push_verify_pool')
+
+        if fetch_read_workers is None:
+            fetch_read_workers = int(self.CFG['SERVER_GRPC'].get('fetch_read_workers', '0'))
+        self.read_pool: Optional[ShardedReadPool] = None
+        if fetch_read_workers > 0:
+            self.read_pool = ShardedReadPool(self.repo_path, fetch_read_workers)
+
+        serverCFG = self.CFG['SERVER_GRPC']
+        cache_nbytes = int(serverCFG.get('sample_cache_nbytes', '0'))
+        cache_disk_nbytes = int(serverCFG.get('sample_cache_disk_nbytes', '0'))
+        self.sample_cache: Optional[CompressedSampleCache] = None
+        if (cache_nbytes > 0) or (cache_disk_nbytes > 0):
+            self.sample_cache = CompressedSampleCache(
+                cache_nbytes,
+                disk_dir=pjoin(self.repo_path, c.DIR_SAMPLE_CACHE),
+                disk_max_nbytes=cache_disk_nbytes)
 
     def close(self):
+        self.push_verify_pool.shutdown(wait=True)
+        if self.read_pool is not None:
+            self.read_pool.close()
+        if self.sample_cache is not None:
+            self.sample_cache.close()
         for backend_accessor in self._rFs.values():
             backend_accessor.close()
         self.env._close_environments()
@@ -140,14 +177,37 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         """
         clientCFG = self.CFG['CLIENT_GRPC']
         push_max_nbytes = clientCFG['push_max_nbytes']
+        fetch_batch_size = clientCFG.get('fetch_batch_size', '1_000')
+        push_batch_size = clientCFG.get('push_batch_size', '1_000')
+        push_frame_nbytes = clientCFG.get('push_frame_nbytes', '16_000_000')
         enable_compression = clientCFG['enable_compression']
         optimization_target = clientCFG['optimization_target']
+        max_message_nbytes = self.CFG['SERVER_GRPC'].get(
+            'max_message_nbytes', str(chunks.DEFAULT_MAX_MESSAGE_NBYTES))
 
         err = hangar_service_pb2.ErrorProto(code=0, message='OK')
         reply = hangar_service_pb2.GetClientConfigReply(error=err)
         reply.config['push_max_nbytes'] = push_max_nbytes
+        reply.config['fetch_batch_size'] = fetch_batch_size
+        reply.config['push_batch_size'] = push_batch_size
+        reply.config['push_frame_nbytes'] = push_frame_nbytes
         reply.config['enable_compression'] = enable_compression
         reply.config['optimization_target'] = optimization_target
+        reply.config['max_message_nbytes'] = max_message_nbytes
+        reply.config['codecs'] = ','.join(SUPPORTED_COMPRESSORS)
+        reply.config['push_codec'] = clientCFG.get('push_codec', AUTO_CODEC)
+        reply.config['fetch_raw_chunks'] = clientCFG.get('fetch_raw_chunks', '1')
+        return reply
+
+    def GetServerStats(self, request, context):
+        """Return counters describing server operation (sample cache use, etc).
+        """
+        err = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        reply = hangar_service_pb2.GetServerStatsReply(error=err)
+        if self.sample_cache is not None:
+            for k, v in self.sample_cache.stats().items():
+                reply.stats[f'sample_cache_{k}'] = v
+        reply.stats['fetch_read_workers'] = self.read_pool.num_workers if self.read_pool else 0
         return reply
 
     # -------------------- Branch Record --------------------------------------
@@ -342,6 +402,7 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
                         digest=digest,
                         uri=digest,
                         compression=True,
+                        num_elements=sample_size_hint(spec),
                     )
                     response.compression_opts['id'] = 'blosc'
                     response.compression_opts['cname'] = 'blosclz'
@@ -372,9 +433,10 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         uri = request.uri
         hashKey = hash_data_db_key_from_raw_key(uri)
         try:
-            with self.hash_reader_lock:
-                hashTxn = self.txnregister.begin_reader_txn(self.env.hashenv)
+            hashTxn = self.txnregister.begin_reader_txn(self.env.hashenv)
+            try:
                 hashVal = hashTxn.get(hashKey, default=False)
+            finally:
                 self.txnregister.abort_reader_txn(self.env.hashenv)
         except Exception as e:
             context_abort_with_exception_traceback(
@@ -386,11 +448,16 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
             context_abort_with_exception_traceback(
                 context=context, exc=exc, status_code=grpc.StatusCode.NOT_FOUND)
 
-        spec = backend_decoder(hashVal)
-        data = self._rFs[spec.backend].read_data(spec)
-        dtype_code, raw_record = chunks.serialize_data(data)
-        compressed_record = blosc.compress(
-            raw_record, clevel=3, cname='blosclz', shuffle=blosc.NOSHUFFLE)
+        key = cache_key('FetchData', DEFAULT_CODEC, [uri])
+        compressed_record = self.sample_cache.get(key) if self.sample_cache else None
+        if compressed_record is None:
+            spec = backend_decoder(hashVal)
+            data = self._rFs[spec.backend].read_data(spec)
+            dtype_code, raw_record = chunks.serialize_data(data)
+            compressed_record = blosc.compress(
+                raw_record, clevel=3, cname='blosclz', shuffle=blosc.NOSHUFFLE)
+            if self.sample_cache is not None:
+                self.sample_cache.put(key, compressed_record)
 
         def replies_iterator(raw, uri, error_proto):
             reply = hangar_service_pb2.FetchDataReply(
@@ -405,6 +472,123 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         repliesIter = replies_iterator(compressed_record, uri, err)
         yield from repliesIter
 
+    def FetchDataBatch(self, request, context):
+        """Stream packed, compressed frames containing many requested samples.
+
+        Rather than a single sample per call (as in :meth:`FetchData`), the
+        client sends the digests of an entire batch of samples. Samples are
+        read in request order and serialized into frames which are compressed
+        as a whole (similar samples compress well against each-other). Each
+        frame holds at most ``fetch_frame_nbytes`` of uncompressed data, which
+        bounds the memory either side needs to hold while a frame is in flight;
+        frames are only read from disk as the client consumes the stream.
+
+        If the client requests ``raw_chunks``, samples stored in the ``HDF5_01``
+        backend are sent as the compressed chunks read from disk, without
+        running the hdf5 filter pipeline (decompression and checksum
+        verification are left to the client). The request is ignored if the
+        hdf5 library lock of h5py is not available (see
+        :data:`~hangar.backends.hdf5_01.RAW_CHUNKS_SUPPORTED`).
+        """
+        uris = list(request.uris)
+        try:
+            hashTxn = self.txnregister.begin_reader_txn(self.env.hashenv)
+            try:
+                hashVals = [hashTxn.get(hash_data_db_key_from_raw_key(uri), default=False)
+                            for uri in uris]
+            finally:
+                self.txnregister.abort_reader_txn(self.env.hashenv)
+        except Exception as e:
+            context_abort_with_exception_traceback(
+                context=context, exc=e, status_code=grpc.StatusCode.INTERNAL)
+            raise e
+
+        for uri, hashVal in zip(uris, hashVals):
+            if hashVal is False:
+                exc = FileNotFoundError(f'request uri does not exist. URI: {uri}')
+                context_abort_with_exception_traceback(
+                    context=context, exc=exc, status_code=grpc.StatusCode.NOT_FOUND)
+
+        raw_chunks = request.raw_chunks and RAW_CHUNKS_SUPPORTED
+
+        def records_iterator(uris, hashVals):
+            for uri, hashVal in zip(uris, hashVals):
+                spec = backend_decoder(hashVal)
+                if raw_chunks and (spec.backend == '01'):
+                    yield self._rFs[spec.backend].read_raw_chunks(spec), uri
+                else:
+                    yield self._rFs[spec.backend].read_data(spec), uri
+
+        max_frame_nbytes = int(self.CFG['SERVER_GRPC'].get('fetch_frame_nbytes', '16_000_000'))
+        codec = self._fetch_codec(request.codec)
+        if self.sample_cache is not None:
+            frames = self._cached_frames(
+                uris, hashVals, max_frame_nbytes, codec, records_iterator, raw_chunks=raw_chunks)
+        elif self.read_pool is not None:
+            frames = self.read_pool.frames(
+                uris, hashVals, max_frame_nbytes, codec, raw_chunks=raw_chunks)
+        else:
+            frames = chunks.pack_record_frames(
+                records_iterator(uris, hashVals), max_frame_nbytes, codec)
+        err = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        response_pb = hangar_service_pb2.FetchDataBatchReply
+        max_message_nbytes = int(self.CFG['SERVER_GRPC'].get(
+            'max_message_nbytes', str(chunks.DEFAULT_MAX_MESSAGE_NBYTES)))
+        yield from chunks.dataFrameChunkedIterator(
+            frames, response_pb, max_message_nbytes=max_message_nbytes, error=err)
+
+    def _fetch_codec(self, requested: str) -> str:
+        """Name of the codec to compress ``FetchDataBatch`` frames with.
+
+        A codec pinned by the ``fetch_codec`` server config value takes
+        precedence over the one requested by the client; unset or invalid
+        requests fall back to the default codec.
+        """
+        pinned = self.CFG['SERVER_GRPC'].get('fetch_codec', AUTO_CODEC)
+        for name in (pinned, requested):
+            if name and (name != AUTO_CODEC):
+                try:
+                    return parse_codec(name).name
+                except ValueError:
+                    pass
+        return DEFAULT_CODEC
+
+    def _cached_frames(self, uris, hashVals, max_frame_nbytes, codec, records_iterator, *,
+                       raw_chunks=False):
+        """Frames of a ``FetchDataBatch`` reply, served from the sample cache.
+
+        Requested samples are sorted by digest and split into segments at
+        content defined boundaries (see :func:`.chunks.frame_segments`) which
+        hold half of ``max_frame_nbytes`` on average, so most segments pack
+        into a single frame no larger than an uncached reply's frames. The
+        frames packed from each segment are cached under the digests it holds.
+        Clients cloning the same data request overlapping ranges of sorted
+        digests, so all but the segments at the edges of each request are
+        identical between them and only need to be read and compressed once.
+        """
+        layout = f'FetchDataBatch:{max_frame_nbytes}:{"raw" if raw_chunks else "arr"}'
+        records = sorted(zip(uris, hashVals))
+        sizes = [sample_size_hint(backend_decoder(hashVal)) * SAMPLE_ITEMSIZE_BOUND
+                 for _, hashVal in records]
+        segments = chunks.frame_segments(records, sizes, max(1, max_frame_nbytes // 2))
+        keys = [cache_key(layout, codec, (uri for uri, _ in seg)) for seg in segments]
+        payloads = [self.sample_cache.get(key) for key in keys]
+        missing = [seg for seg, payload in zip(segments, payloads) if payload is None]
+
+        if self.read_pool is not None:
+            packed = self.read_pool.packed_shards(
+                missing, max_frame_nbytes, codec, raw_chunks=raw_chunks)
+        else:
+            packed = (list(chunks.pack_record_frames(
+                records_iterator(*zip(*seg)), max_frame_nbytes, codec)) for seg in missing)
+        for key, payload in zip(keys, payloads):
+            if payload is None:
+                frames = next(packed)
+                self.sample_cache.put(key, pack_frames(frames))
+            else:
+                frames = unpack_frames(payload)
+            yield from frames
+
     def PushFindDataOrigin(
             self,
             request_iterator: Iterable[hangar_service_pb2.PushFindDataOriginRequest],
@@ -539,6 +723,93 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         reply = hangar_service_pb2.PushDataReply(error=err)
         return reply
 
+    @staticmethod
+    def _verify_push_frame(frame: bytes) -> list:
+        """Decompress a pushed frame and check every sample matches its digest.
+        """
+        records = chunks.unpack_record_frame(frame)
+        for record in records:
+            hash_func = hash_func_from_tcode(hash_type_code_from_digest(record.digest))
+            recieved_hash = hash_func(record.data)
+            if recieved_hash != record.digest:
+                raise ValueError(
+                    f'HASH MANGLED, received: {recieved_hash} != expected digest: {record.digest}')
+        return records
+
+    def PushDataBatch(
+            self,
+            request_iterator: Iterable[hangar_service_pb2.PushDataBatchRequest],
+            context: grpc.ServicerContext
+    ) -> hangar_service_pb2.PushDataReply:
+        """Receive compressed frames each packing many samples from the client.
+
+        Frames are handed off to a pool of workers which decompress them and
+        verify the cryptographic hash of every sample while the following frames
+        are still being received. Verified frames are written to the backends in
+        order, one batch per frame under a single acquisition of the
+        ``data_writer_lock``. At most ``2 * pool workers`` frames are held in
+        memory at any time; receipt of data pauses when that limit is reached.
+        If any sample in a frame is mangled, no sample in that frame (or in any
+        frame after it) will be saved to disk.
+        """
+        if not self.DW.is_cm:
+            context.abort(
+                code=grpc.StatusCode.FAILED_PRECONDITION,
+                details=f'Attept to push without opening context'
+            )
+
+        schema_hashes = []
+
+        def frame_requests(request_iterator):
+            for request in request_iterator:
+                if not schema_hashes:
+                    schema_hashes.append(request.schema_hash)
+                yield request
+
+        def write_verified(future):
+            try:
+                records = future.result()
+            except (ValueError, TypeError) as e:
+                context.abort(code=grpc.StatusCode.DATA_LOSS, details=str(e))
+            try:
+                with self.data_writer_lock:
+                    for record in records:
+                        self.DW.data(schema_hashes[0], data_digest=record.digest, data=record.data)
+            except Exception as e:
+                context_abort_with_exception_traceback(
+                    context=context, exc=e, status_code=grpc.StatusCode.INTERNAL)
+
+        max_pending = 2 * self.push_verify_workers
+        pending = deque()
+        for frame in chunks.reassemble_data_frames(frame_requests(request_iterator)):
+            pending.append(self.push_verify_pool.submit(self._verify_push_frame, frame))
+            while pending and (pending[0].done() or len(pending) >= max_pending):
+                write_verified(pending.popleft())
+        while pending:
+            write_verified(pending.popleft())
+
+        err = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        reply = hangar_service_pb2.PushDataReply(error=err)
+        return reply
+
+    def PushDataReceived(self, request, context):
+        """Return which of the requested digests were stored in the open push context.
+
+        A client retrying a failed ``PushDataBatch`` uses this to only send
+        the samples which the server did not store before the failure.
+        """
+        if not self.DW.is_cm:
+            context.abort(
+                code=grpc.StatusCode.FAILED_PRECONDITION,
+                details=f'Attept to push without opening context'
+            )
+        with self.data_writer_lock:
+            received = self.DW.received(request.digests)
+        err = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        reply = hangar_service_pb2.PushDataReceivedReply(error=err)
+        reply.digests.extend(received)
+        return reply
+
     # ------------------------ Fetch Find Missing -----------------------------------
 
     def FetchFindMissingCommits(self, request, context):
@@ -600,10 +871,14 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
 
     def FetchFindMissingHashRecords(self, request_iterator, context):
         """Determine data tensor hash records existing on the server and not on the client.
+
+        If the request sets a partial clone filter, only records of samples
+        selected by the filter are considered.
         """
         for idx, request in enumerate(request_iterator):
             if idx == 0:
                 commit = request.commit
+                filter_json = request.filter
                 hBytes, offset = bytearray(request.total_byte_size), 0
             size = len(request.hashs)
             hBytes[offset: offset + size] = request.hashs
@@ -613,15 +888,12 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         c_hashs_raw = chunks.deserialize_record_pack(uncompBytes)
         c_hashset = set([chunks.deserialize_ident(raw).digest for raw in c_hashs_raw])
 
-        with tempfile.TemporaryDirectory() as tempD:
-            tmpDF = os.path.join(tempD, 'test.lmdb')
-            tmpDB = lmdb.open(path=tmpDF, **c.LMDB_SETTINGS)
-            commiting.unpack_commit_ref(self.env.refenv, tmpDB, commit)
-            s_hashes_schemas = queries.RecordQuery(tmpDB).data_hash_to_schema_hash()
-            s_hashes = set(s_hashes_schemas.keys())
-            tmpDB.close()
-
-        c_missing = list(s_hashes.difference(c_hashset))
+        filt = self._request_filter(filter_json, context)
+        s_hashes_schemas = self._commit_data_hash_schemas(commit, filt)
+        c_missing = list(set(s_hashes_schemas.keys()).difference(c_hashset))
+        s_hashes_schemas = partial.drop_oversized(
+            filt, {digest: s_hashes_schemas[digest] for digest in c_missing}, self.env.hashenv)
+        c_missing = list(s_hashes_schemas.keys())
         c_hash_schemas_raw = [chunks.serialize_ident(c_mis, s_hashes_schemas[c_mis]) for c_mis in c_missing]
         raw_pack = chunks.serialize_record_pack(c_hash_schemas_raw)
         err = hangar_service_pb2.ErrorProto(code=0, message='OK')
@@ -653,6 +925,120 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         cIter = chunks.missingHashIterator(commit, raw_pack, err, response_pb)
         yield from cIter
 
+    def _decode_hash_record_difference(self, request_iterator, context):
+        """Subtract the server side table of a commit's data hash records from a client table.
+
+        If the request sets a partial clone filter, only records of samples in
+        the columns and with the keys selected by the filter are summarized.
+
+        Returns
+        -------
+        Tuple[str, Dict[str, str], reconcile.FingerprintedDigests, Optional[Tuple[np.ndarray, np.ndarray]], Optional[partial.PartialCloneFilter]]
+            commit, map of data digest -> schema digest in the commit, server
+            digests summarized, fingerprints decoded from the client / server
+            side (or None if the difference could not be decoded), and the
+            partial clone filter of the request.
+        """
+        request, rawTable = chunks.reassemble_single_frame(request_iterator)
+        commit = request.commit
+        if not commiting.check_commit_hash_in_history(self.env.refenv, commit):
+            msg = f'COMMIT: {commit} DOES NOT EXIST ON SERVER'
+            context_abort_with_handled_error(
+                context=context, message=msg, status_code=grpc.StatusCode.NOT_FOUND)
+            return
+
+        filt = self._request_filter(request.filter, context)
+        s_hashes_schemas = self._commit_data_hash_schemas(commit, filt)
+        s_digests = reconcile.FingerprintedDigests(s_hashes_schemas.keys())
+        try:
+            c_table = reconcile.InvertibleBloomTable.from_bytes(bytes(rawTable), request.num_cells)
+        except Exception as e:
+            context_abort_with_exception_traceback(
+                context=context, exc=e, status_code=grpc.StatusCode.INVALID_ARGUMENT)
+            return
+        diff = c_table.subtract(s_digests.table(request.num_cells)).decode()
+        return commit, s_hashes_schemas, s_digests, diff, filt
+
+    @staticmethod
+    def _reconcile_reply_iterator(commit, num_records, raw, decoded):
+        comp_bytes = blosc.compress(
+            raw, cname='zlib', clevel=3, typesize=1, shuffle=blosc.SHUFFLE)
+        err = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        yield from chunks.dataFrameChunkedIterator(
+            [(comp_bytes, num_records)], hangar_service_pb2.ReconcileHashRecordsReply,
+            commit=commit, decoded=decoded, error=err)
+
+    def FetchReconcileHashRecords(self, request_iterator, context):
+        """Decode hash records of a commit on the server and not in a client table.
+        """
+        commit, s_hashes_schemas, s_digests, diff, filt = self._decode_hash_record_difference(
+            request_iterator, context)
+        raw_pack = b''
+        if diff is not None:
+            _, s_only = diff
+            c_missing = partial.drop_oversized(
+                filt, {digest: s_hashes_schemas[digest] for digest in s_digests.lookup(s_only)},
+                self.env.hashenv)
+            c_hash_schemas_raw = [
+                chunks.serialize_ident(c_mis, schema) for c_mis, schema in c_missing.items()]
+            raw_pack = chunks.serialize_record_pack(c_hash_schemas_raw)
+        yield from self._reconcile_reply_iterator(
+            commit, len(s_digests), raw_pack, diff is not None)
+
+    def PushReconcileHashRecords(self, request_iterator, context):
+        """Decode fingerprints in a client table and not in the hash records of a server commit.
+        """
+        commit, _, s_digests, diff, _ = self._decode_hash_record_difference(
+            request_iterator, context)
+        raw_fps = b''
+        if diff is not None:
+            c_only, _ = diff
+            raw_fps = c_only.tobytes()
+        yield from self._reconcile_reply_iterator(
+            commit, len(s_digests), raw_fps, diff is not None)
+
+    def FetchFindFilteredData(self, request, context):
+        """Data hash records (and schemas) of the samples in a commit selected by a partial clone filter.
+        """
+        commit = request.commit
+        if not commiting.check_commit_hash_in_history(self.env.refenv, commit):
+            msg = f'COMMIT: {commit} DOES NOT EXIST ON SERVER'
+            context_abort_with_handled_error(
+                context=context, message=msg, status_code=grpc.StatusCode.NOT_FOUND)
+            return
+
+        filt = self._request_filter(request.filter, context)
+        s_hashes_schemas = partial.drop_oversized(
+            filt, self._commit_data_hash_schemas(commit, filt), self.env.hashenv)
+        s_hash_schemas_raw = [
+            chunks.serialize_ident(digest, schema) for digest, schema in s_hashes_schemas.items()]
+        raw_pack = chunks.serialize_record_pack(s_hash_schemas_raw)
+        err = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        response_pb = hangar_service_pb2.FindMissingHashRecordsReply
+        yield from chunks.missingHashIterator(commit, raw_pack, err, response_pb)
+
+    def _commit_data_hash_schemas(self, commit: str,
+                                  filt: Optional[partial.PartialCloneFilter] = None
+                                  ) -> Dict[str, str]:
+        """Map data digest -> schema digest of samples in a commit selected by the columns / keys of a filter.
+        """
+        with tempfile.TemporaryDirectory() as tempD:
+            tmpDF = os.path.join(tempD, 'test.lmdb')
+            tmpDB = lmdb.open(path=tmpDF, **c.LMDB_SETTINGS)
+            commiting.unpack_commit_ref(self.env.refenv, tmpDB, commit)
+            s_hashes_schemas = partial.select_data_hash_to_schema_hash(
+                queries.RecordQuery(tmpDB), filt)
+            tmpDB.close()
+        return s_hashes_schemas
+
+    @staticmethod
+    def _request_filter(filter_json: str, context) -> Optional[partial.PartialCloneFilter]:
+        try:
+            return partial.filter_from_json(filter_json)
+        except ValueError as e:
+            context_abort_with_exception_traceback(
+                context=context, exc=e, status_code=grpc.StatusCode.INVALID_ARGUMENT)
+
     def FetchFindMissingSchemas(self, request, context):
         """Determine schema hash digest records existing on the server and not on the client.
         """
@@ -692,9 +1078,13 @@ def serve(hangar_path: str,
           channel_address: str = None,
           restrict_push: bool = None,
           username: str = None,
-          password: str = None) -> tuple:
+          password: str = None,
+          fetch_read_workers: int = None) -> tuple:
     """Start serving the GRPC server. Should only be called once.
 
+    ``fetch_read_workers`` processes (if > 0) read and compress sample data
+    sent to clients; by default the ``SERVER_GRPC`` config value is used.
+
     Raises:
         e: critical error from one of the workers.
     """
@@ -719,6 +1109,8 @@ def serve(hangar_path: str,
         channel_address = serverCFG['channel_address']
     max_thread_pool_workers = int(serverCFG['max_thread_pool_workers'])
     max_concurrent_rpcs = int(serverCFG['max_concurrent_rpcs'])
+    max_message_nbytes = int(serverCFG.get(
+        'max_message_nbytes', str(chunks.DEFAULT_MAX_MESSAGE_NBYTES)))
 
     adminCFG = CFG['SERVER_ADMIN']
     if (restrict_push is None) and (username is None) and (password is None):
@@ -742,13 +1134,17 @@ def serve(hangar_path: str,
     server = grpc.server(
         thread_pool=grpc_thread_pool,
         maximum_concurrent_rpcs=max_concurrent_rpcs,
-        options=[('grpc.optimization_target', optimization_target)],
+        options=[
+            ('grpc.optimization_target', optimization_target),
+            ('grpc.max_send_message_length', max_message_nbytes),
+            ('grpc.max_receive_message_length', max_message_nbytes),
+        ],
         compression=compression_val,
         interceptors=(interc,))
 
     # ------------------- Start the GRPC server -------------------------------
 
-    hangserv = HangarServer(server_dir, overwrite)
+    hangserv = HangarServer(server_dir, overwrite, fetch_read_workers=fetch_read_workers)
     hangar_service_pb2_grpc.add_HangarServiceServicer_to_server(hangserv, server)
     port = server.add_insecure_port(channel_address)
     if port == 0:
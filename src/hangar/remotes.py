@@ -6,7 +6,7 @@ from collections import defaultdict
 from contextlib import closing
 from pathlib import Path
 from typing import (
-    List, NamedTuple, Optional, Sequence, Union, Tuple, Set, Dict
+    List, NamedTuple, Optional, Sequence, Union, Tuple, Set, Dict, TYPE_CHECKING
 )
 
 import grpc
@@ -16,7 +16,7 @@ from tqdm import tqdm
 from .backends import backend_decoder
 from .constants import LMDB_SETTINGS
 from .context import Environments
-from .records import hash_data_db_key_from_raw_key
+from .records import DataRecordVal, hash_data_db_key_from_raw_key
 from .records import heads, queries, summarize
 from .records.commiting import (
     check_commit_hash_in_history,
@@ -25,9 +25,21 @@ from .records.commiting import (
 )
 from .remote.client import HangarClient
 from .remote.content import ContentWriter, ContentReader, DataWriter
+from .remote.journal import TransferJournal, TransferSummary, checkpoint_batches
+from .remote.scheduler import TransferScheduler, TransferStats
+from .remote.partial import (
+    PartialCloneFilter,
+    filter_from_json,
+    filter_to_json,
+    normalize_filter,
+    unrecorded_references,
+)
 from .txnctx import TxnRegister
 from .utils import is_suitable_user_key
 
+if TYPE_CHECKING:
+    from .remote.aio_client import AsyncRemotes
+
 logger = logging.getLogger(__name__)
 
 RemoteInfo = NamedTuple('RemoteInfo', [('name', str), ('address', str)])
@@ -148,6 +160,38 @@ class Remotes(object):
             res.append(RemoteInfo(name=name, address=address))
         return res
 
+    def transfer_history(self) -> List[TransferSummary]:
+        """Throughput summaries of completed ``fetch_data`` and ``push`` operations.
+
+        Transfers which were interrupted are resumed from where they left off
+        when the same operation is called again; they appear here once finished.
+
+        Returns
+        -------
+        List[TransferSummary]
+            namedtuple specifying (``run_key``, ``operation``, ``remote``,
+            ``num_samples``, ``elapsed``, ``samples_per_sec``, ``num_resumes``,
+            ``finished``) for each completed transfer, oldest first.
+        """
+        self.__verify_repo_initialized()
+        with TransferJournal(self._repo_path) as journal:
+            return journal.summaries()
+
+    @property
+    def aio(self) -> 'AsyncRemotes':
+        """Awaitable (``asyncio``) versions of the fetch, fetch data, and push operations.
+
+        Returns
+        -------
+        AsyncRemotes
+            accessor whose :meth:`~.AsyncRemotes.fetch`,
+            :meth:`~.AsyncRemotes.fetch_data`, and :meth:`~.AsyncRemotes.push`
+            methods are coroutines to await from a running event loop.
+        """
+        self.__verify_repo_initialized()
+        from .remote.aio_client import AsyncRemotes
+        return AsyncRemotes(self._env)
+
     def ping(self, name: str) -> float:
         """Ping remote server and check the round trip time.
 
@@ -179,7 +223,55 @@ class Remotes(object):
             elapsed = time.time() - start
         return elapsed
 
-    def fetch(self, remote: str, branch: str) -> str:
+    def server_stats(self, name: str) -> Dict[str, int]:
+        """Retrieve counters describing the operation of a remote server.
+
+        These include the hits, misses, and size of the server side cache of
+        compressed sample data sent to clients.
+
+        Parameters
+        ----------
+        name
+            name of the remote server to query
+
+        Returns
+        -------
+        Dict[str, int]
+            map of counter name -> value.
+
+        Raises
+        ------
+        KeyError
+            If no remote with the provided name is recorded.
+        ConnectionError
+            If the remote server could not be reached.
+        """
+        self.__verify_repo_initialized()
+        address = heads.get_remote_address(branchenv=self._env.branchenv, name=name)
+        self._client = HangarClient(envs=self._env, address=address)
+        with closing(self._client) as client:
+            client: HangarClient
+            return client.server_stats()
+
+    def partial_filter(self, name: str) -> Optional[PartialCloneFilter]:
+        """Partial clone filter recorded for a remote.
+
+        Parameters
+        ----------
+        name
+            name of the remote.
+
+        Returns
+        -------
+        Optional[PartialCloneFilter]
+            filter selecting the samples fetched from the remote, or None if
+            every sample is fetched.
+        """
+        self.__verify_repo_initialized()
+        return filter_from_json(heads.get_remote_filter(self._env.branchenv, name=name))
+
+    def fetch(self, remote: str, branch: str, *,
+              partial_filter: Optional[PartialCloneFilter] = None) -> str:
         """Retrieve new commits made on a remote repository branch.
 
         This is semantically identical to a `git fetch` command. Any new commits
@@ -193,6 +285,17 @@ class Remotes(object):
             name of the remote repository to fetch from (ie. ``origin``)
         branch
             name of the branch to fetch the commit references for.
+        partial_filter
+            partial clone filter selecting the samples (columns, sample keys,
+            and maximum sample size) whose data hash records are retrieved
+            from the remote. The filter is recorded in the repository and
+            applies to later :meth:`fetch` and :meth:`fetch_data` operations
+            on the remote; pass an empty ``PartialCloneFilter()`` to remove it.
+            If None (default), the filter recorded for the remote is used.
+
+            Commit references are always retrieved in full. Samples which are
+            not selected appear in checkouts as samples whose data resides on
+            the remote.
 
         Returns
         -------
@@ -201,6 +304,12 @@ class Remotes(object):
         """
         self.__verify_repo_initialized()
         address = heads.get_remote_address(self._env.branchenv, name=remote)
+        if partial_filter is None:
+            partial_filter = self.partial_filter(remote)
+        else:
+            partial_filter = normalize_filter(partial_filter)
+            heads.set_remote_filter(
+                self._env.branchenv, name=remote, filter_json=filter_to_json(partial_filter))
         self._client = HangarClient(envs=self._env, address=address)
         CW = ContentWriter(self._env)
 
@@ -246,29 +355,28 @@ class Remotes(object):
 
             mCmtResponse = client.fetch_find_missing_commits(branch)
             m_cmts = mCmtResponse.commits
-            for commit in tqdm(m_cmts, desc='fetching commit data refs'):
-                mSchemaResponse = client.fetch_find_missing_schemas(commit)
-                for schema in mSchemaResponse.schema_digests:
-                    schema_hash, schemaVal = client.fetch_schema(schema)
-                    CW.schema(schema_hash, schemaVal)
-                # Record missing data hash digests (does not get data itself)
-                m_hashes = client.fetch_find_missing_hash_records(commit)
-                m_schema_hash_map = defaultdict(list)
-                for digest, schema_hash in m_hashes:
-                    m_schema_hash_map[schema_hash].append((digest, schema_hash))
-
-                DW = DataWriter(self._env)
-                with DW as DW_CM:
-                    for schema_hash, m_digests_schemas in m_schema_hash_map.items():
-                        for data_digest, data_schema_hash in m_digests_schemas:
-                            DW_CM.data(schema_hash,
-                                       data_digest=data_digest,
-                                       data=data_schema_hash,
-                                       backend='50')
-
-            # Get missing commit reference specification
-            for commit in tqdm(m_cmts, desc='fetching commit spec'):
-                cmt, parentVal, specVal, refVal = client.fetch_commit_record(commit)
+            # local commit whose records are reconciled against to find missing records.
+            baseCmt = None
+            for baseBranch in (branch, f'{remote}/{branch}'):
+                try:
+                    baseCmt = heads.get_branch_head_commit(self._env.branchenv, baseBranch)
+                except ValueError:
+                    continue
+                break
+            with tqdm(total=len(m_cmts), desc='fetching commit refs') as pbar:
+                schemaRecs, m_hashes, commitRecs = client.fetch_missing_commit_contents(
+                    m_cmts, base_commit=baseCmt, pbar=pbar, partial_filter=partial_filter)
+            if partial_filter is not None:
+                # samples not selected by the filter are referenced from the commit refs.
+                m_hashes.update(unrecorded_references(
+                    (refVal for *_, refVal in commitRecs), self._env.hashenv))
+            for schema_hash, schemaVal in schemaRecs:
+                CW.schema(schema_hash, schemaVal)
+            # Record missing data hash digests (does not get data itself)
+            with DataWriter(self._env) as DW_CM:
+                DW_CM.remote_references(m_hashes.items())
+            # Commit references are written last so partial fetches are never visible
+            for cmt, parentVal, specVal, refVal in commitRecs:
                 CW.commit(cmt, parentVal, specVal, refVal)
 
             # --------------------------- At completion -----------------------
@@ -290,7 +398,12 @@ class Remotes(object):
                           samples: Union[KeyType, Sequence[KeyType],
                                          Sequence[Union[Tuple[KeyType, KeyType], Tuple[KeyType], KeyType]]],
                           branch: Optional[str] = None,
-                          commit: Optional[str] = None) -> str:
+                          commit: Optional[str] = None,
+                          *,
+                          max_concurrency: Optional[int] = None,
+                          bandwidth_limit: Union[None, int, str] = None,
+                          return_stats: bool = False
+                          ) -> Union[str, Tuple[str, TransferStats]]:
         """Granular fetch data operation allowing selection of individual samples.
 
         .. warning::
@@ -329,11 +442,25 @@ class Remotes(object):
         commit
             commit to operate on, either `branch` or `commit` argument must be passed,
             but NOT both.
+        max_concurrency
+            maximum number of data batches transferred concurrently. The
+            number in flight adapts to the throughput observed on the link,
+            up to this limit. If None (default), determined from the number
+            of cpu cores.
+        bandwidth_limit
+            maximum average transfer rate in bytes per second, either as a
+            number or a string such as ``'10MB'``. If None (default), the
+            transfer is not limited.
+        return_stats
+            if True, also return the :class:`~hangar.remote.scheduler.TransferStats`
+            (bytes, samples/sec, retries, compression ratio, etc.) of the
+            data transfer, by default False.
 
         Returns
         -------
-        str
-            On success, the commit hash which data was fetched into.
+        Union[str, Tuple[str, TransferStats]]
+            On success, the commit hash which data was fetched into (and the
+            transfer statistics if ``return_stats`` is True).
         """
         self.__verify_repo_initialized()
         address = heads.get_remote_address(branchenv=self._env.branchenv, name=remote)
@@ -374,13 +501,16 @@ class Remotes(object):
             finally:
                 tmpDB.close()
 
-            m_schema_hash_map = self._form_missing_schema_digest_map(
+            m_schema_hash_map = missing_schema_digest_map(
                 selectedDataRecords=selectedDataRecords, hashenv=self._env.hashenv
             )
 
             # -------------------- download missing data --------------------------
 
             DW = DataWriter(self._env)
+            scheduler = TransferScheduler('fetch_data_sample',
+                                          max_concurrency=max_concurrency,
+                                          bandwidth_limit=bandwidth_limit)
             total_data = sum(len(v) for v in m_schema_hash_map.values())
             with closing(self._client) as client, tqdm(total=total_data, desc='fetching data') as pbar,  DW as DW_CM:
                 client: HangarClient  # type hint
@@ -391,9 +521,14 @@ class Remotes(object):
                         origins=origins,
                         datawriter_cm=DW_CM,
                         schema=schema,
-                        pbar=pbar)
+                        pbar=pbar,
+                        scheduler=scheduler)
 
             move_process_data_to_store(self._repo_path, remote_operation=True)
+            stats = scheduler.stats.finish()
+            logger.info(f'fetch_data_sample transfer: {stats}')
+            if return_stats:
+                return cmt, stats
             return cmt
 
     @staticmethod
@@ -494,9 +629,18 @@ class Remotes(object):
                    commit: str = None,
                    *,
                    column_names: Optional[Sequence[str]] = None,
-                   retrieve_all_history: bool = False) -> List[str]:
+                   partial_filter: Optional[PartialCloneFilter] = None,
+                   retrieve_all_history: bool = False,
+                   max_concurrency: Optional[int] = None,
+                   bandwidth_limit: Union[None, int, str] = None,
+                   return_stats: bool = False
+                   ) -> Union[List[str], Tuple[List[str], TransferStats]]:
         """Retrieve the data for some commit which exists in a `partial` state.
 
+        If a partial clone filter applies, the samples to retrieve are selected
+        by the server, so only the data of samples selected by the filter (and
+        in ``column_names``, if set) is transferred.
+
         Parameters
         ----------
         remote
@@ -511,14 +655,32 @@ class Remotes(object):
             Names of the columns which should be retrieved for the particular
             commits, any columns not named will not have their data fetched
             from the server. Default behavior is to retrieve all columns
+        partial_filter
+            partial clone filter selecting the samples to retrieve. If None
+            (default), the filter recorded for the remote by :meth:`fetch` is
+            used. Unlike :meth:`fetch`, the filter is not recorded.
         retrieve_all_history
             if data should be retrieved for all history accessible by the parents
             of this commit HEAD. by default False
+        max_concurrency
+            maximum number of data batches transferred concurrently. The
+            number in flight adapts to the throughput observed on the link,
+            up to this limit. If None (default), determined from the number
+            of cpu cores.
+        bandwidth_limit
+            maximum average transfer rate in bytes per second, either as a
+            number or a string such as ``'10MB'``. If None (default), the
+            transfer is not limited.
+        return_stats
+            if True, also return the :class:`~hangar.remote.scheduler.TransferStats`
+            (bytes, samples/sec, retries, compression ratio, etc.) of the
+            data transfer, by default False.
 
         Returns
         -------
-        List[str]
-            commit hashes of the data which was returned.
+        Union[List[str], Tuple[List[str], TransferStats]]
+            commit hashes of the data which was returned (and the transfer
+            statistics if ``return_stats`` is True).
 
         Raises
         ------
@@ -545,93 +707,90 @@ class Remotes(object):
             if not cmtExist:
                 raise ValueError(f'specified commit: {commit} does not exist in the repo.')
 
-        # --------------- negotiate missing data to get -----------------------
-
-        if retrieve_all_history is True:
-            hist = summarize.list_history(self._env.refenv, self._env.branchenv, commit_hash=cmt)
-            commits = hist['order']
+        if partial_filter is None:
+            partial_filter = self.partial_filter(remote)
         else:
-            commits = [cmt]
-
-        with tempfile.TemporaryDirectory() as tempD:
-            # share unpacked ref db between dependent methods
-            tmpDF = Path(tempD, 'test.lmdb')
-            tmpDB = lmdb.open(path=str(tmpDF), **LMDB_SETTINGS)
-
-            try:
-                # all history argument
-                selectedDataRecords = set()
-                for commit in tqdm(commits, desc='counting objects'):
-                    with tmpDB.begin(write=True) as txn:
-                        with txn.cursor() as curs:
-                            notEmpty = curs.first()
-                            while notEmpty:
-                                notEmpty = curs.delete()
-                    unpack_commit_ref(self._env.refenv, tmpDB, commit)
-                    recQuery = queries.RecordQuery(tmpDB)
-                    commitDataRecords = self._select_digest_fetch_data(
-                        column_names=column_names, recQuery=recQuery
-                    )
-                    selectedDataRecords.update(commitDataRecords)
-            finally:
-                tmpDB.close()
-
-        m_schema_hash_map = self._form_missing_schema_digest_map(
-            selectedDataRecords=selectedDataRecords, hashenv=self._env.hashenv
-        )
-
-        # -------------------- download missing data --------------------------
-
-        DW = DataWriter(self._env)
-        total_data = sum(len(v) for v in m_schema_hash_map.values())
-
-        with closing(self._client) as client, \
-                tqdm(total=total_data, desc='fetching data') as pbar, \
-                DW as DW_CM:
-            client: HangarClient  # type hint
-            for schema in m_schema_hash_map.keys():
-                hashes = set(m_schema_hash_map[schema])
-                origins = client.fetch_data_origin(hashes)
-                client.fetch_data(
-                    origins=origins,
-                    datawriter_cm=DW_CM,
-                    schema=schema,
-                    pbar=pbar)
-
-        move_process_data_to_store(self._repo_path, remote_operation=True)
-        return commits
-
-    @staticmethod
-    def _form_missing_schema_digest_map(
-            selectedDataRecords: Set[queries.DataRecordVal],
-            hashenv: lmdb.Environment
-    ) -> Dict[str, List[str]]:
-        """Calculate mapping of schemas to data digests.
-
-        Parameters
-        ----------
-        selectedDataRecords
-        hashenv
+            partial_filter = normalize_filter(partial_filter)
 
-        Returns
-        -------
-        Dict[str, List[str]]
-            map of all schema digests -> sequence of all data hash digests
-            registered under that schema.
-        """
+        # --------------- negotiate missing data to get -----------------------
 
+        if column_names is not None:
+            column_names = sorted(column_names)
+            if partial_filter is not None:
+                if partial_filter.columns is not None:
+                    column_names = sorted(set(column_names).intersection(partial_filter.columns))
+                partial_filter = partial_filter._replace(columns=tuple(column_names))
+        run_key = TransferJournal.run_key(
+            'fetch_data', remote, commit=cmt, column_names=column_names,
+            retrieve_all_history=retrieve_all_history,
+            partial_filter=filter_to_json(partial_filter))
+        scheduler = TransferScheduler('fetch_data',
+                                      max_concurrency=max_concurrency,
+                                      bandwidth_limit=bandwidth_limit)
+        journal = TransferJournal(self._repo_path)
         try:
-            hashTxn = TxnRegister().begin_reader_txn(hashenv)
-            m_schema_hash_map = defaultdict(list)
-            for hashVal in selectedDataRecords:
-                hashKey = hash_data_db_key_from_raw_key(hashVal.digest)
-                hashRef = hashTxn.get(hashKey)
-                be_loc = backend_decoder(hashRef)
-                if be_loc.backend == '50':
-                    m_schema_hash_map[be_loc.schema_hash].append(hashVal.digest)
+            with closing(self._client) as client:
+                client: HangarClient  # type hint
+                resumed = journal.resume_run(run_key)
+                if resumed is not None:
+                    # digests written before the interruption no longer reference a remote.
+                    meta, pending = resumed
+                    commits = meta['commits']
+                    selectedDataRecords = set(
+                        DataRecordVal(digest) for digests in pending.values() for digest in digests)
+                else:
+                    if retrieve_all_history is True:
+                        hist = summarize.list_history(self._env.refenv, self._env.branchenv, commit_hash=cmt)
+                        commits = hist['order']
+                    else:
+                        commits = [cmt]
+
+                    if partial_filter is not None:
+                        # samples selected by the filter are found by the server.
+                        selectedDataRecords = set()
+                        for commit in tqdm(commits, desc='counting objects'):
+                            selectedDataRecords.update(
+                                DataRecordVal(ident.digest)
+                                for ident in client.fetch_filtered_data(commit, partial_filter))
+                    else:
+                        selectedDataRecords = select_commits_data_records(
+                            self._env.refenv, commits, column_names)
+
+                m_schema_hash_map = missing_schema_digest_map(
+                    selectedDataRecords=selectedDataRecords, hashenv=self._env.hashenv
+                )
+                if resumed is None:
+                    journal.begin_run(run_key, 'fetch_data', remote, m_schema_hash_map, commits=commits)
+
+                # -------------------- download missing data --------------------------
+
+                total_data = sum(len(v) for v in m_schema_hash_map.values())
+                with tqdm(total=total_data, desc='fetching data') as pbar:
+                    for schema, hashes in m_schema_hash_map.items():
+                        for batch in checkpoint_batches(hashes):
+                            origins = client.fetch_data_origin(batch)
+                            with DataWriter(self._env) as DW_CM:
+                                client.fetch_data(
+                                    origins=origins,
+                                    datawriter_cm=DW_CM,
+                                    schema=schema,
+                                    pbar=pbar,
+                                    scheduler=scheduler)
+                            move_process_data_to_store(self._repo_path, remote_operation=True)
+                            journal.checkpoint(run_key, schema, batch)
+            summary = journal.finish_run(run_key)
+            logger.info(f'fetched {summary.num_samples} samples in {summary.elapsed:.2f} sec '
+                        f'({summary.samples_per_sec:.1f} samples/sec)')
+        except BaseException:
+            journal.suspend_run(run_key)
+            raise
         finally:
-            TxnRegister().abort_reader_txn(hashenv)
-        return m_schema_hash_map
+            journal.close()
+        stats = scheduler.stats.finish()
+        logger.info(f'fetch_data transfer: {stats}')
+        if return_stats:
+            return commits, stats
+        return commits
 
     @staticmethod
     def _select_digest_fetch_data(
@@ -665,7 +824,10 @@ class Remotes(object):
         return selectedDataRecords
 
     def push(self, remote: str, branch: str,
-             *, username: str = '', password: str = '') -> str:
+             *, username: str = '', password: str = '',
+             max_concurrency: Optional[int] = None,
+             bandwidth_limit: Union[None, int, str] = None,
+             return_stats: bool = False) -> Union[str, Tuple[str, TransferStats]]:
         """push changes made on a local repository to a remote repository.
 
         This method is semantically identical to a ``git push`` operation.
@@ -691,11 +853,25 @@ class Remotes(object):
         password
             credentials to use for authentication if repository push restrictions
             are enabled, by default ''.
+        max_concurrency
+            maximum number of data batches transferred concurrently. The
+            number in flight adapts to the throughput observed on the link,
+            up to this limit. If None (default), determined from the number
+            of cpu cores.
+        bandwidth_limit
+            maximum average transfer rate in bytes per second, either as a
+            number or a string such as ``'10MB'``. If None (default), the
+            transfer is not limited.
+        return_stats
+            if True, also return the :class:`~hangar.remote.scheduler.TransferStats`
+            (bytes, samples/sec, retries, compression ratio, etc.) of the
+            data transfer, by default False.
 
         Returns
         -------
-        str
-            Name of the branch which was pushed
+        Union[str, Tuple[str, TransferStats]]
+            Name of the branch which was pushed (and the transfer statistics
+            if ``return_stats`` is True).
         """
         self.__verify_repo_initialized()
         try:
@@ -705,6 +881,15 @@ class Remotes(object):
             raise e from None
 
         CR = ContentReader(self._env)
+        scheduler = TransferScheduler('push',
+                                      max_concurrency=max_concurrency,
+                                      bandwidth_limit=bandwidth_limit)
+
+        def result():
+            stats = scheduler.stats.finish()
+            logger.info(f'push transfer: {stats}')
+            return (branch, stats) if return_stats else branch
+
         self._client = HangarClient(envs=self._env,
                                     address=address,
                                     auth_username=username,
@@ -729,11 +914,11 @@ class Remotes(object):
                 if sHEAD == cHEAD:
                     warnings.warn(
                         f'NoOp: server HEAD: {sHEAD} == client HEAD: {cHEAD}', UserWarning)
-                    return branch
+                    return result()
                 elif (sHEAD not in c_bhistory['order']) and (sHEAD != ''):
                     warnings.warn(
                         f'REJECTED: server branch has commits not on client', UserWarning)
-                    return branch
+                    return result()
 
             # --------------- negotiate missing data to send -------------------
 
@@ -747,58 +932,84 @@ class Remotes(object):
                 else:
                     raise rpc_error
 
-            m_schemas = set()
-            m_schema_hashs = defaultdict(set)
-            with tempfile.TemporaryDirectory() as tempD:
-                tmpDF = Path(tempD, 'test.lmdb')
-                tmpDB = lmdb.open(path=str(tmpDF), **LMDB_SETTINGS)
-                for commit in tqdm(m_commits, desc='counting objects'):
-                    # share unpacked ref db between dependent methods
-                    with tmpDB.begin(write=True) as txn:
-                        with txn.cursor() as curs:
-                            notEmpty = curs.first()
-                            while notEmpty:
-                                notEmpty = curs.delete()
-                    unpack_commit_ref(self._env.refenv, tmpDB, commit)
-                    # schemas
-                    schema_res = client.push_find_missing_schemas(commit, tmpDB=tmpDB)
-                    m_schemas.update(schema_res.schema_digests)
-                    # data hashs
-                    m_cmt_schema_hashs = defaultdict(list)
-                    mis_hashes_sch = client.push_find_missing_hash_records(commit, tmpDB=tmpDB)
-                    for hsh, schema in mis_hashes_sch:
-                        m_cmt_schema_hashs[schema].append(hsh)
-                    for schema, hashes in m_cmt_schema_hashs.items():
-                        m_schema_hashs[schema].update(hashes)
-                tmpDB.close()
+            run_key = TransferJournal.run_key('push', remote, branch=branch, head=cHEAD)
+            journal = TransferJournal(self._repo_path)
+            resumed = journal.resume_run(run_key)
+            if resumed is not None:
+                meta, m_schema_hashs = resumed
+                m_commits, m_schemas = meta['commits'], meta['schemas']
+            else:
+                m_schemas = set()
+                m_schema_hashs = defaultdict(set)
+                # most recent commit in history which the server already has.
+                s_cmts = set(m_commits)
+                baseCmt = next((cmt for cmt in c_bhistory['order'] if cmt not in s_cmts), None)
+                with tempfile.TemporaryDirectory() as tempD:
+                    tmpDF = Path(tempD, 'test.lmdb')
+                    tmpDB = lmdb.open(path=str(tmpDF), **LMDB_SETTINGS)
+                    for commit in tqdm(m_commits, desc='counting objects'):
+                        # share unpacked ref db between dependent methods
+                        with tmpDB.begin(write=True) as txn:
+                            with txn.cursor() as curs:
+                                notEmpty = curs.first()
+                                while notEmpty:
+                                    notEmpty = curs.delete()
+                        unpack_commit_ref(self._env.refenv, tmpDB, commit)
+                        # schemas
+                        schema_res = client.push_find_missing_schemas(commit, tmpDB=tmpDB)
+                        m_schemas.update(schema_res.schema_digests)
+                        # data hashs
+                        m_cmt_schema_hashs = defaultdict(list)
+                        mis_hashes_sch = client.push_find_missing_hash_records(
+                            commit, tmpDB=tmpDB, base_commit=baseCmt)
+                        for hsh, schema in mis_hashes_sch:
+                            m_cmt_schema_hashs[schema].append(hsh)
+                        for schema, hashes in m_cmt_schema_hashs.items():
+                            m_schema_hashs[schema].update(hashes)
+                    tmpDB.close()
+                m_commits, m_schemas = list(m_commits), list(m_schemas)
+                journal.begin_run(run_key, 'push', remote, m_schema_hashs,
+                                  commits=m_commits, schemas=m_schemas)
 
             # ------------------------- send data -----------------------------
 
-            # schemas
-            for m_schema in tqdm(m_schemas, desc='pushing schemas'):
-                schemaVal = CR.schema(m_schema)
-                if not schemaVal:
-                    raise KeyError(f'no schema with hash: {m_schema} exists')
-                client.push_schema(m_schema, schemaVal)
-            # data
-            total_data = sum([len(v) for v in m_schema_hashs.values()])
-            with tqdm(total=total_data, desc='pushing data') as p:
-                client.push_data_begin_context()
-                try:
+            try:
+                # schemas
+                for m_schema in tqdm(m_schemas, desc='pushing schemas'):
+                    schemaVal = CR.schema(m_schema)
+                    if not schemaVal:
+                        raise KeyError(f'no schema with hash: {m_schema} exists')
+                    client.push_schema(m_schema, schemaVal)
+                journal.update_meta(run_key, schemas=[])
+                # data
+                total_data = sum([len(v) for v in m_schema_hashs.values()])
+                with tqdm(total=total_data, desc='pushing data') as p:
                     for dataSchema, dataHashes in m_schema_hashs.items():
-                        client.push_data(dataSchema, dataHashes, pbar=p)
-                        p.update(1)
-                finally:
-                    client.push_data_end_context()
-            # commit refs
-            for commit in tqdm(m_commits, desc='pushing commit refs'):
-                cmtContent = CR.commit(commit)
-                if not cmtContent:
-                    raise KeyError(f'no commit with hash: {commit} exists')
-                client.push_commit_record(commit=cmtContent.commit,
-                                          parentVal=cmtContent.cmtParentVal,
-                                          specVal=cmtContent.cmtSpecVal,
-                                          refVal=cmtContent.cmtRefVal)
+                        for batch in checkpoint_batches(dataHashes):
+                            client.push_data_begin_context()
+                            try:
+                                client.push_data(dataSchema, batch, pbar=p, scheduler=scheduler)
+                            finally:
+                                client.push_data_end_context()
+                            journal.checkpoint(run_key, dataSchema, batch)
+                # commit refs
+                for idx, commit in enumerate(tqdm(m_commits, desc='pushing commit refs')):
+                    cmtContent = CR.commit(commit)
+                    if not cmtContent:
+                        raise KeyError(f'no commit with hash: {commit} exists')
+                    client.push_commit_record(commit=cmtContent.commit,
+                                              parentVal=cmtContent.cmtParentVal,
+                                              specVal=cmtContent.cmtSpecVal,
+                                              refVal=cmtContent.cmtRefVal)
+                    journal.update_meta(run_key, commits=m_commits[idx + 1:])
+                summary = journal.finish_run(run_key)
+                logger.info(f'pushed {summary.num_samples} samples in {summary.elapsed:.2f} sec '
+                            f'({summary.samples_per_sec:.1f} samples/sec)')
+            except BaseException:
+                journal.suspend_run(run_key)
+                raise
+            finally:
+                journal.close()
 
             # --------------------------- At completion -----------------------
 
@@ -822,4 +1033,82 @@ class Remotes(object):
                     heads.set_branch_head_commit(branchenv=self._env.branchenv,
                                                  branch_name=cRemoteBranch,
                                                  commit_hash=branchHead)
-            return branch
+            return result()
+
+
+def select_commits_data_records(
+        refenv: lmdb.Environment,
+        commits: Sequence[str],
+        column_names: Union[None, Sequence[str]]
+) -> Set[queries.DataRecordVal]:
+    """Data records referenced by the named columns of every one of the commits.
+
+    Parameters
+    ----------
+    refenv
+        ref db environment the commits are recorded in.
+    commits
+        digests of the commits to select data records from.
+    column_names
+        column names to fetch data for. If ``None``, download all column data.
+
+    Returns
+    -------
+    Set[queries.DataRecordVal]
+        data records which should be fetched (includes digests)
+    """
+    with tempfile.TemporaryDirectory() as tempD:
+        # share unpacked ref db between dependent methods
+        tmpDF = Path(tempD, 'test.lmdb')
+        tmpDB = lmdb.open(path=str(tmpDF), **LMDB_SETTINGS)
+
+        try:
+            # all history argument
+            selectedDataRecords = set()
+            for commit in tqdm(commits, desc='counting objects'):
+                with tmpDB.begin(write=True) as txn:
+                    with txn.cursor() as curs:
+                        notEmpty = curs.first()
+                        while notEmpty:
+                            notEmpty = curs.delete()
+                unpack_commit_ref(refenv, tmpDB, commit)
+                recQuery = queries.RecordQuery(tmpDB)
+                commitDataRecords = Remotes._select_digest_fetch_data(
+                    column_names=column_names, recQuery=recQuery
+                )
+                selectedDataRecords.update(commitDataRecords)
+        finally:
+            tmpDB.close()
+    return selectedDataRecords
+
+
+def missing_schema_digest_map(
+        selectedDataRecords: Set[queries.DataRecordVal],
+        hashenv: lmdb.Environment
+) -> Dict[str, List[str]]:
+    """Calculate mapping of schemas to data digests.
+
+    Parameters
+    ----------
+    selectedDataRecords
+    hashenv
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        map of all schema digests -> sequence of all data hash digests
+        registered under that schema.
+    """
+
+    try:
+        hashTxn = TxnRegister().begin_reader_txn(hashenv)
+        m_schema_hash_map = defaultdict(list)
+        for hashVal in selectedDataRecords:
+            hashKey = hash_data_db_key_from_raw_key(hashVal.digest)
+            hashRef = hashTxn.get(hashKey)
+            be_loc = backend_decoder(hashRef)
+            if be_loc.backend == '50':
+                m_schema_hash_map[be_loc.schema_hash].append(hashVal.digest)
+    finally:
+        TxnRegister().abort_reader_txn(hashenv)
+    return m_schema_hash_map
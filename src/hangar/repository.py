@@ -7,16 +7,18 @@ from io import StringIO
 from .merger import select_merge_algorithm
 from .constants import DIR_HANGAR
 from .remotes import Remotes
+from .remote.partial import PartialCloneFilter
+from .remote.readthrough import RemoteReadThrough
 from .context import Environments
 from .diagnostics import ecosystem, integrity
 from .records import heads, parsing, summarize, vcompat, commiting
+from .records.ledger import StorageLedger, StorageStats
 from .checkout import ReaderCheckout, WriterCheckout
 from .diff import DiffAndConflicts, ReaderUserDiff
 from .utils import (
     is_valid_directory_path,
     is_suitable_user_key,
     is_ascii,
-    folder_size,
     format_bytes
 )
 
@@ -193,6 +195,12 @@ class Repository(object):
     def size_nbytes(self) -> int:
         """Disk space used by the repository returned in number of bytes.
 
+        Computed from the storage ledger (see :meth:`storage_stats`) rather
+        than by walking the repository directory: the sizes of stored data
+        files are recorded once, when they are committed or fetched, and only
+        the uncommitted data files and the record databases are measured on
+        each call. The result is the total size of the repository directory.
+
             >>> repo.size_nbytes
             1234567890
             >>> print(type(repo.size_nbytes))
@@ -204,12 +212,15 @@ class Repository(object):
             number of bytes used by the repository on disk.
         """
         self.__verify_repo_initialized()
-        return folder_size(self._repo_path, recurse=True)
+        storage_ledger = StorageLedger(self._repo_path, self._env.ledgerenv)
+        return storage_ledger.storage_stats().nbytes
 
     @property
     def size_human(self) -> str:
         """Disk space used by the repository returned in human readable string.
 
+        Computed from the storage ledger, see :attr:`size_nbytes`.
+
             >>> repo.size_human
             '1.23 GB'
             >>> print(type(repo.size_human))
@@ -221,14 +232,68 @@ class Repository(object):
             disk space used by the repository formated in human readable text.
         """
         self.__verify_repo_initialized()
-        nbytes = folder_size(self._repo_path, recurse=True)
+        storage_ledger = StorageLedger(self._repo_path, self._env.ledgerenv)
+        nbytes = storage_ledger.storage_stats().nbytes
         return format_bytes(nbytes)
 
+    def storage_stats(self, *, branch: str = '', commit: str = '') -> StorageStats:
+        """Disk space used by the repository, by backend, column, and commit.
+
+        Statistics are read from a ledger which is updated as data is committed
+        or fetched, rather than by walking the repository directory, so this is
+        fast regardless of the amount of data stored.
+
+            >>> stats = repo.storage_stats()
+            >>> stats.nbytes, stats.backends['01'].num_files
+            (1234567890, 10)
+            >>> stats.commit.unique_nbytes, stats.commit.dedup_ratio
+            (1000000000, 1.5)
+            >>> stats.commit.columns['images'].logical_nbytes
+            1500000000
+
+        Parameters
+        ----------
+        branch : str, optional
+            A specific branch name whose head commit the data statistics are
+            reported for (Default value = '')
+        commit : str, optional
+            A specific commit hash the data statistics are reported for. By
+            default, the staging area branch head commit. (Default value = '')
+
+        Raises
+        ------
+        ValueError
+            If ``commit`` does not exist in the repository.
+
+        Returns
+        -------
+        StorageStats
+            disk space used by the repository, the number and size of the data
+            files of each backend, and (as the ``commit`` field) the size of
+            the data referenced by the commit in total and for each column
+            (``None`` if no commits have been made).
+        """
+        self.__verify_repo_initialized()
+        if commit == '':
+            if branch == '':
+                branch = heads.get_staging_branch_head(self._env.branchenv)
+            commit = heads.get_branch_head_commit(self._env.branchenv, branch)
+        elif not commiting.check_commit_hash_in_history(self._env.refenv, commit):
+            raise ValueError(f'No commit exists with the hash: {commit}')
+
+        storage_ledger = StorageLedger(self._repo_path, self._env.ledgerenv)
+        cmt_stats = None
+        if commit != '':
+            cmt_stats = storage_ledger.commit_stats(commit, self._env.refenv, self._env.hashenv)
+        return storage_ledger.storage_stats(commit=cmt_stats)
+
     def checkout(self,
                  write: bool = False,
                  *,
                  branch: str = '',
-                 commit: str = '') -> Union[ReaderCheckout, WriterCheckout]:
+                 commit: str = '',
+                 read_through_remote: Optional[str] = None,
+                 trust_fresh_writes: bool = False) -> Union[ReaderCheckout, WriterCheckout]:
         """Checkout the repo at some point in time in either `read` or `write` mode.
 
         Only one writer instance can exist at a time. Write enabled checkout
@@ -249,6 +314,18 @@ class Repository(object):
             branch ``HEAD`` commit). This argument takes precedent over a branch
             name parameter if it is set. Note: this only will be used in
             non-writeable checkouts, defaults to ''
+        read_through_remote : Optional[str], optional
+            name of a remote to retrieve remote referenced samples from the
+            first time they are read (instead of raising an error until
+            ``fetch_data`` is run). Retrieved samples are stored locally for
+            all later reads. Only valid for non-writeable checkouts, defaults
+            to None.
+        trust_fresh_writes : bool, optional
+            If True, samples written by this checkout are not verified against
+            their checksum when read back from the same process (the data was
+            hashed in memory immediately before it was written). Samples
+            written by other processes or earlier checkouts are always
+            verified. Only valid for write-enabled checkouts, defaults to False.
 
         Raises
         ------
@@ -257,6 +334,10 @@ class Repository(object):
         ValueError
             If ``commit`` argument is set to any value when ``write=True``.
             Only ``branch`` argument is allowed.
+        ValueError
+            If ``read_through_remote`` is set when ``write=True``.
+        ValueError
+            If ``trust_fresh_writes`` is set when ``write=False``.
 
         Returns
         -------
@@ -271,6 +352,9 @@ class Repository(object):
                     raise ValueError(
                         f'Only `branch` argument can be set if `write=True`. '
                         f'Setting `commit={commit}` not allowed.')
+                if read_through_remote is not None:
+                    raise ValueError(
+                        f'`read_through_remote` can only be set if `write=False`.')
                 if branch == '':
                     branch = heads.get_staging_branch_head(self._env.branchenv)
                 co = WriterCheckout(
@@ -280,9 +364,16 @@ class Repository(object):
                     refenv=self._env.refenv,
                     stageenv=self._env.stageenv,
                     branchenv=self._env.branchenv,
-                    stagehashenv=self._env.stagehashenv)
+                    stagehashenv=self._env.stagehashenv,
+                    trust_fresh_writes=trust_fresh_writes)
                 return co
             elif write is False:
+                if trust_fresh_writes:
+                    raise ValueError(
+                        f'`trust_fresh_writes` can only be set if `write=True`.')
+                if read_through_remote is not None:
+                    address = heads.get_remote_address(
+                        branchenv=self._env.branchenv, name=read_through_remote)
                 commit_hash = self._env.checkout_commit(
                     branch_name=branch, commit=commit)
                 co = ReaderCheckout(
@@ -292,6 +383,8 @@ class Repository(object):
                     branchenv=self._env.branchenv,
                     refenv=self._env.refenv,
                     commit=commit_hash)
+                if read_through_remote is not None:
+                    co._enable_read_through(RemoteReadThrough(self._env, address))
                 return co
             else:
                 raise ValueError("Argument `write` only takes True or False as value")
@@ -299,7 +392,8 @@ class Repository(object):
             raise e from None
 
     def clone(self, user_name: str, user_email: str, remote_address: str,
-              *, remove_old: bool = False) -> str:
+              *, remove_old: bool = False,
+              partial_filter: Optional[PartialCloneFilter] = None) -> str:
         """Download a remote repository to the local disk.
 
         The clone method implemented here is very similar to a `git clone`
@@ -327,6 +421,12 @@ class Repository(object):
             replaced with the newly cloned repo. (the default is False, which
             will not modify any contents on disk and which will refuse to create
             a repository at a given location if one already exists there.)
+        partial_filter : :class:`~hangar.remote.partial.PartialCloneFilter`, optional, kwarg only
+            If provided, only data hash records of the samples selected by the
+            filter (columns, sample keys, maximum sample size) are retrieved,
+            and the filter is recorded for the ``origin`` remote so later
+            fetch and fetch data operations only retrieve selected samples.
+            (the default is None, which clones records of every sample.)
 
         Returns
         -------
@@ -335,7 +435,8 @@ class Repository(object):
         """
         self.init(user_name=user_name, user_email=user_email, remove_old=remove_old)
         self._remote.add(name='origin', address=remote_address)
-        branch = self._remote.fetch(remote='origin', branch='master')
+        branch = self._remote.fetch(
+            remote='origin', branch='master', partial_filter=partial_filter)
         HEAD = heads.get_branch_head_commit(self._env.branchenv, branch_name=branch)
         heads.set_branch_head_commit(self._env.branchenv, 'master', HEAD)
         with warnings.catch_warnings(record=False):
@@ -748,7 +849,12 @@ class Repository(object):
         branches = heads.get_branch_names(self._env.branchenv)
         return branches
 
-    def verify_repo_integrity(self) -> bool:
+    def verify_repo_integrity(self,
+                              *,
+                              ncpus: int = 1,
+                              checkpoint: Optional[Union[str, Path]] = None,
+                              incremental: bool = False,
+                              report: Optional[Union[str, Path]] = None) -> bool:
         """Verify the integrity of the repository data on disk.
 
         Runs a full cryptographic verification of repository contents in order
@@ -794,6 +900,31 @@ class Repository(object):
         there are many more checks which are performed alongside them as part
         of the full verification run.
 
+        Data pieces are verified one backend file at a time (reading each file
+        sequentially), optionally by multiple processes at once. Long running
+        verifications can be made resumable by specifying a ``checkpoint``
+        file, and periodic verifications can be limited to data files written
+        since the last successful run with ``incremental=True``.
+
+        Parameters
+        ----------
+        ncpus : int, optional, kwarg only
+            Number of processes used to read and verify data files. If <= 0,
+            ``num_cpus / 2``. By default 1 (verify in this process).
+        checkpoint : Optional[Union[str, Path]], optional, kwarg only
+            Path of a file recording each data file as its verification
+            completes. If the file exists, data files recorded in it are not
+            verified again (resuming an interrupted run). The file is removed
+            once every data file has been verified. By default None.
+        incremental : bool, optional, kwarg only
+            If True, data files which were verified by the last successful
+            verification run are skipped (all other checks are still
+            performed). By default False.
+        report : Optional[Union[str, Path]], optional, kwarg only
+            Path to write a JSON report of the run to (status, per data file
+            results, and the details of any corrupt data pieces). Written
+            whether the verification passes or fails. By default None.
+
         Returns
         -------
         bool
@@ -808,7 +939,11 @@ class Repository(object):
                 branchenv=self._env.branchenv,
                 hashenv=self._env.hashenv,
                 refenv=self._env.refenv,
-                repo_path=self._env.repo_path)
+                repo_path=self._env.repo_path,
+                ncpus=ncpus,
+                checkpoint=checkpoint,
+                incremental=incremental,
+                report=report)
         finally:
             heads.release_writer_lock(self._env.branchenv, 'VERIFY_PROCESS')
         return True
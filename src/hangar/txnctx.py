@@ -1,29 +1,68 @@
+import threading
 from collections import Counter
-from typing import MutableMapping
+from typing import Iterable, MutableMapping, Tuple
 
 import lmdb
 
 
 class TxnRegisterSingleton(type):
     _instances = {}
+    _lock = threading.Lock()
+
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(TxnRegisterSingleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        try:
+            return cls._instances[cls]
+        except KeyError:
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(TxnRegisterSingleton, cls).__call__(*args, **kwargs)
+                return cls._instances[cls]
+
+
+class _ReaderState(threading.local):
+    """Reader transactions (and reference counts) owned by a single thread.
+    """
+
+    def __init__(self):
+        self.ancestors = Counter()
+        self.txns = {}
 
 
 class TxnRegister(metaclass=TxnRegisterSingleton):
     """Singleton to manage transaction thread safety in lmdb databases.
 
-    This is essentailly a reference counting transaction register, lots of room
-    for improvement here.
+    This is essentailly a reference counting transaction register. Read-only
+    transactions are tracked separately for every thread: each thread shares
+    a single reader txn per environment between all of its (nested) users, but
+    never sees the reader txn of another thread. Looking up the reader txn of
+    the current thread requires no locking, so reads scale across threads.
+
+    Environments are opened with ``max_spare_txns`` (see
+    :data:`~.constants.LMDB_SETTINGS`) so aborted reader txns are reset and
+    renewed (rather than reallocated) the next time a thread begins one.
+
+    Write-enabled transactions are shared by every thread (lmdb only allows a
+    single writer per environment); reference counts of writers are updated
+    under a lock.
     """
 
     def __init__(self):
         self.WriterAncestors = Counter()
-        self.ReaderAncestors = Counter()
         self.WriterTxn: MutableMapping[lmdb.Environment, lmdb.Transaction] = {}
-        self.ReaderTxn: MutableMapping[lmdb.Environment, lmdb.Transaction] = {}
+        self._writer_lock = threading.Lock()
+        self._readers = _ReaderState()
+
+    @property
+    def ReaderAncestors(self) -> Counter:
+        """Reference counts of reader txns opened by the current thread.
+        """
+        return self._readers.ancestors
+
+    @property
+    def ReaderTxn(self) -> MutableMapping[lmdb.Environment, lmdb.Transaction]:
+        """Reader txns opened by the current thread.
+        """
+        return self._readers.txns
 
     @property
     def _debug_(self):  # pragma: no cover
@@ -56,18 +95,20 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
         lmdb.Transaction
             transaction handle to perform operations on
         """
-        if self.WriterAncestors[lmdbenv] == 0:
-            self.WriterTxn[lmdbenv] = lmdbenv.begin(write=True, buffers=buffer)
-        self.WriterAncestors[lmdbenv] += 1
-        return self.WriterTxn[lmdbenv]
+        with self._writer_lock:
+            if self.WriterAncestors[lmdbenv] == 0:
+                self.WriterTxn[lmdbenv] = lmdbenv.begin(write=True, buffers=buffer)
+            self.WriterAncestors[lmdbenv] += 1
+            return self.WriterTxn[lmdbenv]
 
     def begin_reader_txn(self, lmdbenv: lmdb.Environment,
                          buffer: bool = False) -> lmdb.Transaction:
         """Start a reader only txn for the given environment
 
         If there a read-only transaction for the same environment already exists
-        then the same reader txn handle will be returned, and will not close
-        until all operations on that handle have said they are finished.
+        in the calling thread then the same reader txn handle will be returned,
+        and will not close until all operations on that handle have said they
+        are finished.
 
         Parameters
         ----------
@@ -82,10 +123,11 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
         lmdb.Transaction
             handle to the lmdb transaction.
         """
-        if self.ReaderAncestors[lmdbenv] == 0:
-            self.ReaderTxn[lmdbenv] = lmdbenv.begin(write=False, buffers=buffer)
-        self.ReaderAncestors[lmdbenv] += 1
-        return self.ReaderTxn[lmdbenv]
+        readers = self._readers
+        if readers.ancestors[lmdbenv] == 0:
+            readers.txns[lmdbenv] = lmdbenv.begin(write=False, buffers=buffer)
+        readers.ancestors[lmdbenv] += 1
+        return readers.txns[lmdbenv]
 
     def commit_writer_txn(self, lmdbenv: lmdb.Environment) -> bool:
         """Commit changes made in a write-enable transaction handle
@@ -110,25 +152,62 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
             True if this operation actually committed, otherwise false
             if other objects have references to the same (open) handle
         """
-        ancestors = self.WriterAncestors[lmdbenv]
-        if ancestors == 0:
-            msg = f'hash ancestors are zero but commit called on {lmdbenv}'
-            raise RuntimeError(msg)
-        elif ancestors == 1:
-            self.WriterTxn[lmdbenv].commit()
-            self.WriterTxn.__delitem__(lmdbenv)
-            ret = True
-        else:
-            ret = False
-        self.WriterAncestors[lmdbenv] -= 1
-        return ret
+        with self._writer_lock:
+            ancestors = self.WriterAncestors[lmdbenv]
+            if ancestors == 0:
+                msg = f'hash ancestors are zero but commit called on {lmdbenv}'
+                raise RuntimeError(msg)
+            elif ancestors == 1:
+                self.WriterTxn[lmdbenv].commit()
+                self.WriterTxn.__delitem__(lmdbenv)
+                ret = True
+            else:
+                ret = False
+            self.WriterAncestors[lmdbenv] -= 1
+            return ret
+
+    def abort_writer_txn(self, lmdbenv: lmdb.Environment) -> bool:
+        """Discard changes made in a write-enabled transaction handle
+
+        If other objects still have references to the same (open) handle, the
+        transaction is left open for them to commit or abort, and only the
+        reference held by the caller is released.
+
+        Parameters
+        ----------
+        lmdbenv : lmdb.Environment
+            the environment handle used to open the transaction
+
+        Raises
+        ------
+        RuntimeError
+            If the internal reference counting gets out of sync
+
+        Returns
+        -------
+        bool
+            True if this operation actually aborted the transaction, otherwise
+            False if other objects have references to the same (open) handle
+        """
+        with self._writer_lock:
+            ancestors = self.WriterAncestors[lmdbenv]
+            if ancestors == 0:
+                msg = f'hash ancestors are zero but abort called on {lmdbenv}'
+                raise RuntimeError(msg)
+            elif ancestors == 1:
+                self.WriterTxn.pop(lmdbenv).abort()
+                ret = True
+            else:
+                ret = False
+            self.WriterAncestors[lmdbenv] -= 1
+            return ret
 
     def abort_reader_txn(self, lmdbenv: lmdb.Environment) -> bool:
         """Request to close a read-only transaction handle
 
         As multiple objects can have references to the same open transaction
         handle, the transaction is not actuall aborted until all open transactions
-        have called the abort method
+        (in the calling thread) have called the abort method
 
 
         Parameters
@@ -148,14 +227,99 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
             otherwise False if other objects have references to the same (open)
             handle.
         """
-        ancestors = self.ReaderAncestors[lmdbenv]
+        readers = self._readers
+        ancestors = readers.ancestors[lmdbenv]
         if ancestors == 0:
             raise RuntimeError(f'hash ancestors are zero but abort called')
         elif ancestors == 1:
-            self.ReaderTxn[lmdbenv].abort()
-            self.ReaderTxn.__delitem__(lmdbenv)
+            readers.txns.pop(lmdbenv).abort()
             ret = True
         else:
             ret = False
-        self.ReaderAncestors[lmdbenv] -= 1
+        readers.ancestors[lmdbenv] -= 1
         return ret
+
+
+def putmulti_sorted(txn: lmdb.Transaction,
+                    items: Iterable[Tuple[bytes, bytes]],
+                    *,
+                    overwrite: bool = True) -> int:
+    """Write many records into a write-enabled txn in sorted key order.
+
+    Records are de-duplicated (last value for a key wins) and sorted before
+    being handed to ``cursor.putmulti``. When every key sorts after the last
+    key currently in the database the records are appended (``MDB_APPEND``),
+    which skips the b-tree search for each record entirely; otherwise a
+    regular (but still sorted) ``putmulti`` is issued.
+
+    Parameters
+    ----------
+    txn : lmdb.Transaction
+        write enabled transaction to place the records in.
+    items : Iterable[Tuple[bytes, bytes]]
+        key / value pairs to write.
+    overwrite : bool, optional
+        if False, existing keys in the database are left untouched; by
+        default True.
+
+    Returns
+    -------
+    int
+        number of records which were written.
+    """
+    records = sorted(dict(items).items())
+    if not records:
+        return 0
+    with txn.cursor() as cursor:
+        lastKey = cursor.key() if cursor.last() else None
+        append = (lastKey is None) or (bytes(lastKey) < records[0][0])
+        _, added = cursor.putmulti(records, dupdata=False, overwrite=overwrite, append=append)
+    return added
+
+
+def bulk_put_records(lmdbenv: lmdb.Environment,
+                     items: Iterable[Tuple[bytes, bytes]],
+                     *,
+                     chunk_size: int = 100_000,
+                     overwrite: bool = True) -> int:
+    """Sort and write many records to an environment in a single write txn.
+
+    Records are sorted and handed to :func:`putmulti_sorted` in chunks of
+    ``chunk_size``, bounding the size of each ``putmulti`` call, but every
+    chunk is placed in the same write txn obtained from the
+    :class:`TxnRegister`: either all records are committed, or (if writing
+    any chunk fails) none are. Since chunks are written in increasing key
+    order, every chunk after the first is appended whenever the first one
+    was.
+
+    Parameters
+    ----------
+    lmdbenv : lmdb.Environment
+        environment to write the records into.
+    items : Iterable[Tuple[bytes, bytes]]
+        key / value pairs to write. Duplicate keys keep the last value.
+    chunk_size : int, optional
+        max number of records written per ``putmulti`` call, by default 100_000.
+    overwrite : bool, optional
+        if False, existing keys in the database are left untouched; by
+        default True.
+
+    Returns
+    -------
+    int
+        number of records which were written.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size: {chunk_size} must be >= 1')
+    records = sorted(dict(items).items())
+    added = 0
+    txn = TxnRegister().begin_writer_txn(lmdbenv)
+    try:
+        for start in range(0, len(records), chunk_size):
+            added += putmulti_sorted(
+                txn, records[start:start + chunk_size], overwrite=overwrite)
+    except BaseException:
+        TxnRegister().abort_writer_txn(lmdbenv)
+        raise
+    TxnRegister().commit_writer_txn(lmdbenv)
+    return added
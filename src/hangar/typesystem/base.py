@@ -105,3 +105,13 @@ class ColumnBase(metaclass=checkedmeta):
     def data_hash_digest(self, *args, **kwargs):
         raise NotImplementedError
 
+    def data_hash_digest_checksum(self, data) -> tuple:
+        """content digest of ``data`` & the backend checksum of its raw bytes.
+
+        The checksum is None for types whose backends compute their own.
+        """
+        return self.data_hash_digest(data), None
+
+    def data_hash_digests_checksums(self, data: list) -> list:
+        return [self.data_hash_digest_checksum(d) for d in data]
+
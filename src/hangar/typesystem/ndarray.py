@@ -2,7 +2,8 @@ import numpy as np
 
 from .base import ColumnBase
 from .descriptors import OneOf, String, OptionalString, SizedIntegerTuple, OptionalDict
-from ..records import CompatibleData
+from ..records import CompatibleData, hash_ndarrays
+from ..records.hashmachine import ndarray_hasher_checksum_tcode_0
 
 
 @OneOf(['variable_shape', 'fixed_shape'])
@@ -88,6 +89,12 @@ class NdarraySchemaBase(ColumnBase):
     def data_hash_digest(self, data: np.ndarray) -> str:
         return self._data_hasher_func(data)
 
+    def data_hash_digest_checksum(self, data: np.ndarray) -> tuple:
+        return ndarray_hasher_checksum_tcode_0(data)
+
+    def data_hash_digests_checksums(self, data: list) -> list:
+        return hash_ndarrays(data, checksums=True)
+
     def change_backend(self, backend, backend_options=None):
         old_backend = self._backend
         old_backend_options = self._backend_options
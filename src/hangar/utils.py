@@ -4,10 +4,12 @@ import secrets
 import string
 import sys
 import time
+import warnings
 from collections import deque
 from io import StringIO
 from pathlib import Path
 from itertools import tee, filterfalse, count, zip_longest
+from math import ceil
 from typing import Union
 
 import blosc
@@ -40,6 +42,30 @@ def calc_num_threadpool_workers() -> int:
     return bound(2, 10, nCores * 2)
 
 
+def calc_num_process_workers(ncpus: int) -> int:
+    """Determine how many worker processes to spin up for a bulk operation
+
+    Parameters
+    ----------
+    ncpus: int
+        User specified number of worker processes. If <= 0 set to num CPU cores / 2.
+
+    Returns
+    -------
+    int
+    """
+    node_cpus = os.cpu_count()
+    if ncpus <= 0:
+        cpu_try = ceil(node_cpus / 2)
+        ncpus = bound(1, node_cpus, cpu_try)
+    elif ncpus > node_cpus:
+        warnings.warn(
+            f'Input number of CPUs exceeds maximum on node. {ncpus} > {node_cpus}',
+            category=UserWarning
+        )
+    return ncpus
+
+
 def is_64bits():
     """bool indicating if running on atleast a 64 bit machine
     """
@@ -239,3 +239,222 @@ def test_signature_wrong(repo):
             udf=wrong_sig_udf,
             udf_kwargs=kwargs,
             ncpus=2)
+
+
+def test_bulk_importer_single_pass_runs_udf_once_and_dedupes(repo, managed_tmpdir):
+    from os.path import join as pjoin
+    from hangar.bulk_importer import run_bulk_import
+    from hangar.bulk_importer import UDF_Return
+    from hangar.records.hashs import HashQuery
+
+    calls_pth = pjoin(managed_tmpdir, 'udf_calls.txt')
+
+    def make_ndarray(key, multiplier):
+        with open(calls_pth, 'a') as f:
+            f.write(f'{key}\n')
+        arr = np.arange(25, dtype=np.uint32).reshape(5, 5) * multiplier
+        yield UDF_Return(column='arr', key=key, data=arr)
+
+    co = repo.checkout(write=True)
+    arr_col = co.add_ndarray_column('arr', shape=(5, 5), dtype=np.uint32)
+    for multiplier in range(5):
+        arr_col[f'pre{multiplier}'] = np.arange(25, dtype=np.uint32).reshape(5, 5) * multiplier
+    co.commit('first')
+    co.close()
+    assert HashQuery(repo._env.hashenv).num_data_records() == 5
+
+    kwargs = [{'key': idx, 'multiplier': idx % 10} for idx in range(100)]
+    report = run_bulk_import(
+        repo,
+        branch_name='master',
+        column_names=['arr'],
+        udf=make_ndarray,
+        udf_kwargs=kwargs,
+        ncpus=2,
+        single_pass=True)
+    assert report == (100, 5)
+    assert report.num_deduplicated == 95
+
+    with open(calls_pth, 'r') as f:
+        num_calls = len(f.readlines())
+    # every input once, plus two inputs run twice by the pre-run sanity check.
+    assert num_calls == 100 + 4
+    # only data not already stored is written, once.
+    assert HashQuery(repo._env.hashenv).num_data_records() == 10
+
+    co = repo.checkout()
+    try:
+        arr_col = co['arr']
+        assert len(arr_col) == 105
+        for idx in range(100):
+            assert_equal(arr_col[idx], np.arange(25, dtype=np.uint32).reshape(5, 5) * (idx % 10))
+    finally:
+        co.close()
+
+
+def test_bulk_importer_stream_from_generator_commits_checkpoints(repo):
+    from hangar.bulk_importer import run_bulk_import_stream
+    from hangar.bulk_importer import UDF_Return
+
+    def make_ndarray(key, multiplier):
+        arr = np.arange(25, dtype=np.uint32).reshape(5, 5) * multiplier
+        yield UDF_Return(column='arr', key=key, data=arr)
+        yield UDF_Return(column='str', key=key, data=f'{key} * {multiplier}')
+
+    co = repo.checkout(write=True)
+    co.add_ndarray_column('arr', shape=(5, 5), dtype=np.uint32)
+    co.add_str_column('str')
+    co.commit('first')
+    co.close()
+
+    def kwargs_stream():
+        for idx in range(250):
+            yield {'key': idx, 'multiplier': idx % 20}
+
+    report = run_bulk_import_stream(
+        repo,
+        branch_name='master',
+        column_names=['arr', 'str'],
+        udf=make_ndarray,
+        udf_kwargs=kwargs_stream(),
+        ncpus=2,
+        checkpoint_every=100)
+    # 20 distinct arrays (deduplicated across checkpoints) & 250 distinct strings.
+    assert report == (500, 270)
+
+    log = repo.log(return_contents=True)
+    assert len(log['order']) == 4
+
+    co = repo.checkout()
+    try:
+        assert len(co['arr']) == 250
+        assert len(co['str']) == 250
+        for idx in range(250):
+            assert_equal(co['arr', idx], np.arange(25, dtype=np.uint32).reshape(5, 5) * (idx % 20))
+            assert co['str', idx] == f'{idx} * {idx % 20}'
+    finally:
+        co.close()
+
+
+def test_bulk_importer_stream_failure_keeps_completed_checkpoints(repo):
+    from hangar.bulk_importer import run_bulk_import_stream
+    from hangar.bulk_importer import UDF_Return
+
+    def make_ndarray(key):
+        shape = (5, 5) if key != 150 else (6, 6)
+        yield UDF_Return(column='arr', key=key, data=np.zeros(shape, dtype=np.uint32) + key)
+
+    co = repo.checkout(write=True)
+    co.add_ndarray_column('arr', shape=(5, 5), dtype=np.uint32)
+    co.commit('first')
+    co.close()
+
+    with pytest.raises(RuntimeError):
+        run_bulk_import_stream(
+            repo,
+            branch_name='master',
+            column_names=['arr'],
+            udf=make_ndarray,
+            udf_kwargs=({'key': idx} for idx in range(300)),
+            ncpus=2,
+            checkpoint_every=100)
+
+    co = repo.checkout(write=True)
+    try:
+        assert len(co['arr']) == 100
+        assert co.diff.status() == 'CLEAN'
+    finally:
+        co.close()
+
+
+def test_adaptive_batch_sizer_sizes_from_latency_and_remaining_tasks():
+    from hangar.bulk_importer import _AdaptiveBatchSizer
+
+    sizer = _AdaptiveBatchSizer(num_workers=4, target_seconds=0.5, max_size=1000)
+    # latency is unknown until a batch completes
+    assert sizer.size() == 1
+    sizer.record(num_tasks=10, seconds=0.01)
+    assert sizer.size() == 500
+    # batches shrink as the end of the work approaches
+    assert sizer.size(num_remaining=80) == 10
+    assert sizer.size(num_remaining=1) == 1
+    # slow tasks are sent one at a time
+    sizer.record(num_tasks=1, seconds=100)
+    assert sizer.size() == 1
+
+    sizer = _AdaptiveBatchSizer(num_workers=1, max_nbytes=1000)
+    sizer.record(num_tasks=1, seconds=0.0)
+    tasks = iter([{'arr': np.zeros(50, dtype=np.uint8)} for _ in range(100)])
+    assert len(sizer.next_batch(tasks)) == 20
+    assert len(sizer.next_batch(tasks)) == 20
+    assert len(list(tasks)) == 60
+
+
+def test_large_array_kwargs_are_passed_through_shared_memory():
+    from hangar.bulk_importer import (
+        _SharedArray, _Task, _attach_shared_arrays, _share_large_arrays)
+
+    big = np.random.random((500, 500))
+    small = np.arange(10)
+    shms = []
+    task = _share_large_arrays({'big': big, 'small': small, 'name': 'foo'}, shms)
+    assert len(shms) == 1
+    assert isinstance(task['big'], _SharedArray)
+    assert task['small'] is small
+    attached = _attach_shared_arrays(task)
+    assert_equal(attached['big'], big)
+    assert attached['name'] == 'foo'
+
+    recipe_task = _share_large_arrays(_Task({'big': big}, (0,), ('digest',)), shms)
+    assert len(shms) == 2
+    assert_equal(_attach_shared_arrays(recipe_task).udf_kwargs['big'], big)
+    for shm in shms:
+        shm.close()
+        shm.unlink()
+
+
+def test_large_array_kwargs_pickled_without_shared_memory_module(monkeypatch):
+    import sys
+    from hangar.bulk_importer import _attach_shared_arrays, _share_large_arrays
+
+    # python < 3.8 has no multiprocessing.shared_memory module.
+    monkeypatch.setitem(sys.modules, 'multiprocessing.shared_memory', None)
+    big = np.random.random((500, 500))
+    kwargs = {'big': big}
+    shms = []
+    assert _share_large_arrays(kwargs, shms) is kwargs
+    assert shms == []
+    assert _attach_shared_arrays(kwargs) is kwargs
+
+
+@pytest.mark.parametrize('single_pass', [False, True])
+def test_bulk_importer_large_array_kwargs(repo, single_pass):
+    from hangar.bulk_importer import run_bulk_import
+    from hangar.bulk_importer import UDF_Return
+
+    def reduce_array(key, arr):
+        yield UDF_Return(column='arr', key=key, data=arr.sum(axis=0))
+
+    co = repo.checkout(write=True)
+    co.add_ndarray_column('arr', shape=(400,), dtype=np.float64)
+    co.commit('first')
+    co.close()
+
+    kwargs = [{'key': idx, 'arr': np.random.random((400, 400))} for idx in range(20)]
+    report = run_bulk_import(
+        repo,
+        branch_name='master',
+        column_names=['arr'],
+        udf=reduce_array,
+        udf_kwargs=kwargs,
+        ncpus=2,
+        single_pass=single_pass)
+    assert report == (20, 20)
+
+    co = repo.checkout()
+    try:
+        assert len(co['arr']) == 20
+        for kw in kwargs:
+            assert np.allclose(co['arr', kw['key']], kw['arr'].sum(axis=0))
+    finally:
+        co.close()
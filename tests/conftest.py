@@ -303,6 +303,53 @@ def server_instance(monkeypatch, managed_tmpdir, worker_id):
     server.wait_for_termination(timeout=2)
 
 
+@pytest.fixture()
+def server_instance_read_workers(monkeypatch, managed_tmpdir, worker_id):
+    from secrets import choice
+    from hangar.remote import server
+    monkeypatch.setattr(server, 'server_config', mock_server_config)
+
+    possibble_addresses = [x for x in range(50000, 59999)]
+    chosen_address = choice(possibble_addresses)
+    address = f'localhost:{chosen_address}'
+    base_tmpdir = pjoin(managed_tmpdir, f'{worker_id[-1]}')
+    mkdir(base_tmpdir)
+    server, hangserver, _ = server.serve(
+        base_tmpdir, overwrite=True, channel_address=address, fetch_read_workers=2)
+    server.start()
+    yield address, hangserver
+
+    hangserver.close()
+    server.stop(0.1)
+    server.wait_for_termination(timeout=2)
+
+
+def mock_server_config_sample_cache(*args, **kwargs):
+    CFG = mock_server_config(*args, **kwargs)
+    CFG['SERVER_GRPC']['sample_cache_nbytes'] = '64_000_000'
+    return CFG
+
+
+@pytest.fixture()
+def server_instance_sample_cache(monkeypatch, managed_tmpdir, worker_id):
+    from secrets import choice
+    from hangar.remote import server
+    monkeypatch.setattr(server, 'server_config', mock_server_config_sample_cache)
+
+    possibble_addresses = [x for x in range(50000, 59999)]
+    chosen_address = choice(possibble_addresses)
+    address = f'localhost:{chosen_address}'
+    base_tmpdir = pjoin(managed_tmpdir, f'{worker_id[-1]}')
+    mkdir(base_tmpdir)
+    server, hangserver, _ = server.serve(base_tmpdir, overwrite=True, channel_address=address)
+    server.start()
+    yield address
+
+    hangserver.close()
+    server.stop(0.1)
+    server.wait_for_termination(timeout=2)
+
+
 @pytest.fixture(scope='class')
 def server_instance_class(monkeysession, tmp_path_factory, worker_id):
     from secrets import choice
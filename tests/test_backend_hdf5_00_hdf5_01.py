@@ -183,3 +183,37 @@ def test_arrayset_overflows_collection_size_collection_count(be_code, repo, monk
             proto[:] = i
             assert np.allclose(proto, ncm_aset[i])
     rco.close()
+
+
+@pytest.mark.parametrize('opts,shape,dtype', [
+    ({'complib': 'blosc:lz4hc', 'complevel': 5, 'shuffle': 'byte'}, (200, 300), np.float32),
+    ({'complib': 'blosc:zstd', 'complevel': 3, 'shuffle': 'bit'}, (5, 7), np.float32),
+    ({'complib': 'lzf', 'complevel': None, 'shuffle': True}, (), np.int64),
+    ({'complib': 'gzip', 'complevel': 3, 'shuffle': False}, (1000, 1000), np.uint8),
+])
+def test_hdf5_01_raw_chunks_decode_to_written_data(repo, opts, shape, dtype):
+    from hangar.backends.hdf5_01 import decode_raw_chunks
+    from hangar.records import hashs
+
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column('aset', shape=shape, dtype=dtype, backend='01',
+                                  backend_options=opts)
+    with aset as a:
+        for i in range(3):
+            a[i] = (np.arange(np.prod(shape, dtype=int)) % 20 * i).astype(dtype).reshape(shape)
+    wco.commit('hello')
+    wco.close()
+
+    rco = repo.checkout()
+    be_fs = rco.columns['aset']._be_fs['01']
+    specs = hashs.HashQuery(repo._env.hashenv).gen_all_data_digests_and_parsed_backend_specs()
+    for _, spec in specs:
+        raw = be_fs.read_raw_chunks(spec)
+        assert raw.checksum == spec.checksum
+        assert raw.shape == tuple(spec.shape)
+        assert len(raw.chunks) >= 1
+        res = decode_raw_chunks(raw)
+        expected = be_fs.read_data(spec)
+        assert res.dtype == expected.dtype
+        assert np.array_equal(res, expected)
+    rco.close()
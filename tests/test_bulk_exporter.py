@@ -0,0 +1,98 @@
+import io
+import tarfile
+
+import numpy as np
+import pytest
+
+from conftest import fixed_shape_backend_params
+
+
+@pytest.fixture()
+def exported_repo(repo):
+    co = repo.checkout(write=True)
+    arr = co.add_ndarray_column('arr', shape=(4, 4), dtype=np.float32)
+    strs = co.add_str_column('strs')
+    for idx in range(15):
+        arr[idx] = np.full((4, 4), idx, dtype=np.float32)
+        arr[f's{idx}'] = np.full((4, 4), -idx, dtype=np.float32)
+        strs[idx] = f'value {idx}'
+    co.commit('first')
+    co.close()
+    return repo
+
+
+@pytest.fixture()
+def outdir(tmp_path):
+    pth = tmp_path.joinpath('exported')
+    pth.mkdir()
+    return pth
+
+
+def _read_tar_shard(fpath):
+    with tarfile.open(fpath, mode='r') as tf:
+        return {member.name: np.load(io.BytesIO(tf.extractfile(member).read()))
+                for member in tf.getmembers()}
+
+
+@pytest.mark.parametrize('backend', fixed_shape_backend_params)
+def test_bulk_export_tar_shards(exported_repo, outdir, backend):
+    from hangar.bulk_exporter import run_bulk_export
+
+    co = exported_repo.checkout(write=True)
+    co['arr'].change_backend(backend)
+    co['arr'][100] = np.ones((4, 4), dtype=np.float32)
+    co.commit('backend changed')
+    co.close()
+
+    progress = []
+    shards = run_bulk_export(exported_repo, 'arr', outdir, archive='tar',
+                             batch_size=7, ncpus=2, progress=progress.append)
+    assert [p.name for p in shards] == [f'arr-{idx:05d}.tar' for idx in range(5)]
+    assert sorted(progress) == [3, 7, 7, 7, 7]
+    assert sorted(p.name for p in outdir.iterdir()) == [p.name for p in shards]
+
+    members = {}
+    for shard in shards:
+        members.update(_read_tar_shard(shard))
+    assert len(members) == 31
+    for idx in range(15):
+        assert np.array_equal(members[f'int:{idx}.npy'], np.full((4, 4), idx, dtype=np.float32))
+        assert np.array_equal(members[f'str:s{idx}.npy'], np.full((4, 4), -idx, dtype=np.float32))
+    assert np.array_equal(members['int:100.npy'], np.ones((4, 4), dtype=np.float32))
+
+
+def test_bulk_export_npz_shards_of_selected_keys_at_commit(exported_repo, outdir):
+    from hangar.bulk_exporter import run_bulk_export
+
+    first_commit = exported_repo.log(return_contents=True)['head']
+    co = exported_repo.checkout(write=True)
+    co['strs'][0] = 'changed'
+    co.commit('second')
+    co.close()
+
+    shards = run_bulk_export(exported_repo, 'strs', outdir, commit=first_commit,
+                             keys=[0, 1, 2], archive='npz', ncpus=1)
+    assert len(shards) == 1
+    with np.load(shards[0]) as npz:
+        assert dict(npz) == {'int:0': 'value 0', 'int:1': 'value 1', 'int:2': 'value 2'}
+
+
+def test_bulk_export_invalid_arguments(exported_repo, outdir):
+    from hangar.bulk_exporter import run_bulk_export
+
+    co = exported_repo.checkout(write=True)
+    co.add_ndarray_column('nested', prototype=np.zeros((2,)), contains_subsamples=True)
+    co.commit('nested')
+    co.close()
+
+    with pytest.raises(ValueError, match='not a flat column'):
+        run_bulk_export(exported_repo, 'nested', outdir, archive='tar')
+    with pytest.raises(ValueError):
+        run_bulk_export(exported_repo, 'arr', outdir, archive='zip')
+    with pytest.raises(ValueError):
+        run_bulk_export(exported_repo, 'arr', outdir, archive='tar', batch_size=0)
+    with pytest.raises(ValueError):
+        run_bulk_export(exported_repo, 'arr', outdir.joinpath('missing'), archive='tar')
+    with pytest.raises(KeyError, match='No sample with key: missing'):
+        run_bulk_export(exported_repo, 'arr', outdir, keys=['missing'], archive='tar')
+    assert list(outdir.iterdir()) == []
@@ -762,6 +762,34 @@ def test_branch_create_and_delete(written_two_cmt_server_repo):
             new_repo._env._close_environments()
 
 
+def test_stats(repo_20_filled_samples):
+    import json
+
+    repo = repo_20_filled_samples
+    runner = CliRunner()
+    res = runner.invoke(cli.stats, obj=repo)
+    assert res.exit_code == 0
+    lines = res.stdout.splitlines()
+    assert lines[0].startswith('Disk Usage: ')
+    assert any(line.startswith('writtenaset ') and line.split()[1:3] == ['20', '20']
+               for line in lines)
+    assert lines[-1].startswith('TOTAL ')
+
+    res = runner.invoke(cli.stats, ['master', '--json'], obj=repo)
+    assert res.exit_code == 0
+    out = json.loads(res.stdout)
+    expected = repo.storage_stats()
+    assert out['nbytes'] == expected.nbytes
+    assert out['commit']['num_data_records'] == 40
+    assert out['commit']['columns']['second_aset']['num_data_pieces'] == 20
+    assert out['commit']['dedup_ratio'] == expected.commit.dedup_ratio
+
+    cmt = repo.log(return_contents=True)['head']
+    res = runner.invoke(cli.stats, [cmt[:10], '--json'], obj=repo)
+    assert res.exit_code == 0
+    assert json.loads(res.stdout)['commit']['commit'] == cmt
+
+
 def test_start_server(managed_tmpdir):
     import time
     runner = CliRunner()
@@ -933,6 +961,112 @@ class TestImport(object):
             co.close()
 
 
+class TestParallelImport(object):
+
+    @staticmethod
+    def load(fpath, *args, **kwargs):
+        fpath = Path(fpath)
+        value = int(fpath.read_text())
+        return np.full((5, 7), value, dtype=np.float64), fpath.stem
+
+    @pytest.fixture()
+    def data_dir(self, tmp_path):
+        root = tmp_path / 'data'
+        (root / 'sub').mkdir(parents=True)
+        for idx in range(4):
+            root.joinpath(f'top{idx}.ext').write_text(str(idx % 2))
+        for idx in range(3):
+            root.joinpath('sub', f'nested{idx}.ext').write_text(str(idx + 10))
+        root.joinpath('skipped.txt').write_text('0')
+        return root
+
+    @pytest.mark.parametrize('recursive,include,exclude,expected', [
+        (False, [], [], {'top0', 'top1', 'top2', 'top3', 'skipped'}),
+        (True, ['*.ext'], [], {'top0', 'top1', 'top2', 'top3', 'nested0', 'nested1', 'nested2'}),
+        (True, ['sub/*'], [], {'nested0', 'nested1', 'nested2'}),
+        (True, ['*.ext'], ['sub/nested1*', 'top3*'], {'top0', 'top1', 'top2', 'nested0', 'nested2'}),
+    ])
+    def test_iter_import_files_filters(self, data_dir, recursive, include, exclude, expected):
+        from hangar.cli.utils import iter_import_files
+
+        found = list(iter_import_files(data_dir, recursive=recursive, include=include, exclude=exclude))
+        assert {f.stem for f in found} == expected
+        assert all(f.is_absolute() for f in found)
+        single = data_dir / 'top0.ext'
+        assert list(iter_import_files(single, include=['*.nomatch'])) == [single.resolve()]
+
+    def test_import_jobs_recursive_with_dedup_report(self, monkeypatch, written_repo_with_1_sample, data_dir):
+        repo = written_repo_with_1_sample
+        runner = CliRunner()
+        aset_name = 'writtenaset'
+
+        with monkeypatch.context() as m:
+            m.setattr(PluginManager, "_scan_plugins", monkeypatch_scan(['load'], ['ext'], 'load', self.load))
+            res = runner.invoke(
+                cli.import_data,
+                [aset_name, str(data_dir), '--recursive', '--include', '*.ext', '--jobs', '2'],
+                obj=repo)
+            assert res.exit_code == 0, res.output
+            assert 'Imported 7 samples from 7 files (5 data pieces written, 2 deduplicated).' in res.output
+
+        co = repo.checkout(write=True)
+        try:
+            aset = co.columns[aset_name]
+            for idx in range(4):
+                assert np.array_equal(aset[f'top{idx}'], np.full((5, 7), idx % 2))
+            for idx in range(3):
+                assert np.array_equal(aset[f'nested{idx}'], np.full((5, 7), idx + 10))
+            assert 'skipped' not in aset
+        finally:
+            co.close()
+
+    @pytest.mark.parametrize('overwrite', [False, True])
+    def test_import_jobs_overwrite(self, monkeypatch, written_repo_with_1_sample, tmp_path, overwrite):
+        repo = written_repo_with_1_sample
+        runner = CliRunner()
+        aset_name = 'writtenaset'
+        tmp_path.joinpath('data.ext').write_text('3')
+        tmp_path.joinpath('new.ext').write_text('4')
+
+        co = repo.checkout()
+        original = co.columns[aset_name]['data']
+        co.close()
+
+        args = [aset_name, str(tmp_path), '--jobs', '2']
+        if overwrite:
+            args.append('--overwrite')
+        with monkeypatch.context() as m:
+            m.setattr(PluginManager, "_scan_plugins", monkeypatch_scan(['load'], ['ext'], 'load', self.load))
+            res = runner.invoke(cli.import_data, args, obj=repo)
+            assert res.exit_code == 0, res.output
+
+        co = repo.checkout(write=True)
+        try:
+            aset = co.columns[aset_name]
+            assert np.array_equal(aset['new'], np.full((5, 7), 4))
+            if overwrite:
+                assert np.array_equal(aset['data'], np.full((5, 7), 3))
+            else:
+                assert np.array_equal(aset['data'], original)
+        finally:
+            co.close()
+
+    def test_import_jobs_nested_column_fails(self, monkeypatch, written_repo_with_1_sample, tmp_path):
+        repo = written_repo_with_1_sample
+        co = repo.checkout(write=True)
+        co.add_ndarray_column('nestedcol', prototype=np.zeros((5, 7)), contains_subsamples=True)
+        co.commit('add nested')
+        co.close()
+        tmp_path.joinpath('data.ext').write_text('3')
+
+        runner = CliRunner()
+        with monkeypatch.context() as m:
+            m.setattr(PluginManager, "_scan_plugins", monkeypatch_scan(['load'], ['ext'], 'load', self.load))
+            res = runner.invoke(cli.import_data, ['nestedcol', str(tmp_path), '--jobs', '2'], obj=repo)
+        assert res.exit_code == 1
+        assert 'only flat columns can be imported with --jobs' in res.output
+
+
 class TestExport(object):
     save_msg = "Data saved from custom save function"
 
@@ -1042,6 +1176,77 @@ class TestExport(object):
             assert res.exit_code == 0
 
 
+class TestParallelExport(object):
+
+    @pytest.fixture()
+    def outdir(self, tmp_path):
+        pth = tmp_path.joinpath('exported')
+        pth.mkdir()
+        return pth
+
+    @staticmethod
+    def save(data, outdir, sampleN, extension, *args, **kwargs):
+        np.save(os.path.join(outdir, f"{sampleN}.{extension}.npy"), data)
+
+    def test_export_jobs_one_file_per_sample(self, monkeypatch, written_repo_with_1_sample, outdir):
+        repo = written_repo_with_1_sample
+        runner = CliRunner()
+        aset_name = 'writtenaset'
+
+        with monkeypatch.context() as m:
+            m.setattr(PluginManager, "_scan_plugins", monkeypatch_scan(['save'], ['ext'], 'save', self.save))
+            res = runner.invoke(
+                cli.export_data, [aset_name, '-o', str(outdir), '--format', 'ext', '--jobs', '2'], obj=repo)
+            assert res.exit_code == 0, res.output
+
+        co = repo.checkout()
+        try:
+            aset = co.columns[aset_name]
+            assert sorted(p.name for p in outdir.iterdir()) == [
+                'int:123.ext.npy', 'str:123.ext.npy', 'str:data.ext.npy']
+            for key in aset.keys():
+                fpath = outdir.joinpath(f'{type(key).__name__}:{key}.ext.npy')
+                assert np.array_equal(np.load(fpath), aset[key])
+        finally:
+            co.close()
+
+    @pytest.mark.parametrize('archive', ['tar', 'npz'])
+    def test_export_archive_shards(self, written_repo_with_1_sample, outdir, archive):
+        repo = written_repo_with_1_sample
+        runner = CliRunner()
+        res = runner.invoke(
+            cli.export_data,
+            ['writtenaset', '-o', str(outdir), '--archive', archive, '--batch-size', '2'],
+            obj=repo)
+        assert res.exit_code == 0, res.output
+        assert f'Exported 3 samples into 2 {archive} shards' in res.output
+        assert sorted(p.name for p in outdir.iterdir()) == [
+            f'writtenaset-00000.{archive}', f'writtenaset-00001.{archive}']
+
+    def test_export_archive_single_sample(self, written_repo_with_1_sample, outdir):
+        repo = written_repo_with_1_sample
+        runner = CliRunner()
+        res = runner.invoke(
+            cli.export_data,
+            ['writtenaset', '-o', str(outdir), '--sample', 'int:123', '--archive', 'npz'],
+            obj=repo)
+        assert res.exit_code == 0, res.output
+        co = repo.checkout()
+        try:
+            with np.load(outdir.joinpath('writtenaset-00000.npz')) as npz:
+                assert list(npz.keys()) == ['int:123']
+                assert np.array_equal(npz['int:123'], co.columns['writtenaset'][123])
+        finally:
+            co.close()
+
+    def test_export_jobs_missing_column(self, written_repo_with_1_sample, outdir):
+        runner = CliRunner()
+        res = runner.invoke(
+            cli.export_data, ['missing', '-o', str(outdir), '--jobs', '2'],
+            obj=written_repo_with_1_sample)
+        assert res.exit_code == 1
+
+
 class TestShow(object):
     show_msg = "Data is displayed from custom show function"
 
@@ -388,3 +388,28 @@ def test_schema_smaller_16_bytes_cannot_change_to_blosc_backend(
     with pytest.raises(ValueError, match='blosc clib requires'):
         aset.change_backend(backend=backend, backend_options=be_opts)
     wco.close()
+
+
+def test_lazy_open_handles_open_each_file_once_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+    from threading import Barrier
+    from hangar.backends.handles import LazyOpenHandles
+
+    barrier = Barrier(8)
+    opened = []
+
+    def _open(uid):
+        opened.append(uid)
+        return f'handle-{uid}'
+
+    handles = LazyOpenHandles(a=partial(_open, 'a'))
+
+    def _read(_):
+        barrier.wait()
+        return handles.opened('a')
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert set(pool.map(_read, range(8))) == {'handle-a'}
+    assert opened == ['a']
+    assert handles['a'] == 'handle-a'
@@ -1,4 +1,5 @@
 import pytest
+import lmdb
 import numpy as np
 
 from conftest import fixed_shape_backend_params, variable_shape_backend_params
@@ -27,3 +28,110 @@ def test_nested_context_manager_does_not_close_all_open(repo, backend1, backend2
         assert baraset._is_conman is True
     assert co.columns._any_is_conman() is False
     co.close()
+
+
+def test_reader_txns_are_shared_within_and_separate_across_threads(repo):
+    from concurrent.futures import ThreadPoolExecutor
+    from hangar.txnctx import TxnRegister
+
+    register = TxnRegister()
+    env = repo._env.hashenv
+    txn = register.begin_reader_txn(env)
+    assert register.begin_reader_txn(env) is txn
+
+    def other_thread_txn():
+        other = register.begin_reader_txn(env)
+        try:
+            return other is txn, register.ReaderAncestors[env]
+        finally:
+            register.abort_reader_txn(env)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(other_thread_txn).result() == (False, 1)
+    assert register.ReaderAncestors[env] == 2
+    assert register.abort_reader_txn(env) is False
+    assert register.abort_reader_txn(env) is True
+    with pytest.raises(RuntimeError):
+        register.abort_reader_txn(env)
+
+
+def test_reader_checkout_columns_read_concurrently_from_threads(repo_300_filled_samples):
+    from concurrent.futures import ThreadPoolExecutor
+
+    co = repo_300_filled_samples.checkout()
+    aset = co.columns['aset']
+
+    def read_samples(keys):
+        return [(key, aset[key]) for key in keys]
+
+    batches = [range(start, 300, 8) for start in range(8)]
+    with co, ThreadPoolExecutor(max_workers=8) as executor:
+        for batch in executor.map(read_samples, batches):
+            for key, arr in batch:
+                assert np.all(arr == key)
+    co.close()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 100])
+def test_bulk_put_records_sorts_and_chunks_writes(repo, chunk_size):
+    from hangar.txnctx import TxnRegister, bulk_put_records
+
+    env = repo._env.stagehashenv
+    items = [(f'k{i:03d}'.encode(), f'v{i}'.encode()) for i in reversed(range(10))]
+    items.append((b'k005', b'last'))
+    assert bulk_put_records(env, items, chunk_size=chunk_size) == 10
+
+    txn = TxnRegister().begin_reader_txn(env)
+    try:
+        with txn.cursor() as cur:
+            stored = [(bytes(k), bytes(v)) for k, v in cur.iternext()]
+    finally:
+        TxnRegister().abort_reader_txn(env)
+    expected = {k: v for k, v in items}
+    assert stored == sorted(expected.items())
+    assert TxnRegister().WriterAncestors[env] == 0
+
+
+def test_putmulti_sorted_appends_only_after_last_key(repo):
+    from hangar.txnctx import TxnRegister, putmulti_sorted
+
+    env = repo._env.stagehashenv
+    txn = TxnRegister().begin_writer_txn(env)
+    try:
+        assert putmulti_sorted(txn, [(b'b', b'1'), (b'd', b'1')]) == 2
+        # keys interleave with existing records; cannot be appended.
+        assert putmulti_sorted(txn, [(b'c', b'2'), (b'a', b'2'), (b'b', b'2')]) == 3
+        assert putmulti_sorted(txn, [(b'e', b'3'), (b'a', b'3')], overwrite=False) == 1
+        assert putmulti_sorted(txn, [(b'f', b'4'), (b'g', b'4')]) == 2
+        assert putmulti_sorted(txn, []) == 0
+        with txn.cursor() as cur:
+            stored = dict((bytes(k), bytes(v)) for k, v in cur.iternext())
+    finally:
+        TxnRegister().commit_writer_txn(env)
+    assert stored == {b'a': b'2', b'b': b'2', b'c': b'2', b'd': b'1',
+                      b'e': b'3', b'f': b'4', b'g': b'4'}
+
+
+def test_bulk_put_records_writes_nothing_if_a_chunk_fails(repo):
+    from hangar.txnctx import TxnRegister, bulk_put_records
+
+    env = repo._env.stagehashenv
+    # the oversized key of the last chunk is rejected by lmdb.
+    items = [(f'k{i:03d}'.encode(), b'v') for i in range(10)] + [(b'z' * 1_000, b'v')]
+    with pytest.raises(lmdb.Error):
+        bulk_put_records(env, reversed(items), chunk_size=3)
+
+    txn = TxnRegister().begin_reader_txn(env)
+    try:
+        with txn.cursor() as cur:
+            assert not any(bytes(k).startswith(b'k') for k in cur.iternext(values=False))
+    finally:
+        TxnRegister().abort_reader_txn(env)
+    assert TxnRegister().WriterAncestors[env] == 0
+
+
+def test_bulk_put_records_rejects_invalid_chunk_size(repo):
+    from hangar.txnctx import bulk_put_records
+
+    with pytest.raises(ValueError):
+        bulk_put_records(repo._env.stagehashenv, [(b'a', b'b')], chunk_size=0)
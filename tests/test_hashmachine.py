@@ -0,0 +1,124 @@
+import os
+
+import numpy as np
+import pytest
+from xxhash import xxh64_hexdigest
+
+from hangar.records.hashmachine import (
+    hash_ndarrays,
+    ndarray_hasher_checksum_tcode_0,
+    ndarray_hasher_tcode_0,
+)
+
+
+@pytest.mark.parametrize('arr', [
+    np.arange(10),
+    np.array(5.0),
+    np.zeros((0, 3), dtype=np.uint8),
+    np.random.random((700, 513)).astype(np.float32),  # spans multiple hash blocks
+    np.random.randint(0, 255, (3, 262_144 + 7), dtype=np.uint8),
+])
+def test_ndarray_digest_and_checksum_match_separate_hashers(arr):
+    digest, checksum = ndarray_hasher_checksum_tcode_0(arr)
+    assert digest == ndarray_hasher_tcode_0(arr)
+    assert checksum == xxh64_hexdigest(arr)
+
+
+def test_ndarray_digest_and_checksum_differs_on_shape():
+    a, b = np.zeros((10, 10, 10)), np.zeros((1000,))
+    assert ndarray_hasher_checksum_tcode_0(a)[0] != ndarray_hasher_checksum_tcode_0(b)[0]
+    assert ndarray_hasher_checksum_tcode_0(a)[1] == ndarray_hasher_checksum_tcode_0(b)[1]
+
+
+def test_ndarray_digest_and_checksum_requires_c_contiguous():
+    with pytest.raises(ValueError):
+        ndarray_hasher_checksum_tcode_0(np.zeros((4, 4))[:, ::2])
+
+
+@pytest.mark.parametrize('cpu_count', [1, 4])
+@pytest.mark.parametrize('shape', [(10,), (1024, 1024)])
+def test_hash_ndarrays_matches_single_array_hashers(monkeypatch, cpu_count, shape):
+    monkeypatch.setattr(os, 'cpu_count', lambda: cpu_count)
+    arrays = [np.random.random(shape) for _ in range(6)]
+    assert hash_ndarrays(arrays) == [ndarray_hasher_tcode_0(arr) for arr in arrays]
+    assert hash_ndarrays(arrays, checksums=True) == [
+        (ndarray_hasher_tcode_0(arr), xxh64_hexdigest(arr)) for arr in arrays]
+    assert hash_ndarrays([]) == []
+
+
+def test_column_update_batch_hashes_same_digests_as_setitem(repo):
+    from hangar.records.hashs import HashQuery
+
+    arrays = {idx: np.random.random((512, 512)) for idx in range(8)}
+    co = repo.checkout(write=True)
+    try:
+        flat = co.add_ndarray_column('flat', prototype=arrays[0])
+        nested = co.add_ndarray_column('nested', prototype=arrays[0], contains_subsamples=True)
+        flat.update(arrays)
+        num_records = HashQuery(repo._env.hashenv).num_data_records()
+        assert num_records == 8
+        # identical data written one sample at a time is deduplicated.
+        for idx, arr in arrays.items():
+            flat[f's{idx}'] = arr
+        nested.update({'sample': arrays})
+        assert HashQuery(repo._env.hashenv).num_data_records() == num_records
+        for idx, arr in arrays.items():
+            assert np.array_equal(flat[idx], arr)
+            assert np.array_equal(nested['sample'][idx], arr)
+    finally:
+        co.close()
+
+
+@pytest.mark.parametrize('backend', ['00', '01', '10'])
+def test_backend_write_data_with_precomputed_checksum(repo, backend):
+    from hangar.backends import backend_decoder
+
+    arr = np.random.random((10, 10))
+    _, checksum = ndarray_hasher_checksum_tcode_0(arr)
+    co = repo.checkout(write=True)
+    try:
+        col = co.add_ndarray_column('col', prototype=arr, backend=backend)
+        with col:
+            be = col._be_fs[backend]
+            computed = backend_decoder(be.write_data(arr))
+            precomputed = backend_decoder(be.write_data(arr, checksum=checksum))
+            assert computed.checksum == precomputed.checksum == checksum
+            assert np.array_equal(be.read_data(precomputed), arr)
+    finally:
+        co.close()
+
+
+@pytest.mark.parametrize('backend', ['00', '01', '10'])
+def test_trust_fresh_writes_skips_read_checksum(repo, monkeypatch, backend):
+    from hangar.backends import hdf5_00, hdf5_01, numpy_10
+
+    arr = np.random.random((10, 10))
+    co = repo.checkout(write=True, trust_fresh_writes=True)
+    try:
+        col = co.add_ndarray_column('col', prototype=arr, backend=backend)
+        col[0] = arr
+        col.update({1: arr + 1, 2: arr + 2})
+        for mod in (hdf5_00, hdf5_01, numpy_10):
+            monkeypatch.setattr(mod, 'xxh64_hexdigest', lambda *a: pytest.fail('verified'))
+        assert np.array_equal(col[0], arr)
+        assert np.array_equal(col[2], arr + 2)
+        co.commit('first')
+    finally:
+        co.close()
+    monkeypatch.undo()
+
+    co = repo.checkout(write=True)
+    try:
+        with monkeypatch.context() as m:
+            m.setattr(numpy_10, 'xxh64_hexdigest', lambda *a: 'corrupt')
+            m.setattr(hdf5_00, 'xxh64_hexdigest', lambda *a: 'corrupt')
+            m.setattr(hdf5_01, 'xxh64_hexdigest', lambda *a: 'corrupt')
+            with pytest.raises(RuntimeError, match='DATA CORRUPTION'):
+                co.columns['col'][1]
+    finally:
+        co.close()
+
+
+def test_trust_fresh_writes_requires_write_checkout(repo):
+    with pytest.raises(ValueError, match='trust_fresh_writes'):
+        repo.checkout(trust_fresh_writes=True)
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 import numpy as np
@@ -277,3 +279,281 @@ def test_serialize_deserialize_ident_only_schema_only_record_pack(ident_testcase
         assert isinstance(resIdent, DataIdent)
         assert resIdent.digest == origIdent[0]
         assert resIdent.schema == origIdent[1]
+
+
+@pytest.mark.parametrize('max_frame_nbytes,expected_nframes', [
+    (1, 4),
+    (1_000, 2),
+    (10_000_000, 1),
+])
+def test_pack_unpack_record_frames(max_frame_nbytes, expected_nframes):
+    from hangar.remote.chunks import pack_record_frames
+    from hangar.remote.chunks import unpack_record_frame
+    from hangar.remote.chunks import dataFrameChunkedIterator
+    from hangar.remote.chunks import reassemble_data_frames
+    from hangar.remote.hangar_service_pb2 import FetchDataBatchReply, ErrorProto
+
+    records = [
+        (np.arange(100, dtype=np.float32).reshape(10, 10), 'digest0'),
+        ('i am string', 'digest1'),
+        (b'i am bytes', 'digest2'),
+        (np.zeros((623, 3, 5), dtype=np.uint8), 'digest3'),
+    ]
+    frames = list(pack_record_frames(records, max_frame_nbytes))
+    assert len(frames) == expected_nframes
+    assert sum(num_records for _, num_records in frames) == len(records)
+
+    err = ErrorProto(code=0, message='OK')
+    replies = dataFrameChunkedIterator(frames, FetchDataBatchReply, error=err)
+    res = []
+    for frame in reassemble_data_frames(replies):
+        res.extend(unpack_record_frame(frame))
+
+    assert len(res) == len(records)
+    for resRec, (data, digest) in zip(res, records):
+        assert resRec.digest == digest
+        if isinstance(data, np.ndarray):
+            assert_array_equal(resRec.data, data)
+        else:
+            assert resRec.data == data
+
+
+@pytest.mark.parametrize('num_common,num_left,num_right', [
+    (0, 0, 0), (0, 10, 0), (1_000, 0, 25), (10_000, 300, 400)])
+def test_reconcile_table_decodes_set_difference(num_common, num_left, num_right):
+    from hangar.remote.reconcile import FingerprintedDigests, table_num_cells
+
+    common = [f'0={idx:040x}' for idx in range(num_common)]
+    left_only = [f'2=left{idx}' for idx in range(num_left)]
+    right_only = [f'3=right{idx}' for idx in range(num_right)]
+    left = FingerprintedDigests(common + left_only)
+    right = FingerprintedDigests(right_only + common)
+
+    num_cells = table_num_cells(num_left + num_right)
+    diff = left.table(num_cells).subtract(right.table(num_cells)).decode()
+    assert diff is not None
+    left_fps, right_fps = diff
+    assert sorted(left.lookup(left_fps)) == sorted(left_only)
+    assert sorted(right.lookup(right_fps)) == sorted(right_only)
+    assert left.lookup(right_fps) == []
+
+
+def test_reconcile_table_serializes_and_fails_to_decode_when_too_small():
+    from hangar.remote.reconcile import FingerprintedDigests, InvertibleBloomTable
+
+    left = FingerprintedDigests([f'0=left{idx}' for idx in range(3_000)])
+    right = FingerprintedDigests([f'0=right{idx}' for idx in range(10)])
+    raw = left.table(1_026).to_bytes()
+    table = InvertibleBloomTable.from_bytes(raw, 1_026)
+    assert np.array_equal(table.count, left.table(1_026).count)
+    assert table.subtract(right.table(1_026)).decode() is None
+    with pytest.raises(ValueError):
+        InvertibleBloomTable.from_bytes(raw, 1_029)
+    with pytest.raises(ValueError):
+        InvertibleBloomTable(1_000)
+
+
+def test_frame_segments_boundaries_only_depend_on_digests():
+    from hangar.remote.chunks import frame_segments
+
+    records = [(f'0={idx:040x}', b'val') for idx in range(2_000)]
+    sizes = [1_000] * len(records)
+    segments = frame_segments(records, sizes, 16_000)
+    assert [rec for seg in segments for rec in seg] == records
+    assert 50 < len(segments) < 400
+    # a request covering part of the range splits its interior identically.
+    sub_segments = frame_segments(records[500:1_500], sizes[500:1_500], 16_000)
+    interior = [seg for seg in segments if seg[0] in records[500:1_500] and seg[-1] in records[500:1_500]]
+    assert all(seg in sub_segments for seg in interior[1:])
+
+
+def test_frame_segments_hold_segment_nbytes_on_average():
+    from hangar.remote.chunks import frame_segments
+
+    records = [(f'0={idx:040x}', b'val') for idx in range(20_000)]
+    large = frame_segments(records, [100_000] * len(records), 1_000_000)
+    assert 10 < (len(records) / len(large)) < 20
+    small = frame_segments(records, [1] * len(records), 1_000_000, max_segment_records=500)
+    assert 250 < (len(records) / len(small)) < 1_000
+
+
+def test_compressed_sample_cache_evicts_lru_to_disk_tier(tmp_path):
+    from hangar.remote.sample_cache import CompressedSampleCache, pack_frames, unpack_frames
+
+    cache = CompressedSampleCache(25, disk_dir=tmp_path / 'cache', disk_max_nbytes=25)
+    cache.put('a', b'a' * 10)
+    cache.put('b', b'b' * 10)
+    assert cache.get('a') == b'a' * 10
+    cache.put('c', b'c' * 10)  # b is least recently used -> moved to disk
+    assert cache.stats()['disk_num_entries'] == 1
+    assert cache.get('b') == b'b' * 10  # promoted from disk, a demoted
+    assert cache.get('missing') is None
+    cache.put('d', b'd' * 30)  # larger than both tiers -> not cached
+    assert cache.get('d') is None
+
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['disk_hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['evictions'] == 1
+    assert stats['nbytes'] <= 25 and stats['disk_nbytes'] <= 25
+    cache.close()
+    assert not (tmp_path / 'cache').exists()
+
+    frames = [(b'frame one', 3), (b'', 0), (b'frame three', 1)]
+    assert unpack_frames(pack_frames(frames)) == frames
+
+
+@pytest.mark.parametrize('nbytes,max_message_nbytes,expected_nchunks', [
+    (0, 4_194_304, 0),
+    (10, 4_194_304, 1),
+    (4_000_000, 4_194_304, 1),
+    (4_194_304, 4_194_304, 2),
+    (20_000_000, 4_194_304, 5),
+    (20_000_000, 33_554_432, 1),
+])
+def test_chunk_bytes_adaptive_sizes(nbytes, max_message_nbytes, expected_nchunks):
+    from hangar.remote.chunks import chunk_bytes, MESSAGE_HEADROOM_NBYTES
+
+    payload = os.urandom(nbytes)
+    res = list(chunk_bytes(payload, max_message_nbytes=max_message_nbytes))
+    assert len(res) == expected_nchunks
+    assert all(isinstance(chunk, bytes) for chunk in res)
+    assert all(len(chunk) <= max_message_nbytes - MESSAGE_HEADROOM_NBYTES for chunk in res)
+    assert b''.join(res) == payload
+    if expected_nchunks == 1:
+        assert res[0] is payload
+    small = bytearray(payload[:1_000])
+    assert list(chunk_bytes(small, chunkSize=3)) == [small[i:i + 3] for i in range(0, len(small), 3)]
+
+
+def test_reassemble_data_frames_single_message_frames_are_not_copied():
+    from hangar.remote.chunks import dataFrameChunkedIterator, reassemble_data_frames
+    from hangar.remote.hangar_service_pb2 import FetchDataBatchReply
+
+    frames = [(b'a' * 100, 1), (os.urandom(300_000), 2)]
+    messages = dataFrameChunkedIterator(
+        frames, FetchDataBatchReply, max_message_nbytes=65_536 + 100_000)
+    # messages are reused between chunks, so must be serialized as they are sent
+    raw_messages = [message.SerializeToString() for message in messages]
+    assert len(raw_messages) == 4
+    res = list(reassemble_data_frames(map(FetchDataBatchReply.FromString, raw_messages)))
+    assert isinstance(res[0], bytes) and isinstance(res[1], bytearray)
+    assert [bytes(frame) for frame in res] == [frame for frame, _ in frames]
+
+
+@pytest.mark.parametrize('codec,clib', [
+    ('none:0:noshuffle', 'BloscLZ'),
+    ('blosclz:3:noshuffle', 'BloscLZ'),
+    ('lz4:1:shuffle', 'LZ4'),
+    ('zstd:5:bitshuffle', 'Zstd'),
+    ('zlib:9:shuffle', 'Zlib'),
+])
+def test_pack_unpack_record_frames_with_codec(codec, clib):
+    import blosc
+    from hangar.remote.chunks import pack_record_frames, unpack_record_frame
+
+    records = [(np.arange(1_000, dtype=np.float64).reshape(10, 100), f'digest{idx}') for idx in range(3)]
+    records.append(('i am string', 'digest3'))
+    (frame, num_records), = pack_record_frames(records, 10_000_000, codec)
+    assert num_records == 4
+    assert blosc.get_clib(frame) == clib
+    res = unpack_record_frame(frame)
+    for resRec, (data, digest) in zip(res, records):
+        assert resRec.digest == digest
+        if isinstance(data, np.ndarray):
+            assert_array_equal(resRec.data, data)
+        else:
+            assert resRec.data == data
+
+
+def test_pack_unpack_record_frames_with_raw_chunks():
+    from hangar.backends.hdf5_01 import HDF5_01_RawChunks
+    from hangar.remote.chunks import pack_record_frames, unpack_record_frame
+
+    raw = HDF5_01_RawChunks(
+        checksum='89be0b2dd5c2593d',
+        shape=(150, 7),
+        dtype='<f4',
+        row_shape=(200, 7),
+        chunk_shape=(100, 7),
+        filters=((32001, 1, (2, 2, 4, 2800, 5, 1, 2)),),
+        chunks=(((0, 0), 0, b'compressed0'), ((100, 0), 1, b'\x00' * 20)))
+    records = [(raw, 'digest0'), (np.arange(10), 'digest1')]
+    (frame, num_records), = pack_record_frames(records, 10_000_000)
+    assert num_records == 2
+    res = unpack_record_frame(frame)
+    assert res[0].digest == 'digest0'
+    assert res[0].data == raw
+    assert_array_equal(res[1].data, np.arange(10))
+
+
+@pytest.mark.parametrize('name', [
+    'blosclz', 'blosclz:3', 'foo:3:shuffle', 'zstd:10:shuffle', 'zstd:1:byteshuffle', 'zstd:a:shuffle'])
+def test_parse_codec_invalid_names(name):
+    from hangar.remote.codecs import parse_codec
+    with pytest.raises(ValueError):
+        parse_codec(name)
+
+
+def test_codec_selected_by_measured_throughput():
+    from hangar.remote.codecs import (
+        DEFAULT_CODEC, ThroughputMeter, codec_for_throughput, select_codec)
+
+    meter = ThroughputMeter(smoothing=0.5)
+    assert select_codec('auto', meter) == DEFAULT_CODEC
+    assert select_codec('lz4:2:shuffle', meter) == 'lz4:2:shuffle'
+    meter.record(1_000_000_000, 1)
+    assert select_codec('auto', meter) == 'none:0:noshuffle'
+    meter.record(0, 1)  # moving average -> 500 MB/s
+    assert meter.nbytes_per_sec == 500_000_000
+    with meter.timer() as timer:
+        timer.nbytes = 0
+    assert meter.nbytes_per_sec < 500_000_000
+    assert codec_for_throughput(50e6) == 'zstd:1:shuffle'
+    assert codec_for_throughput(1e6) == 'zstd:5:bitshuffle'
+    assert codec_for_throughput(50e6, supported=['blosclz', 'lz4']) == DEFAULT_CODEC
+
+
+def test_transfer_timer_measures_uncompressed_nbytes():
+    import blosc
+    from hangar.remote.codecs import ThroughputMeter
+
+    raw = b'\x00' * 100_000
+    frame = blosc.compress(raw, cname='zstd', clevel=5)
+    assert len(frame) < len(raw)
+    meter = ThroughputMeter()
+    with meter.timer() as timer:
+        timer.add_frame(bytearray(frame))
+        assert list(timer.count_frames([(frame, 1)])) == [(frame, 1)]
+    assert timer.nbytes == 2 * len(raw)
+
+
+def test_client_config_from_reply_defaults_missing_keys():
+    from hangar.remote import hangar_service_pb2
+    from hangar.remote.client import DEFAULT_CLIENT_CONFIG, client_config_from_reply
+
+    reply = hangar_service_pb2.GetClientConfigReply()
+    reply.config['push_max_nbytes'] = '100'
+    reply.config['fetch_batch_size'] = ''
+    cfg = client_config_from_reply(reply)
+    assert cfg['push_max_nbytes'] == 100
+    assert cfg['fetch_batch_size'] == int(DEFAULT_CLIENT_CONFIG['fetch_batch_size'])
+    assert cfg['push_batch_size'] == int(DEFAULT_CLIENT_CONFIG['push_batch_size'])
+    assert cfg['codecs'] == ['blosclz']
+    assert cfg['fetch_raw_chunks'] is False
+
+
+def test_raw_chunks_not_requested_without_hdf5_library_lock(monkeypatch):
+    from hangar.backends import hdf5_01
+    from hangar.remote import client, hangar_service_pb2
+
+    reply = hangar_service_pb2.GetClientConfigReply()
+    reply.config['fetch_raw_chunks'] = '1'
+    assert client.client_config_from_reply(reply)['fetch_raw_chunks'] is True
+
+    monkeypatch.setattr(client, 'RAW_CHUNKS_SUPPORTED', False)
+    monkeypatch.setattr(hdf5_01, 'RAW_CHUNKS_SUPPORTED', False)
+    assert client.client_config_from_reply(reply)['fetch_raw_chunks'] is False
+    with pytest.raises(RuntimeError):
+        hdf5_01.decode_raw_chunks(None)
@@ -743,6 +743,789 @@ class TestRemoteServerFetchDataSample:
         newRepo._env._close_environments()
 
 
+def test_server_push_frame_verification_detects_mangled_digest():
+    from hangar.remote.server import HangarServer
+    from hangar.remote.chunks import pack_record_frames
+    from hangar.records.hashmachine import ndarray_hasher_tcode_0
+
+    arr = np.arange(10)
+    good_digest = ndarray_hasher_tcode_0(arr)
+    (frame, _), = pack_record_frames([(arr, good_digest)], 1_000)
+    records = HangarServer._verify_push_frame(frame)
+    assert records[0].digest == good_digest
+
+    (frame, _), = pack_record_frames([(arr, good_digest), (arr + 1, good_digest)], 1_000)
+    with pytest.raises(ValueError, match='HASH MANGLED'):
+        HangarServer._verify_push_frame(frame)
+
+
+def test_transfer_journal_checkpoint_resume_and_finish(managed_tmpdir):
+    from hangar.remote.journal import TransferJournal
+
+    run_key = TransferJournal.run_key('push', 'origin', branch='master', head='abc')
+    assert run_key == TransferJournal.run_key('push', 'origin', branch='master', head='abc')
+    assert run_key != TransferJournal.run_key('push', 'origin', branch='dev', head='abc')
+
+    with TransferJournal(managed_tmpdir) as journal:
+        assert journal.resume_run(run_key) is None
+        journal.begin_run(run_key, 'push', 'origin',
+                          {'s1': ['0=a', '0=b', '0=c'], 's2': ['0=d']}, commits=['c1', 'c2'])
+        journal.checkpoint(run_key, 's1', ['0=a', '0=b'])
+        journal.suspend_run(run_key)
+
+    with TransferJournal(managed_tmpdir) as journal:
+        meta, pending = journal.resume_run(run_key)
+        assert meta == {'commits': ['c1', 'c2']}
+        assert pending == {'s1': ['0=c'], 's2': ['0=d']}
+        journal.update_meta(run_key, commits=['c2'])
+        journal.checkpoint(run_key, 's1', ['0=c'])
+        journal.checkpoint(run_key, 's2', ['0=d'])
+        summary = journal.finish_run(run_key)
+        assert summary.num_samples == 4
+        assert summary.num_resumes == 1
+        assert summary.operation == 'push'
+        assert journal.resume_run(run_key) is None
+        assert journal.summaries() == [summary]
+
+
+def test_interrupted_push_resumes_without_resending_data(
+        server_instance, repo, managed_tmpdir, array5by7, monkeypatch):
+    from hangar import Repository
+    from hangar.remote.client import HangarClient
+
+    co = repo.checkout(write=True)
+    co.add_ndarray_column(name='writtenaset', shape=(5, 7), dtype=np.float32)
+    with co.columns['writtenaset'] as d:
+        for sIdx in range(10):
+            d[str(sIdx)] = np.random.randn(*array5by7.shape).astype(np.float32)
+    co.commit('first commit')
+    co.close()
+    repo.remote.add('origin', server_instance)
+
+    def interrupt(*args, **kwargs):
+        raise ConnectionError('interrupted')
+
+    with monkeypatch.context() as m:
+        m.setattr(HangarClient, 'push_commit_record', interrupt)
+        with pytest.raises(ConnectionError):
+            repo.remote.push('origin', 'master')
+    assert repo.remote.transfer_history() == []
+
+    pushed = []
+    orig_push_data = HangarClient.push_data
+
+    def record_push_data(self, schema, digests, pbar=None):
+        pushed.extend(digests)
+        return orig_push_data(self, schema, digests, pbar=pbar)
+
+    monkeypatch.setattr(HangarClient, 'push_data', record_push_data)
+    assert repo.remote.push('origin', 'master') == 'master'
+    assert pushed == []
+    summary, = repo.remote.transfer_history()
+    assert summary.operation == 'push'
+    assert summary.num_samples == 10
+    assert summary.num_resumes == 1
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+    newRepo.remote.fetch_data('origin', branch='master')
+    nco = newRepo.checkout()
+    assert len(nco.columns['writtenaset']) == 10
+    assert nco.columns['writtenaset'].contains_remote_references is False
+    assert newRepo.remote.transfer_history()[0].num_samples == 10
+    nco.close()
+    newRepo._env._close_environments()
+
+
+def test_push_and_fetch_find_missing_records_via_reconciliation(
+        server_instance, repo, managed_tmpdir, array5by7, monkeypatch):
+    from hangar import Repository
+    from hangar.remote import reconcile
+    from hangar.remote.client import HangarClient
+
+    monkeypatch.setattr(reconcile, 'MIN_NUM_CELLS', 12)
+    reconciled = []
+    orig_reconcile = HangarClient._reconcile_hash_records
+
+    def record_reconcile(self, *args, **kwargs):
+        res = orig_reconcile(self, *args, **kwargs)
+        reconciled.append(res is not None)
+        return res
+
+    monkeypatch.setattr(HangarClient, '_reconcile_hash_records', record_reconcile)
+
+    # table decoding is probabilistic; fixed data makes the digests (and
+    # therefore whether the tables decode) deterministic.
+    rng = np.random.RandomState(0)
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column(name='writtenaset', shape=(5, 7), dtype=np.float32)
+    for sIdx in range(200):
+        col[sIdx] = rng.randn(*array5by7.shape).astype(np.float32)
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    repo.remote.push('origin', 'master')
+    assert reconciled == []  # server has no commits to reconcile against.
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+
+    co = repo.checkout(write=True)
+    col = co.columns['writtenaset']
+    del col[0]
+    for sIdx in range(200, 203):
+        col[sIdx] = rng.randn(*array5by7.shape).astype(np.float32)
+    co.commit('second')
+    co.close()
+    repo.remote.push('origin', 'master')
+    assert reconciled == [True]
+
+    newRepo.remote.fetch('origin', 'master')
+    assert reconciled == [True, True]
+    newRepo.remote.fetch_data('origin', branch='origin/master')
+    nco = newRepo.checkout(branch='origin/master')
+    co = repo.checkout()
+    assert len(nco.columns['writtenaset']) == 202
+    for sIdx in range(1, 203):
+        assert np.allclose(nco['writtenaset', sIdx], co['writtenaset', sIdx])
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+
+def test_partial_clone_filter_normalize_and_json_roundtrip():
+    from hangar.remote.partial import (
+        PartialCloneFilter, filter_from_json, filter_to_json, normalize_filter)
+
+    filt = normalize_filter(PartialCloneFilter(
+        columns=['b', 'a', 'b'], key_prefixes=['x'], key_ranges=[('c', 'f'), (10, 20)]))
+    assert filt.columns == ('a', 'b')
+    assert filt.key_ranges == ((10, 20), ('c', 'f'))
+    assert filter_from_json(filter_to_json(filt)) == filt
+    assert normalize_filter(PartialCloneFilter()) is None
+    assert filter_from_json(filter_to_json(None)) is None
+
+    assert filt.selects_key('xray') and filt.selects_key('dog') and filt.selects_key(15)
+    assert not filt.selects_key('f') and not filt.selects_key(20) and not filt.selects_key('15')
+
+    with pytest.raises(TypeError):
+        normalize_filter(PartialCloneFilter(columns='a'))
+    with pytest.raises(TypeError):
+        normalize_filter(PartialCloneFilter(key_ranges=[(0, 'a')]))
+    with pytest.raises(ValueError):
+        normalize_filter(PartialCloneFilter(key_ranges=[(5, 1)]))
+    with pytest.raises(ValueError):
+        normalize_filter(PartialCloneFilter(max_sample_nbytes=-1))
+    with pytest.raises(ValueError):
+        filter_from_json('{"not_an_option": 1}')
+
+
+def test_partial_clone_filters_hash_records_and_data_on_server(
+        server_instance, repo, managed_tmpdir, monkeypatch):
+    from hangar import Repository
+    from hangar.remote.client import HangarClient
+    from hangar.remote.partial import PartialCloneFilter
+
+    received = []
+    orig_full_hash_records = HangarClient._fetch_full_hash_records
+
+    def record_full_hash_records(self, *args, **kwargs):
+        res = orig_full_hash_records(self, *args, **kwargs)
+        received.extend(res)
+        return res
+
+    monkeypatch.setattr(HangarClient, '_fetch_full_hash_records', record_full_hash_records)
+
+    co = repo.checkout(write=True)
+    arr = co.add_ndarray_column('arr', shape=(10, 10), dtype=np.float32, variable_shape=True)
+    for sIdx in range(20):
+        shape = (2, 2) if (sIdx < 10) else (10, 10)
+        arr[sIdx] = np.random.randn(*shape).astype(np.float32)
+    names = co.add_str_column('names')
+    for prefix in ('a', 'b'):
+        for sIdx in range(5):
+            names[f'{prefix}{sIdx}'] = f'{prefix} name {sIdx}'
+    other = co.add_ndarray_column('other', prototype=np.zeros((5, 7), dtype=np.float32))
+    for sIdx in range(5):
+        other[sIdx] = np.random.randn(5, 7).astype(np.float32)
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    repo.remote.push('origin', 'master')
+
+    filt = PartialCloneFilter(columns=['names', 'arr'], key_prefixes=['a'],
+                              key_ranges=[(5, 15)], max_sample_nbytes=100)
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance,
+                  remove_old=True, partial_filter=filt)
+    assert newRepo.remote.partial_filter('origin') == PartialCloneFilter(
+        columns=('arr', 'names'), key_prefixes=('a',), key_ranges=((5, 15),), max_sample_nbytes=100)
+    # arr samples 5-9 (10-14 are larger than 100 bytes) and names a0-a4
+    assert len(received) == 10
+
+    nco = newRepo.checkout()
+    assert len(nco.columns['arr']) == 20
+    assert len(nco.columns['names']) == 10
+    assert len(nco.columns['other']) == 5
+    assert len(nco.columns['arr'].remote_reference_keys) == 20
+    nco.close()
+
+    newRepo.remote.fetch_data('origin', branch='master')
+    nco = newRepo.checkout()
+    co = repo.checkout()
+    assert set(nco.columns['arr'].remote_reference_keys) == set(range(20)) - set(range(5, 10))
+    assert set(nco.columns['names'].remote_reference_keys) == {f'b{i}' for i in range(5)}
+    assert len(nco.columns['other'].remote_reference_keys) == 5
+    for sIdx in range(5, 10):
+        assert np.allclose(nco['arr', sIdx], co['arr', sIdx])
+    for sIdx in range(5):
+        assert nco['names', f'a{sIdx}'] == co['names', f'a{sIdx}']
+
+    # column names further restrict the recorded filter
+    newRepo.remote.fetch_data(
+        'origin', branch='master', column_names=['other'],
+        partial_filter=PartialCloneFilter(columns=['other']))
+    nco.close()
+    nco = newRepo.checkout()
+    assert len(nco.columns['other'].remote_reference_keys) == 0
+    assert len(nco.columns['names'].remote_reference_keys) == 5
+    nco.close()
+    co.close()
+
+    # later fetches stay sparse
+    co = repo.checkout(write=True)
+    co['names']['a5'] = 'a name 5'
+    co['names']['b5'] = 'b name 5'
+    co.commit('second')
+    co.close()
+    repo.remote.push('origin', 'master')
+    newRepo.remote.fetch('origin', 'master')
+    newRepo.remote.fetch_data('origin', branch='origin/master')
+    nco = newRepo.checkout(branch='origin/master')
+    assert nco['names', 'a5'] == 'a name 5'
+    assert set(nco.columns['names'].remote_reference_keys) == {f'b{i}' for i in range(6)}
+    nco.close()
+    newRepo._env._close_environments()
+
+
+def test_transfer_scheduler_retries_transient_errors_and_adapts_concurrency():
+    import grpc
+    from hangar.remote.scheduler import TransferScheduler
+
+    class RpcError(grpc.RpcError):
+        def __init__(self, code):
+            self._code = code
+
+        def code(self):
+            return self._code
+
+    attempts = {}
+
+    def transfer(batch):
+        attempts[batch[0]] = attempts.get(batch[0], 0) + 1
+        if (batch[0] == 3) and (attempts[batch[0]] == 1):
+            raise RpcError(grpc.StatusCode.UNAVAILABLE)
+        return batch[0]
+
+    scheduler = TransferScheduler('test', max_concurrency=4, retry_backoff=0)
+    assert scheduler.concurrency == 4
+    res = list(scheduler.run([[i] for i in range(10)], transfer))
+    assert sorted(res) == list(range(10))
+    assert attempts[3] == 2
+    stats = scheduler.stats.finish()
+    assert stats.retries == 1
+    assert stats.num_batches == 10
+    assert 1 <= stats.max_concurrency <= 4
+
+    def fail(batch):
+        raise RpcError(grpc.StatusCode.DATA_LOSS)
+
+    with pytest.raises(grpc.RpcError):
+        list(TransferScheduler('test', max_concurrency=2).run([[0]], fail))
+
+    def unavailable(batch):
+        raise RpcError(grpc.StatusCode.UNAVAILABLE)
+
+    scheduler = TransferScheduler('test', max_concurrency=2, max_retries=2, retry_backoff=0)
+    with pytest.raises(grpc.RpcError):
+        list(scheduler.run([[0]], unavailable))
+    assert scheduler.stats.retries == 2
+    assert scheduler.concurrency == 1
+
+
+def test_transfer_scheduler_bandwidth_limit_and_largest_first_batches():
+    from hangar.remote.scheduler import (
+        BandwidthLimiter, TransferScheduler, largest_first_batches, sample_size_hint)
+    from hangar.backends import backend_decoder
+
+    with pytest.raises(ValueError):
+        BandwidthLimiter(0)
+    scheduler = TransferScheduler('test', bandwidth_limit='40kB')
+    assert scheduler.limiter.nbytes_per_sec == 40_000
+    start = time.perf_counter()
+    for _ in range(5):
+        scheduler.throttle(4_000)
+    # 10_000 byte burst is sent at once, the rest at the limited rate
+    assert time.perf_counter() - start >= 0.2
+
+    items = ['a', 'b', 'c', 'd', 'e']
+    sizes = [1, 10, 1, 5, 10]
+    assert largest_first_batches(items, sizes, str, 2) == [['b', 'e'], ['d', 'a'], ['c']]
+    assert sample_size_hint(backend_decoder(b'50:')) == 1
+
+
+def test_push_data_retry_only_sends_samples_server_did_not_store(
+        monkeypatch, server_instance, repo, managed_tmpdir):
+    import grpc
+    from hangar import Repository
+    from hangar.remote.client import HangarClient
+
+    class RpcError(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.UNAVAILABLE
+
+    co = repo.checkout(write=True)
+    arr = co.add_ndarray_column('arr', shape=(50, 50), dtype=np.float32)
+    for sIdx in range(30):
+        arr[sIdx] = np.zeros((50, 50), dtype=np.float32) + sIdx
+    co.commit('first')
+    co.close()
+
+    sent_records = []
+    original_push_data = HangarClient.push_data
+
+    def push_data(self, *args, **kwargs):
+        push_data_batch = self.stub.PushDataBatch
+
+        def flaky_push_data_batch(request_iterator):
+            # the first attempt fails after the server received one frame.
+            messages, received = [], 0
+            for message in request_iterator:
+                messages.append(message)
+                received += len(message.raw_data)
+                if received == message.nbytes:
+                    sent_records.append(message.num_records)
+                    received = 0
+                    if len(sent_records) == 1:
+                        push_data_batch(iter(messages))
+                        raise RpcError()
+            return push_data_batch(iter(messages))
+
+        self.cfg['push_frame_nbytes'] = 25_000
+        monkeypatch.setattr(self.stub, 'PushDataBatch', flaky_push_data_batch)
+        return original_push_data(self, *args, **kwargs)
+
+    monkeypatch.setattr(HangarClient, 'push_data', push_data)
+    repo.remote.add('origin', server_instance)
+    _, push_stats = repo.remote.push('origin', 'master', max_concurrency=1, return_stats=True)
+    assert push_stats.retries == 1
+    assert push_stats.num_samples == 30
+    assert sent_records[0] == 2
+    assert sum(sent_records) == 30
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+    newRepo.remote.fetch_data('origin', branch='master')
+    nco = newRepo.checkout()
+    for sIdx in range(30):
+        assert np.allclose(nco['arr', sIdx], sIdx)
+    nco.close()
+    newRepo._env._close_environments()
+
+
+def test_push_and_fetch_data_report_transfer_stats(server_instance, repo, managed_tmpdir):
+    from hangar import Repository
+    from hangar.remote.scheduler import TransferStats
+
+    co = repo.checkout(write=True)
+    arr = co.add_ndarray_column('arr', shape=(50, 50), dtype=np.float32, variable_shape=True)
+    for sIdx in range(30):
+        shape = (50, 50) if (sIdx % 3 == 0) else (2, 2)
+        arr[sIdx] = np.zeros(shape, dtype=np.float32) + sIdx
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    branch, push_stats = repo.remote.push(
+        'origin', 'master', max_concurrency=2, bandwidth_limit='100MB', return_stats=True)
+    assert branch == 'master'
+    assert isinstance(push_stats, TransferStats)
+    assert push_stats.num_samples == 30
+    assert push_stats.nbytes > 0
+    assert push_stats.raw_nbytes > push_stats.nbytes
+    assert push_stats.compression_ratio > 1
+    assert push_stats.max_concurrency <= 2
+    assert push_stats.as_dict()['num_samples'] == 30
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+    commits, fetch_stats = newRepo.remote.fetch_data(
+        'origin', branch='master', max_concurrency=3, return_stats=True)
+    assert len(commits) == 1
+    assert fetch_stats.operation == 'fetch_data'
+    assert fetch_stats.num_samples == 30
+    assert fetch_stats.nbytes > 0
+    assert fetch_stats.samples_per_sec > 0
+    assert fetch_stats.retries == 0
+
+    nco = newRepo.checkout()
+    for sIdx in range(30):
+        assert np.allclose(nco['arr', sIdx], sIdx)
+    nco.close()
+    # nothing left to transfer
+    _, push_stats = repo.remote.push('origin', 'master', return_stats=True)
+    assert push_stats.num_samples == 0
+    newRepo._env._close_environments()
+
+
+def test_data_writer_remote_references_do_not_overwrite_local_records(aset_samples_initialized_repo):
+    from hangar.backends import backend_decoder
+    from hangar.records import hash_data_db_key_from_raw_key
+    from hangar.remote.content import DataWriter
+    from hangar.txnctx import TxnRegister
+
+    from hangar.records.hashmachine import ndarray_hasher_tcode_0
+
+    repo = aset_samples_initialized_repo
+    arr = np.arange(35, dtype=np.float64).reshape(5, 7)
+    co = repo.checkout(write=True)
+    co.columns['writtenaset'][0] = arr
+    co.commit('first')
+    co.close()
+    local_digest = ndarray_hasher_tcode_0(arr)
+    with DataWriter(repo._env) as DW_CM:
+        num_added = DW_CM.remote_references(
+            [('0=remoteb', 'schemab'), (local_digest, 'schemaa'), ('0=remotea', 'schemaa')])
+    assert num_added == 2
+
+    hashTxn = TxnRegister().begin_reader_txn(repo._env.hashenv)
+    try:
+        specs = {digest: backend_decoder(hashTxn.get(hash_data_db_key_from_raw_key(digest)))
+                 for digest in ('0=remotea', '0=remoteb', local_digest)}
+    finally:
+        TxnRegister().abort_reader_txn(repo._env.hashenv)
+    assert specs['0=remotea'].backend == '50'
+    assert specs['0=remotea'].schema_hash == 'schemaa'
+    assert specs['0=remoteb'].schema_hash == 'schemab'
+    assert specs[local_digest].backend != '50'
+
+
+def test_read_through_checkout_fetches_remote_samples_on_access(
+        server_instance, repo, managed_tmpdir, array5by7):
+    from hangar import Repository
+    from hangar.dataset import make_numpy_dataset
+
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column(name='writtenaset', shape=(5, 7), dtype=np.float32)
+    for sIdx in range(20):
+        col[sIdx] = np.random.randn(*array5by7.shape).astype(np.float32)
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    repo.remote.push('origin', 'master')
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+    with pytest.raises(ValueError):
+        newRepo.checkout(write=True, read_through_remote='origin')
+    with pytest.raises(KeyError):
+        newRepo.checkout(read_through_remote='doesnotexist')
+
+    co = repo.checkout()
+    with pytest.warns(UserWarning):
+        nco = newRepo.checkout(read_through_remote='origin')
+    fetcher = nco._read_through
+    ncol = nco.columns['writtenaset']
+    assert len(ncol.remote_reference_keys) == 20
+    assert np.allclose(ncol[3], co['writtenaset', 3])
+    assert (fetcher.num_requests, fetcher.num_fetched) == (1, 1)
+
+    # hinted samples are retrieved alongside the next miss.
+    assert len(make_numpy_dataset([ncol])) == 20
+    dset = make_numpy_dataset([ncol], keys=list(range(20)), shuffle=False)
+    for sIdx, data in enumerate(dset):
+        assert np.allclose(data, co['writtenaset', sIdx])
+    assert (fetcher.num_requests, fetcher.num_fetched) == (2, 20)
+    nco.close()
+
+    # retrieved data is stored locally for every later checkout.
+    nco = newRepo.checkout()
+    assert len(nco.columns['writtenaset'].remote_reference_keys) == 0
+    for sIdx in range(20):
+        assert np.allclose(nco['writtenaset', sIdx], co['writtenaset', sIdx])
+    nco.close()
+    co.close()
+    newRepo._env._close_environments()
+
+
+def test_async_client_fetches_and_pushes_data_concurrently(
+        server_instance, repo, managed_tmpdir, array5by7):
+    import asyncio
+    from hangar import Repository
+    from hangar.remote.aio_client import AsyncHangarClient
+
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column(name='writtenaset', shape=(5, 7), dtype=np.float32)
+    for sIdx in range(30):
+        col[sIdx] = np.random.randn(*array5by7.shape).astype(np.float32)
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+
+    async def ping():
+        async with AsyncHangarClient(repo._env, server_instance) as client:
+            return await client.ping_pong()
+
+    assert asyncio.run(ping()) == 'PONG'
+    assert asyncio.run(repo.remote.aio.push('origin', 'master')) == 'master'
+    assert repo.remote.transfer_history()[-1].num_samples == 30
+    co = repo.checkout(write=True)
+    for sIdx in range(30, 35):
+        co.columns['writtenaset'][sIdx] = np.random.randn(*array5by7.shape).astype(np.float32)
+    second = co.commit('second')
+    co.close()
+    assert asyncio.run(repo.remote.aio.push('origin', 'master')) == 'master'
+    assert repo.remote.transfer_history()[-1].num_samples == 5
+    with pytest.warns(UserWarning):
+        asyncio.run(repo.remote.aio.push('origin', 'master'))
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.init('Test User', 'tester@foo.com', remove_old=True)
+    newRepo.remote.add('origin', server_instance)
+
+    async def fetch_all(remote):
+        # independent transfers share the event loop.
+        branch = await remote.fetch('origin', 'master')
+        pong, commits = await asyncio.gather(ping(), remote.fetch_data('origin', branch=branch))
+        return branch, pong, commits
+
+    branch, pong, commits = asyncio.run(fetch_all(newRepo.remote.aio))
+    assert (branch, pong, commits) == ('origin/master', 'PONG', [second])
+    assert newRepo.remote.transfer_history()[-1].num_samples == 35
+
+    co = repo.checkout(commit=second)
+    nco = newRepo.checkout(commit=second)
+    assert len(nco.columns['writtenaset'].remote_reference_keys) == 0
+    for sIdx in range(35):
+        assert np.allclose(nco['writtenaset', sIdx], co['writtenaset', sIdx])
+    nco.close()
+    co.close()
+    newRepo._env._close_environments()
+
+
+def test_server_read_workers_send_fetched_data(
+        server_instance_read_workers, repo, managed_tmpdir, array5by7):
+    from hangar import Repository
+
+    address, hangserver = server_instance_read_workers
+    assert hangserver.read_pool.num_workers == 2
+    co = repo.checkout(write=True)
+    arr_col = co.add_ndarray_column(name='arr', shape=(5, 7), dtype=np.float32)
+    str_col = co.add_str_column(name='str')
+    bytes_col = co.add_bytes_column(name='bytes')
+    for sIdx in range(300):
+        arr_col[sIdx] = np.random.randn(*array5by7.shape).astype(np.float32)
+        str_col[sIdx] = f'sample {sIdx}'
+        bytes_col[sIdx] = f'sample {sIdx}'.encode()
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', address)
+    repo.remote.push('origin', 'master')
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', address, remove_old=True)
+    newRepo.remote.fetch_data('origin', branch='master')
+    nco = newRepo.checkout()
+    co = repo.checkout()
+    assert len(nco.columns['arr']) == 300
+    for sIdx in range(300):
+        assert np.allclose(nco['arr', sIdx], co['arr', sIdx])
+        assert nco['str', sIdx] == co['str', sIdx]
+        assert nco['bytes', sIdx] == co['bytes', sIdx]
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+
+def test_server_sample_cache_disabled_by_default(server_instance, repo):
+    repo.remote.add('origin', server_instance)
+    stats = repo.remote.server_stats('origin')
+    assert 'sample_cache_num_entries' not in stats
+
+
+def test_server_sample_cache_serves_repeated_clones(server_instance_sample_cache, repo,
+                                                    managed_tmpdir, array5by7):
+    from hangar import Repository
+
+    server_instance = server_instance_sample_cache
+
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column(name='writtenaset', shape=(5, 7), dtype=np.float32)
+    for sIdx in range(500):
+        col[sIdx] = np.random.randn(*array5by7.shape).astype(np.float32)
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    repo.remote.push('origin', 'master')
+    stats = repo.remote.server_stats('origin')
+    assert stats['sample_cache_num_entries'] == 0
+
+    for clone_idx in range(2):
+        new_tmpdir = pjoin(managed_tmpdir, f'new{clone_idx}')
+        mkdir(new_tmpdir)
+        newRepo = Repository(path=new_tmpdir, exists=False)
+        newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+        newRepo.remote.fetch_data('origin', branch='master')
+        nco = newRepo.checkout()
+        co = repo.checkout()
+        for sIdx in range(500):
+            assert np.allclose(nco['writtenaset', sIdx], co['writtenaset', sIdx])
+        co.close()
+        nco.close()
+        newRepo._env._close_environments()
+
+        stats = repo.remote.server_stats('origin')
+        if clone_idx == 0:
+            assert stats['sample_cache_hits'] == 0
+            assert stats['sample_cache_num_entries'] == stats['sample_cache_misses'] > 0
+            num_misses = stats['sample_cache_misses']
+        else:
+            assert stats['sample_cache_hits'] > 0
+            assert stats['sample_cache_hits'] + stats['sample_cache_misses'] > num_misses
+            assert stats['sample_cache_nbytes'] > 0
+
+
+def test_fetch_data_batch_frames_use_requested_codec(written_two_cmt_server_repo):
+    import blosc
+    from hangar.records import hashs
+    from hangar.remote import chunks, hangar_service_pb2
+    from hangar.remote.client import HangarClient
+
+    server_address, repo = written_two_cmt_server_repo
+    digests = hashs.HashQuery(repo._env.hashenv).list_all_hash_keys_raw()
+
+    client = HangarClient(envs=repo._env, address=server_address)
+    try:
+        assert 'zstd' in client.cfg['codecs']
+        assert client.cfg['push_codec'] == 'auto'
+        for codec, clib in [('zstd:5:bitshuffle', 'Zstd'), ('lz4:1:shuffle', 'LZ4'), ('', 'BloscLZ')]:
+            request = hangar_service_pb2.FetchDataBatchRequest(uris=digests, codec=codec)
+            frames = list(chunks.reassemble_data_frames(client.stub.FetchDataBatch(request)))
+            assert all(blosc.get_clib(bytes(frame)) == clib for frame in frames)
+            assert sum(len(chunks.unpack_record_frame(frame)) for frame in frames) == len(digests)
+
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize('compatible', [True, False])
+def test_fetch_data_passes_raw_hdf5_chunks_through(
+        server_instance, repo, managed_tmpdir, monkeypatch, compatible):
+    from hangar import Repository
+    from hangar.backends.hdf5_01 import HDF5_01_FileHandles
+    from hangar.remote import client
+
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column(name='aset', shape=(50, 60), dtype=np.float32, backend='01')
+    with col as c:
+        for sIdx in range(40):
+            c[sIdx] = np.arange(3000, dtype=np.float32).reshape(50, 60) * sIdx
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    repo.remote.push('origin', 'master')
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+
+    verified, written = [], []
+    original_verify = client.verify_raw_chunks
+    original_write_data = HDF5_01_FileHandles.write_data
+
+    def verify_raw_chunks(pb, raw):
+        verified.append(pb.digest)
+        return original_verify(pb, raw)
+
+    def write_data(self, *args, **kwargs):
+        written.append(args)
+        return original_write_data(self, *args, **kwargs)
+
+    monkeypatch.setattr(client, 'verify_raw_chunks', verify_raw_chunks)
+    monkeypatch.setattr(HDF5_01_FileHandles, 'write_data', write_data)
+    if not compatible:
+        monkeypatch.setattr(HDF5_01_FileHandles, '_write_layout', lambda self: ())
+    newRepo.remote.fetch_data('origin', branch='master')
+    monkeypatch.undo()
+
+    # chunks are verified before being written, whether or not they are decoded.
+    assert len(verified) == 40
+    assert len(written) == (0 if compatible else 40)
+    nco = newRepo.checkout()
+    co = repo.checkout()
+    for sIdx in range(40):
+        assert np.allclose(nco['aset', sIdx], co['aset', sIdx])
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+
+def test_fetch_data_mangled_raw_hdf5_chunks_not_recorded(
+        server_instance, repo, managed_tmpdir, monkeypatch):
+    from hangar import Repository
+    from hangar.remote import client
+
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column(name='aset', shape=(50, 60), dtype=np.float32, backend='01')
+    for sIdx in range(10):
+        col[sIdx] = np.arange(3000, dtype=np.float32).reshape(50, 60) * sIdx
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    repo.remote.push('origin', 'master')
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+
+    original_decode = client.decode_raw_chunks
+    monkeypatch.setattr(client, 'decode_raw_chunks', lambda raw: original_decode(raw) + 1)
+    with pytest.raises(RuntimeError, match='MANGLED'):
+        newRepo.remote.fetch_data('origin', branch='master')
+    monkeypatch.undo()
+
+    # the mangled samples still reference the remote, so they are fetched again.
+    nco = newRepo.checkout()
+    assert len(nco.columns['aset'].remote_reference_keys) == 10
+    nco.close()
+    newRepo.remote.fetch_data('origin', branch='master')
+    nco = newRepo.checkout()
+    co = repo.checkout()
+    assert len(nco.columns['aset'].remote_reference_keys) == 0
+    for sIdx in range(10):
+        assert np.allclose(nco['aset', sIdx], co['aset', sIdx])
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+
 def test_push_unchanged_repo_makes_no_modifications(written_two_cmt_server_repo):
     _, repo = written_two_cmt_server_repo
     with pytest.warns(UserWarning):
@@ -907,3 +1690,34 @@ def test_push_restricted_wrong_user_and_password(server_instance_push_restricted
                                  'master',
                                  username='wrong_username',
                                  password='wrong_password')
+
+
+def test_storage_stats_resolve_fetched_data(server_instance, repo, managed_tmpdir):
+    from hangar import Repository
+
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column(name='aset', shape=(10,), dtype=np.float32, backend='01')
+    for sIdx in range(5):
+        col[sIdx] = np.full(10, sIdx, dtype=np.float32)
+    co.commit('first')
+    co.close()
+    repo.remote.add('origin', server_instance)
+    repo.remote.push('origin', 'master')
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    try:
+        newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
+        partial = newRepo.storage_stats()
+        assert partial.backends == {}
+        assert partial.commit.num_unresolved == 5
+        assert partial.commit.unique_nbytes == 0
+
+        newRepo.remote.fetch_data('origin', branch='master')
+        fetched = newRepo.storage_stats()
+        assert fetched.backends['01'].num_files == 1
+        assert fetched.commit.num_unresolved == 0
+        assert fetched.commit == repo.storage_stats().commit
+    finally:
+        newRepo._env._close_environments()
@@ -323,3 +323,95 @@ def test_schema_digest_modification_is_caught(diverse_repo):
 
         with diverse_repo._env.hashenv.begin(write=True) as txn:
             txn.put(kreplaced, vreplaced)
+
+
+def _corrupt_one_data_digest(repo):
+    from hangar.records import hashs
+
+    hq = hashs.HashQuery(repo._env.hashenv)
+    keys = list(hq.gen_all_hash_keys_db())
+    with repo._env.hashenv.begin(write=True) as txn:
+        txn.put(keys[0], txn.get(keys[1]))
+
+
+@pytest.mark.parametrize('ncpus', [1, 2])
+def test_verify_writes_report(diverse_repo, tmp_path, ncpus):
+    import json
+
+    report = tmp_path.joinpath('report.json')
+    assert diverse_repo.verify_repo_integrity(ncpus=ncpus, report=report) is True
+    res = json.loads(report.read_text())
+    assert res['status'] == 'passed'
+    assert res['mode'] == 'full'
+    assert res['corrupt'] == []
+    assert res['num_files'] == res['num_files_verified'] == len(res['files']) > 1
+    assert res['num_data_pieces_verified'] == sum(f['num_data_pieces'] for f in res['files'])
+    assert all(f['status'] == 'verified' for f in res['files'])
+
+
+@pytest.mark.parametrize('ncpus', [1, 2])
+def test_verify_report_lists_corrupt_data(diverse_repo, tmp_path, ncpus):
+    import json
+
+    _corrupt_one_data_digest(diverse_repo)
+    report = tmp_path.joinpath('report.json')
+    with pytest.raises(RuntimeError, match='1 corrupt data pieces found in 1 backend files'):
+        diverse_repo.verify_repo_integrity(ncpus=ncpus, report=report)
+    res = json.loads(report.read_text())
+    assert res['status'] == 'failed'
+    assert 'Data corruption detected for array' in res['error']
+    assert len(res['corrupt']) == 1
+    assert [f['status'] for f in res['files']].count('corrupt') == 1
+    assert res['num_files_verified'] == res['num_files'] - 1
+
+
+def test_verify_resumes_from_checkpoint(diverse_repo, tmp_path):
+    import json
+
+    checkpoint = tmp_path.joinpath('verify.ckpt')
+    report = tmp_path.joinpath('report.json')
+    _corrupt_one_data_digest(diverse_repo)
+    with pytest.raises(RuntimeError):
+        diverse_repo.verify_repo_integrity(checkpoint=checkpoint, report=report)
+    res = json.loads(report.read_text())
+    intact = [f['file'] for f in res['files'] if f['status'] == 'verified']
+    recorded = [json.loads(line)['file'] for line in checkpoint.read_text().splitlines()]
+    assert sorted(recorded) == sorted(intact)
+
+    # a partially written record (ie. from a killed process) is ignored
+    with open(checkpoint, 'a') as f:
+        f.write('{"file": "00:tru')
+    with pytest.raises(RuntimeError):
+        diverse_repo.verify_repo_integrity(checkpoint=checkpoint, report=report)
+    res = json.loads(report.read_text())
+    assert res['num_files_skipped'] == len(intact)
+    assert res['num_files_verified'] == 0
+    assert checkpoint.is_file()
+
+
+def test_verify_incremental_only_checks_new_files(diverse_repo, tmp_path):
+    import json
+
+    report = tmp_path.joinpath('report.json')
+    diverse_repo.verify_repo_integrity(incremental=True, report=report)
+    first = json.loads(report.read_text())
+    assert first['num_files_skipped'] == 0
+
+    diverse_repo.verify_repo_integrity(incremental=True, report=report)
+    second = json.loads(report.read_text())
+    assert second['mode'] == 'incremental'
+    assert second['num_files_verified'] == 0
+    assert second['num_files_skipped'] == first['num_files']
+
+    co = diverse_repo.checkout(write=True)
+    co['test'][10] = np.arange(10) + 10
+    co.commit('new data')
+    co.close()
+    diverse_repo.verify_repo_integrity(incremental=True, report=report)
+    third = json.loads(report.read_text())
+    assert third['num_files_verified'] == 1
+    assert third['num_data_pieces_verified'] == 1
+
+    # full runs verify every file regardless of the incremental log.
+    diverse_repo.verify_repo_integrity(report=report)
+    assert json.loads(report.read_text())['num_files_skipped'] == 0
@@ -0,0 +1,164 @@
+import pytest
+
+import numpy as np
+
+
+def test_repo_size_matches_directory_walk(repo_20_filled_samples):
+    from hangar.utils import folder_size
+
+    repo = repo_20_filled_samples
+    stats = repo.storage_stats()
+    assert stats.nbytes == folder_size(repo._repo_path, recurse=True)
+    assert stats.data_nbytes == sum(be.nbytes for be in stats.backends.values())
+    assert stats.staged_nbytes == 0
+
+    co = repo.checkout(write=True)
+    try:
+        co['writtenaset']['new'] = np.full((5, 7), 1234.5)
+        staged = repo.storage_stats()
+        assert staged.staged_nbytes > 0
+        assert staged.data_nbytes == stats.data_nbytes
+        assert repo.size_nbytes == folder_size(repo._repo_path, recurse=True)
+        co.commit('new sample')
+    finally:
+        co.close()
+    committed = repo.storage_stats()
+    assert committed.staged_nbytes == 0
+    assert committed.data_nbytes > stats.data_nbytes
+    assert committed.nbytes == folder_size(repo._repo_path, recurse=True)
+
+
+def test_size_matches_directory_on_fresh_repo(repo):
+    from hangar.utils import folder_size, format_bytes
+
+    nbytes = repo.size_nbytes
+    assert nbytes == folder_size(repo._repo_path, recurse=True)
+    assert repo.size_human == format_bytes(nbytes)
+
+
+def test_commit_stats_per_column_and_dedup(repo):
+    co = repo.checkout(write=True)
+    arrs = co.add_ndarray_column('arrs', shape=(10,), dtype=np.float32)
+    dups = co.add_ndarray_column('dups', shape=(10,), dtype=np.float32, backend='10')
+    strs = co.add_str_column('strs')
+    for idx in range(4):
+        arrs[idx] = np.full(10, idx, dtype=np.float32)
+        dups[idx] = np.zeros(10, dtype=np.float32)
+    strs['a'] = 'hello'
+    strs['b'] = 'hello'
+    strs['c'] = 'wörld'
+    first = co.commit('first')
+    arrs[4] = np.ones(10, dtype=np.float32)
+    co.commit('second')
+    co.close()
+
+    stats = repo.storage_stats().commit
+    assert stats.columns['arrs'] == (5, 4, 200, 160)
+    assert stats.columns['dups'] == (4, 1, 160, 40)
+    assert stats.columns['dups'].dedup_ratio == 4
+    assert stats.columns['strs'] == (3, 2, 16, 11)
+    # arrs[0] & the dups samples are identical data, stored once.
+    assert stats.num_data_records == 12
+    assert stats.num_data_pieces == 6
+    assert stats.logical_nbytes == 376
+    assert stats.unique_nbytes == 171
+    assert stats.num_unresolved == 0
+    assert stats.dedup_ratio == 376 / 171
+
+    first_stats = repo.storage_stats(commit=first).commit
+    assert first_stats.commit == first
+    assert first_stats.columns['arrs'] == (4, 4, 160, 160)
+    with pytest.raises(ValueError):
+        repo.storage_stats(commit='a=doesnotexist')
+
+
+def test_commit_stats_recorded_on_commit(repo, monkeypatch):
+    from hangar.records import ledger
+
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column('col', shape=(10,), dtype=np.float32)
+    col[0] = np.zeros(10, dtype=np.float32)
+    cmt = co.commit('first')
+    co.close()
+
+    # stats are read from the ledger; the commit is not traversed again.
+    monkeypatch.setattr(ledger.StorageLedger, '_record_commit_stats', lambda *a, **k: pytest.fail())
+    assert repo.storage_stats().commit.commit == cmt
+
+
+def test_commit_stats_derived_from_parent_match_full_traversal(repo, monkeypatch):
+    from hangar.records import ledger
+
+    co = repo.checkout(write=True)
+    arrs = co.add_ndarray_column('arrs', shape=(10,), dtype=np.float32)
+    strs = co.add_str_column('strs')
+    for idx in range(5):
+        arrs[idx] = np.full(10, idx % 3, dtype=np.float32)
+    strs['a'] = 'hello'
+    co.commit('first')
+
+    # only the root commit is computed from every record.
+    monkeypatch.setattr(ledger.StorageLedger, '_record_commit_stats', lambda *a, **k: pytest.fail())
+    del arrs[0]
+    arrs[1] = np.full(10, 2, dtype=np.float32)
+    arrs[5] = np.full(10, 7, dtype=np.float32)
+    strs['b'] = 'hello'
+    co.add_ndarray_column('more', shape=(10,), dtype=np.float32)['x'] = np.full(10, 7, dtype=np.float32)
+    co.commit('second')
+    co.columns.delete('strs')
+    arrs[6] = np.full(10, 7, dtype=np.float32)
+    cmt = co.commit('third')
+    co.close()
+    monkeypatch.undo()
+
+    stats = repo.storage_stats().commit
+    assert stats.columns['arrs'] == (6, 4, 240, 160)
+    assert stats.columns['more'] == (1, 1, 40, 40)
+    assert 'strs' not in stats.columns
+    assert stats.num_data_pieces == 4
+
+    # statistics of the same commit computed from every record are identical.
+    with repo._env.ledgerenv.begin(write=True) as txn:
+        txn.delete(f'c:{cmt}'.encode())
+    assert repo.storage_stats().commit == stats
+
+
+def test_commit_stats_recorded_for_branches_and_merges(repo, monkeypatch):
+    from hangar.records import ledger
+
+    co = repo.checkout(write=True)
+    co.add_ndarray_column('arrs', shape=(10,), dtype=np.float32)
+    co['arrs'][0] = np.zeros(10, dtype=np.float32)
+    co.commit('root')
+    co.close()
+    repo.create_branch('dev')
+
+    # after the root commit, the stats of commits alternating between
+    # branches (and of the merge commit) are derived from their parent.
+    monkeypatch.setattr(ledger.StorageLedger, '_record_commit_stats', lambda *a, **k: pytest.fail())
+    for branch, key in (('dev', 1), ('master', 2), ('dev', 3), ('master', 4)):
+        co = repo.checkout(write=True, branch=branch)
+        co['arrs'][key] = np.full(10, key, dtype=np.float32)
+        co.commit(f'{branch} {key}')
+        co.close()
+    cmt = repo.merge('merge', master_branch='master', dev_branch='dev')
+    stats = repo.storage_stats(commit=cmt).commit
+    monkeypatch.undo()
+
+    assert stats.columns['arrs'] == (5, 5, 200, 200)
+    with repo._env.ledgerenv.begin(write=True) as txn:
+        txn.delete(f'c:{cmt}'.encode())
+    assert repo.storage_stats(commit=cmt).commit == stats
+
+
+def test_ledger_created_for_existing_repo(repo_20_filled_samples):
+    from hangar.utils import folder_size
+
+    repo = repo_20_filled_samples
+    expected = repo.storage_stats()
+    with repo._env.ledgerenv.begin(write=True) as txn:
+        txn.drop(repo._env.ledgerenv.open_db(), delete=False)
+    stats = repo.storage_stats()
+    assert stats.backends == expected.backends
+    assert stats.commit == expected.commit
+    assert stats.nbytes == folder_size(repo._repo_path, recurse=True)